@@ -0,0 +1,212 @@
+#!/usr/bin/env python
+
+# Copyright 2026 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""End-to-end action latency of the async-inference `PolicyServer`, with polled and with streamed actions.
+
+A server with a synthetic MLP policy is started on a loopback port. A single robot client sends observations
+one at a time and measures the time until the action chunk predicted for that observation is received:
+
+- `poll`: like `RobotClient(stream_actions=False)`, observations are sent with `SendObservations` while a
+  receiver thread calls `GetActions` in a loop. The server holds each `GetActions` response until
+  `inference_latency` has elapsed.
+- `stream`: like `RobotClient(stream_actions=True)`, observations and action chunks share a single
+  `StreamActions` stream, and each chunk is pushed as soon as it is computed.
+
+```bash
+python benchmarks/async_inference/run_action_stream_benchmark.py --inference-latency 0.033 --inference-latency 0
+```
+"""
+
+import argparse
+import logging
+import pickle  # nosec
+import threading
+import time
+from concurrent import futures
+from queue import Queue
+
+import grpc
+import numpy as np
+import torch
+
+from lerobot.async_inference.configs import PolicyServerConfig
+from lerobot.async_inference.constants import DEFAULT_INFERENCE_LATENCY
+from lerobot.async_inference.helpers import TimedObservation
+from lerobot.async_inference.policy_server import PolicyServer
+from lerobot.transport import services_pb2, services_pb2_grpc  # type: ignore
+from lerobot.transport.utils import grpc_channel_options, send_bytes_in_chunks
+from lerobot.utils.constants import OBS_STATE
+
+STATE_DIM = 14
+CHUNK_SIZE = 50
+
+
+class SyntheticPolicy(torch.nn.Module):
+    """MLP mapping the state to a chunk of actions, standing in for a real policy."""
+
+    class _Config:
+        image_features = {}
+
+    def __init__(self, hidden_dim: int, num_layers: int):
+        super().__init__()
+        self.config = self._Config()
+        layers = [torch.nn.Linear(STATE_DIM, hidden_dim), torch.nn.ReLU()]
+        for _ in range(num_layers):
+            layers += [torch.nn.Linear(hidden_dim, hidden_dim), torch.nn.ReLU()]
+        layers.append(torch.nn.Linear(hidden_dim, CHUNK_SIZE * STATE_DIM))
+        self.net = torch.nn.Sequential(*layers)
+
+    @torch.no_grad()
+    def predict_action_chunk(self, observation: dict[str, torch.Tensor]) -> torch.Tensor:
+        state = observation[OBS_STATE]
+        return self.net(state).view(len(state), CHUNK_SIZE, STATE_DIM)
+
+
+def start_server(inference_latency: float, policy: SyntheticPolicy, port: int):
+    config = PolicyServerConfig(
+        host="127.0.0.1", port=port, inference_latency=inference_latency, obs_queue_timeout=0.1
+    )
+    policy_server = PolicyServer(config)
+    # Per-request logging (of the server and of the chunked transfers) would dominate the timings
+    policy_server.logger.setLevel(logging.WARNING)
+    logging.getLogger().setLevel(logging.WARNING)
+    policy_server.policy = policy
+    policy_server.device = "cpu"
+    policy_server.actions_per_chunk = CHUNK_SIZE
+    policy_server.lerobot_features = {
+        OBS_STATE: {
+            "dtype": "float32",
+            "shape": [STATE_DIM],
+            "names": [f"joint{i}" for i in range(STATE_DIM)],
+        }
+    }
+    policy_server.preprocessor = lambda observation: observation
+    policy_server.postprocessor = lambda action: action
+
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+    services_pb2_grpc.add_AsyncInferenceServicer_to_server(policy_server, server)
+    server.add_insecure_port(f"127.0.0.1:{port}")
+    server.start()
+    return policy_server, server
+
+
+def make_observation(timestep: int) -> TimedObservation:
+    return TimedObservation(
+        timestamp=time.time(),
+        timestep=timestep,
+        observation={f"joint{i}": float(np.random.randn()) for i in range(STATE_DIM)},
+        must_go=True,
+    )
+
+
+def poll_latencies(stub, num_observations: int) -> list[float]:
+    received = {}
+    received_cond = threading.Condition()
+    stop = threading.Event()
+
+    def receive_actions():
+        while not stop.is_set():
+            actions = stub.GetActions(services_pb2.Empty())
+            if actions.data:
+                timestep = pickle.loads(actions.data)[0].get_timestep()  # nosec
+                with received_cond:
+                    received[timestep] = time.perf_counter()
+                    received_cond.notify_all()
+
+    receiver = threading.Thread(target=receive_actions)
+    receiver.start()
+
+    latencies = []
+    for timestep in range(num_observations):
+        start = time.perf_counter()
+        stub.SendObservations(
+            send_bytes_in_chunks(pickle.dumps(make_observation(timestep)), services_pb2.Observation)  # nosec
+        )
+        with received_cond:
+            received_cond.wait_for(lambda timestep=timestep: timestep in received)
+            latencies.append(received[timestep] - start)
+
+    stop.set()
+    receiver.join()
+    return latencies
+
+
+def stream_latencies(stub, num_observations: int) -> list[float]:
+    observations = Queue()
+
+    def observation_stream():
+        while (observation := observations.get()) is not None:
+            yield from send_bytes_in_chunks(pickle.dumps(observation), services_pb2.Observation)  # nosec
+
+    responses = stub.StreamActions(observation_stream())
+
+    latencies = []
+    for timestep in range(num_observations):
+        start = time.perf_counter()
+        observations.put(make_observation(timestep))
+        actions = next(responses)
+        latencies.append(time.perf_counter() - start)
+        assert pickle.loads(actions.data)[0].get_timestep() == timestep  # nosec
+
+    observations.put(None)
+    responses.cancel()
+    return latencies
+
+
+def run(mode: str, inference_latency: float, args, policy: SyntheticPolicy, port: int):
+    policy_server, server = start_server(inference_latency, policy, port)
+    channel = grpc.insecure_channel(f"127.0.0.1:{port}", grpc_channel_options())
+    stub = services_pb2_grpc.AsyncInferenceStub(channel)
+    stub.Ready(services_pb2.Empty())
+
+    measure = poll_latencies if mode == "poll" else stream_latencies
+    latencies = measure(stub, args.warmup + args.num_observations)[args.warmup :]
+
+    channel.close()
+    policy_server.stop()
+    server.stop(grace=None)
+
+    return np.percentile(latencies, [50, 99]) * 1e3
+
+
+def main(args):
+    torch.set_num_threads(args.torch_threads)
+    policy = SyntheticPolicy(args.hidden_dim, args.num_layers).eval()
+    port = args.port
+
+    print(f"{'inference_latency (ms)':>22} {'mode':>7} {'p50 (ms)':>9} {'p99 (ms)':>9}")
+    for inference_latency in args.inference_latencies or [DEFAULT_INFERENCE_LATENCY, 0.0]:
+        for mode in ["poll", "stream"]:
+            p50, p99 = run(mode, inference_latency, args, policy, port)
+            print(f"{inference_latency * 1e3:>22.1f} {mode:>7} {p50:>9.2f} {p99:>9.2f}")
+            port += 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--inference-latency",
+        type=float,
+        action="append",
+        dest="inference_latencies",
+        help="Server `inference_latency` in seconds (can be repeated). Defaults to 1/fps and 0.",
+    )
+    parser.add_argument("--num-observations", type=int, default=200, help="Measured observations per mode.")
+    parser.add_argument("--warmup", type=int, default=20, help="Unmeasured observations per mode.")
+    parser.add_argument("--hidden-dim", type=int, default=512, help="Width of the synthetic policy.")
+    parser.add_argument("--num-layers", type=int, default=4, help="Depth of the synthetic policy.")
+    parser.add_argument("--torch-threads", type=int, default=1, help="Number of intra-op torch threads.")
+    parser.add_argument("--port", type=int, default=50251, help="First loopback port to serve on.")
+    main(parser.parse_args())
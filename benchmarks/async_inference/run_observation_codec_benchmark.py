@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+
+# Copyright 2026 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Bytes on the wire and encode/decode latency of the async-inference observation codecs.
+
+A synthetic observation of a 6-DoF arm with several cameras is encoded with the legacy `pickle` path and with
+every codec of `lerobot.async_inference.observation_codec`. The camera frames are smooth synthetic scenes with
+sensor noise, so that the compression ratios are in the range of real camera frames rather than of random
+pixels. Decoding is timed both sequentially and on a thread pool, as done by the `PolicyServer`.
+
+```bash
+python benchmarks/async_inference/run_observation_codec_benchmark.py --num-cameras 3 --quality 80 --quality 90
+```
+"""
+
+import argparse
+import pickle  # nosec
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from lerobot.async_inference.helpers import TimedObservation
+from lerobot.async_inference.observation_codec import IMAGE_CODECS, decode_observation, encode_observation
+
+MOTORS = ["shoulder_pan", "shoulder_lift", "elbow_flex", "wrist_flex", "wrist_roll", "gripper"]
+
+
+def make_frame(height: int, width: int, rng: np.random.Generator) -> np.ndarray:
+    y, x = np.mgrid[0:height, 0:width].astype(np.float32)
+    frame = np.empty((height, width, 3), dtype=np.float32)
+    for channel in range(3):
+        fx, fy, phase = rng.uniform(0.5, 4, size=3)
+        frame[..., channel] = 128 + 80 * np.sin(fx * 2 * np.pi * x / width + phase) * np.cos(
+            fy * 2 * np.pi * y / height
+        )
+    # A few flat objects with sharp edges
+    for _ in range(8):
+        top, left = rng.integers(0, height - height // 4), rng.integers(0, width - width // 4)
+        frame[top : top + height // 6, left : left + width // 6] = rng.uniform(0, 255, size=3)
+    frame += rng.normal(0, 3, size=frame.shape)
+    return np.clip(frame, 0, 255).astype(np.uint8)
+
+
+def make_observation(num_cameras: int, height: int, width: int, rng: np.random.Generator) -> TimedObservation:
+    observation = {f"{motor}.pos": float(rng.normal()) for motor in MOTORS}
+    for i in range(num_cameras):
+        observation[f"camera{i}"] = make_frame(height, width, rng)
+    observation["task"] = "pick up the cube"
+    return TimedObservation(timestamp=time.time(), timestep=0, observation=observation, must_go=True)
+
+
+def time_fn(fn, num_iterations: int) -> float:
+    fn()
+    start = time.perf_counter()
+    for _ in range(num_iterations):
+        fn()
+    return (time.perf_counter() - start) / num_iterations
+
+
+def main(args):
+    rng = np.random.default_rng(0)
+    obs = make_observation(args.num_cameras, args.height, args.width, rng)
+    executor = ThreadPoolExecutor(max_workers=args.decode_workers)
+
+    configurations = [("pickle", None)]
+    for codec in IMAGE_CODECS:
+        qualities = (args.qualities or [90]) if codec != "raw" else [None]
+        configurations += [(codec, quality) for quality in qualities]
+
+    print(
+        f"{args.num_cameras} cameras {args.width}x{args.height}, sizes per observation and bandwidth at {args.fps} Hz"
+    )
+    print(
+        f"{'codec':>8} {'quality':>8} {'KB':>9} {'MB/s':>8} {'encode (ms)':>12} {'decode (ms)':>12} "
+        f"{'pool decode (ms)':>17}"
+    )
+    for codec, quality in configurations:
+        if codec == "pickle":
+
+            def encode():
+                return pickle.dumps(obs)  # nosec
+
+        else:
+
+            def encode(codec=codec, quality=quality):
+                return encode_observation(obs, codec, quality or 0)
+
+        data = encode()
+        encode_s = time_fn(encode, args.num_iterations)
+        decode_s = time_fn(lambda data=data: decode_observation(data), args.num_iterations)
+        pool_decode_s = time_fn(lambda data=data: decode_observation(data, executor), args.num_iterations)
+        print(
+            f"{codec:>8} {quality or '-':>8} {len(data) / 1024:>9.1f} {len(data) * args.fps / 1e6:>8.2f} "
+            f"{encode_s * 1e3:>12.2f} {decode_s * 1e3:>12.2f} {pool_decode_s * 1e3:>17.2f}"
+        )
+    executor.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num-cameras", type=int, default=3, help="Number of cameras of the robot.")
+    parser.add_argument("--height", type=int, default=480, help="Height of the camera frames.")
+    parser.add_argument("--width", type=int, default=640, help="Width of the camera frames.")
+    parser.add_argument("--fps", type=int, default=30, help="Observation rate used for the bandwidth.")
+    parser.add_argument(
+        "--quality",
+        type=int,
+        action="append",
+        dest="qualities",
+        help="Quality of the lossy codecs (can be repeated). Defaults to 90.",
+    )
+    parser.add_argument("--decode-workers", type=int, default=4, help="Threads of the decoding pool.")
+    parser.add_argument("--num-iterations", type=int, default=20, help="Timed iterations per codec.")
+    main(parser.parse_args())
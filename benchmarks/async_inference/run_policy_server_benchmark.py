@@ -0,0 +1,188 @@
+#!/usr/bin/env python
+
+# Copyright 2026 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Load generator for the async-inference `BatchingPolicyServer`.
+
+A server with a synthetic MLP policy is started on a loopback port, and a number of simulated robot clients
+(one gRPC channel each) repeatedly send an observation and request the matching action chunk. For each number
+of clients, the server is run without batching (`max_batch_size=1`, one forward pass per request) and with
+batching (`max_batch_size` = number of clients), and the p50/p99 request latency and the total throughput
+are reported.
+
+```bash
+python benchmarks/async_inference/run_policy_server_benchmark.py --num-clients 1 --num-clients 8 --device cuda
+```
+"""
+
+import argparse
+import logging
+import pickle  # nosec
+import threading
+import time
+from concurrent import futures
+
+import grpc
+import numpy as np
+import torch
+
+from lerobot.async_inference.configs import PolicyServerConfig
+from lerobot.async_inference.helpers import TimedObservation
+from lerobot.async_inference.policy_server import BatchingPolicyServer
+from lerobot.transport import services_pb2, services_pb2_grpc  # type: ignore
+from lerobot.transport.utils import grpc_channel_options, send_bytes_in_chunks
+from lerobot.utils.constants import OBS_STATE
+
+STATE_DIM = 14
+CHUNK_SIZE = 50
+
+
+class SyntheticPolicy(torch.nn.Module):
+    """MLP mapping the state to a chunk of actions, standing in for a real policy."""
+
+    class _Config:
+        image_features = {}
+
+    def __init__(self, hidden_dim: int, num_layers: int):
+        super().__init__()
+        self.config = self._Config()
+        layers = [torch.nn.Linear(STATE_DIM, hidden_dim), torch.nn.ReLU()]
+        for _ in range(num_layers):
+            layers += [torch.nn.Linear(hidden_dim, hidden_dim), torch.nn.ReLU()]
+        layers.append(torch.nn.Linear(hidden_dim, CHUNK_SIZE * STATE_DIM))
+        self.net = torch.nn.Sequential(*layers)
+
+    @torch.no_grad()
+    def predict_action_chunk(self, observation: dict[str, torch.Tensor]) -> torch.Tensor:
+        state = observation[OBS_STATE]
+        return self.net(state).view(len(state), CHUNK_SIZE, STATE_DIM)
+
+
+def start_server(max_batch_size: int, batch_timeout: float, policy: SyntheticPolicy, device: str, port: int):
+    config = PolicyServerConfig(
+        host="127.0.0.1",
+        port=port,
+        inference_latency=0.0,
+        obs_queue_timeout=1.0,
+        max_batch_size=max_batch_size,
+        batch_timeout=batch_timeout,
+    )
+    policy_server = BatchingPolicyServer(config)
+    # Per-request logging would dominate the timings
+    policy_server.logger.setLevel(logging.WARNING)
+    policy_server.policy = policy
+    policy_server.device = device
+    policy_server.actions_per_chunk = CHUNK_SIZE
+    policy_server.lerobot_features = {
+        OBS_STATE: {
+            "dtype": "float32",
+            "shape": [STATE_DIM],
+            "names": [f"joint{i}" for i in range(STATE_DIM)],
+        }
+    }
+
+    def preprocessor(observation):
+        observation[OBS_STATE] = observation[OBS_STATE].to(device, torch.float32)
+        return observation
+
+    policy_server.preprocessor = preprocessor
+    policy_server.postprocessor = lambda action: action.cpu()
+
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=2 * max(max_batch_size, 8) + 4))
+    services_pb2_grpc.add_AsyncInferenceServicer_to_server(policy_server, server)
+    server.add_insecure_port(f"127.0.0.1:{port}")
+    server.start()
+    return policy_server, server
+
+
+def client_loop(port: int, stop: threading.Event, latencies: list[float]):
+    channel = grpc.insecure_channel(f"127.0.0.1:{port}", grpc_channel_options())
+    stub = services_pb2_grpc.AsyncInferenceStub(channel)
+    stub.Ready(services_pb2.Empty())
+
+    timestep = 0
+    while not stop.is_set():
+        observation = TimedObservation(
+            timestamp=time.time(),
+            timestep=timestep,
+            observation={f"joint{i}": float(np.random.randn()) for i in range(STATE_DIM)},
+            must_go=True,
+        )
+        start = time.perf_counter()
+        # Like `RobotClient`, a `GetActions` call is already pending when the observation is sent
+        actions_future = stub.GetActions.future(services_pb2.Empty())
+        stub.SendObservations(
+            send_bytes_in_chunks(pickle.dumps(observation), services_pb2.Observation)  # nosec
+        )
+        actions = actions_future.result()
+        if actions.data:
+            latencies.append(time.perf_counter() - start)
+        timestep += 1
+    channel.close()
+
+
+def run(num_clients: int, max_batch_size: int, args, policy: SyntheticPolicy, port: int):
+    policy_server, server = start_server(max_batch_size, args.batch_timeout, policy, args.device, port)
+    stop = threading.Event()
+    latencies = [[] for _ in range(num_clients)]
+    threads = [
+        threading.Thread(target=client_loop, args=(port, stop, latencies[i])) for i in range(num_clients)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(args.warmup)
+    for client_latencies in latencies:
+        client_latencies.clear()
+    time.sleep(args.duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    policy_server.stop()
+    server.stop(grace=None)
+
+    all_latencies = np.concatenate([np.asarray(client_latencies) for client_latencies in latencies])
+    p50, p99 = np.percentile(all_latencies, [50, 99]) * 1e3
+    return p50, p99, len(all_latencies) / args.duration
+
+
+def main(args):
+    torch.set_num_threads(args.torch_threads)
+    policy = SyntheticPolicy(args.hidden_dim, args.num_layers).to(args.device).eval()
+    port = args.port
+
+    print(f"{'clients':>8} {'max_batch':>10} {'p50 (ms)':>9} {'p99 (ms)':>9} {'chunks/s':>9}")
+    for num_clients in args.num_clients or [1, 2, 4, 8]:
+        for max_batch_size in sorted({1, num_clients}):
+            p50, p99, throughput = run(num_clients, max_batch_size, args, policy, port)
+            print(f"{num_clients:>8} {max_batch_size:>10} {p50:>9.2f} {p99:>9.2f} {throughput:>9.1f}")
+            port += 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--num-clients",
+        type=int,
+        action="append",
+        help="Number of concurrent clients (can be repeated). Defaults to 1, 2, 4 and 8.",
+    )
+    parser.add_argument("--batch-timeout", type=float, default=0.005, help="Batching latency budget (s).")
+    parser.add_argument("--hidden-dim", type=int, default=2048, help="Width of the synthetic policy.")
+    parser.add_argument("--num-layers", type=int, default=8, help="Depth of the synthetic policy.")
+    parser.add_argument("--device", type=str, default="cpu", help="Device the policy runs on.")
+    parser.add_argument("--torch-threads", type=int, default=4, help="Number of intra-op torch threads.")
+    parser.add_argument("--duration", type=float, default=5.0, help="Measured seconds per configuration.")
+    parser.add_argument("--warmup", type=float, default=1.0, help="Unmeasured seconds per configuration.")
+    parser.add_argument("--port", type=int, default=50151, help="First loopback port to serve on.")
+    main(parser.parse_args())
@@ -0,0 +1,194 @@
+#!/usr/bin/env python
+
+# Copyright 2026 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Loopback benchmark of the ZMQ camera wire formats.
+
+Publishes synthetic frames of several cameras at a fixed fps with the `FramePublisher` of the image server,
+and receives them on a SUB socket subscribed to every camera, decoding them as `ZMQCamera` does. Compares
+the JSON protocol (base64 JPEGs), and the binary protocol with JPEG and raw payloads, on:
+
+- the bytes sent per frame,
+- the server time spent encoding a frame,
+- the client time spent parsing and decoding a received frame,
+- the latency from the capture timestamp to the decoded frame.
+
+```bash
+python benchmarks/cameras/run_zmq_camera_benchmark.py --num-cameras 2 --height 480 --width 640 --fps 30
+```
+"""
+
+import argparse
+import json
+import socket
+import threading
+import time
+
+import numpy as np
+import zmq
+
+from lerobot.cameras.zmq.configuration_zmq import ZMQProtocol
+from lerobot.cameras.zmq.image_server import FramePublisher, encode_frame
+from lerobot.cameras.zmq.protocol import (
+    FrameEncoding,
+    decode_json_image,
+    decode_payload,
+    subscribe,
+    unpack_header,
+)
+
+
+def make_image(height: int, width: int, seed: int) -> np.ndarray:
+    """A smooth gradient with some noise, which compresses roughly like a camera image."""
+    rng = np.random.default_rng(seed)
+    y, x = np.mgrid[0:height, 0:width]
+    image = np.stack([x * 255 // width, y * 255 // height, (x + y) * 255 // (width + height)], axis=-1)
+    return np.clip(image + rng.integers(-8, 8, image.shape), 0, 255).astype(np.uint8)
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def run(args, protocol: ZMQProtocol, encoding: FrameEncoding) -> dict:
+    port = free_port()
+    context = zmq.Context()
+    pub = context.socket(zmq.PUB)
+    pub.setsockopt(zmq.SNDHWM, 20)
+    pub.setsockopt(zmq.LINGER, 0)
+    pub.bind(f"tcp://127.0.0.1:{port}")
+    sub = context.socket(zmq.SUB)
+    sub.setsockopt(zmq.RCVTIMEO, 2000)
+    if protocol == ZMQProtocol.BINARY:
+        subscribe(sub)
+    else:
+        sub.setsockopt_string(zmq.SUBSCRIBE, "")
+    sub.connect(f"tcp://127.0.0.1:{port}")
+    # Let the subscription reach the publisher
+    time.sleep(0.5)
+
+    images = {f"camera_{i}": make_image(args.height, args.width, i) for i in range(args.num_cameras)}
+    publisher = FramePublisher(pub, protocol, encoding)
+    encode_s, sent_bytes = [], []
+
+    # Count the bytes on the wire by wrapping the socket sends
+    def send_multipart(parts, *a, **kw):
+        sent_bytes.append(sum(len(memoryview(part).cast("B")) for part in parts))
+        return zmq.Socket.send_multipart(pub, parts, *a, **kw)
+
+    def send_string(message, *a, **kw):
+        sent_bytes.append(len(message.encode("utf-8")) / max(len(images), 1))
+        return zmq.Socket.send_string(pub, message, *a, **kw)
+
+    pub.send_multipart = send_multipart
+    pub.send_string = send_string
+
+    def publish_loop():
+        for _ in range(args.num_frames):
+            t0 = time.perf_counter()
+            frames = {}
+            for name, image in images.items():
+                start = time.perf_counter()
+                encoded = encode_frame(image, protocol, encoding, args.jpeg_quality)
+                encode_s.append(time.perf_counter() - start)
+                frames[name] = (image, encoded, time.time())
+            publisher.publish(frames)
+            time.sleep(max(0.0, 1 / args.fps - (time.perf_counter() - t0)))
+
+    thread = threading.Thread(target=publish_loop, daemon=True)
+    thread.start()
+
+    decode_s, latencies = [], []
+    received, dropped = 0, 0
+    last_sequences: dict[str, int] = {}
+    expected = args.num_frames * (args.num_cameras if protocol == ZMQProtocol.BINARY else 1)
+    try:
+        while received < expected:
+            if protocol == ZMQProtocol.BINARY:
+                parts = sub.recv_multipart(copy=False)
+                start = time.perf_counter()
+                header = unpack_header(parts[0].bytes, parts[1].bytes)
+                decode_payload(header, parts[2].buffer)
+                timestamps = [header.timestamp]
+                last = last_sequences.get(header.camera_name)
+                if last is not None:
+                    dropped += header.sequence - last - 1
+                last_sequences[header.camera_name] = header.sequence
+            else:
+                message = sub.recv_string()
+                start = time.perf_counter()
+                data = json.loads(message)
+                for image_b64 in data["images"].values():
+                    decode_json_image(image_b64)
+                timestamps = list(data["timestamps"].values())
+            now = time.time()
+            decode_s.append((time.perf_counter() - start) / len(timestamps))
+            latencies.extend(now - timestamp for timestamp in timestamps)
+            received += 1
+    except zmq.Again:
+        pass
+    finally:
+        thread.join()
+        sub.close(linger=0)
+        pub.close()
+        context.term()
+
+    latency_ms = np.array(latencies) * 1e3
+    return {
+        "bytes_per_frame": float(np.mean(sent_bytes)),
+        "encode_ms": float(np.mean(encode_s) * 1e3),
+        "decode_ms": float(np.mean(decode_s) * 1e3),
+        "latency_ms_p50": float(np.percentile(latency_ms, 50)),
+        "latency_ms_p99": float(np.percentile(latency_ms, 99)),
+        "received": received,
+        "expected": expected,
+        "dropped": dropped,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--num-cameras", type=int, default=2)
+    parser.add_argument("--height", type=int, default=480)
+    parser.add_argument("--width", type=int, default=640)
+    parser.add_argument("--fps", type=int, default=30)
+    parser.add_argument("--num-frames", type=int, default=150)
+    parser.add_argument("--jpeg-quality", type=int, default=80)
+    args = parser.parse_args()
+
+    print(
+        f"{args.num_cameras} camera(s) {args.height}x{args.width} @ {args.fps} fps, {args.num_frames} frames, "
+        f"JPEG quality {args.jpeg_quality}"
+    )
+    modes = [
+        ("json (base64)", ZMQProtocol.JSON, FrameEncoding.JPEG),
+        ("binary jpeg", ZMQProtocol.BINARY, FrameEncoding.JPEG),
+        ("binary raw", ZMQProtocol.BINARY, FrameEncoding.RAW),
+    ]
+    for name, protocol, encoding in modes:
+        result = run(args, protocol, encoding)
+        print(
+            f"{name:>14}: {result['bytes_per_frame'] / 1e3:8.1f} kB/frame | encode {result['encode_ms']:.2f} ms/frame, "
+            f"decode {result['decode_ms']:.2f} ms/frame | latency p50 {result['latency_ms_p50']:.2f} ms, "
+            f"p99 {result['latency_ms_p99']:.2f} ms | received {result['received']}/{result['expected']}, "
+            f"dropped {result['dropped']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
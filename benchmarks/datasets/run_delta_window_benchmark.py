@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+
+# Copyright 2026 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Microbenchmark of the delta-timestamp window gather of `DatasetReader`.
+
+Compares the vectorized gather (NumPy episode bounds + one Arrow `take`) used by `DatasetReader.get_item`
+with the previous per-key, per-index Python path (list comprehensions + `torch.stack` over HF rows).
+
+A synthetic dataset with state/action features is recorded in a temporary directory, so the benchmark
+doesn't need network access:
+
+```bash
+python benchmarks/datasets/run_delta_window_benchmark.py --horizon 50 --horizon 100 --action-dim 14
+```
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import torch
+
+from lerobot.datasets.lerobot_dataset import LeRobotDataset
+
+
+def create_dataset(root: Path, num_episodes: int, episode_length: int, action_dim: int, fps: int):
+    features = {
+        "observation.state": {"dtype": "float32", "shape": (action_dim,), "names": None},
+        "action": {"dtype": "float32", "shape": (action_dim,), "names": None},
+    }
+    dataset = LeRobotDataset.create(
+        repo_id="benchmark/delta_window", fps=fps, features=features, root=root, use_videos=False
+    )
+    for _ in range(num_episodes):
+        for _ in range(episode_length):
+            dataset.add_frame(
+                {
+                    "observation.state": np.random.randn(action_dim).astype(np.float32),
+                    "action": np.random.randn(action_dim).astype(np.float32),
+                    "task": "benchmark",
+                }
+            )
+        dataset.save_episode()
+    dataset.finalize()
+
+
+def legacy_query(reader, abs_idx: int, ep_idx: int) -> dict:
+    """Reference implementation of the previous list-based window gather."""
+    ep = reader._meta.episodes[ep_idx]
+    ep_start = ep["dataset_from_index"]
+    ep_end = ep["dataset_to_index"]
+    query_indices = {
+        key: [max(ep_start, min(ep_end - 1, abs_idx + delta)) for delta in delta_idx]
+        for key, delta_idx in reader.delta_indices.items()
+    }
+    item = {
+        f"{key}_is_pad": torch.BoolTensor(
+            [(abs_idx + delta < ep_start) | (abs_idx + delta >= ep_end) for delta in delta_idx]
+        )
+        for key, delta_idx in reader.delta_indices.items()
+    }
+    for key, q_idx in query_indices.items():
+        item[key] = torch.stack(reader.hf_dataset[q_idx][key])
+    return item
+
+
+def vectorized_query(reader, abs_idx: int, ep_idx: int) -> dict:
+    query_indices, padding = reader._get_query_indices(abs_idx, ep_idx)
+    return {**padding, **reader._query_hf_dataset(query_indices)}
+
+
+def time_fn(fn, reader, samples: list[tuple[int, int]]) -> float:
+    start = time.perf_counter()
+    for abs_idx, ep_idx in samples:
+        fn(reader, abs_idx, ep_idx)
+    return (time.perf_counter() - start) / len(samples)
+
+
+def main(
+    num_episodes: int, episode_length: int, action_dim: int, horizons: list[int], num_samples: int, fps: int
+):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        root = Path(tmp_dir) / "dataset"
+        create_dataset(root, num_episodes, episode_length, action_dim, fps)
+
+        print(f"{'horizon':>8} {'legacy (ms)':>12} {'vectorized (ms)':>16} {'speedup':>8}")
+        for horizon in horizons:
+            delta_timestamps = {
+                "observation.state": [-1 / fps, 0.0],
+                "action": [i / fps for i in range(horizon)],
+            }
+            dataset = LeRobotDataset("benchmark/delta_window", root=root, delta_timestamps=delta_timestamps)
+            reader = dataset.reader
+            rel_indices = np.random.randint(0, len(dataset), size=num_samples)
+            rows = reader.hf_dataset[rel_indices.tolist()]
+            samples = [
+                (abs_idx.item(), ep_idx.item())
+                for abs_idx, ep_idx in zip(rows["index"], rows["episode_index"], strict=True)
+            ]
+
+            # Sanity check before timing
+            expected = legacy_query(reader, *samples[0])
+            actual = vectorized_query(reader, *samples[0])
+            for key, value in expected.items():
+                assert torch.equal(value, actual[key]), key
+
+            legacy_s = time_fn(legacy_query, reader, samples)
+            vectorized_s = time_fn(vectorized_query, reader, samples)
+            print(
+                f"{horizon:>8} {legacy_s * 1e3:>12.3f} {vectorized_s * 1e3:>16.3f} "
+                f"{legacy_s / vectorized_s:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num-episodes", type=int, default=20, help="Number of synthetic episodes.")
+    parser.add_argument("--episode-length", type=int, default=300, help="Number of frames per episode.")
+    parser.add_argument("--action-dim", type=int, default=14, help="Dimension of state and action.")
+    parser.add_argument(
+        "--horizon",
+        type=int,
+        action="append",
+        dest="horizons",
+        help="Action window length (can be repeated). Defaults to 1, 50 and 100.",
+    )
+    parser.add_argument("--num-samples", type=int, default=500, help="Number of timed queries per path.")
+    parser.add_argument("--fps", type=int, default=30, help="Frames per second of the synthetic dataset.")
+    args = parser.parse_args()
+    main(
+        num_episodes=args.num_episodes,
+        episode_length=args.episode_length,
+        action_dim=args.action_dim,
+        horizons=args.horizons or [1, 50, 100],
+        num_samples=args.num_samples,
+        fps=args.fps,
+    )
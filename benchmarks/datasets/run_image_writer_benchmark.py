@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+
+# Copyright 2026 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Recording-loop benchmark of the `AsyncImageWriter` process mode.
+
+Simulates a recording loop that saves one frame per camera at a fixed fps, and compares the time spent in
+`save_image`, the CPU time of the recording process (which includes the queue feeder thread that pickles
+the frames in the background) and the stability of the loop period when the frames are pickled through the
+queue (`--shared-memory-slots 0`, the previous transport) and when they go through shared-memory slots:
+
+```bash
+python benchmarks/datasets/run_image_writer_benchmark.py --num-cameras 2 --height 720 --width 1280 --fps 30
+```
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from lerobot.datasets.image_writer import AsyncImageWriter
+
+
+def run_loop(args, shared_memory_slots: int, root: Path) -> dict:
+    writer = AsyncImageWriter(
+        num_processes=args.num_processes,
+        num_threads=args.num_threads,
+        shared_memory_slots=shared_memory_slots,
+    )
+    frames = [
+        np.random.randint(0, 255, (args.height, args.width, 3), dtype=np.uint8)
+        for _ in range(args.num_cameras)
+    ]
+    save_s, periods = [], []
+    period = 1 / args.fps
+    try:
+        cpu_start = time.process_time()
+        last_step = time.perf_counter()
+        for frame_index in range(args.num_frames):
+            step_start = time.perf_counter()
+            for camera, frame in enumerate(frames):
+                fpath = root / f"camera_{camera}" / f"frame_{frame_index:06d}.png"
+                fpath.parent.mkdir(parents=True, exist_ok=True)
+                writer.save_image(frame, fpath)
+            save_s.append(time.perf_counter() - step_start)
+            time.sleep(max(0.0, period - (time.perf_counter() - step_start)))
+            now = time.perf_counter()
+            periods.append(now - last_step)
+            last_step = now
+        cpu_ms_per_step = (time.process_time() - cpu_start) / args.num_frames * 1e3
+        stats = writer.get_stats()
+        writer.wait_until_done()
+    finally:
+        writer.stop()
+
+    save_ms = np.array(save_s) * 1e3
+    achieved_fps = 1 / np.array(periods[1:])
+    return {
+        "save_ms_p50": np.percentile(save_ms, 50),
+        "save_ms_p99": np.percentile(save_ms, 99),
+        "save_ms_max": save_ms.max(),
+        "cpu_ms_per_step": cpu_ms_per_step,
+        "fps_mean": achieved_fps.mean(),
+        "fps_std": achieved_fps.std(),
+        "late_steps": int((np.array(save_s) > period).sum()),
+        **stats,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--num-cameras", type=int, default=2)
+    parser.add_argument("--height", type=int, default=480)
+    parser.add_argument("--width", type=int, default=640)
+    parser.add_argument("--fps", type=int, default=30)
+    parser.add_argument("--num-frames", type=int, default=300)
+    parser.add_argument("--num-processes", type=int, default=2)
+    parser.add_argument("--num-threads", type=int, default=4)
+    parser.add_argument("--shared-memory-slots", type=int, default=30)
+    args = parser.parse_args()
+
+    print(
+        f"{args.num_cameras} camera(s) {args.height}x{args.width} @ {args.fps} fps, {args.num_frames} steps, "
+        f"{args.num_processes} process(es) x {args.num_threads} thread(s)"
+    )
+    for name, slots in [("pickled queue", 0), ("shared memory", args.shared_memory_slots)]:
+        with tempfile.TemporaryDirectory() as root:
+            result = run_loop(args, slots, Path(root))
+        print(
+            f"{name:>14}: save_image p50 {result['save_ms_p50']:.2f} ms, p99 {result['save_ms_p99']:.2f} ms, "
+            f"max {result['save_ms_max']:.2f} ms, recorder CPU {result['cpu_ms_per_step']:.2f} ms/step | fps {result['fps_mean']:.2f} +/- {result['fps_std']:.2f}, "
+            f"{result['late_steps']} late step(s) | shared memory images {result['shared_memory_images']}, "
+            f"pool full {result['pool_full_images']}, max slots in use {result['max_slots_in_use']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
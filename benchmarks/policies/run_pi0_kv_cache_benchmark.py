@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+
+# Copyright 2026 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Action chunk latency and peak memory of the pi0 denoising loop, with and without a prefix KV cache copy.
+
+A randomly initialized `PI0Pytorch` encodes a random prefix (standing in for the image and language tokens)
+into a KV cache, then runs the flow-matching denoising steps of an action chunk on top of it:
+
+- `deepcopy`: the prefix cache is deep-copied before every denoising step, as previously done by
+  `PI0Pytorch.denoise_step` to keep the suffix keys and values out of the shared cache.
+- `read_only`: the suffix attention reads the prefix cache through `ReadOnlyPrefixCache`, without copying it.
+
+Each mode runs in its own process so that peak memory is measured independently: the CUDA peak allocation on
+GPU, the peak resident set size of the process on CPU. Both modes must predict the same actions.
+
+```bash
+python benchmarks/policies/run_pi0_kv_cache_benchmark.py --device cuda --dtype bfloat16
+# Reduced model for a quick CPU run
+python benchmarks/policies/run_pi0_kv_cache_benchmark.py --num-layers 4 --prefix-len 560
+```
+"""
+
+import argparse
+import copy
+import multiprocessing
+import resource
+import time
+
+import numpy as np
+import torch
+
+from lerobot.policies.pi0 import modeling_pi0
+from lerobot.policies.pi0.configuration_pi0 import PI0Config
+from lerobot.policies.pi0.modeling_pi0 import PI0Pytorch, make_att_2d_masks
+
+
+def build_model(args) -> PI0Pytorch:
+    if args.num_layers is not None:
+        get_gemma_config = modeling_pi0.get_gemma_config
+
+        def get_reduced_gemma_config(variant):
+            config = get_gemma_config(variant)
+            config.depth = args.num_layers
+            return config
+
+        modeling_pi0.get_gemma_config = get_reduced_gemma_config
+
+    config = PI0Config(
+        paligemma_variant=args.paligemma_variant,
+        action_expert_variant=args.action_expert_variant,
+        dtype=args.dtype,
+        num_inference_steps=args.num_steps,
+        device=args.device,
+    )
+    return PI0Pytorch(config).to(args.device).eval()
+
+
+@torch.no_grad()
+def predict_chunk(model: PI0Pytorch, prefix_embs: torch.Tensor, state: torch.Tensor, noise, mode: str):
+    """Same computation as `PI0Pytorch.sample_actions`, starting from the prefix embeddings."""
+    bsize, prefix_len = prefix_embs.shape[:2]
+    prefix_pad_masks = torch.ones(bsize, prefix_len, dtype=torch.bool, device=prefix_embs.device)
+    prefix_att_masks = torch.zeros(bsize, prefix_len, dtype=torch.bool, device=prefix_embs.device)
+    prefix_att_2d_masks_4d = model._prepare_attention_masks_4d(
+        make_att_2d_masks(prefix_pad_masks, prefix_att_masks)
+    )
+    model.paligemma_with_expert.paligemma.model.language_model.config._attn_implementation = "eager"
+    _, past_key_values = model.paligemma_with_expert.forward(
+        attention_mask=prefix_att_2d_masks_4d,
+        position_ids=torch.cumsum(prefix_pad_masks, dim=1) - 1,
+        past_key_values=None,
+        inputs_embeds=[prefix_embs, None],
+        use_cache=True,
+    )
+
+    dt = -1.0 / model.config.num_inference_steps
+    x_t = noise
+    for step in range(model.config.num_inference_steps):
+        timestep = torch.tensor(1.0 + step * dt, dtype=torch.float32, device=noise.device).expand(bsize)
+        cache = copy.deepcopy(past_key_values) if mode == "deepcopy" else past_key_values
+        x_t = x_t + dt * model.denoise_step(state, prefix_pad_masks, cache, x_t, timestep)
+    return x_t
+
+
+def synchronize(device: str):
+    if device.startswith("cuda"):
+        torch.cuda.synchronize()
+
+
+def run_mode(mode: str, args) -> tuple[np.ndarray, float, torch.Tensor]:
+    torch.set_num_threads(args.torch_threads)
+    torch.manual_seed(0)
+    model = build_model(args)
+    width = model.paligemma_with_expert.paligemma.config.text_config.hidden_size
+    dtype = torch.bfloat16 if args.dtype == "bfloat16" else torch.float32
+    prefix_embs = torch.randn(args.batch_size, args.prefix_len, width, dtype=dtype, device=args.device)
+    state = torch.randn(args.batch_size, model.config.max_state_dim, device=args.device)
+    noise = torch.randn(
+        args.batch_size, model.config.chunk_size, model.config.max_action_dim, device=args.device
+    )
+
+    actions = predict_chunk(model, prefix_embs, state, noise, mode)
+    if args.device.startswith("cuda"):
+        torch.cuda.reset_peak_memory_stats()
+
+    latencies = []
+    for _ in range(args.num_chunks):
+        synchronize(args.device)
+        start = time.perf_counter()
+        predict_chunk(model, prefix_embs, state, noise, mode)
+        synchronize(args.device)
+        latencies.append(time.perf_counter() - start)
+
+    if args.device.startswith("cuda"):
+        peak_mb = torch.cuda.max_memory_allocated() / 2**20
+    else:
+        # ru_maxrss is in KiB on Linux
+        peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2**10
+    return np.array(latencies), peak_mb, actions.float().cpu()
+
+
+def main(args):
+    # A fresh process per mode, so that the peak memory of one mode does not hide the other one
+    context = multiprocessing.get_context("spawn")
+    results = {}
+    for mode in ["deepcopy", "read_only"]:
+        with context.Pool(1) as pool:
+            results[mode] = pool.apply(run_mode, (mode, args))
+
+    torch.testing.assert_close(results["read_only"][2], results["deepcopy"][2])
+
+    print(
+        f"{args.paligemma_variant} + {args.action_expert_variant}, {args.num_layers or 'all'} layers, "
+        f"prefix of {args.prefix_len} tokens, batch {args.batch_size}, {args.num_steps} steps, "
+        f"{args.dtype} on {args.device}"
+    )
+    memory = "peak CUDA alloc (MB)" if args.device.startswith("cuda") else "peak RSS (MB)"
+    print(f"{'mode':>10} {'p50 chunk (ms)':>15} {'p90 chunk (ms)':>15} {memory:>21}")
+    for mode, (latencies, peak_mb, _) in results.items():
+        p50, p90 = np.percentile(latencies, [50, 90]) * 1e3
+        print(f"{mode:>10} {p50:>15.1f} {p90:>15.1f} {peak_mb:>21.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--paligemma-variant", default="gemma_2b", help="Variant of the VLM backbone.")
+    parser.add_argument("--action-expert-variant", default="gemma_300m", help="Variant of the action expert.")
+    parser.add_argument(
+        "--num-layers", type=int, help="Override the number of layers of both models, for smaller runs."
+    )
+    parser.add_argument(
+        "--prefix-len",
+        type=int,
+        default=816,
+        help="Prefix tokens, e.g. 3 cameras of 256 image tokens and 48 language tokens.",
+    )
+    parser.add_argument("--batch-size", type=int, default=1, help="Number of observations per chunk.")
+    parser.add_argument("--num-steps", type=int, default=10, help="Denoising steps per chunk.")
+    parser.add_argument("--num-chunks", type=int, default=5, help="Timed action chunks per mode.")
+    parser.add_argument("--dtype", default="float32", choices=["float32", "bfloat16"])
+    parser.add_argument("--device", default="cpu", help="Device to run the model on.")
+    parser.add_argument("--torch-threads", type=int, default=1, help="Number of intra-op torch threads.")
+    main(parser.parse_args())
@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+
+# Copyright 2026 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Serialization cost of the learner/actor transport payloads.
+
+Compares the flat tensor wire format (`tensors_to_bytes` / `bytes_to_tensors`) with the previous
+`torch.save` / `torch.load` path, for a policy state dict (learner -> actor) and a batch of transitions
+(actor -> learner). Encode and decode times include the chunking done by `send_bytes_in_chunks` and the
+reassembly done by `receive_bytes_in_chunks`.
+
+```bash
+python benchmarks/transport/run_tensor_wire_benchmark.py --num-params 20000000 --num-transitions 256
+```
+"""
+
+import argparse
+import io
+import time
+from multiprocessing import Event
+
+import torch
+
+from lerobot.transport import services_pb2
+from lerobot.transport.utils import (
+    bytes_to_tensors,
+    receive_bytes_in_chunks,
+    send_bytes_in_chunks,
+    tensors_to_bytes,
+)
+
+
+def legacy_to_bytes(obj) -> bytes:
+    buffer = io.BytesIO()
+    torch.save(obj, buffer)
+    return buffer.getvalue()
+
+
+def legacy_from_bytes(data: bytes):
+    return torch.load(io.BytesIO(data), weights_only=True)
+
+
+def make_state_dict(num_params: int, num_layers: int) -> dict:
+    layer_size = num_params // num_layers
+    return {
+        "policy": {f"layers.{i}.weight": torch.randn(layer_size) for i in range(num_layers)},
+        "discrete_critic": {"head.weight": torch.randn(256, 256)},
+    }
+
+
+def make_transitions(num_transitions: int, image_size: int) -> list[dict]:
+    def observation():
+        return {
+            "observation.image": torch.rand(3, image_size, image_size),
+            "observation.state": torch.randn(14),
+        }
+
+    return [
+        {
+            "state": observation(),
+            "action": torch.randn(6),
+            "reward": 0.0,
+            "done": False,
+            "truncated": False,
+            "next_state": observation(),
+            "complementary_info": {"discrete_penalty": torch.tensor([0.0])},
+        }
+        for _ in range(num_transitions)
+    ]
+
+
+def time_roundtrip(obj, encode, decode, repeats: int) -> tuple[float, float, int]:
+    encode_s = decode_s = 0.0
+    for _ in range(repeats):
+        start = time.perf_counter()
+        chunks = list(send_bytes_in_chunks(encode(obj), services_pb2.Transition))
+        encode_s += time.perf_counter() - start
+
+        start = time.perf_counter()
+        decode(receive_bytes_in_chunks(iter(chunks), None, Event()))
+        decode_s += time.perf_counter() - start
+    size = sum(len(chunk.data) for chunk in chunks)
+    return encode_s / repeats, decode_s / repeats, size
+
+
+def main(num_params: int, num_layers: int, num_transitions: int, image_size: int, repeats: int):
+    payloads = {
+        "state dict": make_state_dict(num_params, num_layers),
+        "transitions": make_transitions(num_transitions, image_size),
+    }
+    formats = {
+        "torch.save": (legacy_to_bytes, legacy_from_bytes),
+        "wire format": (tensors_to_bytes, bytes_to_tensors),
+    }
+
+    print(f"{'payload':>12} {'format':>12} {'size (MB)':>10} {'encode (ms)':>12} {'decode (ms)':>12}")
+    for payload_name, obj in payloads.items():
+        for format_name, (encode, decode) in formats.items():
+            encode_s, decode_s, size = time_roundtrip(obj, encode, decode, repeats)
+            print(
+                f"{payload_name:>12} {format_name:>12} {size / 1024**2:>10.1f} "
+                f"{encode_s * 1e3:>12.1f} {decode_s * 1e3:>12.1f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num-params", type=int, default=10_000_000, help="Parameters in the state dict.")
+    parser.add_argument("--num-layers", type=int, default=100, help="Tensors the parameters are split into.")
+    parser.add_argument("--num-transitions", type=int, default=128, help="Transitions per batch.")
+    parser.add_argument("--image-size", type=int, default=64, help="Height and width of the observations.")
+    parser.add_argument("--repeats", type=int, default=5, help="Number of timed round trips.")
+    args = parser.parse_args()
+    main(
+        num_params=args.num_params,
+        num_layers=args.num_layers,
+        num_transitions=args.num_transitions,
+        image_size=args.image_size,
+        repeats=args.repeats,
+    )
@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+
+# Copyright 2026 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Throughput of video dataset loading with the uniform and the locality-aware `EpisodeAwareSampler`.
+
+A synthetic video dataset split across several video files is recorded in a temporary directory. Each sampler
+configuration then loads the same number of batches through a `DataLoader`, and the frames per second as well as
+the average number of distinct video files per batch are reported.
+
+```bash
+python benchmarks/video/run_sampler_benchmark.py --locality-window 1 --locality-window 32 --num-workers 4
+```
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import torch
+
+from lerobot.datasets.lerobot_dataset import LeRobotDataset
+from lerobot.datasets.sampler import EpisodeAwareSampler
+
+CAMERA_KEY = "observation.images.cam"
+
+
+def create_dataset(root: Path, num_episodes: int, episode_length: int, image_size: int, fps: int):
+    features = {
+        CAMERA_KEY: {
+            "dtype": "video",
+            "shape": (image_size, image_size, 3),
+            "names": ["height", "width", "channels"],
+        },
+        "action": {"dtype": "float32", "shape": (6,), "names": None},
+    }
+    dataset = LeRobotDataset.create(
+        repo_id="benchmark/sampler", fps=fps, features=features, root=root, use_videos=True
+    )
+    # Small video files so that the dataset spans several of them
+    dataset.meta.update_chunk_settings(video_files_size_in_mb=1)
+    for _ in range(num_episodes):
+        for _ in range(episode_length):
+            dataset.add_frame(
+                {
+                    CAMERA_KEY: np.random.randint(0, 256, (image_size, image_size, 3), dtype=np.uint8),
+                    "action": np.random.randn(6).astype(np.float32),
+                    "task": "benchmark",
+                }
+            )
+        dataset.save_episode()
+    dataset.finalize()
+
+
+def run(
+    dataset: LeRobotDataset,
+    locality_window: int,
+    batch_size: int,
+    num_workers: int,
+    num_batches: int,
+) -> tuple[float, float]:
+    episodes = dataset.meta.episodes
+    episode_files = list(
+        zip(
+            episodes[f"videos/{CAMERA_KEY}/chunk_index"],
+            episodes[f"videos/{CAMERA_KEY}/file_index"],
+            strict=True,
+        )
+    )
+    sampler = EpisodeAwareSampler(
+        episodes["dataset_from_index"],
+        episodes["dataset_to_index"],
+        shuffle=True,
+        episode_groups=episode_files,
+        locality_window=locality_window,
+    )
+    dataloader = torch.utils.data.DataLoader(
+        dataset,
+        batch_size=batch_size,
+        sampler=sampler,
+        num_workers=num_workers,
+        prefetch_factor=2 if num_workers > 0 else None,
+    )
+
+    # Same definition of a file as in the sampler, keyed by frame index
+    frame_files = np.empty(dataset.num_frames, dtype=np.int64)
+    for ep_idx, (start, end) in enumerate(
+        zip(episodes["dataset_from_index"], episodes["dataset_to_index"], strict=True)
+    ):
+        frame_files[start:end] = hash(episode_files[ep_idx])
+
+    num_frames = 0
+    files_per_batch = []
+    start = time.perf_counter()
+    for i, batch in enumerate(dataloader):
+        if i == num_batches:
+            break
+        num_frames += len(batch["index"])
+        files_per_batch.append(len(np.unique(frame_files[batch["index"].numpy()])))
+    elapsed = time.perf_counter() - start
+    return num_frames / elapsed, float(np.mean(files_per_batch))
+
+
+def main(
+    num_episodes: int,
+    episode_length: int,
+    image_size: int,
+    fps: int,
+    locality_windows: list[int],
+    batch_size: int,
+    num_workers: int,
+    num_batches: int,
+):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        root = Path(tmp_dir) / "dataset"
+        create_dataset(root, num_episodes, episode_length, image_size, fps)
+        dataset = LeRobotDataset("benchmark/sampler", root=root)
+        num_files = len(
+            set(
+                zip(
+                    dataset.meta.episodes[f"videos/{CAMERA_KEY}/chunk_index"],
+                    dataset.meta.episodes[f"videos/{CAMERA_KEY}/file_index"],
+                    strict=True,
+                )
+            )
+        )
+        print(f"{dataset.num_frames} frames, {dataset.num_episodes} episodes, {num_files} video files")
+        print(f"{'locality_window':>16} {'frames/s':>10} {'files/batch':>12}")
+        for locality_window in locality_windows:
+            torch.manual_seed(0)
+            fps_loaded, files_per_batch = run(dataset, locality_window, batch_size, num_workers, num_batches)
+            label = f"{locality_window} (uniform)" if locality_window == 1 else str(locality_window)
+            print(f"{label:>16} {fps_loaded:>10.1f} {files_per_batch:>12.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num-episodes", type=int, default=40, help="Number of synthetic episodes.")
+    parser.add_argument("--episode-length", type=int, default=150, help="Number of frames per episode.")
+    parser.add_argument("--image-size", type=int, default=96, help="Height and width of the frames.")
+    parser.add_argument("--fps", type=int, default=30, help="Frames per second of the synthetic dataset.")
+    parser.add_argument(
+        "--locality-window",
+        type=int,
+        action="append",
+        dest="locality_windows",
+        help="Locality window of the sampler (can be repeated). Defaults to 1 (uniform), 8 and 32.",
+    )
+    parser.add_argument("--batch-size", type=int, default=32, help="DataLoader batch size.")
+    parser.add_argument("--num-workers", type=int, default=0, help="Number of DataLoader workers.")
+    parser.add_argument("--num-batches", type=int, default=30, help="Number of timed batches per sampler.")
+    args = parser.parse_args()
+    main(
+        num_episodes=args.num_episodes,
+        episode_length=args.episode_length,
+        image_size=args.image_size,
+        fps=args.fps,
+        locality_windows=args.locality_windows or [1, 8, 32],
+        batch_size=args.batch_size,
+        num_workers=args.num_workers,
+        num_batches=args.num_batches,
+    )
@@ -20,9 +20,13 @@ import torch
 from lerobot.robots.config import RobotConfig
 
 from .constants import (
+    DEFAULT_BATCH_TIMEOUT,
+    DEFAULT_CLIENT_IDLE_TIMEOUT,
     DEFAULT_FPS,
+    DEFAULT_IMAGE_QUALITY,
     DEFAULT_INFERENCE_LATENCY,
     DEFAULT_OBS_QUEUE_TIMEOUT,
+    SUPPORTED_OBSERVATION_CODECS,
 )
 
 # Aggregate function registry for CLI usage
@@ -64,6 +68,34 @@ class PolicyServerConfig:
         default=DEFAULT_OBS_QUEUE_TIMEOUT, metadata={"help": "Timeout for observation queue in seconds"}
     )
 
+    # Multi-client batching configuration
+    max_batch_size: int = field(
+        default=1,
+        metadata={
+            "help": "Maximum number of client observations run through the policy in one forward pass. "
+            "Values greater than 1 serve several robot clients concurrently and batch their observations"
+        },
+    )
+    batch_timeout: float = field(
+        default=DEFAULT_BATCH_TIMEOUT,
+        metadata={"help": "Latency budget, in seconds, for collecting the observations of a batch"},
+    )
+    client_idle_timeout: float = field(
+        default=DEFAULT_CLIENT_IDLE_TIMEOUT,
+        metadata={
+            "help": "Time, in seconds, after which the batching server drops the state of a client that "
+            "stopped calling it"
+        },
+    )
+    max_workers: int = field(
+        default=4,
+        metadata={"help": "Number of gRPC worker threads. Each connected client keeps two of them busy"},
+    )
+    decode_workers: int = field(
+        default=4,
+        metadata={"help": "Number of threads decoding the camera frames of the received observations"},
+    )
+
     def __post_init__(self):
         """Validate configuration after initialization."""
         if self.port < 1 or self.port > 65535:
@@ -78,6 +110,21 @@ class PolicyServerConfig:
         if self.obs_queue_timeout < 0:
             raise ValueError(f"obs_queue_timeout must be non-negative, got {self.obs_queue_timeout}")
 
+        if self.max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be positive, got {self.max_batch_size}")
+
+        if self.batch_timeout < 0:
+            raise ValueError(f"batch_timeout must be non-negative, got {self.batch_timeout}")
+
+        if self.client_idle_timeout <= 0:
+            raise ValueError(f"client_idle_timeout must be positive, got {self.client_idle_timeout}")
+
+        if self.max_workers < 1:
+            raise ValueError(f"max_workers must be positive, got {self.max_workers}")
+
+        if self.decode_workers < 1:
+            raise ValueError(f"decode_workers must be positive, got {self.decode_workers}")
+
     @classmethod
     def from_dict(cls, config_dict: dict) -> "PolicyServerConfig":
         """Create a PolicyServerConfig from a dictionary."""
@@ -96,6 +143,11 @@ class PolicyServerConfig:
             "fps": self.fps,
             "environment_dt": self.environment_dt,
             "inference_latency": self.inference_latency,
+            "max_batch_size": self.max_batch_size,
+            "batch_timeout": self.batch_timeout,
+            "client_idle_timeout": self.client_idle_timeout,
+            "max_workers": self.max_workers,
+            "decode_workers": self.decode_workers,
         }
 
 
@@ -137,6 +189,28 @@ class RobotClientConfig:
     chunk_size_threshold: float = field(default=0.5, metadata={"help": "Threshold for chunk size control"})
     fps: int = field(default=DEFAULT_FPS, metadata={"help": "Frames per second"})
 
+    # Transport configuration
+    stream_actions: bool = field(
+        default=True,
+        metadata={
+            "help": "Exchange observations and actions over one long-lived `StreamActions` stream, with action "
+            "chunks pushed as soon as they are computed. If False, poll the server with `GetActions`"
+        },
+    )
+
+    observation_codec: str = field(
+        default="raw",
+        metadata={
+            "help": "Codec applied to camera frames before sending them to the server. "
+            f"Options: {SUPPORTED_OBSERVATION_CODECS}. 'raw' is lossless, 'jpeg' and 'webp' trade image "
+            "quality for bandwidth ('webp' is smaller but much slower to encode)"
+        },
+    )
+    image_quality: int = field(
+        default=DEFAULT_IMAGE_QUALITY,
+        metadata={"help": "Quality (1-100) of the 'jpeg' and 'webp' observation codecs"},
+    )
+
     # Aggregate function configuration (CLI-compatible)
     aggregate_fn_name: str = field(
         default="weighted_average",
@@ -179,6 +253,14 @@ class RobotClientConfig:
         if self.actions_per_chunk <= 0:
             raise ValueError(f"actions_per_chunk must be positive, got {self.actions_per_chunk}")
 
+        if self.observation_codec not in SUPPORTED_OBSERVATION_CODECS:
+            raise ValueError(
+                f"Unknown observation_codec '{self.observation_codec}'. Available: {SUPPORTED_OBSERVATION_CODECS}"
+            )
+
+        if self.image_quality < 1 or self.image_quality > 100:
+            raise ValueError(f"image_quality must be between 1 and 100, got {self.image_quality}")
+
         self.aggregate_fn = get_aggregate_function(self.aggregate_fn_name)
 
     @classmethod
@@ -197,6 +279,9 @@ class RobotClientConfig:
             "chunk_size_threshold": self.chunk_size_threshold,
             "fps": self.fps,
             "actions_per_chunk": self.actions_per_chunk,
+            "stream_actions": self.stream_actions,
+            "observation_codec": self.observation_codec,
+            "image_quality": self.image_quality,
             "task": self.task,
             "debug_visualize_queue_size": self.debug_visualize_queue_size,
             "aggregate_fn_name": self.aggregate_fn_name,
@@ -16,14 +16,29 @@
 
 DEFAULT_FPS = 30
 
+"""Client side: Quality (1-100) of the lossy codecs applied to camera frames before sending them"""
+DEFAULT_IMAGE_QUALITY = 90
+
 """Server side: Running inference on (at most) 1/fps"""
 DEFAULT_INFERENCE_LATENCY = 1 / DEFAULT_FPS
 
 """Server side: Timeout for observation queue in seconds"""
 DEFAULT_OBS_QUEUE_TIMEOUT = 2
 
+"""Server side: How often an action stream checks whether its client is still connected, in seconds"""
+STREAM_POLL_INTERVAL = 0.1
+
+"""Server side: Time budget for collecting the observations of several clients into one batch"""
+DEFAULT_BATCH_TIMEOUT = 0.005
+
+"""Server side: Time after which the state of a client that stopped calling the server is dropped, in seconds"""
+DEFAULT_CLIENT_IDLE_TIMEOUT = 60
+
 # All action chunking policies
 SUPPORTED_POLICIES = ["act", "smolvla", "diffusion", "tdmpc", "vqbet", "pi0", "pi05", "groot"]
 
+# Codecs applied to camera frames when sending observations, see `observation_codec.py`
+SUPPORTED_OBSERVATION_CODECS = ["raw", "jpeg", "webp"]
+
 # TODO: Add all other robots
 SUPPORTED_ROBOTS = ["so100_follower", "so101_follower", "bi_so_follower", "omx_follower"]
@@ -16,6 +16,7 @@ import logging
 import logging.handlers
 import os
 import time
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -225,6 +226,146 @@ class TimedAction(TimedData):
         return self.action
 
 
+@dataclass
+class TimedActionChunk:
+    """A chunk of consecutive actions, stored as a single `(T, action_dim)` tensor.
+
+    Equivalent to `to_timed_actions()`, but much cheaper to pickle than `T` separate `TimedAction` objects.
+
+    Args:
+        timestamp: Timestamp of the first action.
+        timestep: Timestep of the first action.
+        environment_dt: Time between two consecutive actions, in seconds.
+        actions: The actions, of shape `(T, action_dim)`.
+    """
+
+    timestamp: float
+    timestep: int
+    environment_dt: float
+    actions: torch.Tensor
+
+    def __len__(self) -> int:
+        return len(self.actions)
+
+    def get_timestamp(self):
+        return self.timestamp
+
+    def get_timestep(self):
+        return self.timestep
+
+    def to(self, device: str | torch.device) -> "TimedActionChunk":
+        return TimedActionChunk(self.timestamp, self.timestep, self.environment_dt, self.actions.to(device))
+
+    def to_timed_actions(self) -> list[TimedAction]:
+        return [
+            TimedAction(
+                timestamp=self.timestamp + i * self.environment_dt, timestep=self.timestep + i, action=action
+            )
+            for i, action in enumerate(self.actions)
+        ]
+
+    @classmethod
+    def from_timed_actions(
+        cls, timed_actions: list[TimedAction], environment_dt: float
+    ) -> "TimedActionChunk":
+        """Stack actions of consecutive timesteps into a chunk."""
+        return cls(
+            timestamp=timed_actions[0].get_timestamp(),
+            timestep=timed_actions[0].get_timestep(),
+            environment_dt=environment_dt,
+            actions=torch.stack([timed_action.get_action() for timed_action in timed_actions]),
+        )
+
+
+class ActionChunkBuffer:
+    """Actions left to execute by the robot client, indexed by timestep.
+
+    The buffer is shared by the thread receiving action chunks, which merges them, and the control loop, which
+    pops actions. The pending actions always cover a contiguous range of timesteps and are stored as a single
+    `TimedActionChunk`. Merging blends the overlapping timesteps with one vectorized `aggregate_fn` call and
+    publishes the result with a single attribute assignment, and a published chunk is never modified in place:
+    the control loop pops in O(1) by indexing the latest published chunk, without taking any lock.
+    """
+
+    def __init__(self):
+        # Latest merged chunk, with a view of each of its actions
+        self._published: tuple[TimedActionChunk, tuple[torch.Tensor, ...]] | None = None
+        # Timestep of the last popped action, only written by the control loop
+        self._last_popped = -1
+
+    def _first_timestep(self, chunk: TimedActionChunk) -> int:
+        return max(chunk.timestep, self._last_popped + 1)
+
+    def __len__(self) -> int:
+        published = self._published
+        if published is None:
+            return 0
+        chunk = published[0]
+        return max(0, chunk.timestep + len(chunk) - self._first_timestep(chunk))
+
+    def empty(self) -> bool:
+        return len(self) == 0
+
+    def timesteps(self) -> list[int]:
+        """Timesteps of the pending actions, in execution order."""
+        published = self._published
+        if published is None:
+            return []
+        chunk = published[0]
+        return list(range(self._first_timestep(chunk), chunk.timestep + len(chunk)))
+
+    def pop(self) -> TimedAction | None:
+        """Returns the next action to execute, or None if there is none."""
+        published = self._published
+        if published is None:
+            return None
+        chunk, actions = published
+        timestep = self._first_timestep(chunk)
+        index = timestep - chunk.timestep
+        if index >= len(actions):
+            return None
+
+        self._last_popped = timestep
+        return TimedAction(
+            timestamp=chunk.timestamp + index * chunk.environment_dt, timestep=timestep, action=actions[index]
+        )
+
+    def merge(
+        self,
+        incoming: TimedActionChunk,
+        latest_timestep: int,
+        aggregate_fn: Callable[[torch.Tensor, torch.Tensor], torch.Tensor] | None = None,
+    ) -> None:
+        """Replace the pending actions with the actions of `incoming` after `latest_timestep`.
+
+        On the timesteps that were still pending, the actions are combined as `aggregate_fn(old, new)` (applied
+        to `(T, action_dim)` slices). Without `aggregate_fn`, the incoming actions are kept.
+        """
+        start = max(incoming.timestep, latest_timestep + 1)
+        offset = min(start - incoming.timestep, len(incoming))
+        actions = incoming.actions[offset:]
+
+        published = self._published
+        if published is not None and aggregate_fn is not None:
+            current = published[0]
+            overlap_start = max(start, self._first_timestep(current))
+            overlap_end = min(start + len(actions), current.timestep + len(current))
+            if overlap_start < overlap_end:
+                new_slice = slice(overlap_start - start, overlap_end - start)
+                old_slice = slice(overlap_start - current.timestep, overlap_end - current.timestep)
+                actions = actions.clone()
+                actions[new_slice] = aggregate_fn(current.actions[old_slice], actions[new_slice])
+
+        chunk = TimedActionChunk(
+            timestamp=incoming.timestamp + offset * incoming.environment_dt,
+            timestep=start,
+            environment_dt=incoming.environment_dt,
+            actions=actions,
+        )
+        # Row views are created once here rather than on every pop
+        self._published = (chunk, actions.unbind(0))
+
+
 @dataclass
 class TimedObservation(TimedData):
     observation: RawObservation
@@ -270,6 +411,8 @@ class RemotePolicyConfig:
     actions_per_chunk: int
     device: str = "cpu"
     rename_map: dict[str, str] = field(default_factory=dict)
+    # Whether the client accepts action chunks as a single `TimedActionChunk` instead of a list of `TimedAction`
+    compact_action_chunks: bool = False
 
 
 def _compare_observation_states(obs1_state: torch.Tensor, obs2_state: torch.Tensor, atol: float) -> bool:
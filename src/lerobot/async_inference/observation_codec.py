@@ -0,0 +1,158 @@
+# Copyright 2026 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Typed wire encoding of the observations sent by the `RobotClient` to the `PolicyServer`.
+
+Observations are framed with the flat tensor wire format of `lerobot.transport.utils` instead of being
+pickled: the joint values are packed into a single float64 tensor, other arrays are sent as raw tensors, and
+every camera frame is either sent raw or compressed on its own (JPEG or WebP, with a quality knob). The
+payload describes how each camera was encoded, so the server decodes it without any configuration.
+"""
+
+import pickle  # nosec
+from collections.abc import Callable
+from concurrent.futures import Executor
+from typing import Any
+
+import cv2
+import numpy as np
+import torch
+
+from lerobot.transport.utils import TENSOR_WIRE_MAGIC, bytes_to_tensors, tensors_to_bytes
+
+from .constants import DEFAULT_IMAGE_QUALITY
+from .helpers import TimedObservation
+
+
+def _encode_raw(image: np.ndarray, quality: int) -> torch.Tensor:
+    return torch.from_numpy(image)
+
+
+def _decode_raw(data: torch.Tensor) -> np.ndarray:
+    return data.numpy()
+
+
+def _make_cv2_encoder(extension: str, quality_flag: int) -> Callable[[np.ndarray, int], torch.Tensor]:
+    def encode(image: np.ndarray, quality: int) -> torch.Tensor:
+        # Camera frames are RGB while OpenCV expects BGR
+        ok, encoded = cv2.imencode(extension, cv2.cvtColor(image, cv2.COLOR_RGB2BGR), [quality_flag, quality])
+        if not ok:
+            raise RuntimeError(f"Failed to encode image with shape {image.shape} as {extension}")
+        return torch.from_numpy(encoded)
+
+    return encode
+
+
+def _decode_cv2(data: torch.Tensor) -> np.ndarray:
+    image = cv2.imdecode(data.numpy(), cv2.IMREAD_COLOR)
+    if image is None:
+        raise ValueError("Failed to decode compressed image")
+    return cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+
+
+# Image codec registry: name -> (encode, decode)
+IMAGE_CODECS: dict[
+    str, tuple[Callable[[np.ndarray, int], torch.Tensor], Callable[[torch.Tensor], np.ndarray]]
+] = {
+    "raw": (_encode_raw, _decode_raw),
+    "jpeg": (_make_cv2_encoder(".jpg", cv2.IMWRITE_JPEG_QUALITY), _decode_cv2),
+    "webp": (_make_cv2_encoder(".webp", cv2.IMWRITE_WEBP_QUALITY), _decode_cv2),
+}
+
+
+def _is_compressible_image(value: Any) -> bool:
+    """Camera frames, i.e. (H, W, 3) uint8 arrays, are the only values with an image codec applied."""
+    return (
+        isinstance(value, np.ndarray) and value.dtype == np.uint8 and value.ndim == 3 and value.shape[2] == 3
+    )
+
+
+def encode_observation(
+    obs: TimedObservation, codec: str = "raw", quality: int = DEFAULT_IMAGE_QUALITY
+) -> bytes:
+    """Serialize a `TimedObservation` without pickling it.
+
+    Args:
+        obs: The observation to send.
+        codec: Name of the image codec applied to every camera frame, one of `IMAGE_CODECS`.
+        quality: Quality of the lossy image codecs, between 1 and 100.
+    """
+    if codec not in IMAGE_CODECS:
+        raise ValueError(f"Unknown observation codec '{codec}'. Available: {list(IMAGE_CODECS)}")
+    encode_image = IMAGE_CODECS[codec][0]
+
+    state_names, state_values = [], []
+    images, arrays, values = {}, {}, {}
+    for key, value in obs.get_observation().items():
+        if isinstance(value, float | np.floating):
+            state_names.append(key)
+            state_values.append(float(value))
+        elif _is_compressible_image(value):
+            images[key] = {"codec": codec, "data": encode_image(np.ascontiguousarray(value), quality)}
+        elif isinstance(value, np.ndarray):
+            arrays[key] = {"numpy": True, "data": torch.from_numpy(np.ascontiguousarray(value))}
+        elif isinstance(value, torch.Tensor):
+            arrays[key] = {"numpy": False, "data": value}
+        elif isinstance(value, np.generic):
+            values[key] = value.item()
+        else:
+            values[key] = value
+
+    return tensors_to_bytes(
+        {
+            "timestamp": obs.get_timestamp(),
+            "timestep": obs.get_timestep(),
+            "must_go": obs.must_go,
+            "keys": list(obs.get_observation()),
+            "state": {"names": state_names, "values": torch.tensor(state_values, dtype=torch.float64)},
+            "images": images,
+            "arrays": arrays,
+            "values": values,
+        }
+    )
+
+
+def _decode_image(image: dict[str, Any]) -> np.ndarray:
+    if image["codec"] not in IMAGE_CODECS:
+        raise ValueError(f"Unknown image codec '{image['codec']}'")
+    return IMAGE_CODECS[image["codec"]][1](image["data"])
+
+
+def decode_observation(data: bytes, executor: Executor | None = None) -> TimedObservation:
+    """Inverse of `encode_observation`. Pickled observations (sent by older clients) are also accepted.
+
+    Args:
+        data: The received payload.
+        executor: If given, the camera frames are decoded concurrently on it.
+    """
+    if bytes(data[: len(TENSOR_WIRE_MAGIC)]) != TENSOR_WIRE_MAGIC:
+        return pickle.loads(data)  # nosec
+
+    # Copy into a writable buffer, since the raw arrays share its memory and may be modified downstream
+    payload = bytes_to_tensors(bytearray(data))
+
+    decoded = dict(zip(payload["state"]["names"], payload["state"]["values"].tolist(), strict=True))
+    image_keys = list(payload["images"])
+    image_map = executor.map if executor is not None else map
+    decoded.update(zip(image_keys, image_map(_decode_image, payload["images"].values()), strict=True))
+    for key, array in payload["arrays"].items():
+        decoded[key] = array["data"].numpy() if array["numpy"] else array["data"]
+    decoded.update(payload["values"])
+
+    return TimedObservation(
+        timestamp=payload["timestamp"],
+        timestep=payload["timestep"],
+        observation={key: decoded[key] for key in payload["keys"]},
+        must_go=payload["must_go"],
+    )
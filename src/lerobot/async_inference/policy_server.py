@@ -22,6 +22,16 @@ python -m lerobot.async_inference.policy_server \
      --inference_latency=0.033 \
      --obs_queue_timeout=1
 ```
+
+Serving a fleet of robots with the same policy, batching the observations of up to 8 clients:
+```shell
+python -m lerobot.async_inference.policy_server \
+     --host=0.0.0.0 \
+     --port=8080 \
+     --max_batch_size=8 \
+     --batch_timeout=0.005 \
+     --max_workers=20
+```
 """
 
 import logging
@@ -29,7 +39,7 @@ import pickle  # nosec
 import threading
 import time
 from concurrent import futures
-from dataclasses import asdict
+from dataclasses import asdict, dataclass, field
 from pprint import pformat
 from queue import Empty, Queue
 from typing import Any
@@ -44,21 +54,23 @@ from lerobot.transport import (
     services_pb2,  # type: ignore
     services_pb2_grpc,  # type: ignore
 )
-from lerobot.transport.utils import receive_bytes_in_chunks
+from lerobot.transport.utils import iter_bytes_in_chunks, receive_bytes_in_chunks
 from lerobot.types import PolicyAction
 
 from .configs import PolicyServerConfig
-from .constants import SUPPORTED_POLICIES
+from .constants import STREAM_POLL_INTERVAL, SUPPORTED_POLICIES
 from .helpers import (
     FPSTracker,
     Observation,
     RemotePolicyConfig,
     TimedAction,
+    TimedActionChunk,
     TimedObservation,
     get_logger,
     observations_similar,
     raw_observation_to_observation,
 )
+from .observation_codec import decode_observation
 
 
 class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
@@ -74,12 +86,18 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
 
         self.observation_queue = Queue(maxsize=1)
 
+        # Camera frames of the received observations are decoded concurrently
+        self._decode_executor = futures.ThreadPoolExecutor(
+            max_workers=config.decode_workers, thread_name_prefix="observation_decoder"
+        )
+
         self._predicted_timesteps_lock = threading.Lock()
         self._predicted_timesteps = set()
 
         self.last_processed_obs = None
 
         # Attributes will be set by SendPolicyInstructions
+        self.compact_action_chunks = False
         self.device = None
         self.policy_type = None
         self.lerobot_features = None
@@ -122,6 +140,21 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
 
         client_id = context.peer()
 
+        policy_specs = self._parse_policy_specs(request)
+
+        self.logger.info(
+            f"Receiving policy instructions from {client_id} | "
+            f"Policy type: {policy_specs.policy_type} | "
+            f"Pretrained name or path: {policy_specs.pretrained_name_or_path} | "
+            f"Actions per chunk: {policy_specs.actions_per_chunk} | "
+            f"Device: {policy_specs.device}"
+        )
+
+        self._load_policy(policy_specs)
+
+        return services_pb2.Empty()
+
+    def _parse_policy_specs(self, request) -> RemotePolicyConfig:
         policy_specs = pickle.loads(request.data)  # nosec
 
         if not isinstance(policy_specs, RemotePolicyConfig):
@@ -133,18 +166,14 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
                 f"Supported policies: {SUPPORTED_POLICIES}"
             )
 
-        self.logger.info(
-            f"Receiving policy instructions from {client_id} | "
-            f"Policy type: {policy_specs.policy_type} | "
-            f"Pretrained name or path: {policy_specs.pretrained_name_or_path} | "
-            f"Actions per chunk: {policy_specs.actions_per_chunk} | "
-            f"Device: {policy_specs.device}"
-        )
+        return policy_specs
 
+    def _load_policy(self, policy_specs: RemotePolicyConfig) -> None:
         self.device = policy_specs.device
         self.policy_type = policy_specs.policy_type  # act, pi0, etc.
         self.lerobot_features = policy_specs.lerobot_features
         self.actions_per_chunk = policy_specs.actions_per_chunk
+        self.compact_action_chunks = policy_specs.compact_action_chunks
 
         policy_class = get_policy_class(self.policy_type)
 
@@ -168,8 +197,6 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
 
         self.logger.info(f"Time taken to put policy on {self.device}: {end - start:.4f} seconds")
 
-        return services_pb2.Empty()
-
     def SendObservations(self, request_iterator, context):  # noqa: N802
         """Receive observations from the robot client"""
         client_id = context.peer()
@@ -180,7 +207,14 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
         received_bytes = receive_bytes_in_chunks(
             request_iterator, None, self.shutdown_event, self.logger
         )  # blocking call while looping over request_iterator
-        timed_observation = pickle.loads(received_bytes)  # nosec
+        self._receive_observation(client_id, received_bytes, receive_time, start_deserialize)
+
+        return services_pb2.Empty()
+
+    def _receive_observation(
+        self, client_id: str, received_bytes: bytes, receive_time: float, start_deserialize: float
+    ) -> None:
+        timed_observation = decode_observation(received_bytes, self._decode_executor)
         deserialize_time = time.perf_counter() - start_deserialize
 
         self.logger.debug(f"Received observation #{timed_observation.get_timestep()}")
@@ -204,12 +238,15 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
             f"Deserialization time: {deserialize_time:.6f}s"
         )
 
-        if not self._enqueue_observation(
-            timed_observation  # wrapping a RawObservation
+        if not self._handle_observation(
+            client_id,
+            timed_observation,  # wrapping a RawObservation
         ):
             self.logger.debug(f"Observation #{obs_timestep} has been filtered out")
 
-        return services_pb2.Empty()
+    def _handle_observation(self, client_id: str, obs: TimedObservation) -> bool:
+        """Route an observation received from `client_id`. A single client is served at a time."""
+        return self._enqueue_observation(obs)
 
     def GetActions(self, request, context):  # noqa: N802
         """Returns actions to the robot client. Actions are sent as a single
@@ -217,10 +254,54 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
         client_id = context.peer()
         self.logger.debug(f"Client {client_id} connected for action streaming")
 
+        getactions_starts = time.perf_counter()
+        actions = self._compute_actions(client_id, timeout=self.config.obs_queue_timeout)
+        if actions is None:
+            return services_pb2.Empty()
+
+        time.sleep(
+            max(0, self.config.inference_latency - max(0, time.perf_counter() - getactions_starts))
+        )  # sleep controls inference latency
+
+        return actions
+
+    def StreamActions(self, request_iterator, context):  # noqa: N802
+        """Bidirectional stream: observations are received from the robot client on `request_iterator`,
+        and each action chunk is pushed back as soon as it is computed, without polling."""
+        client_id = context.peer()
+        self.logger.info(f"Client {client_id} opened an action stream")
+
+        stream_closed = threading.Event()
+        reader = threading.Thread(
+            target=self._read_observation_stream,
+            args=(client_id, request_iterator, stream_closed),
+            daemon=True,
+        )
+        reader.start()
+
+        while self.running and not stream_closed.is_set() and context.is_active():
+            actions = self._compute_actions(client_id, timeout=STREAM_POLL_INTERVAL)
+            if actions is not None:
+                yield actions
+
+        self.logger.info(f"Action stream of client {client_id} closed")
+
+    def _read_observation_stream(self, client_id: str, request_iterator, stream_closed: threading.Event):
+        try:
+            for received_bytes in iter_bytes_in_chunks(request_iterator, self.shutdown_event, self.logger):
+                start_deserialize = time.perf_counter()
+                self._receive_observation(client_id, received_bytes, time.time(), start_deserialize)
+        except grpc.RpcError as e:
+            self.logger.debug(f"Observation stream of client {client_id} ended: {e}")
+        finally:
+            stream_closed.set()
+
+    def _compute_actions(self, client_id: str, timeout: float) -> services_pb2.Actions | None:
+        """Run the policy on the latest observation, waiting for at most `timeout` seconds for one.
+        Returns None if no observation was received in time or inference failed."""
         # Generate action based on the most recent observation and its timestep
         try:
-            getactions_starts = time.perf_counter()
-            obs = self.observation_queue.get(timeout=self.config.obs_queue_timeout)
+            obs = self.observation_queue.get(timeout=timeout)
             self.logger.info(
                 f"Running inference for observation #{obs.get_timestep()} (must_go: {obs.must_go})"
             )
@@ -229,7 +310,7 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
                 self._predicted_timesteps.add(obs.get_timestep())
 
             start_time = time.perf_counter()
-            action_chunk = self._predict_action_chunk(obs)
+            action_chunk = self._predict_action_chunk(obs, compact=self.compact_action_chunks)
             inference_time = time.perf_counter() - start_time
 
             start_time = time.perf_counter()
@@ -251,19 +332,15 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
                 f"Total time: {inference_time + serialize_time:.2f}s"
             )
 
-            time.sleep(
-                max(0, self.config.inference_latency - max(0, time.perf_counter() - getactions_starts))
-            )  # sleep controls inference latency
-
             return actions
 
-        except Empty:  # no observation added to queue in obs_queue_timeout
-            return services_pb2.Empty()
+        except Empty:  # no observation added to queue in timeout
+            return None
 
         except Exception as e:
-            self.logger.error(f"Error in StreamActions: {e}")
+            self.logger.error(f"Error computing actions: {e}")
 
-            return services_pb2.Empty()
+            return None
 
     def _obs_sanity_checks(self, obs: TimedObservation, previous_obs: TimedObservation) -> bool:
         """Check if the observation is valid to be processed by the policy"""
@@ -309,11 +386,26 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
 
         return False
 
-    def _time_action_chunk(self, t_0: float, action_chunk: list[torch.Tensor], i_0: int) -> list[TimedAction]:
+    def _time_action_chunk(
+        self,
+        t_0: float,
+        action_chunk: list[torch.Tensor] | torch.Tensor,
+        i_0: int,
+        compact: bool = False,
+    ) -> list[TimedAction] | TimedActionChunk:
         """Turn a chunk of actions into a list of TimedAction instances,
         with the first action corresponding to t_0 and the rest corresponding to
         t_0 + i*environment_dt for i in range(len(action_chunk))
+
+        With `compact=True`, a single `TimedActionChunk` holding the `(T, action_dim)` actions is returned
+        instead.
         """
+        if compact:
+            actions = action_chunk if isinstance(action_chunk, torch.Tensor) else torch.stack(action_chunk)
+            return TimedActionChunk(
+                timestamp=t_0, timestep=i_0, environment_dt=self.config.environment_dt, actions=actions
+            )
+
         return [
             TimedAction(timestamp=t_0 + i * self.config.environment_dt, timestep=i_0 + i, action=action)
             for i, action in enumerate(action_chunk)
@@ -327,29 +419,76 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
 
         return chunk[:, : self.actions_per_chunk, :]
 
-    def _predict_action_chunk(self, observation_t: TimedObservation) -> list[TimedAction]:
-        """Predict an action chunk based on an observation.
+    def _predict_action_chunk(
+        self, observation_t: TimedObservation, compact: bool = False
+    ) -> list[TimedAction] | TimedActionChunk:
+        """Predict an action chunk based on an observation."""
+        action_chunk = self._predict_action_chunks([observation_t])[0]
+        self.last_processed_obs: TimedObservation = observation_t
+        return action_chunk if compact else action_chunk.to_timed_actions()
+
+    def _postprocess_action_chunk(self, action_tensor: torch.Tensor) -> torch.Tensor:
+        """Apply the postprocessor to a `(B, chunk_size, action_dim)` action tensor."""
+        if getattr(self.postprocessor, "supports_action_chunks", False):
+            # Every step handles the time axis: unnormalize and move the whole chunk in one call
+            return self.postprocessor(action_tensor)
+
+        # Otherwise the postprocessor expects (B, action_dim) per action, so each action in the chunk is
+        # processed individually
+        processed_actions = [
+            self.postprocessor(action_tensor[:, i, :]) for i in range(action_tensor.shape[1])
+        ]
+        # Stack back to (B, chunk_size, action_dim)
+        return torch.stack(processed_actions, dim=1)
+
+    def _collate_observations(self, observations: list[Observation]) -> Observation:
+        """Concatenate single-sample observations into one batch. Tensors are concatenated along the
+        batch dimension, everything else (e.g. the task) is gathered in a list."""
+        if len(observations) == 1:
+            return observations[0]
+
+        return {
+            key: torch.cat([obs[key] for obs in observations])
+            if isinstance(observations[0][key], torch.Tensor)
+            else [obs[key] for obs in observations]
+            for key in observations[0]
+        }
+
+    def _predict_action_chunks(
+        self,
+        observations_t: list[TimedObservation],
+        lerobot_features: list[dict[str, dict]] | None = None,
+    ) -> list[TimedActionChunk]:
+        """Predict one action chunk per observation, with a single forward pass over the whole batch.
 
         Pipeline:
-        1. Convert raw observation to LeRobot format
+        1. Convert raw observations to LeRobot format and stack them into a batch
         2. Apply preprocessor (tokenization, normalization, batching, device placement)
-        3. Run policy inference to get action chunk
+        3. Run policy inference to get action chunks
         4. Apply postprocessor (unnormalization, device movement)
-        5. Convert to TimedAction list
+        5. Convert to TimedActionChunks, one per observation
+
+        `lerobot_features` optionally gives the features of the robot each observation comes from, and
+        defaults to the server's features.
         """
-        """1. Prepare observation"""
+        if lerobot_features is None:
+            lerobot_features = [self.lerobot_features] * len(observations_t)
+
+        """1. Prepare observations"""
         start_prepare = time.perf_counter()
-        observation: Observation = raw_observation_to_observation(
-            observation_t.get_observation(),
-            self.lerobot_features,
-            self.policy_image_features,
+        observation: Observation = self._collate_observations(
+            [
+                raw_observation_to_observation(
+                    observation_t.get_observation(), features, self.policy_image_features
+                )
+                for observation_t, features in zip(observations_t, lerobot_features, strict=True)
+            ]
         )
         prepare_time = time.perf_counter() - start_prepare
 
         """2. Apply preprocessor"""
         start_preprocess = time.perf_counter()
         observation = self.preprocessor(observation)
-        self.last_processed_obs: TimedObservation = observation_t
         preprocessing_time = time.perf_counter() - start_preprocess
 
         """3. Get action chunk"""
@@ -362,39 +501,29 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
 
         """4. Apply postprocessor"""
         # Apply postprocessor (handles unnormalization and device movement)
-        # Postprocessor expects (B, action_dim) per action, but we have (B, chunk_size, action_dim)
-        # So we process each action in the chunk individually
         start_postprocess = time.perf_counter()
-        _, chunk_size, _ = action_tensor.shape
-
-        # Process each action in the chunk
-        processed_actions = []
-        for i in range(chunk_size):
-            # Extract action at timestep i: (B, action_dim)
-            single_action = action_tensor[:, i, :]
-            processed_action = self.postprocessor(single_action)
-            processed_actions.append(processed_action)
-
-        # Stack back to (B, chunk_size, action_dim), then remove batch dim
-        action_tensor = torch.stack(processed_actions, dim=1).squeeze(0)
+        action_tensor = self._postprocess_action_chunk(action_tensor)
         self.logger.debug(f"Postprocessed action shape: {action_tensor.shape}")
 
         action_tensor = action_tensor.detach().cpu()
 
-        """5. Convert to TimedAction list"""
-        action_chunk = self._time_action_chunk(
-            observation_t.get_timestamp(), list(action_tensor), observation_t.get_timestep()
-        )
+        """5. Convert to TimedActionChunks"""
+        action_chunks = [
+            self._time_action_chunk(
+                observation_t.get_timestamp(), actions, observation_t.get_timestep(), compact=True
+            )
+            for observation_t, actions in zip(observations_t, action_tensor, strict=True)
+        ]
         postprocess_stops = time.perf_counter()
         postprocessing_time = postprocess_stops - start_postprocess
 
+        timesteps = [observation_t.get_timestep() for observation_t in observations_t]
         self.logger.info(
-            f"Observation {observation_t.get_timestep()} | "
-            f"Total time: {1000 * (postprocess_stops - start_prepare):.2f}ms"
+            f"Observations {timesteps} | Total time: {1000 * (postprocess_stops - start_prepare):.2f}ms"
         )
 
         self.logger.debug(
-            f"Observation {observation_t.get_timestep()} | "
+            f"Observations {timesteps} | "
             f"Prepare time: {1000 * prepare_time:.2f}ms | "
             f"Preprocessing time: {1000 * preprocessing_time:.2f}ms | "
             f"Inference time: {1000 * inference_time:.2f}ms | "
@@ -402,14 +531,249 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
             f"Total time: {1000 * (postprocess_stops - start_prepare):.2f}ms"
         )
 
-        return action_chunk
+        return action_chunks
 
     def stop(self):
         """Stop the server"""
         self._reset_server()
+        self._decode_executor.shutdown(wait=False, cancel_futures=True)
         self.logger.info("Server stopping...")
 
 
+@dataclass
+class ClientSession:
+    """Observation state of one robot client served by the `BatchingPolicyServer`."""
+
+    lerobot_features: dict[str, dict] | None = None
+    observation_queue: Queue = field(default_factory=lambda: Queue(maxsize=1))
+    predicted_timesteps: set[int] = field(default_factory=set)
+    last_processed_obs: TimedObservation | None = None
+    compact_action_chunks: bool = False
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    # `time.monotonic` of the last call of the client, to drop the sessions of disconnected clients
+    last_seen: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class _BatchRequest:
+    client_id: str
+    observation: TimedObservation
+    lerobot_features: dict[str, dict]
+    future: futures.Future = field(default_factory=futures.Future)
+
+
+class BatchingPolicyServer(PolicyServer):
+    """`PolicyServer` serving several robot clients with the same policy.
+
+    Observations are tracked per client, and the state of clients that stop calling the server for
+    `config.client_idle_timeout` seconds is dropped when another client connects. Pending action requests (`GetActions` calls, or clients waiting on
+    their `StreamActions` stream) are collected for up to
+    `config.batch_timeout` seconds (or until `config.max_batch_size` requests, or every client waiting for
+    actions, are pending), run through the preprocessor, the policy and the postprocessor as a single batch,
+    and each action chunk is routed back to the client that asked for it.
+    """
+
+    def __init__(self, config: PolicyServerConfig):
+        super().__init__(config)
+        self._clients: dict[str, ClientSession] = {}
+        self._clients_lock = threading.Lock()
+        self._policy_specs: RemotePolicyConfig | None = None
+        self._policy_lock = threading.Lock()
+
+        # Number of clients waiting for actions, i.e. the largest batch that can currently be formed
+        self._waiting_clients = 0
+        self._waiting_clients_lock = threading.Lock()
+        self._requests: Queue[_BatchRequest] = Queue()
+        self._stop_batching = threading.Event()
+        self._batching_thread = threading.Thread(target=self._batching_loop, daemon=True)
+        self._batching_thread.start()
+
+    def _get_session(self, client_id: str) -> ClientSession | None:
+        with self._clients_lock:
+            session = self._clients.get(client_id)
+        if session is not None:
+            session.last_seen = time.monotonic()
+        return session
+
+    def _evict_idle_sessions(self) -> None:
+        """Drop the sessions of the clients that didn't call the server for `config.client_idle_timeout`
+        seconds. Reconnecting clients get a new peer address, so their previous session is never reused."""
+        now = time.monotonic()
+        with self._clients_lock:
+            idle_clients = [
+                client_id
+                for client_id, session in self._clients.items()
+                if now - session.last_seen > self.config.client_idle_timeout
+            ]
+            for client_id in idle_clients:
+                del self._clients[client_id]
+        for client_id in idle_clients:
+            self.logger.info(f"Dropped the session of idle client {client_id}")
+
+    def Ready(self, request, context):  # noqa: N802
+        client_id = context.peer()
+        self.logger.info(f"Client {client_id} connected and ready")
+        self._evict_idle_sessions()
+        # Only the state of this client is flushed, the other clients keep being served
+        with self._clients_lock:
+            self._clients[client_id] = ClientSession()
+
+        return services_pb2.Empty()
+
+    def SendPolicyInstructions(self, request, context):  # noqa: N802
+        """Receive policy instructions from a robot client. The policy is loaded once and shared by all
+        clients, which must therefore request the same policy."""
+        client_id = context.peer()
+        session = self._get_session(client_id)
+        if session is None:
+            self.logger.warning(f"Client {client_id} is not ready. Ignoring policy instructions.")
+            return services_pb2.Empty()
+
+        policy_specs = self._parse_policy_specs(request)
+        self.logger.info(
+            f"Receiving policy instructions from {client_id} | "
+            f"Policy type: {policy_specs.policy_type} | "
+            f"Pretrained name or path: {policy_specs.pretrained_name_or_path}"
+        )
+
+        with self._policy_lock:
+            if self._policy_specs is None or not self._same_policy(policy_specs, self._policy_specs):
+                with self._clients_lock:
+                    other_clients = [
+                        other_id
+                        for other_id, other in self._clients.items()
+                        if other_id != client_id and other.lerobot_features is not None
+                    ]
+                if self._policy_specs is not None and other_clients:
+                    raise ValueError(
+                        f"Client {client_id} requested a different policy than the one served to "
+                        f"{other_clients}. All clients of a batching server must use the same policy."
+                    )
+                self._load_policy(policy_specs)
+                self._policy_specs = policy_specs
+
+        session.lerobot_features = policy_specs.lerobot_features
+        session.compact_action_chunks = policy_specs.compact_action_chunks
+        return services_pb2.Empty()
+
+    @staticmethod
+    def _same_policy(specs: RemotePolicyConfig, other: RemotePolicyConfig) -> bool:
+        return (
+            specs.policy_type == other.policy_type
+            and specs.pretrained_name_or_path == other.pretrained_name_or_path
+            and specs.actions_per_chunk == other.actions_per_chunk
+            and specs.device == other.device
+            and specs.rename_map == other.rename_map
+        )
+
+    def _handle_observation(self, client_id: str, obs: TimedObservation) -> bool:
+        session = self._get_session(client_id)
+        if session is None:
+            self.logger.warning(f"Received observation from unknown client {client_id}")
+            return False
+
+        with session.lock:
+            if session.last_processed_obs is not None and not obs.must_go:
+                if obs.get_timestep() in session.predicted_timesteps:
+                    return False
+                features = session.lerobot_features or self.lerobot_features
+                if observations_similar(obs, session.last_processed_obs, lerobot_features=features):
+                    return False
+
+            # Only the latest observation of each client is run through the policy
+            if session.observation_queue.full():
+                _ = session.observation_queue.get_nowait()
+            session.observation_queue.put(obs)
+        return True
+
+    def _compute_actions(self, client_id: str, timeout: float) -> services_pb2.Actions | None:
+        """Computes an action chunk for the client, in a batch with the other clients."""
+        session = self._get_session(client_id)
+        if session is None:
+            return None
+
+        with self._waiting_clients_lock:
+            self._waiting_clients += 1
+        try:
+            obs = session.observation_queue.get(timeout=timeout)
+            with session.lock:
+                session.predicted_timesteps.add(obs.get_timestep())
+
+            batch_request = _BatchRequest(
+                client_id=client_id,
+                observation=obs,
+                lerobot_features=session.lerobot_features or self.lerobot_features,
+            )
+            self._requests.put(batch_request)
+            action_chunk = batch_request.future.result()
+            if not session.compact_action_chunks:
+                action_chunk = action_chunk.to_timed_actions()
+
+            with session.lock:
+                session.last_processed_obs = obs
+
+            return services_pb2.Actions(data=pickle.dumps(action_chunk))  # nosec
+
+        except Empty:  # no observation added to queue in timeout
+            return None
+
+        except Exception as e:
+            self.logger.error(f"Error computing actions for {client_id}: {e}")
+
+            return None
+
+        finally:
+            with self._waiting_clients_lock:
+                self._waiting_clients -= 1
+
+    def _collect_batch(self) -> list[_BatchRequest]:
+        """Wait for a first request, then gather more until the batch is full or the budget is spent."""
+        try:
+            batch = [self._requests.get(timeout=0.1)]
+        except Empty:
+            return []
+
+        deadline = time.perf_counter() + self.config.batch_timeout
+        while len(batch) < self.config.max_batch_size:
+            with self._waiting_clients_lock:
+                if len(batch) >= self._waiting_clients:
+                    # Every client waiting for actions is already part of the batch
+                    break
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._requests.get(timeout=remaining))
+            except Empty:
+                break
+        return batch
+
+    def _batching_loop(self) -> None:
+        while not self._stop_batching.is_set():
+            batch = self._collect_batch()
+            if not batch:
+                continue
+
+            self.logger.debug(f"Running a batch of {len(batch)} observations")
+            try:
+                action_chunks = self._predict_action_chunks(
+                    [batch_request.observation for batch_request in batch],
+                    [batch_request.lerobot_features for batch_request in batch],
+                )
+            except Exception as e:
+                for batch_request in batch:
+                    batch_request.future.set_exception(e)
+                continue
+
+            for batch_request, action_chunk in zip(batch, action_chunks, strict=True):
+                batch_request.future.set_result(action_chunk)
+
+    def stop(self):
+        """Stop the server"""
+        self._stop_batching.set()
+        super().stop()
+
+
 @draccus.wrap()
 def serve(cfg: PolicyServerConfig):
     """Start the PolicyServer with the given configuration.
@@ -420,10 +784,10 @@ def serve(cfg: PolicyServerConfig):
     logging.info(pformat(asdict(cfg)))
 
     # Create the server instance first
-    policy_server = PolicyServer(cfg)
+    policy_server = BatchingPolicyServer(cfg) if cfg.max_batch_size > 1 else PolicyServer(cfg)
 
     # Setup and start gRPC server
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=cfg.max_workers))
     services_pb2_grpc.add_AsyncInferenceServicer_to_server(policy_server, server)
     server.add_insecure_port(f"{cfg.host}:{cfg.port}")
 
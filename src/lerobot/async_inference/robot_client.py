@@ -68,16 +68,19 @@ from lerobot.utils.import_utils import register_third_party_plugins
 from .configs import RobotClientConfig
 from .helpers import (
     Action,
+    ActionChunkBuffer,
     FPSTracker,
     Observation,
     RawObservation,
     RemotePolicyConfig,
     TimedAction,
+    TimedActionChunk,
     TimedObservation,
     get_logger,
     map_robot_keys_to_lerobot_features,
     visualize_action_queue_size,
 )
+from .observation_codec import encode_observation
 
 
 class RobotClient:
@@ -106,6 +109,7 @@ class RobotClient:
             lerobot_features,
             config.actions_per_chunk,
             config.policy_device,
+            compact_action_chunks=True,
         )
         self.channel = grpc.insecure_channel(
             self.server_address, grpc_channel_options(initial_backoff=f"{config.environment_dt:.4f}s")
@@ -115,15 +119,20 @@ class RobotClient:
 
         self.shutdown_event = threading.Event()
 
+        # Cleared when the server doesn't implement `StreamActions`, to poll it with `GetActions` instead
+        self.stream_actions = config.stream_actions
+        # Serialized observations waiting to be sent on the `StreamActions` stream (None closes the stream)
+        self._observation_stream: Queue[bytes | None] = Queue()
+
         # Initialize client side variables
-        self.latest_action_lock = threading.Lock()
+        # Timestep of the last performed action, only written by the control loop
         self.latest_action = -1
         self.action_chunk_size = -1
 
         self._chunk_size_threshold = config.chunk_size_threshold
 
-        self.action_queue = Queue()
-        self.action_queue_lock = threading.Lock()  # Protect queue operations
+        # Shared by the action receiving thread and the control loop without locking
+        self.action_queue = ActionChunkBuffer()
         self.action_queue_size = []
         self.start_barrier = threading.Barrier(2)  # 2 threads: action receiver, control loop
 
@@ -173,6 +182,7 @@ class RobotClient:
     def stop(self):
         """Stop the robot client"""
         self.shutdown_event.set()
+        self._observation_stream.put(None)
 
         self.robot.disconnect()
         self.logger.debug("Robot disconnected")
@@ -193,10 +203,16 @@ class RobotClient:
             raise ValueError("Input observation needs to be a TimedObservation!")
 
         start_time = time.perf_counter()
-        observation_bytes = pickle.dumps(obs)
+        observation_bytes = encode_observation(obs, self.config.observation_codec, self.config.image_quality)
         serialize_time = time.perf_counter() - start_time
         self.logger.debug(f"Observation serialization time: {serialize_time:.6f}s")
 
+        if self.stream_actions:
+            # Sent on the action stream opened by `receive_actions`
+            self._observation_stream.put(observation_bytes)
+            self.logger.debug(f"Queued observation #{obs.get_timestep()} on the action stream")
+            return True
+
         try:
             observation_iterator = send_bytes_in_chunks(
                 observation_bytes,
@@ -215,56 +231,38 @@ class RobotClient:
             return False
 
     def _inspect_action_queue(self):
-        with self.action_queue_lock:
-            queue_size = self.action_queue.qsize()
-            timestamps = sorted([action.get_timestep() for action in self.action_queue.queue])
-        self.logger.debug(f"Queue size: {queue_size}, Queue contents: {timestamps}")
-        return queue_size, timestamps
+        timesteps = self.action_queue.timesteps()
+        queue_size = len(timesteps)
+        self.logger.debug(f"Queue size: {queue_size}, Queue contents: {timesteps}")
+        return queue_size, timesteps
 
     def _aggregate_action_queues(
         self,
-        incoming_actions: list[TimedAction],
+        incoming_actions: TimedActionChunk | list[TimedAction],
         aggregate_fn: Callable[[torch.Tensor, torch.Tensor], torch.Tensor] | None = None,
     ):
-        """Finds the same timestep actions in the queue and aggregates them using the aggregate_fn"""
-        if aggregate_fn is None:
-            # default aggregate function: take the latest action
-            def aggregate_fn(x1, x2):
-                return x2
-
-        future_action_queue = Queue()
-        with self.action_queue_lock:
-            internal_queue = self.action_queue.queue
-
-        current_action_queue = {action.get_timestep(): action.get_action() for action in internal_queue}
-
-        for new_action in incoming_actions:
-            with self.latest_action_lock:
-                latest_action = self.latest_action
-
-            # New action is older than the latest action in the queue, skip it
-            if new_action.get_timestep() <= latest_action:
-                continue
-
-            # If the new action's timestep is not in the current action queue, add it directly
-            elif new_action.get_timestep() not in current_action_queue:
-                future_action_queue.put(new_action)
-                continue
-
-            # If the new action's timestep is in the current action queue, aggregate it
-            # TODO: There is probably a way to do this with broadcasting of the two action tensors
-            future_action_queue.put(
-                TimedAction(
-                    timestamp=new_action.get_timestamp(),
-                    timestep=new_action.get_timestep(),
-                    action=aggregate_fn(
-                        current_action_queue[new_action.get_timestep()], new_action.get_action()
-                    ),
-                )
+        """Merges the incoming actions into the queue, aggregating the actions of the timesteps still pending
+        with the aggregate_fn (by default, the incoming actions are kept)"""
+        if not isinstance(incoming_actions, TimedActionChunk):
+            incoming_actions = TimedActionChunk.from_timed_actions(
+                incoming_actions, self.config.environment_dt
             )
 
-        with self.action_queue_lock:
-            self.action_queue = future_action_queue
+        self.action_queue.merge(incoming_actions, self.latest_action, aggregate_fn)
+
+    def _observation_stream_iterator(self):
+        """Yield the chunks of every observation queued by `send_observation`, until the client stops."""
+        while self.running:
+            observation_bytes = self._observation_stream.get()
+            if observation_bytes is None:
+                return
+
+            yield from send_bytes_in_chunks(
+                observation_bytes,
+                services_pb2.Observation,
+                log_prefix="[CLIENT] Observation",
+                silent=True,
+            )
 
     def receive_actions(self, verbose: bool = False):
         """Receive actions from the policy server"""
@@ -274,119 +272,137 @@ class RobotClient:
 
         while self.running:
             try:
-                # Use StreamActions to get a stream of actions from the server
-                actions_chunk = self.stub.GetActions(services_pb2.Empty())
-                if len(actions_chunk.data) == 0:
-                    continue  # received `Empty` from server, wait for next call
-
-                receive_time = time.time()
-
-                # Deserialize bytes back into list[TimedAction]
-                deserialize_start = time.perf_counter()
-                timed_actions = pickle.loads(actions_chunk.data)  # nosec
-                deserialize_time = time.perf_counter() - deserialize_start
-
-                # Log device type of received actions
-                if len(timed_actions) > 0:
-                    received_device = timed_actions[0].get_action().device.type
-                    self.logger.debug(f"Received actions on device: {received_device}")
-
-                # Move actions to client_device (e.g., for downstream planners that need GPU)
-                client_device = self.config.client_device
-                if client_device != "cpu":
-                    for timed_action in timed_actions:
-                        if timed_action.get_action().device.type != client_device:
-                            timed_action.action = timed_action.get_action().to(client_device)
-                    self.logger.debug(f"Converted actions to device: {client_device}")
+                if self.stream_actions:
+                    # Action chunks are pushed by the server as soon as they are computed
+                    for actions_chunk in self.stub.StreamActions(self._observation_stream_iterator()):
+                        self._receive_actions_chunk(actions_chunk, verbose)
                 else:
-                    self.logger.debug(f"Actions kept on device: {client_device}")
-
-                self.action_chunk_size = max(self.action_chunk_size, len(timed_actions))
-
-                # Calculate network latency if we have matching observations
-                if len(timed_actions) > 0 and verbose:
-                    with self.latest_action_lock:
-                        latest_action = self.latest_action
-
-                    self.logger.debug(f"Current latest action: {latest_action}")
+                    actions_chunk = self.stub.GetActions(services_pb2.Empty())
+                    self._receive_actions_chunk(actions_chunk, verbose)
 
-                    # Get queue state before changes
-                    old_size, old_timesteps = self._inspect_action_queue()
-                    if not old_timesteps:
-                        old_timesteps = [latest_action]  # queue was empty
-
-                    # Log incoming actions
-                    incoming_timesteps = [a.get_timestep() for a in timed_actions]
-
-                    first_action_timestep = timed_actions[0].get_timestep()
-                    server_to_client_latency = (receive_time - timed_actions[0].get_timestamp()) * 1000
-
-                    self.logger.info(
-                        f"Received action chunk for step #{first_action_timestep} | "
-                        f"Latest action: #{latest_action} | "
-                        f"Incoming actions: {incoming_timesteps[0]}:{incoming_timesteps[-1]} | "
-                        f"Network latency (server->client): {server_to_client_latency:.2f}ms | "
-                        f"Deserialization time: {deserialize_time * 1000:.2f}ms"
+            except grpc.RpcError as e:
+                if self.stream_actions and e.code() == grpc.StatusCode.UNIMPLEMENTED:
+                    self.logger.warning(
+                        "The policy server doesn't implement `StreamActions` (older LeRobot version), "
+                        "falling back to polling it with `GetActions`. Set `stream_actions=False` to skip this."
                     )
+                    self.stream_actions = False
+                    # Unblock the stream iterator and resend the observation that may have been lost with it
+                    self._observation_stream.put(None)
+                    self.must_go.set()
+                elif self.running:
+                    self.logger.error(f"Error receiving actions: {e}")
+
+    def _receive_actions_chunk(self, actions_chunk: services_pb2.Actions, verbose: bool = False):
+        """Deserialize an action chunk received from the policy server and merge it into the action queue"""
+        if len(actions_chunk.data) == 0:
+            return  # received `Empty` from server, wait for next call
+
+        receive_time = time.time()
+
+        # Deserialize bytes back into a TimedActionChunk
+        deserialize_start = time.perf_counter()
+        action_chunk = pickle.loads(actions_chunk.data)  # nosec
+        deserialize_time = time.perf_counter() - deserialize_start
+
+        if not isinstance(action_chunk, TimedActionChunk):
+            # list[TimedAction], sent by servers that don't send compact action chunks
+            if len(action_chunk) == 0:
+                return
+            action_chunk = TimedActionChunk.from_timed_actions(action_chunk, self.config.environment_dt)
+
+        # Log device type of received actions
+        self.logger.debug(f"Received actions on device: {action_chunk.actions.device.type}")
+
+        # Move actions to client_device (e.g., for downstream planners that need GPU)
+        client_device = self.config.client_device
+        if action_chunk.actions.device.type != client_device:
+            action_chunk = action_chunk.to(client_device)
+            self.logger.debug(f"Converted actions to device: {client_device}")
+        else:
+            self.logger.debug(f"Actions kept on device: {client_device}")
+
+        self.action_chunk_size = max(self.action_chunk_size, len(action_chunk))
+
+        # Log incoming actions
+        incoming_timesteps = [
+            action_chunk.get_timestep(),
+            action_chunk.get_timestep() + len(action_chunk) - 1,
+        ]
+
+        # Calculate network latency if we have matching observations
+        if verbose:
+            latest_action = self.latest_action
 
-                # Update action queue
-                start_time = time.perf_counter()
-                self._aggregate_action_queues(timed_actions, self.config.aggregate_fn)
-                queue_update_time = time.perf_counter() - start_time
+            self.logger.debug(f"Current latest action: {latest_action}")
 
-                self.must_go.set()  # after receiving actions, next empty queue triggers must-go processing!
+            # Get queue state before changes
+            old_size, old_timesteps = self._inspect_action_queue()
+            if not old_timesteps:
+                old_timesteps = [latest_action]  # queue was empty
 
-                if verbose:
-                    # Get queue state after changes
-                    new_size, new_timesteps = self._inspect_action_queue()
+            server_to_client_latency = (receive_time - action_chunk.get_timestamp()) * 1000
 
-                    with self.latest_action_lock:
-                        latest_action = self.latest_action
+            self.logger.info(
+                f"Received action chunk for step #{action_chunk.get_timestep()} | "
+                f"Latest action: #{latest_action} | "
+                f"Incoming actions: {incoming_timesteps[0]}:{incoming_timesteps[-1]} | "
+                f"Network latency (server->client): {server_to_client_latency:.2f}ms | "
+                f"Deserialization time: {deserialize_time * 1000:.2f}ms"
+            )
 
-                    self.logger.info(
-                        f"Latest action: {latest_action} | "
-                        f"Old action steps: {old_timesteps[0]}:{old_timesteps[-1]} | "
-                        f"Incoming action steps: {incoming_timesteps[0]}:{incoming_timesteps[-1]} | "
-                        f"Updated action steps: {new_timesteps[0]}:{new_timesteps[-1]}"
-                    )
-                    self.logger.debug(
-                        f"Queue update complete ({queue_update_time:.6f}s) | "
-                        f"Before: {old_size} items | "
-                        f"After: {new_size} items | "
-                    )
+        # Update action queue
+        start_time = time.perf_counter()
+        self._aggregate_action_queues(action_chunk, self.config.aggregate_fn)
+        queue_update_time = time.perf_counter() - start_time
 
-            except grpc.RpcError as e:
-                self.logger.error(f"Error receiving actions: {e}")
+        self.must_go.set()  # after receiving actions, next empty queue triggers must-go processing!
+
+        if verbose:
+            # Get queue state after changes
+            new_size, new_timesteps = self._inspect_action_queue()
+            if not new_timesteps:
+                new_timesteps = [self.latest_action]  # all incoming actions were stale
+
+            self.logger.info(
+                f"Latest action: {self.latest_action} | "
+                f"Old action steps: {old_timesteps[0]}:{old_timesteps[-1]} | "
+                f"Incoming action steps: {incoming_timesteps[0]}:{incoming_timesteps[-1]} | "
+                f"Updated action steps: {new_timesteps[0]}:{new_timesteps[-1]}"
+            )
+            self.logger.debug(
+                f"Queue update complete ({queue_update_time:.6f}s) | "
+                f"Before: {old_size} items | "
+                f"After: {new_size} items | "
+            )
 
     def actions_available(self):
         """Check if there are actions available in the queue"""
-        with self.action_queue_lock:
-            return not self.action_queue.empty()
+        return not self.action_queue.empty()
 
     def _action_tensor_to_action_dict(self, action_tensor: torch.Tensor) -> dict[str, float]:
-        action = {key: action_tensor[i].item() for i, key in enumerate(self.robot.action_features)}
+        values = action_tensor.tolist()
+        action = {key: values[i] for i, key in enumerate(self.robot.action_features)}
         return action
 
-    def control_loop_action(self, verbose: bool = False) -> dict[str, Any]:
-        """Reading and performing actions in local queue"""
+    def control_loop_action(self, verbose: bool = False) -> dict[str, Any] | None:
+        """Reading and performing actions in local queue, returns `None` when the queue was emptied meanwhile"""
 
-        # Lock only for queue operations
         get_start = time.perf_counter()
-        with self.action_queue_lock:
-            self.action_queue_size.append(self.action_queue.qsize())
-            # Get action from queue
-            timed_action = self.action_queue.get_nowait()
+        self.action_queue_size.append(len(self.action_queue))
+        # Get action from queue, without locking
+        timed_action = self.action_queue.pop()
         get_end = time.perf_counter() - get_start
+        if timed_action is None:
+            return None
 
         _performed_action = self.robot.send_action(
             self._action_tensor_to_action_dict(timed_action.get_action())
         )
-        with self.latest_action_lock:
-            self.latest_action = timed_action.get_timestep()
+        self.latest_action = timed_action.get_timestep()
 
         if verbose:
-            with self.action_queue_lock:
-                current_queue_size = self.action_queue.qsize()
+            current_queue_size = len(self.action_queue)
 
             self.logger.debug(
                 f"Ts={timed_action.get_timestamp()} | "
@@ -402,8 +418,7 @@ class RobotClient:
 
     def _ready_to_send_observation(self):
         """Flags when the client is ready to send an observation"""
-        with self.action_queue_lock:
-            return self.action_queue.qsize() / self.action_chunk_size <= self._chunk_size_threshold
+        return len(self.action_queue) / self.action_chunk_size <= self._chunk_size_threshold
 
     def control_loop_observation(self, task: str, verbose: bool = False) -> RawObservation:
         try:
@@ -413,8 +428,7 @@ class RobotClient:
             raw_observation: RawObservation = self.robot.get_observation()
             raw_observation["task"] = task
 
-            with self.latest_action_lock:
-                latest_action = self.latest_action
+            latest_action = self.latest_action
 
             observation = TimedObservation(
                 timestamp=time.time(),  # need time.time() to compare timestamps across client and server
@@ -425,9 +439,8 @@ class RobotClient:
             obs_capture_time = time.perf_counter() - start_time
 
             # If there are no actions left in the queue, the observation must go through processing!
-            with self.action_queue_lock:
-                observation.must_go = self.must_go.is_set() and self.action_queue.empty()
-                current_queue_size = self.action_queue.qsize()
+            observation.must_go = self.must_go.is_set() and self.action_queue.empty()
+            current_queue_size = len(self.action_queue)
 
             _ = self.send_observation(observation)
 
@@ -468,7 +481,10 @@ class RobotClient:
             control_loop_start = time.perf_counter()
             """Control loop: (1) Performing actions, when available"""
             if self.actions_available():
-                _performed_action = self.control_loop_action(verbose)
+                performed_action = self.control_loop_action(verbose)
+                # The queue may be emptied between the check and the pop, keep the last performed action then
+                if performed_action is not None:
+                    _performed_action = performed_action
 
             """Control loop: (2) Streaming observations to the remote policy server"""
             if self._ready_to_send_observation():
@@ -15,6 +15,6 @@
 # limitations under the License.
 
 from .camera_zmq import ZMQCamera
-from .configuration_zmq import ZMQCameraConfig
+from .configuration_zmq import ZMQCameraConfig, ZMQProtocol
 
-__all__ = ["ZMQCamera", "ZMQCameraConfig"]
+__all__ = ["ZMQCamera", "ZMQCameraConfig", "ZMQProtocol"]
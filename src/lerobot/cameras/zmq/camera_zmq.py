@@ -15,23 +15,22 @@
 # limitations under the License.
 
 """
-ZMQCamera - Captures frames from remote cameras via ZeroMQ using JSON protocol in the
-following format:
+ZMQCamera - Captures frames from remote cameras via ZeroMQ, either with the binary protocol
+(multipart messages with a struct header and JPEG or raw pixels, one topic per camera) or with
+the JSON protocol of the previous servers:
     {
         "timestamps": {"camera_name": float},
         "images": {"camera_name": "<base64-jpeg>"}
     }
+See `lerobot.cameras.zmq.protocol` for the wire formats.
 """
 
-import base64
 import json
 import logging
 import time
 from threading import Event, Lock, Thread
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import cv2
-import numpy as np
 from numpy.typing import NDArray
 
 from lerobot.utils.decorators import check_if_already_connected, check_if_not_connected
@@ -39,7 +38,18 @@ from lerobot.utils.errors import DeviceNotConnectedError
 
 from ..camera import Camera
 from ..configs import ColorMode
-from .configuration_zmq import ZMQCameraConfig
+from .configuration_zmq import ZMQCameraConfig, ZMQProtocol
+from .protocol import (
+    JSON_MESSAGE_PREFIX,
+    FrameHeader,
+    decode_json_image,
+    decode_payload,
+    subscribe,
+    unpack_header,
+)
+
+if TYPE_CHECKING:
+    import zmq
 
 logger = logging.getLogger(__name__)
 
@@ -48,9 +58,11 @@ class ZMQCamera(Camera):
     """
     Manages camera interactions via ZeroMQ for receiving frames from a remote server.
 
-    This class connects to a ZMQ Publisher, subscribes to frame topics, and decodes
-    incoming JSON messages containing Base64 encoded images. It supports both
-    synchronous and asynchronous frame reading patterns.
+    This class connects to a ZMQ Publisher, subscribes to the topic of its camera, and decodes
+    the incoming frames (binary protocol), or the JSON messages containing Base64 encoded images
+    of the previous servers (`protocol="json"`). It supports both synchronous and asynchronous
+    frame reading patterns. In the binary protocol, gaps in the per-camera sequence numbers are
+    counted in `dropped_frames`.
 
     Example usage:
         ```python
@@ -83,6 +95,7 @@ class ZMQCamera(Camera):
         self.camera_name = config.camera_name
         self.color_mode = config.color_mode
         self.timeout_ms = config.timeout_ms
+        self.protocol = config.protocol
 
         # ZMQ Context and Socket
         self.context: zmq.Context | None = None
@@ -97,6 +110,11 @@ class ZMQCamera(Camera):
         self.latest_timestamp: float | None = None
         self.new_frame_event: Event = Event()
 
+        # Sequence tracking of the binary protocol
+        self.last_sequence: int | None = None
+        self.received_frames: int = 0
+        self.dropped_frames: int = 0
+
     def __str__(self) -> str:
         return f"ZMQCamera({self.camera_name}@{self.server_address}:{self.port})"
 
@@ -119,11 +137,18 @@ class ZMQCamera(Camera):
         try:
             import zmq
 
+            self.last_sequence = None
             self.context = zmq.Context()
             self.socket = self.context.socket(zmq.SUB)
-            self.socket.setsockopt_string(zmq.SUBSCRIBE, "")
             self.socket.setsockopt(zmq.RCVTIMEO, self.timeout_ms)
-            self.socket.setsockopt(zmq.CONFLATE, True)
+            if self.protocol == ZMQProtocol.BINARY:
+                # CONFLATE doesn't support multipart messages, the queued frames are drained on read instead
+                subscribe(self.socket, [self.camera_name])
+                # Also receive the JSON messages of older servers, to report the protocol mismatch
+                self.socket.subscribe(JSON_MESSAGE_PREFIX)
+            else:
+                self.socket.setsockopt_string(zmq.SUBSCRIBE, "")
+                self.socket.setsockopt(zmq.CONFLATE, True)
             self.socket.connect(f"tcp://{self.server_address}:{self.port}")
             self._connected = True
 
@@ -178,16 +203,30 @@ class ZMQCamera(Camera):
         if not self.is_connected or self.socket is None:
             raise DeviceNotConnectedError(f"{self} is not connected.")
 
+        if self.protocol == ZMQProtocol.BINARY:
+            return self._read_binary_frame()
+
         try:
             message = self.socket.recv_string()
         except Exception as e:
             # zmq is lazy-imported in connect(), so check by name to avoid a top-level import
             if type(e).__name__ == "Again":
                 raise TimeoutError(f"{self} timeout after {self.timeout_ms}ms") from e
+            if isinstance(e, UnicodeDecodeError):
+                raise RuntimeError(
+                    f"{self} received a non-JSON message, the server may use the binary protocol: "
+                    "set `protocol: binary` in the camera config."
+                ) from e
             raise
 
         # Decode JSON message
-        data = json.loads(message)
+        try:
+            data = json.loads(message)
+        except json.JSONDecodeError as e:
+            raise RuntimeError(
+                f"{self} received a non-JSON message, the server may use the binary protocol: "
+                "set `protocol: binary` in the camera config."
+            ) from e
 
         if "images" not in data:
             raise RuntimeError(f"{self} invalid message: missing 'images' key")
@@ -203,13 +242,53 @@ class ZMQCamera(Camera):
             raise RuntimeError(f"{self} no images in message")
 
         # Decode base64 JPEG
-        img_bytes = base64.b64decode(img_b64)
-        frame = cv2.imdecode(np.frombuffer(img_bytes, np.uint8), cv2.IMREAD_COLOR)
-
-        if frame is None:
-            raise RuntimeError(f"{self} failed to decode image")
+        try:
+            return decode_json_image(img_b64)
+        except RuntimeError as e:
+            raise RuntimeError(f"{self} failed to decode image") from e
+
+    def _read_binary_frame(self) -> NDArray[Any]:
+        """Receive the frames queued on the socket, and decode the most recent one."""
+        socket = self.socket
+        if socket is None:
+            raise DeviceNotConnectedError(f"{self} is not connected.")
+        try:
+            parts = socket.recv_multipart(copy=False)
+        except Exception as e:
+            if type(e).__name__ == "Again":
+                raise TimeoutError(f"{self} timeout after {self.timeout_ms}ms") from e
+            raise
+        header = self._unpack_frame_header(parts)
+        while socket.poll(0):
+            parts = socket.recv_multipart(copy=False)
+            header = self._unpack_frame_header(parts)
 
-        return frame
+        try:
+            return decode_payload(header, parts[2].buffer)
+        except RuntimeError as e:
+            raise RuntimeError(f"{self} failed to decode frame {header.sequence}: {e}") from e
+
+    def _unpack_frame_header(self, parts: "list[zmq.Frame]") -> FrameHeader:
+        if len(parts) == 1 and parts[0].bytes.startswith(JSON_MESSAGE_PREFIX):
+            raise RuntimeError(
+                f"{self} received a JSON message, the server uses the JSON protocol of previous LeRobot "
+                "versions: set `protocol: json` in the camera config."
+            )
+        if len(parts) != 3:
+            raise RuntimeError(f"{self} invalid message: expected 3 parts, got {len(parts)}")
+        try:
+            header = unpack_header(parts[0].bytes, parts[1].bytes)
+        except RuntimeError as e:
+            raise RuntimeError(f"{self} invalid message: {e}") from e
+
+        # A sequence number going backwards means that the server restarted
+        if self.last_sequence is not None and header.sequence > self.last_sequence + 1:
+            dropped = header.sequence - self.last_sequence - 1
+            self.dropped_frames += dropped
+            logger.debug(f"{self} dropped {dropped} frame(s) before frame {header.sequence}")
+        self.last_sequence = header.sequence
+        self.received_frames += 1
+        return header
 
     @check_if_not_connected
     def read(self, color_mode: ColorMode | None = None) -> NDArray[Any]:
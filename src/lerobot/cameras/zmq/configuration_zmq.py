@@ -15,10 +15,20 @@
 # limitations under the License.
 
 from dataclasses import dataclass
+from enum import Enum
 
 from ..configs import CameraConfig, ColorMode
 
-__all__ = ["ZMQCameraConfig", "ColorMode"]
+__all__ = ["ZMQCameraConfig", "ColorMode", "ZMQProtocol"]
+
+
+class ZMQProtocol(str, Enum):
+    """Wire format of the frames, see `lerobot.cameras.zmq.protocol`."""
+
+    # Multipart messages with a struct header and the JPEG or raw pixels of one camera
+    BINARY = "binary"
+    # JSON messages with the base64 JPEGs of every camera, as sent by the previous servers
+    JSON = "json"
 
 
 @CameraConfig.register_subclass("zmq")
@@ -30,9 +40,11 @@ class ZMQCameraConfig(CameraConfig):
     color_mode: ColorMode = ColorMode.RGB
     timeout_ms: int = 5000
     warmup_s: int = 1
+    protocol: ZMQProtocol = ZMQProtocol.BINARY
 
     def __post_init__(self) -> None:
         self.color_mode = ColorMode(self.color_mode)
+        self.protocol = ZMQProtocol(self.protocol)
 
         if self.timeout_ms <= 0:
             raise ValueError(f"`timeout_ms` must be positive, but {self.timeout_ms} is provided.")
@@ -16,10 +16,10 @@
 
 """
 Streams camera images over ZMQ.
-Uses lerobot's OpenCVCamera for capture, encodes images to base64 and sends them over ZMQ.
+Uses lerobot's OpenCVCamera for capture, and sends the frames over ZMQ in the binary protocol (JPEG or raw
+pixels) or in the JSON protocol (base64 JPEGs) of `lerobot.cameras.zmq.protocol`.
 """
 
-import base64
 import contextlib
 import json
 import logging
@@ -27,29 +27,93 @@ import threading
 import time
 from collections import deque
 
-import cv2
 import numpy as np
 import zmq
 
 from lerobot.cameras.configs import ColorMode
 from lerobot.cameras.opencv import OpenCVCamera, OpenCVCameraConfig
+from lerobot.cameras.zmq.configuration_zmq import ZMQProtocol
+from lerobot.cameras.zmq.protocol import FrameEncoding, encode_jpeg, encode_json_image, pack_frame
 
 logger = logging.getLogger(__name__)
 
 
-def encode_image(image: np.ndarray, quality: int = 80) -> str:
-    """Encode RGB image to base64 JPEG string."""
-    _, buffer = cv2.imencode(".jpg", image, [int(cv2.IMWRITE_JPEG_QUALITY), quality])
-    return base64.b64encode(buffer).decode("utf-8")
+def encode_frame(
+    image: np.ndarray,
+    protocol: ZMQProtocol = ZMQProtocol.BINARY,
+    encoding: FrameEncoding = FrameEncoding.JPEG,
+    quality: int = 80,
+) -> str | bytes | None:
+    """Encode a frame for the given protocol: a base64 JPEG string, a JPEG bitstream, or `None` for raw
+    frames, which are sent from the image buffer."""
+    if protocol == ZMQProtocol.JSON:
+        return encode_json_image(image, quality)
+    if encoding == FrameEncoding.RAW:
+        return None
+    return encode_jpeg(image, quality)
+
+
+class FramePublisher:
+    """Publishes the latest frames of the cameras on a ZMQ PUB socket.
+
+    In the binary protocol each frame is a multipart message on the topic of its camera, numbered by a
+    per-camera sequence number. A frame that can't be sent because the socket buffer is full still takes a
+    sequence number, so that subscribers see it as dropped. In the JSON protocol all the cameras go in one
+    message, as sent by the previous servers.
+    """
+
+    def __init__(
+        self,
+        socket: zmq.Socket,
+        protocol: ZMQProtocol = ZMQProtocol.BINARY,
+        encoding: FrameEncoding = FrameEncoding.JPEG,
+    ):
+        self.socket = socket
+        self.protocol = ZMQProtocol(protocol)
+        self.encoding = FrameEncoding(encoding)
+        self.sequences: dict[str, int] = {}
+
+    def publish(self, frames: dict[str, tuple[np.ndarray, str | bytes | None, float]]) -> None:
+        """Send frames given as `{camera_name: (image, encoded, timestamp)}`, `encoded` being the output of
+        `encode_frame`."""
+        if self.protocol == ZMQProtocol.JSON:
+            message = {
+                "timestamps": {name: timestamp for name, (_, _, timestamp) in frames.items()},
+                "images": {name: encoded for name, (_, encoded, _) in frames.items()},
+            }
+            # Send as JSON string (suppress if buffer full)
+            with contextlib.suppress(zmq.Again):
+                self.socket.send_string(json.dumps(message), zmq.NOBLOCK)
+            return
+
+        for name, (image, encoded, timestamp) in frames.items():
+            if isinstance(encoded, str):
+                raise ValueError(f"Frame of {name} was encoded for the JSON protocol, not the binary one.")
+            sequence = self.sequences.get(name, -1) + 1
+            self.sequences[name] = sequence
+            parts = pack_frame(name, image, sequence, timestamp, self.encoding, payload=encoded)
+            with contextlib.suppress(zmq.Again):
+                self.socket.send_multipart(parts, zmq.NOBLOCK, copy=False)
 
 
 class CameraCaptureThread:
     """Background thread that continuously captures and encodes frames from a camera."""
 
-    def __init__(self, camera: OpenCVCamera, name: str):
+    def __init__(
+        self,
+        camera: OpenCVCamera,
+        name: str,
+        protocol: ZMQProtocol = ZMQProtocol.BINARY,
+        encoding: FrameEncoding = FrameEncoding.JPEG,
+        jpeg_quality: int = 80,
+    ):
         self.camera = camera
         self.name = name
-        self.latest_encoded: str | None = None  # Pre-encoded JPEG as base64
+        self.protocol = protocol
+        self.encoding = encoding
+        self.jpeg_quality = jpeg_quality
+        self.latest_frame: np.ndarray | None = None
+        self.latest_encoded: str | bytes | None = None  # Pre-encoded frame, see `encode_frame`
         self.latest_timestamp: float = 0.0
         self.frame_lock = threading.Lock()
         self.running = False
@@ -74,24 +138,30 @@ class CameraCaptureThread:
                 frame = self.camera.read()  # Blocks at camera's native rate
                 timestamp = time.time()
                 # Encode immediately in capture thread (this is the slow part)
-                encoded = encode_image(frame)
+                encoded = encode_frame(frame, self.protocol, self.encoding, self.jpeg_quality)
                 with self.frame_lock:
+                    self.latest_frame = frame
                     self.latest_encoded = encoded
                     self.latest_timestamp = timestamp
             except Exception as e:
                 logger.warning(f"Camera {self.name} capture error: {e}")
                 time.sleep(0.01)
 
-    def get_latest(self) -> tuple[str | None, float]:
-        """Get the latest encoded frame and its timestamp."""
+    def get_latest(self) -> tuple[np.ndarray | None, str | bytes | None, float]:
+        """Get the latest frame, its encoding and its timestamp."""
         with self.frame_lock:
-            return self.latest_encoded, self.latest_timestamp
+            return self.latest_frame, self.latest_encoded, self.latest_timestamp
 
 
 class ImageServer:
     def __init__(self, config: dict, port: int = 5555):
         # fps controls the publish loop rate (how often frames are sent over ZMQ), not the camera capture rate
         self.fps = config.get("fps", 30)
+        # "binary" (default) or "json" for the clients of the previous protocol
+        self.protocol = ZMQProtocol(config.get("protocol", ZMQProtocol.BINARY))
+        # "jpeg" (default) or "raw" pixels, for the binary protocol
+        self.encoding = FrameEncoding(config.get("encoding", FrameEncoding.JPEG))
+        self.jpeg_quality = config.get("jpeg_quality", 80)
         self.cameras: dict[str, OpenCVCamera] = {}
         self.capture_threads: dict[str, CameraCaptureThread] = {}
 
@@ -110,7 +180,9 @@ class ImageServer:
             logger.info(f"Camera {name}: {shape[1]}x{shape[0]}")
 
             # Create capture thread for this camera
-            capture_thread = CameraCaptureThread(camera, name)
+            capture_thread = CameraCaptureThread(
+                camera, name, self.protocol, self.encoding, self.jpeg_quality
+            )
             self.capture_threads[name] = capture_thread
 
         # ZMQ PUB socket
@@ -119,8 +191,9 @@ class ImageServer:
         self.socket.setsockopt(zmq.SNDHWM, 20)
         self.socket.setsockopt(zmq.LINGER, 0)
         self.socket.bind(f"tcp://*:{port}")
+        self.publisher = FramePublisher(self.socket, self.protocol, self.encoding)
 
-        logger.info(f"ImageServer running on port {port}")
+        logger.info(f"ImageServer running on port {port} ({self.protocol.value} protocol)")
 
     def run(self):
         frame_count = 0
@@ -142,18 +215,15 @@ class ImageServer:
             while True:
                 t0 = time.time()
 
-                # Build message
-                message = {"timestamps": {}, "images": {}}
+                # Collect the frames captured since the last publish
+                frames = {}
                 for name, capture_thread in self.capture_threads.items():
-                    encoded, timestamp = capture_thread.get_latest()
-                    if encoded is not None and timestamp > last_published_ts.get(name, 0.0):
-                        message["timestamps"][name] = timestamp
-                        message["images"][name] = encoded
+                    frame, encoded, timestamp = capture_thread.get_latest()
+                    if frame is not None and timestamp > last_published_ts.get(name, 0.0):
+                        frames[name] = (frame, encoded, timestamp)
                         last_published_ts[name] = timestamp
 
-                # Send as JSON string (suppress if buffer full)
-                with contextlib.suppress(zmq.Again):
-                    self.socket.send_string(json.dumps(message), zmq.NOBLOCK)
+                self.publisher.publish(frames)
 
                 frame_count += 1
                 frame_times.append(time.time() - t0)
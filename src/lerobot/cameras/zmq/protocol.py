@@ -0,0 +1,184 @@
+#!/usr/bin/env python
+
+# Copyright 2026 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Wire formats of the ZMQ camera stream.
+
+Binary protocol (default): each camera frame is its own multipart message
+
+    [topic, header, payload]
+
+- `topic` is the camera name followed by a NUL byte, so that a SUB socket can select one or several
+  cameras by subscribing to their topics (ZMQ matches subscriptions on the prefix of the first part).
+- `header` is a fixed-size little-endian struct: magic, protocol version, payload encoding, frame height,
+  width and channels, a per-camera sequence number (to detect dropped frames) and the capture timestamp.
+- `payload` is the JPEG bitstream, or the raw uint8 pixels (height, width, channels) in C order.
+
+JSON protocol (compatibility with the previous servers and clients): one single-part message per publish
+with every camera, the images being base64-encoded JPEGs:
+
+    {"timestamps": {"camera_name": float}, "images": {"camera_name": "<base64-jpeg>"}}
+"""
+
+import base64
+import struct
+from collections.abc import Iterable
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+import cv2
+import numpy as np
+from numpy.typing import NDArray
+
+
+class FrameEncoding(str, Enum):
+    JPEG = "jpeg"
+    RAW = "raw"
+
+
+MAGIC = b"LRZC"
+PROTOCOL_VERSION = 1
+# magic, version, encoding, height, width, channels, padding, sequence, timestamp
+HEADER = struct.Struct("<4sBBHHBxQd")
+_ENCODING_IDS = {FrameEncoding.JPEG: 0, FrameEncoding.RAW: 1}
+_ENCODINGS = {v: k for k, v in _ENCODING_IDS.items()}
+# First byte of the messages of the JSON protocol, which has no topic
+JSON_MESSAGE_PREFIX = b"{"
+
+
+@dataclass(frozen=True)
+class FrameHeader:
+    camera_name: str
+    encoding: FrameEncoding
+    height: int
+    width: int
+    channels: int
+    sequence: int
+    timestamp: float
+
+
+def camera_topic(camera_name: str) -> bytes:
+    """Topic of a camera in the binary protocol, NUL-terminated so that camera names don't prefix-match."""
+    return camera_name.encode("utf-8") + b"\0"
+
+
+def subscribe(socket: Any, camera_names: Iterable[str] | None = None) -> None:
+    """Subscribe a ZMQ SUB socket to the binary frames of some cameras, or of every camera if `None`."""
+    if camera_names is None:
+        socket.subscribe(b"")
+        return
+    for camera_name in camera_names:
+        socket.subscribe(camera_topic(camera_name))
+
+
+def encode_jpeg(image: NDArray[Any], quality: int = 80) -> bytes:
+    """Encode an image to a JPEG bitstream."""
+    ok, buffer = cv2.imencode(".jpg", image, [int(cv2.IMWRITE_JPEG_QUALITY), quality])
+    if not ok:
+        raise RuntimeError("Failed to encode image to JPEG")
+    return buffer.tobytes()
+
+
+def pack_frame(
+    camera_name: str,
+    image: NDArray[Any],
+    sequence: int,
+    timestamp: float,
+    encoding: FrameEncoding = FrameEncoding.JPEG,
+    payload: bytes | memoryview | None = None,
+) -> list[bytes | memoryview]:
+    """Build the multipart message of a camera frame.
+
+    Args:
+        camera_name: Name of the camera, used as the topic.
+        image: The (height, width, channels) uint8 frame, which describes the payload in the header.
+        sequence: Per-camera sequence number of the frame.
+        timestamp: Capture time of the frame (`time.time()`).
+        encoding: Payload encoding.
+        payload: Already encoded JPEG bitstream. Raw frames are sent from the image buffer without a copy.
+
+    Returns:
+        The `[topic, header, payload]` parts, to be sent with `socket.send_multipart`.
+    """
+    height, width = image.shape[:2]
+    channels = image.shape[2] if image.ndim == 3 else 1
+    if payload is None:
+        if encoding == FrameEncoding.RAW:
+            payload = memoryview(np.ascontiguousarray(image, dtype=np.uint8)).cast("B")
+        else:
+            payload = encode_jpeg(image)
+    header = HEADER.pack(
+        MAGIC, PROTOCOL_VERSION, _ENCODING_IDS[encoding], height, width, channels, sequence, timestamp
+    )
+    return [camera_topic(camera_name), header, payload]
+
+
+def unpack_header(topic: bytes, header: bytes) -> FrameHeader:
+    """Parse the topic and header parts of a binary message.
+
+    Raises:
+        RuntimeError: If the message isn't a binary camera frame of a supported version.
+    """
+    if len(header) != HEADER.size:
+        raise RuntimeError(f"Invalid camera frame header of {len(header)} bytes, expected {HEADER.size}")
+    magic, version, encoding, height, width, channels, sequence, timestamp = HEADER.unpack(header)
+    if magic != MAGIC:
+        raise RuntimeError(f"Invalid camera frame magic {magic!r}")
+    if version != PROTOCOL_VERSION:
+        raise RuntimeError(
+            f"Unsupported camera frame protocol version {version} (expected {PROTOCOL_VERSION})"
+        )
+    if encoding not in _ENCODINGS:
+        raise RuntimeError(f"Unknown camera frame encoding {encoding}")
+    return FrameHeader(
+        camera_name=topic.rstrip(b"\0").decode("utf-8"),
+        encoding=_ENCODINGS[encoding],
+        height=height,
+        width=width,
+        channels=channels,
+        sequence=sequence,
+        timestamp=timestamp,
+    )
+
+
+def decode_payload(header: FrameHeader, payload: bytes | memoryview) -> NDArray[Any]:
+    """Decode the payload of a binary message into a (height, width, channels) uint8 frame.
+
+    Raw frames are a view of the payload buffer, without a copy.
+    """
+    if header.encoding == FrameEncoding.RAW:
+        expected_size = header.height * header.width * header.channels
+        if len(payload) != expected_size:
+            raise RuntimeError(f"Raw frame of {len(payload)} bytes, expected {expected_size}")
+        return np.frombuffer(payload, dtype=np.uint8).reshape(header.height, header.width, header.channels)
+    frame = cv2.imdecode(np.frombuffer(payload, np.uint8), cv2.IMREAD_COLOR)
+    if frame is None:
+        raise RuntimeError("Failed to decode JPEG frame")
+    return frame
+
+
+def encode_json_image(image: NDArray[Any], quality: int = 80) -> str:
+    """Encode an image to a base64 JPEG string, for the JSON protocol."""
+    return base64.b64encode(encode_jpeg(image, quality)).decode("utf-8")
+
+
+def decode_json_image(image_b64: str) -> NDArray[Any]:
+    """Decode a base64 JPEG string of the JSON protocol."""
+    frame = cv2.imdecode(np.frombuffer(base64.b64decode(image_b64), np.uint8), cv2.IMREAD_COLOR)
+    if frame is None:
+        raise RuntimeError("Failed to decode image")
+    return frame
@@ -17,7 +17,7 @@
 from dataclasses import dataclass, field
 
 from lerobot.datasets.transforms import ImageTransformsConfig
-from lerobot.datasets.video_utils import get_safe_default_codec
+from lerobot.datasets.video_utils import DEFAULT_VIDEO_DECODER_CACHE_SIZE, get_safe_default_codec
 
 
 @dataclass
@@ -36,8 +36,21 @@ class DatasetConfig:
     use_imagenet_stats: bool = True
     video_backend: str = field(default_factory=get_safe_default_codec)
     streaming: bool = False
+    # Load every numeric (non-video, non-image) column in RAM once and share it with the dataloader workers,
+    # instead of reading rows through the Hugging Face dataset formatter. Ignored when `streaming` is True.
+    materialize: bool = False
+    # Bounds of the video decoder cache of each dataloader worker. Every cached decoder keeps a video file open,
+    # least recently used ones are closed first. Set to None for no limit.
+    video_decoder_cache_size: int | None = DEFAULT_VIDEO_DECODER_CACHE_SIZE
+    video_decoder_cache_max_mb: float | None = None
+    # Number of consecutive training samples drawn from the same video file when shuffling. 1 is a uniform
+    # shuffle; larger values (e.g. a multiple of the batch size) make each worker decode from fewer files at the
+    # cost of less random batches. Ignored when `streaming` is True.
+    locality_window: int = 1
 
     def __post_init__(self) -> None:
+        if self.locality_window < 1:
+            raise ValueError(f"locality_window must be >= 1, got {self.locality_window}")
         if self.episodes is not None:
             if any(ep < 0 for ep in self.episodes):
                 raise ValueError(
@@ -70,6 +83,11 @@ class EvalConfig:
     # `use_async_envs` specifies whether to use asynchronous environments (multiprocessing).
     # Defaults to True; automatically downgraded to SyncVectorEnv when batch_size=1.
     use_async_envs: bool = True
+    # `continuous_batching` resets each environment of the batch with the next episode as soon as its episode is
+    # done, instead of waiting for the whole batch. Only used for action chunking policies (see
+    # `CHUNKED_POLICY_TYPES` in lerobot_eval.py) and when the tasks are evaluated one at a time; ignored with a
+    # warning when `env.max_parallel_tasks > 1`.
+    continuous_batching: bool = False
 
     def __post_init__(self) -> None:
         if self.batch_size == 0:
@@ -55,6 +55,13 @@ class TrainPipelineConfig(HubMixin):
     cudnn_deterministic: bool = False
     # Number of workers for the dataloader.
     num_workers: int = 4
+    # Number of batches loaded and passed through the policy preprocessor in a background thread while the
+    # current batch is trained on. The default of 0 loads and preprocesses each batch synchronously, as in
+    # previous versions. Try 1 when the preprocessor (e.g. tokenization) shows up in the `data_s` timings.
+    prefetch_batches: int = 0
+    # Run the CPU steps of the policy preprocessor (the ones before its device step, e.g. tokenization) in the
+    # dataloader workers, as part of the batch collation.
+    preprocess_in_workers: bool = False
     batch_size: int = 8
     steps: int = 100_000
     eval_freq: int = 20_000
@@ -132,6 +139,9 @@ class TrainPipelineConfig(HubMixin):
         if isinstance(self.dataset.repo_id, list):
             raise NotImplementedError("LeRobotMultiDataset is not currently implemented.")
 
+        if self.prefetch_batches < 0:
+            raise ValueError(f"`prefetch_batches` must be non-negative, got {self.prefetch_batches}.")
+
         if not self.use_policy_training_preset and (self.optimizer is None or self.scheduler is None):
             raise ValueError("Optimizer and Scheduler must be set when the policy presets are not used.")
         elif self.use_policy_training_preset and not self.resume:
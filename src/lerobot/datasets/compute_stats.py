@@ -35,7 +35,20 @@ class RunningQuantileStats:
     which adapt dynamically if the observed data range expands.
     """
 
-    def __init__(self, quantile_list: list[float] | None = None, num_quantile_bins: int = 5000):
+    def __init__(
+        self,
+        quantile_list: list[float] | None = None,
+        num_quantile_bins: int = 5000,
+        value_range: tuple[np.ndarray, np.ndarray] | None = None,
+    ):
+        """
+        Args:
+            quantile_list: Quantiles to estimate. Defaults to `DEFAULT_QUANTILES`.
+            num_quantile_bins: Number of histogram bins per dimension.
+            value_range: Known (min, max) of each dimension. When set, the histogram bins are laid out over this
+                range instead of the range of the first batch, so that instances created with the same range
+                share their bin edges and merge exactly.
+        """
         self._count = 0
         self._mean = None
         self._mean_of_squares = None
@@ -44,6 +57,7 @@ class RunningQuantileStats:
         self._histograms = None
         self._bin_edges = None
         self._num_quantile_bins = num_quantile_bins
+        self._value_range = value_range
 
         self._quantile_list = quantile_list
         if self._quantile_list is None:
@@ -64,24 +78,25 @@ class RunningQuantileStats:
             self._mean_of_squares = np.mean(batch**2, axis=0)
             self._min = np.min(batch, axis=0)
             self._max = np.max(batch, axis=0)
-            self._histograms = [np.zeros(self._num_quantile_bins) for _ in range(vector_length)]
-            self._bin_edges = [
-                np.linspace(self._min[i] - 1e-10, self._max[i] + 1e-10, self._num_quantile_bins + 1)
-                for i in range(vector_length)
-            ]
+            self._histograms = np.zeros((vector_length, self._num_quantile_bins))
+            low, high = self._min, self._max
+            if self._value_range is not None:
+                low = np.minimum(np.broadcast_to(self._value_range[0], low.shape), low)
+                high = np.maximum(np.broadcast_to(self._value_range[1], high.shape), high)
+            self._bin_edges = np.linspace(low - 1e-10, high + 1e-10, self._num_quantile_bins + 1, axis=1)
         else:
             if vector_length != self._mean.size:
                 raise ValueError("The length of new vectors does not match the initialized vector length.")
 
             new_max = np.max(batch, axis=0)
             new_min = np.min(batch, axis=0)
-            max_changed = np.any(new_max > self._max)
-            min_changed = np.any(new_min < self._min)
             self._max = np.maximum(self._max, new_max)
             self._min = np.minimum(self._min, new_min)
 
-            if max_changed or min_changed:
-                self._adjust_histograms()
+            # Only rebin when the new vectors fall outside of the current bins
+            changed = (new_max > self._bin_edges[:, -1]) | (new_min < self._bin_edges[:, 0])
+            if np.any(changed):
+                self._adjust_histograms(changed)
 
         self._count += num_elements
 
@@ -96,6 +111,52 @@ class RunningQuantileStats:
 
         self._update_histograms(batch)
 
+    def merge(self, other: RunningQuantileStats) -> None:
+        """Merge the statistics accumulated by another instance into this one.
+
+        Count, mean, std, min and max are combined exactly. Histograms are summed directly when both instances
+        share the same bin edges, otherwise both are first rebinned onto the union of their ranges. This lets
+        per-episode or per-worker accumulators be computed in parallel and combined afterwards.
+
+        Args:
+            other: Statistics to merge. It is not modified.
+        """
+        if other._num_quantile_bins != self._num_quantile_bins:
+            raise ValueError(
+                f"Cannot merge statistics with {other._num_quantile_bins} quantile bins into statistics with "
+                f"{self._num_quantile_bins} quantile bins."
+            )
+        if other._count == 0:
+            return
+        if self._count == 0:
+            self._count = other._count
+            self._mean = other._mean.copy()
+            self._mean_of_squares = other._mean_of_squares.copy()
+            self._min = other._min.copy()
+            self._max = other._max.copy()
+            self._histograms = other._histograms.copy()
+            self._bin_edges = other._bin_edges.copy()
+            return
+        if other._mean.size != self._mean.size:
+            raise ValueError("The length of new vectors does not match the initialized vector length.")
+
+        self._max = np.maximum(self._max, other._max)
+        self._min = np.minimum(self._min, other._min)
+        other_histograms = other._histograms
+        if not np.array_equal(other._bin_edges, self._bin_edges):
+            changed = (other._bin_edges[:, -1] > self._bin_edges[:, -1]) | (
+                other._bin_edges[:, 0] < self._bin_edges[:, 0]
+            )
+            if np.any(changed):
+                self._adjust_histograms(changed)
+            other_histograms = _rebin_histograms(other._histograms, other._bin_edges, self._bin_edges)
+
+        self._count += other._count
+        weight = other._count / self._count
+        self._mean += (other._mean - self._mean) * weight
+        self._mean_of_squares += (other._mean_of_squares - self._mean_of_squares) * weight
+        self._histograms += other_histograms
+
     def get_statistics(self) -> dict[str, np.ndarray]:
         """Compute and return the statistics of the vectors processed so far.
 
@@ -126,74 +187,95 @@ class RunningQuantileStats:
 
         return stats
 
-    def _adjust_histograms(self):
-        """Adjust histograms when min or max changes."""
-        for i in range(len(self._histograms)):
-            old_edges = self._bin_edges[i]
-            old_hist = self._histograms[i]
-
-            # Create new edges with small padding to ensure range coverage
-            padding = (self._max[i] - self._min[i]) * 1e-10
-            new_edges = np.linspace(
-                self._min[i] - padding, self._max[i] + padding, self._num_quantile_bins + 1
-            )
-
-            # Redistribute existing histogram counts to new bins
-            # We need to map each old bin center to the new bins
-            old_centers = (old_edges[:-1] + old_edges[1:]) / 2
-            new_hist = np.zeros(self._num_quantile_bins)
+    def _adjust_histograms(self, changed: np.ndarray) -> None:
+        """Rebin the histograms of the dimensions whose min or max changed.
 
-            for old_center, count in zip(old_centers, old_hist, strict=False):
-                if count > 0:
-                    # Find which new bin this old center belongs to
-                    bin_idx = np.searchsorted(new_edges, old_center) - 1
-                    bin_idx = max(0, min(bin_idx, self._num_quantile_bins - 1))
-                    new_hist[bin_idx] += count
-
-            self._histograms[i] = new_hist
-            self._bin_edges[i] = new_edges
+        Args:
+            changed: Boolean mask over the feature dimensions.
+        """
+        # Create new edges with small padding to ensure range coverage
+        padding = (self._max[changed] - self._min[changed]) * 1e-10
+        new_edges = np.linspace(
+            self._min[changed] - padding, self._max[changed] + padding, self._num_quantile_bins + 1, axis=1
+        )
+        self._histograms[changed] = _rebin_histograms(
+            self._histograms[changed], self._bin_edges[changed], new_edges
+        )
+        self._bin_edges[changed] = new_edges
 
     def _update_histograms(self, batch: np.ndarray) -> None:
         """Update histograms with new vectors."""
-        for i in range(batch.shape[1]):
-            hist, _ = np.histogram(batch[:, i], bins=self._bin_edges[i])
-            self._histograms[i] += hist
+        self._histograms += _histogram_2d(batch.T, self._bin_edges)
 
     def _compute_quantiles(self) -> list[np.ndarray]:
-        """Compute quantiles based on histograms."""
+        """Compute quantiles based on histograms, for all dimensions at once."""
+        cumsum = np.cumsum(self._histograms, axis=1)
+        num_bins = cumsum.shape[1]
+        rows = np.arange(cumsum.shape[0])
         results = []
         for q in self._quantile_list:
             target_count = q * self._count
-            q_values = []
-
-            for hist, edges in zip(self._histograms, self._bin_edges, strict=True):
-                q_value = self._compute_single_quantile(hist, edges, target_count)
-                q_values.append(q_value)
-
-            results.append(np.array(q_values))
+            # Row-wise equivalent of `np.searchsorted(cumsum, target_count)`
+            idx = np.sum(cumsum < target_count, axis=1)
+            inner = np.clip(idx, 1, num_bins - 1)
+
+            # Linear interpolation within the bin, or the bin edge if the bin is empty
+            count_before = cumsum[rows, inner - 1]
+            count_in_bin = cumsum[rows, inner] - count_before
+            fraction = (target_count - count_before) / np.where(count_in_bin == 0, 1, count_in_bin)
+            left_edges = self._bin_edges[rows, inner]
+            bin_widths = self._bin_edges[rows, inner + 1] - left_edges
+            q_values = np.where(count_in_bin == 0, left_edges, left_edges + fraction * bin_widths)
+
+            q_values = np.where(idx == 0, self._bin_edges[:, 0], q_values)
+            q_values = np.where(idx >= num_bins, self._bin_edges[:, -1], q_values)
+            results.append(q_values)
         return results
 
-    def _compute_single_quantile(self, hist: np.ndarray, edges: np.ndarray, target_count: float) -> float:
-        """Compute a single quantile value from histogram and bin edges."""
-        cumsum = np.cumsum(hist)
-        idx = np.searchsorted(cumsum, target_count)
 
-        if idx == 0:
-            return edges[0]
-        if idx >= len(cumsum):
-            return edges[-1]
+def _bin_indices(values: np.ndarray, edges: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Locate `values` in the uniform bins of each row of `edges`, with `np.histogram` semantics.
+
+    Args:
+        values: Array of shape (num_dims, num_values).
+        edges: Increasing, evenly spaced bin edges of shape (num_dims, num_bins + 1).
 
-        # If not edge case, interpolate within the bin
-        count_before = cumsum[idx - 1]
-        count_in_bin = cumsum[idx] - count_before
+    Returns:
+        Bin index of each value, of shape (num_dims, num_values), and a boolean mask of the values that lie within
+        the edges. Bins are half-open except for the last one, which includes its right edge.
+    """
+    num_bins = edges.shape[1] - 1
+    low, high = edges[:, :1], edges[:, -1:]
+    width = high - low
+    scale = num_bins / np.where(width > 0, width, 1)
+    in_range = (values >= low) & (values <= high)
+    values = np.where(in_range, values, low)
+    idx = np.clip(np.floor((values - low) * scale), 0, num_bins - 1).astype(np.int64)
+    # Correct the rounding errors of the division as `np.histogram` does
+    idx -= values < np.take_along_axis(edges, idx, axis=1)
+    idx += (values >= np.take_along_axis(edges, idx + 1, axis=1)) & (idx != num_bins - 1)
+    np.clip(idx, 0, num_bins - 1, out=idx)
+    return idx, in_range
+
+
+def _histogram_2d(values: np.ndarray, edges: np.ndarray, weights: np.ndarray | None = None) -> np.ndarray:
+    """Row-wise `np.histogram` of `values` (num_dims, num_values) with the bin `edges` of each row."""
+    num_dims, num_bins = edges.shape[0], edges.shape[1] - 1
+    idx, in_range = _bin_indices(values, edges)
+    # Offset the bins of each dimension so that a single bincount fills every histogram
+    flat_idx = idx + (np.arange(num_dims) * num_bins)[:, None]
+    flat_weights = in_range.astype(np.float64) if weights is None else np.where(in_range, weights, 0)
+    return np.bincount(flat_idx.ravel(), weights=flat_weights.ravel(), minlength=num_dims * num_bins).reshape(
+        num_dims, num_bins
+    )
 
-        # If no samples in this bin, use the bin edge
-        if count_in_bin == 0:
-            return edges[idx]
 
-        # Linear interpolation within the bin
-        fraction = (target_count - count_before) / count_in_bin
-        return edges[idx] + fraction * (edges[idx + 1] - edges[idx])
+def _rebin_histograms(histograms: np.ndarray, old_edges: np.ndarray, new_edges: np.ndarray) -> np.ndarray:
+    """Redistribute the counts of each old bin to the new bin containing its center."""
+    old_centers = (old_edges[:, :-1] + old_edges[:, 1:]) / 2
+    # Old centers always fall within the new range, which contains the old one; clip the rounding errors
+    old_centers = np.clip(old_centers, new_edges[:, :1], new_edges[:, -1:])
+    return _histogram_2d(old_centers, new_edges, weights=histograms)
 
 
 def estimate_num_samples(
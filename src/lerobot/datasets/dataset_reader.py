@@ -19,6 +19,8 @@ from collections.abc import Callable
 from pathlib import Path
 
 import datasets
+import numpy as np
+import pyarrow as pa
 import torch
 
 from lerobot.datasets.dataset_metadata import LeRobotDatasetMetadata
@@ -28,16 +30,22 @@ from lerobot.datasets.feature_utils import (
     get_hf_features_from_features,
 )
 from lerobot.datasets.io_utils import (
+    arrow_column_to_numpy,
     hf_transform_to_torch,
     load_nested_dataset,
 )
-from lerobot.datasets.video_utils import decode_video_frames
+from lerobot.datasets.video_utils import (
+    DEFAULT_VIDEO_DECODER_CACHE_SIZE,
+    VideoDecoderCache,
+    decode_video_frames,
+)
 
 
 class DatasetReader:
     """Encapsulates read-side state and methods for LeRobotDataset.
 
-    Owns: hf_dataset, _absolute_to_relative_idx, delta_indices.
+    Owns: hf_dataset, the absolute-to-relative index mapping, delta_indices and, in materialized mode,
+    the in-memory numeric columns.
     """
 
     def __init__(
@@ -49,6 +57,9 @@ class DatasetReader:
         video_backend: str,
         delta_timestamps: dict[str, list[float]] | None,
         image_transforms: Callable | None,
+        materialize: bool = False,
+        video_decoder_cache_size: int | None = DEFAULT_VIDEO_DECODER_CACHE_SIZE,
+        video_decoder_cache_max_mb: float | None = None,
     ):
         """Initialize the reader with metadata, filtering, and transform config.
 
@@ -66,6 +77,17 @@ class DatasetReader:
                 relative timestamp offsets for temporal context windows.
             image_transforms: Optional torchvision v2 transform applied to
                 visual features.
+            materialize: If ``True``, every numeric column is loaded once into
+                contiguous tensors placed in shared memory, and rows are served
+                by slicing them instead of going through the HF dataset
+                formatter. DataLoader workers share these tensors instead of
+                copying them. Meant for datasets whose non-video features fit
+                in RAM.
+            video_decoder_cache_size: Maximum number of video decoders (and
+                open files) kept by each process. ``None`` means unbounded.
+                Defaults to 64.
+            video_decoder_cache_max_mb: Maximum estimated memory of the cached
+                video decoders of each process, in MB. ``None`` means unbounded.
         """
         self._meta = meta
         self.root = root
@@ -73,9 +95,25 @@ class DatasetReader:
         self._tolerance_s = tolerance_s
         self._video_backend = video_backend
         self._image_transforms = image_transforms
+        self._materialize = materialize
+        # Each DataLoader worker ends up with its own cache (see VideoDecoderCache), bounded as configured
+        self.video_decoder_cache = VideoDecoderCache(
+            max_size=video_decoder_cache_size,
+            max_bytes=int(video_decoder_cache_max_mb * 1024**2) if video_decoder_cache_max_mb else None,
+        )
 
         self.hf_dataset: datasets.Dataset | None = None
-        self._absolute_to_relative_idx: dict[int, int] | None = None
+        # Materialized numeric columns (shared memory tensors), and a view of hf_dataset restricted to the
+        # remaining columns (e.g. images) that can't be materialized.
+        self._columns: dict[str, torch.Tensor] | None = None
+        self._non_materialized_dataset: datasets.Dataset | None = None
+        # Sorted absolute indices of the selected frames and their matching relative (row) indices.
+        # Only set when filtering episodes, otherwise absolute and relative indices are the same.
+        self._sorted_abs_idx: np.ndarray | None = None
+        self._sorted_rel_idx: np.ndarray | None = None
+        # Per-episode [from, to) absolute index bounds, indexed by episode index.
+        self._ep_from_idx: np.ndarray | None = None
+        self._ep_to_idx: np.ndarray | None = None
 
         # Setup delta_indices (doesn't depend on hf_dataset)
         self.delta_indices = None
@@ -94,21 +132,74 @@ class DatasetReader:
             self.hf_dataset = None
             return False
         self._build_index_mapping()
+        self._build_column_store()
         return True
 
     def load_and_activate(self) -> None:
         """Load HF dataset from disk and build index mapping. Call after data is on disk."""
         self.hf_dataset = self._load_hf_dataset()
         self._build_index_mapping()
+        self._build_column_store()
 
     def _build_index_mapping(self) -> None:
         """Build absolute-to-relative index mapping from loaded hf_dataset."""
-        self._absolute_to_relative_idx = None
+        self._sorted_abs_idx = None
+        self._sorted_rel_idx = None
+        self._ep_from_idx = None
+        self._ep_to_idx = None
         if self.episodes is not None and self.hf_dataset is not None:
-            self._absolute_to_relative_idx = {
-                abs_idx.item() if isinstance(abs_idx, torch.Tensor) else abs_idx: rel_idx
-                for rel_idx, abs_idx in enumerate(self.hf_dataset["index"])
-            }
+            abs_idx = self.hf_dataset.with_format("numpy")["index"][:].astype(np.int64)
+            order = np.argsort(abs_idx, kind="stable")
+            self._sorted_abs_idx = abs_idx[order]
+            self._sorted_rel_idx = order
+
+    def _build_column_store(self) -> None:
+        """Load every numeric column of hf_dataset into contiguous shared-memory tensors (materialized mode)."""
+        self._columns = None
+        self._non_materialized_dataset = None
+        if not self._materialize or self.hf_dataset is None or self.hf_dataset._indices is not None:
+            return
+
+        table = self.hf_dataset.data.table
+        columns = {}
+        for key in table.column_names:
+            shape = self._meta.features[key]["shape"] if key in self._meta.features else ()
+            values = arrow_column_to_numpy(table.column(key), shape)
+            if values is not None:
+                # Allocating in shared memory upfront lets DataLoader workers map the same storage
+                # instead of getting their own copy, whatever the multiprocessing start method.
+                columns[key] = _to_torch(values, out=_empty_like_numpy(values).share_memory_())
+
+        remaining = [key for key in table.column_names if key not in columns]
+        if len(remaining) > 0:
+            self._non_materialized_dataset = self.hf_dataset.select_columns(remaining)
+        self._columns = columns
+
+    def abs_to_rel_indices(self, abs_indices: np.ndarray) -> np.ndarray:
+        """Map absolute frame indices (the ``index`` column) to row indices in ``hf_dataset``.
+
+        Raises:
+            KeyError: If any of the indices does not belong to the selected episodes.
+        """
+        abs_indices = np.asarray(abs_indices, dtype=np.int64)
+        if self._sorted_abs_idx is None:
+            return abs_indices
+        pos = np.searchsorted(self._sorted_abs_idx, abs_indices)
+        pos = np.minimum(pos, len(self._sorted_abs_idx) - 1)
+        missing = self._sorted_abs_idx[pos] != abs_indices
+        if missing.any():
+            raise KeyError(
+                f"Frame indices {abs_indices[missing].tolist()} are not part of the selected episodes."
+            )
+        return self._sorted_rel_idx[pos]
+
+    def _get_episode_bounds(self, ep_idx: int) -> tuple[int, int]:
+        """Return the ``[from, to)`` absolute frame bounds of an episode, cached as numpy arrays."""
+        if self._ep_from_idx is None:
+            episodes = self._meta.episodes.with_format("numpy")
+            self._ep_from_idx = episodes["dataset_from_index"][:].astype(np.int64)
+            self._ep_to_idx = episodes["dataset_to_index"][:].astype(np.int64)
+        return int(self._ep_from_idx[ep_idx]), int(self._ep_to_idx[ep_idx])
 
     @property
     def num_frames(self) -> int:
@@ -176,53 +267,84 @@ class DatasetReader:
 
     def _get_query_indices(
         self, abs_idx: int, ep_idx: int
-    ) -> tuple[dict[str, list[int]], dict[str, torch.Tensor]]:
-        """Compute query indices for delta timestamps."""
-        ep = self._meta.episodes[ep_idx]
-        ep_start = ep["dataset_from_index"]
-        ep_end = ep["dataset_to_index"]
-        query_indices = {
-            key: [max(ep_start, min(ep_end - 1, abs_idx + delta)) for delta in delta_idx]
-            for key, delta_idx in self.delta_indices.items()
-        }
-        padding = {
-            f"{key}_is_pad": torch.BoolTensor(
-                [(abs_idx + delta < ep_start) | (abs_idx + delta >= ep_end) for delta in delta_idx]
-            )
-            for key, delta_idx in self.delta_indices.items()
-        }
+    ) -> tuple[dict[str, np.ndarray], dict[str, torch.Tensor]]:
+        """Compute query indices for delta timestamps.
+
+        Indices falling outside of the episode are clamped to its first/last frame and flagged in the
+        ``{key}_is_pad`` masks.
+        """
+        ep_start, ep_end = self._get_episode_bounds(ep_idx)
+        query_indices = {}
+        padding = {}
+        for key, delta_idx in self.delta_indices.items():
+            indices = abs_idx + np.asarray(delta_idx, dtype=np.int64)
+            padding[f"{key}_is_pad"] = torch.from_numpy((indices < ep_start) | (indices >= ep_end))
+            query_indices[key] = np.clip(indices, ep_start, ep_end - 1)
         return query_indices, padding
 
     def _get_query_timestamps(
         self,
         current_ts: float,
-        query_indices: dict[str, list[int]] | None = None,
+        query_indices: dict[str, np.ndarray] | None = None,
     ) -> dict[str, list[float]]:
         query_timestamps = {}
         for key in self._meta.video_keys:
             if query_indices is not None and key in query_indices:
-                if self._absolute_to_relative_idx is not None:
-                    relative_indices = [self._absolute_to_relative_idx[idx] for idx in query_indices[key]]
-                    timestamps = self.hf_dataset[relative_indices]["timestamp"]
-                else:
-                    timestamps = self.hf_dataset[query_indices[key]]["timestamp"]
-                query_timestamps[key] = torch.stack(timestamps).tolist()
+                timestamps = self._gather_columns(["timestamp"], query_indices[key])["timestamp"]
+                query_timestamps[key] = timestamps.tolist()
             else:
                 query_timestamps[key] = [current_ts]
 
         return query_timestamps
 
-    def _query_hf_dataset(self, query_indices: dict[str, list[int]]) -> dict:
-        """Query dataset for indices across keys, skipping video keys."""
+    def _take_rows(self, keys: list[str], relative_indices: np.ndarray) -> dict[str, torch.Tensor]:
+        """Read ``keys`` at ``relative_indices`` with a single Arrow ``take`` into preallocated tensors.
+
+        Only numeric columns can be read this way; the returned dict omits the other ones (e.g. images,
+        strings), which callers have to read through the HF dataset formatter.
+        """
+        if self._columns is not None:
+            # Everything that can be read this way has already been materialized
+            rel_indices_t = torch.from_numpy(relative_indices)
+            return {key: self._columns[key][rel_indices_t] for key in keys if key in self._columns}
+
+        if self.hf_dataset._indices is not None:
+            relative_indices = self.hf_dataset._indices.column(0).to_numpy()[relative_indices]
+        table = self.hf_dataset.data.table.select(keys).take(pa.array(relative_indices))
+        result = {}
+        for key in keys:
+            shape = self._meta.features[key]["shape"] if key in self._meta.features else ()
+            values = arrow_column_to_numpy(table.column(key), shape)
+            if values is not None:
+                result[key] = _to_torch(values)
+        return result
+
+    def _gather_columns(self, keys: list[str], abs_indices: np.ndarray) -> dict[str, torch.Tensor]:
+        """Same as :meth:`_take_rows`, from absolute frame indices."""
+        return self._take_rows(keys, self.abs_to_rel_indices(abs_indices))
+
+    def _query_hf_dataset(self, query_indices: dict[str, np.ndarray]) -> dict:
+        """Query dataset for indices across keys, skipping video keys.
+
+        Numeric columns are gathered together with one Arrow ``take`` over the union of the requested
+        indices, other columns (e.g. images) go through the HF dataset formatter.
+        """
         result: dict = {}
-        for key, q_idx in query_indices.items():
-            if key in self._meta.video_keys:
+        keys = [key for key in query_indices if key not in self._meta.video_keys]
+        numeric_keys = [key for key in keys if self._meta.features.get(key, {}).get("dtype") != "image"]
+        if len(numeric_keys) > 0:
+            all_indices = np.concatenate([query_indices[key] for key in numeric_keys])
+            unique_indices, inverse = np.unique(all_indices, return_inverse=True)
+            gathered = self._gather_columns(numeric_keys, unique_indices)
+            offsets = np.cumsum([0] + [len(query_indices[key]) for key in numeric_keys])
+            for i, key in enumerate(numeric_keys):
+                if key in gathered:
+                    result[key] = gathered[key][torch.from_numpy(inverse[offsets[i] : offsets[i + 1]])]
+
+        for key in keys:
+            if key in result:
                 continue
-            relative_indices = (
-                q_idx
-                if self._absolute_to_relative_idx is None
-                else [self._absolute_to_relative_idx[idx] for idx in q_idx]
-            )
+            relative_indices = self.abs_to_rel_indices(query_indices[key]).tolist()
             try:
                 result[key] = torch.stack(self.hf_dataset[key][relative_indices])
             except (KeyError, TypeError, IndexError):
@@ -234,15 +356,81 @@ class DatasetReader:
         in the main process (e.g. by using a second Dataloader with num_workers=0). It will result in a
         Segmentation Fault.
         """
-        ep = self._meta.episodes[ep_idx]
-        item = {}
-        for vid_key, query_ts in query_timestamps.items():
-            from_timestamp = ep[f"videos/{vid_key}/from_timestamp"]
-            shifted_query_ts = [from_timestamp + ts for ts in query_ts]
+        return self._query_videos_batch([(query_timestamps, ep_idx)])[0]
 
-            video_path = self.root / self._meta.get_video_file_path(ep_idx, vid_key)
-            frames = decode_video_frames(video_path, shifted_query_ts, self._tolerance_s, self._video_backend)
-            item[vid_key] = frames.squeeze(0)
+    def _query_videos_batch(
+        self, queries: list[tuple[dict[str, list[float]], int]]
+    ) -> list[dict[str, torch.Tensor]]:
+        """Decode the frames of several ``(query_timestamps, ep_idx)`` queries at once.
+
+        Queries are grouped by video file, so that each file is decoded with a single call for all the
+        timestamps it serves. Backends without accurate seeking (pyav, video_reader) decode every frame
+        between the first and last requested timestamps, so for those the queries are grouped by episode
+        as well to keep the decoded range short.
+        """
+        groups: dict[tuple, list[tuple[int, list[float]]]] = {}
+        for item_idx, (query_timestamps, ep_idx) in enumerate(queries):
+            ep = self._meta.episodes[ep_idx]
+            for vid_key, query_ts in query_timestamps.items():
+                from_timestamp = ep[f"videos/{vid_key}/from_timestamp"]
+                shifted_query_ts = [from_timestamp + ts for ts in query_ts]
+                video_path = self.root / self._meta.get_video_file_path(ep_idx, vid_key)
+                group_key = (
+                    (vid_key, video_path)
+                    if self._video_backend == "torchcodec"
+                    else (vid_key, video_path, ep_idx)
+                )
+                groups.setdefault(group_key, []).append((item_idx, shifted_query_ts))
+
+        items: list[dict[str, torch.Tensor]] = [{} for _ in queries]
+        for (vid_key, video_path, *_), requests in groups.items():
+            all_query_ts = [ts for _, query_ts in requests for ts in query_ts]
+            frames = decode_video_frames(
+                video_path,
+                all_query_ts,
+                self._tolerance_s,
+                self._video_backend,
+                decoder_cache=self.video_decoder_cache,
+            )
+            splits = frames.split([len(query_ts) for _, query_ts in requests])
+            for (item_idx, _), item_frames in zip(requests, splits, strict=True):
+                items[item_idx][vid_key] = item_frames.squeeze(0)
+
+        return items
+
+    def _get_row(self, idx) -> dict:
+        """Return the row at relative index ``idx``, sliced from the materialized columns when available."""
+        if self._columns is None:
+            return self.hf_dataset[idx]
+        item = {key: column[idx] for key, column in self._columns.items()}
+        if self._non_materialized_dataset is not None:
+            item.update(self._non_materialized_dataset[idx])
+        return item
+
+    def _get_rows(self, relative_indices: np.ndarray) -> list[dict]:
+        """Return the rows at ``relative_indices``, reading all numeric columns with one Arrow ``take``."""
+        keys = self.hf_dataset.column_names
+        columns = self._take_rows(keys, relative_indices)
+        remaining = [key for key in keys if key not in columns]
+        if len(remaining) > 0:
+            columns.update(self.hf_dataset.select_columns(remaining)[relative_indices.tolist()])
+        return [{key: columns[key][i] for key in keys} for i in range(len(relative_indices))]
+
+    def _finalize_item(self, item: dict) -> dict:
+        """Apply image transforms and add the task (and subtask) strings to a fully queried item."""
+        if self._image_transforms is not None:
+            image_keys = self._meta.camera_keys
+            for cam in image_keys:
+                item[cam] = self._image_transforms(item[cam])
+
+        # Add task as a string
+        task_idx = item["task_index"].item()
+        item["task"] = self._meta.tasks.iloc[task_idx].name
+
+        # add subtask information if available
+        if "subtask_index" in self._meta.features and self._meta.subtasks is not None:
+            subtask_idx = item["subtask_index"].item()
+            item["subtask"] = self._meta.subtasks.iloc[subtask_idx].name
 
         return item
 
@@ -253,7 +441,7 @@ class DatasetReader:
         HF dataset, **not** the absolute frame index stored in the ``index``
         column.  The absolute index is retrieved from the row itself.
         """
-        item = self.hf_dataset[idx]
+        item = self._get_row(idx)
         ep_idx = item["episode_index"].item()
         abs_idx = item["index"].item()
 
@@ -271,18 +459,73 @@ class DatasetReader:
             video_frames = self._query_videos(query_timestamps, ep_idx)
             item = {**video_frames, **item}
 
-        if self._image_transforms is not None:
-            image_keys = self._meta.camera_keys
-            for cam in image_keys:
-                item[cam] = self._image_transforms(item[cam])
+        return self._finalize_item(item)
 
-        # Add task as a string
-        task_idx = item["task_index"].item()
-        item["task"] = self._meta.tasks.iloc[task_idx].name
+    def get_items(self, indices: list[int]) -> list[dict]:
+        """Batched version of :meth:`get_item`, returning the same items.
 
-        # add subtask information if available
-        if "subtask_index" in self._meta.features and self._meta.subtasks is not None:
-            subtask_idx = item["subtask_index"].item()
-            item["subtask"] = self._meta.subtasks.iloc[subtask_idx].name
+        Work is shared across the batch: the rows and the delta-timestamp windows of all items are each read
+        with one Arrow ``take``, and video frames are decoded with one call per video file.
+        """
+        relative_indices = np.asarray(indices, dtype=np.int64)
+        items = self._get_rows(relative_indices)
+        ep_indices = [item["episode_index"].item() for item in items]
 
-        return item
+        all_query_indices: list[dict[str, np.ndarray] | None] = [None] * len(items)
+        if self.delta_indices is not None:
+            paddings = []
+            for i, item in enumerate(items):
+                all_query_indices[i], padding = self._get_query_indices(item["index"].item(), ep_indices[i])
+                paddings.append(padding)
+            # Query the windows of the whole batch at once, then split them back per item
+            batch_query_indices = {
+                key: np.concatenate([query_indices[key] for query_indices in all_query_indices])
+                for key in self.delta_indices
+            }
+            query_result = self._query_hf_dataset(batch_query_indices)
+            for key, val in query_result.items():
+                query_result[key] = val.unflatten(0, (len(items), len(self.delta_indices[key])))
+            for i in range(len(items)):
+                items[i] = {**items[i], **paddings[i]}
+                for key, val in query_result.items():
+                    items[i][key] = val[i]
+
+        if len(self._meta.video_keys) > 0:
+            batch_query_timestamps = {}
+            for key in self._meta.video_keys:
+                if self.delta_indices is not None and key in self.delta_indices:
+                    batch_query_indices = np.concatenate(
+                        [query_indices[key] for query_indices in all_query_indices]
+                    )
+                    timestamps = self._gather_columns(["timestamp"], batch_query_indices)["timestamp"]
+                    batch_query_timestamps[key] = timestamps.unflatten(0, (len(items), -1)).tolist()
+                else:
+                    batch_query_timestamps[key] = [[item["timestamp"].item()] for item in items]
+            queries = [
+                ({key: batch_query_timestamps[key][i] for key in self._meta.video_keys}, ep_indices[i])
+                for i in range(len(items))
+            ]
+            video_frames = self._query_videos_batch(queries)
+            items = [{**frames, **item} for frames, item in zip(video_frames, items, strict=True)]
+
+        return [self._finalize_item(item) for item in items]
+
+
+def _empty_like_numpy(values: np.ndarray) -> torch.Tensor:
+    """Allocate an uninitialized tensor with the shape of ``values`` and the dtype given by :func:`_to_torch`."""
+    # Match the dtypes produced by `hf_transform_to_torch` (torch.tensor on Python scalars)
+    if values.dtype.kind == "f":
+        dtype = torch.get_default_dtype()
+    elif values.dtype.kind in "iu":
+        dtype = torch.int64
+    else:
+        dtype = torch.bool
+    return torch.empty(values.shape, dtype=dtype)
+
+
+def _to_torch(values: np.ndarray, out: torch.Tensor | None = None) -> torch.Tensor:
+    """Copy a numpy array into a (preallocated) tensor, casting to the dtypes of the HF formatter path."""
+    if out is None:
+        out = _empty_like_numpy(values)
+    out.numpy()[...] = values
+    return out
@@ -23,10 +23,11 @@ This module provides utilities for:
 - Merging datasets (wrapper around aggregate functionality)
 """
 
+import io
 import logging
 import shutil
 from collections.abc import Callable
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 import datasets
@@ -38,14 +39,18 @@ from tqdm import tqdm
 
 from lerobot.datasets.aggregate import aggregate_datasets
 from lerobot.datasets.compute_stats import (
+    RunningQuantileStats,
     aggregate_stats,
-    compute_episode_stats,
+    auto_downsample_height_width,
     compute_relative_action_stats,
+    sample_indices,
 )
 from lerobot.datasets.dataset_metadata import LeRobotDatasetMetadata
 from lerobot.datasets.io_utils import (
+    arrow_column_to_numpy,
     get_parquet_file_size_in_mb,
     load_episodes,
+    load_image_as_numpy,
     write_info,
     write_stats,
     write_tasks,
@@ -59,9 +64,12 @@ from lerobot.datasets.utils import (
     DEFAULT_EPISODES_PATH,
     update_chunk_file_indices,
 )
-from lerobot.datasets.video_utils import encode_video_frames, get_video_info
+from lerobot.datasets.video_utils import decode_video_frames, encode_video_frames, get_video_info
 from lerobot.utils.constants import ACTION, HF_LEROBOT_HOME, OBS_IMAGE, OBS_STATE
 
+# Number of sampled video frames decoded at once when recomputing image stats
+_STATS_VIDEO_DECODE_BATCH = 64
+
 
 def _load_episode_with_stats(src_dataset: LeRobotDataset, episode_idx: int) -> dict:
     """Load a single episode's metadata including stats from parquet file.
@@ -1537,6 +1545,117 @@ def modify_tasks(
     return dataset
 
 
+def _compute_file_value_ranges(
+    parquet_path: Path, numeric_features: dict[str, dict], chunk_rows: int
+) -> dict[str, tuple[np.ndarray, np.ndarray]]:
+    """Min and max of every numeric feature of a data file, read in chunks of `chunk_rows` frames."""
+    ranges = {}
+    parquet_file = pq.ParquetFile(parquet_path)
+    keys = [key for key in numeric_features if key in parquet_file.schema_arrow.names]
+    for batch in parquet_file.iter_batches(batch_size=chunk_rows, columns=keys):
+        for key in keys:
+            values = _numeric_batch_values(batch, key, numeric_features[key])
+            low, high = values.min(axis=0), values.max(axis=0)
+            if key in ranges:
+                low, high = np.minimum(ranges[key][0], low), np.maximum(ranges[key][1], high)
+            ranges[key] = (low, high)
+    return ranges
+
+
+def _numeric_batch_values(batch, key: str, feature: dict) -> np.ndarray:
+    """Values of a numeric column of a record batch, flattened to (num_frames, num_dims) float64."""
+    values = arrow_column_to_numpy(batch.column(key), tuple(feature["shape"]))
+    if values is None:
+        values = np.stack(batch.column(key).to_numpy(zero_copy_only=False))
+    return values.reshape(len(values), -1).astype(np.float64)
+
+
+def _update_image_stats(
+    image_stats: dict[str, RunningQuantileStats], image_counts: dict[str, int], key: str, frames: np.ndarray
+) -> None:
+    """Accumulate per-channel pixel statistics of (N, C, H, W) frames with values in [0, 1]."""
+    frames = np.stack([auto_downsample_height_width(frame) for frame in frames])
+    num_channels = frames.shape[1]
+    if key not in image_stats:
+        # A fixed [0, 1] range gives every worker the same bins, so that their histograms merge exactly
+        image_stats[key] = RunningQuantileStats(value_range=(np.zeros(num_channels), np.ones(num_channels)))
+        image_counts[key] = 0
+    image_stats[key].update(frames.transpose(0, 2, 3, 1).reshape(-1, num_channels).astype(np.float64))
+    image_counts[key] += len(frames)
+
+
+def _compute_file_stats(
+    parquet_path: Path,
+    numeric_features: dict[str, dict],
+    value_ranges: dict[str, tuple[np.ndarray, np.ndarray]],
+    image_keys: list[str],
+    sampled_indices: np.ndarray,
+    video_jobs: list[tuple[str, Path, list[float]]],
+    video_backend: str | None,
+    tolerance_s: float,
+    chunk_rows: int,
+) -> tuple[dict[str, RunningQuantileStats], dict[str, int]]:
+    """Partial statistics of the frames of one data file.
+
+    Numeric features are read in chunks of `chunk_rows` frames. Image features stored in the data file are only
+    decoded for the frames of `sampled_indices`, and the sampled frames of video features (`video_jobs`) are
+    decoded by batches of consecutive timestamps.
+
+    Returns:
+        The running statistics of each feature, and the number of sampled frames of each image/video feature.
+    """
+    stats = {
+        key: RunningQuantileStats(value_range=value_ranges[key])
+        for key in numeric_features
+        if key in value_ranges
+    }
+    image_counts = {}
+
+    parquet_file = pq.ParquetFile(parquet_path)
+    numeric_keys = [key for key in stats if key in parquet_file.schema_arrow.names]
+    columns = numeric_keys + (["index", *image_keys] if image_keys else [])
+    for batch in parquet_file.iter_batches(batch_size=chunk_rows, columns=columns):
+        for key in numeric_keys:
+            stats[key].update(_numeric_batch_values(batch, key, numeric_features[key]))
+        if not image_keys:
+            continue
+        rows = np.flatnonzero(np.isin(batch.column("index").to_numpy(), sampled_indices))
+        if len(rows) == 0:
+            continue
+        for key in image_keys:
+            images = batch.column(key).take(rows).to_pylist()
+            frames = np.stack(
+                [
+                    load_image_as_numpy(io.BytesIO(img["bytes"]) if img["bytes"] else img["path"])
+                    for img in images
+                ]
+            )
+            _update_image_stats(stats, image_counts, key, frames)
+
+    for key, video_path, timestamps in video_jobs:
+        for start in range(0, len(timestamps), _STATS_VIDEO_DECODE_BATCH):
+            frames = decode_video_frames(
+                video_path,
+                timestamps[start : start + _STATS_VIDEO_DECODE_BATCH],
+                tolerance_s=tolerance_s,
+                backend=video_backend,
+            )
+            _update_image_stats(stats, image_counts, key, frames.numpy())
+
+    return stats, image_counts
+
+
+def _map_data_files(fn: Callable, jobs: list[tuple], num_workers: int, desc: str) -> list:
+    """Run `fn(*job)` for every job, in a process pool when `num_workers` > 1."""
+    if num_workers <= 1:
+        return [fn(*job) for job in tqdm(jobs, desc=desc)]
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        futures = [executor.submit(fn, *job) for job in jobs]
+        for _ in tqdm(as_completed(futures), total=len(futures), desc=desc):
+            pass
+        return [future.result() for future in futures]
+
+
 def recompute_stats(
     dataset: LeRobotDataset,
     skip_image_video: bool = True,
@@ -1544,8 +1663,18 @@ def recompute_stats(
     relative_exclude_joints: list[str] | None = None,
     chunk_size: int = 50,
     num_workers: int = 0,
+    chunk_rows: int = 10_000,
+    video_backend: str | None = None,
 ) -> LeRobotDataset:
-    """Recompute stats.json from scratch by iterating all episodes.
+    """Recompute stats.json from scratch by streaming all data files.
+
+    Data files are processed in parallel and read in chunks of `chunk_rows` frames, so that memory stays
+    bounded whatever the episode lengths. A first pass computes the range of each numeric feature; the second
+    pass then accumulates the statistics of every file in histograms sharing the same bins, so that the partial
+    statistics of the workers (count, mean, std, min, max and quantiles) are merged exactly.
+
+    Image and video statistics are computed per channel over frames sampled in each episode (see
+    `sample_indices`), video frames being decoded by batches.
 
     Args:
         dataset: The LeRobotDataset to recompute stats for.
@@ -1559,8 +1688,11 @@ def recompute_stats(
             relative_action=True. These dims keep absolute stats.
         chunk_size: Action chunk size used for relative stats computation. Should match
             ``policy.chunk_size``. Only used when ``relative_action=True``.
-        num_workers: Number of parallel threads for relative action stats computation.
-            Values ≤1 mean single-threaded. Only used when ``relative_action=True``.
+        num_workers: Number of worker processes computing the stats of the data files, also used as the
+            number of threads of the relative action stats computation. Values ≤1 mean single-process.
+        chunk_rows: Maximum number of frames read at once from a data file.
+        video_backend: Backend used to decode video frames when ``skip_image_video=False``. Defaults to
+            torchcodec when available in the platform; otherwise, defaults to 'pyav'.
 
     Returns:
         The same dataset with updated stats.
@@ -1582,7 +1714,7 @@ def recompute_stats(
 
     # When relative_action is enabled, compute action stats via chunk-based sampling
     # (matching what the model sees during training) and skip action in the
-    # per-episode pass below.
+    # per-file pass below.
     relative_action_stats = None
     if relative_action and ACTION in features and OBS_STATE in features:
         if relative_exclude_joints is None:
@@ -1594,7 +1726,7 @@ def recompute_stats(
             exclude_joints=relative_exclude_joints,
             num_workers=num_workers,
         )
-        features_to_compute.pop(ACTION, None)
+        features_to_compute = {k: v for k, v in features_to_compute.items() if k != ACTION}
 
     logging.info(f"Recomputing stats for features: {list(features_to_compute.keys())}")
 
@@ -1603,32 +1735,76 @@ def recompute_stats(
     if not parquet_files:
         raise ValueError(f"No parquet files found in {data_dir}")
 
-    all_episode_stats = []
-    numeric_keys = [k for k, v in features_to_compute.items() if v["dtype"] not in ["image", "video"]]
-
-    for parquet_path in tqdm(parquet_files, desc="Computing stats from data files"):
-        df = pd.read_parquet(parquet_path)
-
-        for ep_idx in sorted(df["episode_index"].unique()):
-            ep_df = df[df["episode_index"] == ep_idx]
-            episode_data = {}
-            for key in numeric_keys:
-                if key in ep_df.columns:
-                    values = ep_df[key].values
-                    if hasattr(values[0], "__len__"):
-                        episode_data[key] = np.stack(values)
-                    else:
-                        episode_data[key] = np.array(values)
-
-            ep_stats = compute_episode_stats(episode_data, features_to_compute)
-            all_episode_stats.append(ep_stats)
+    numeric_to_compute = {k: v for k, v in features_to_compute.items() if k in numeric_features}
+    image_keys = [k for k, v in features_to_compute.items() if v["dtype"] == "image"]
+    video_keys = [k for k, v in features_to_compute.items() if v["dtype"] == "video"]
+
+    # Frames sampled for image/video stats, and the video frames to decode, grouped by data file
+    sampled_per_file = {path: [] for path in parquet_files}
+    video_jobs_per_file = {path: [] for path in parquet_files}
+    if image_keys or video_keys:
+        if dataset.meta.episodes is None:
+            dataset.meta.episodes = load_episodes(dataset.root)
+        for ep in dataset.meta.episodes:
+            data_path = dataset.root / dataset.meta.get_data_file_path(ep["episode_index"])
+            offsets = np.asarray(sample_indices(ep["length"]))
+            sampled_per_file[data_path].append(ep["dataset_from_index"] + offsets)
+            for key in video_keys:
+                video_path = dataset.root / dataset.meta.get_video_file_path(ep["episode_index"], key)
+                timestamps = (ep[f"videos/{key}/from_timestamp"] + offsets / dataset.meta.fps).tolist()
+                video_jobs_per_file[data_path].append((key, video_path, timestamps))
+
+    value_ranges = {}
+    if numeric_to_compute:
+        range_jobs = [(path, numeric_to_compute, chunk_rows) for path in parquet_files]
+        for file_ranges in _map_data_files(
+            _compute_file_value_ranges, range_jobs, num_workers, "Computing feature ranges"
+        ):
+            for key, (low, high) in file_ranges.items():
+                if key in value_ranges:
+                    low = np.minimum(value_ranges[key][0], low)
+                    high = np.maximum(value_ranges[key][1], high)
+                value_ranges[key] = (low, high)
+
+    stats_jobs = [
+        (
+            path,
+            numeric_to_compute,
+            value_ranges,
+            image_keys,
+            np.concatenate(sampled_per_file[path]) if sampled_per_file[path] else np.empty(0, dtype=np.int64),
+            video_jobs_per_file[path],
+            video_backend,
+            dataset.tolerance_s,
+            chunk_rows,
+        )
+        for path in parquet_files
+    ]
+    merged_stats: dict[str, RunningQuantileStats] = {}
+    image_counts: dict[str, int] = {}
+    for file_stats, file_image_counts in _map_data_files(
+        _compute_file_stats, stats_jobs, num_workers, "Computing stats from data files"
+    ):
+        for key, running_stats in file_stats.items():
+            merged_stats.setdefault(key, RunningQuantileStats()).merge(running_stats)
+        for key, count in file_image_counts.items():
+            image_counts[key] = image_counts.get(key, 0) + count
+
+    new_stats = {}
+    for key, running_stats in merged_stats.items():
+        ft_stats = running_stats.get_statistics()
+        if key in image_counts:
+            # Per-channel stats of shape (C, 1, 1), counted in sampled frames
+            new_stats[key] = {k: v if k == "count" else v.reshape(-1, 1, 1) for k, v in ft_stats.items()}
+            new_stats[key]["count"] = np.array([image_counts[key]])
+        else:
+            shape = tuple(features[key]["shape"])
+            new_stats[key] = {k: v if k == "count" else v.reshape(shape) for k, v in ft_stats.items()}
 
-    if features_to_compute and not all_episode_stats:
+    if features_to_compute and not new_stats:
         logging.warning("No episode stats computed")
         return dataset
 
-    new_stats = aggregate_stats(all_episode_stats) if all_episode_stats else {}
-
     if relative_action_stats is not None:
         new_stats[ACTION] = relative_action_stats
 
@@ -19,15 +19,20 @@ from __future__ import annotations
 
 import concurrent.futures
 import contextlib
+import json
 import logging
+import queue
 import shutil
 import tempfile
+import threading
+from dataclasses import dataclass
 from pathlib import Path
 
 import datasets
 import numpy as np
 import pandas as pd
 import PIL.Image
+import pyarrow as pa
 import pyarrow.parquet as pq
 import torch
 
@@ -35,8 +40,8 @@ from lerobot.datasets.compute_stats import compute_episode_stats
 from lerobot.datasets.dataset_metadata import LeRobotDatasetMetadata
 from lerobot.datasets.feature_utils import (
     get_hf_features_from_features,
+    make_frame_validator,
     validate_episode_buffer,
-    validate_frame,
 )
 from lerobot.datasets.image_writer import AsyncImageWriter, write_image
 from lerobot.datasets.io_utils import (
@@ -48,6 +53,7 @@ from lerobot.datasets.io_utils import (
 from lerobot.datasets.utils import (
     DEFAULT_EPISODES_PATH,
     DEFAULT_IMAGE_PATH,
+    PENDING_EPISODES_DIR,
     update_chunk_file_indices,
 )
 from lerobot.datasets.video_utils import (
@@ -56,9 +62,14 @@ from lerobot.datasets.video_utils import (
     encode_video_frames,
     get_video_duration_in_s,
 )
+from lerobot.utils.utils import is_valid_numpy_dtype_string
 
 logger = logging.getLogger(__name__)
 
+# Number of frames preallocated for the features of the first episode, later episodes start with the
+# length of the previous one
+MIN_COLUMN_CAPACITY = 64
+
 
 def _encode_video_worker(
     video_key: str,
@@ -78,11 +89,82 @@ def _encode_video_worker(
     return temp_path
 
 
+class _FeatureColumn:
+    """Growable array holding the values of a fixed-shape feature for the frames of an episode.
+
+    Frames are copied into a preallocated array whose capacity doubles when it's full, instead of being
+    appended to a list and stacked at the end of the episode.
+    """
+
+    def __init__(self, shape: tuple[int, ...], dtype: np.dtype, capacity: int = MIN_COLUMN_CAPACITY):
+        self._data = np.empty((max(capacity, 1), *shape), dtype=dtype)
+        self._size = 0
+
+    def append(self, value) -> None:
+        if self._size == len(self._data):
+            grown = np.empty((2 * len(self._data), *self._data.shape[1:]), dtype=self._data.dtype)
+            grown[: self._size] = self._data
+            self._data = grown
+        self._data[self._size] = value
+        self._size += 1
+
+    def __len__(self) -> int:
+        return self._size
+
+    def to_numpy(self) -> np.ndarray:
+        """Return the values of the recorded frames, as a view of the column."""
+        return self._data[: self._size]
+
+
+def _episode_to_arrow_table(ep_dict: dict, hf_features: datasets.Features) -> pa.Table | None:
+    """Build the arrow table of an episode directly from its numpy columns.
+
+    The table has the same schema as the one of `datasets.Dataset.from_dict`, without converting the
+    columns frame by frame. Returns `None` for features that don't map to a flat arrow array (images,
+    multi-dimensional arrays), which go through `datasets` instead.
+    """
+    arrays = []
+    for key, feature in hf_features.items():
+        value = ep_dict[key]
+        if isinstance(feature, datasets.Value):
+            if isinstance(value, np.ndarray):
+                value = value.reshape(-1)
+            arrays.append(pa.array(value, type=feature.pa_type))
+        elif (
+            isinstance(feature, datasets.Sequence)
+            and isinstance(feature.feature, datasets.Value)
+            and feature.length > 0
+            and isinstance(value, np.ndarray)
+        ):
+            values = pa.array(np.ascontiguousarray(value).reshape(-1), type=feature.feature.pa_type)
+            arrays.append(pa.FixedSizeListArray.from_arrays(values, feature.length))
+        else:
+            return None
+    return pa.Table.from_arrays(arrays, schema=hf_features.arrow_schema)
+
+
+@dataclass
+class _PendingEpisode:
+    """An episode whose frames are all written, waiting to be committed to the dataset."""
+
+    episode_index: int
+    # Index under which the temporary images of the episode were written
+    source_episode_index: int
+    length: int
+    tasks: list[str]
+    buffer: dict
+    # Temporary video path and stats per video key, when the videos were encoded while recording
+    streaming_results: dict[str, tuple[Path, dict | None]] | None
+    delete_images: bool
+    journal_dir: Path | None = None
+
+
 class DatasetWriter:
     """Encapsulates write-side state and methods for LeRobotDataset.
 
     Owns: episode_buffer, image_writer, _pq_writer (ParquetWriter), _latest_episode,
-    _current_file_start_frame, _streaming_encoder, _episodes_since_last_encoding, _recorded_frames.
+    _current_file_start_frame, _streaming_encoder, _episodes_since_last_encoding, _recorded_frames,
+    and with background saving, the save thread and its queue of pending episodes.
     """
 
     def __init__(
@@ -94,6 +176,7 @@ class DatasetWriter:
         batch_encoding_size: int,
         streaming_encoder: StreamingVideoEncoder | None = None,
         initial_frames: int = 0,
+        background_saving: bool = False,
     ):
         """Initialize the writer with metadata, codec, and encoding config.
 
@@ -108,6 +191,10 @@ class DatasetWriter:
             streaming_encoder: Optional pre-built :class:`StreamingVideoEncoder`
                 for real-time encoding. ``None`` disables streaming mode.
             initial_frames: Starting frame count (non-zero when resuming).
+            background_saving: If ``True``, :meth:`save_episode` hands the
+                episode off to a background thread that writes it while the
+                next episode is recorded. Episodes in flight are journaled
+                under ``pending_episodes/`` so that they can be recovered.
         """
         self._meta = meta
         self._root = root
@@ -115,6 +202,21 @@ class DatasetWriter:
         self._encoder_threads = encoder_threads
         self._batch_encoding_size = batch_encoding_size
         self._streaming_encoder = streaming_encoder
+        self._validate_frame = make_frame_validator(meta.features)
+        self._column_capacity = MIN_COLUMN_CAPACITY
+
+        # Background saving state, set before the episode buffer which needs the next episode index
+        self._save_queue: queue.Queue | None = None
+        self._save_thread: threading.Thread | None = None
+        self._background_save_error: Exception | None = None
+        self._next_background_episode_index: int = meta.total_episodes
+        self._encoding_pool: concurrent.futures.ProcessPoolExecutor | None = None
+        if background_saving:
+            self._save_queue = queue.Queue()
+            self._save_thread = threading.Thread(
+                target=self._background_save_loop, name="DatasetWriter-save", daemon=True
+            )
+            self._save_thread.start()
 
         # Writer state
         self.image_writer: AsyncImageWriter | None = None
@@ -127,12 +229,23 @@ class DatasetWriter:
         self._finalized = False
 
     def _create_episode_buffer(self, episode_index: int | None = None) -> dict:
-        current_ep_idx = self._meta.total_episodes if episode_index is None else episode_index
+        current_ep_idx = self._next_episode_index() if episode_index is None else episode_index
         ep_buffer = {}
         ep_buffer["size"] = 0
         ep_buffer["task"] = []
-        for key in self._meta.features:
-            ep_buffer[key] = current_ep_idx if key == "episode_index" else []
+        for key, ft in self._meta.features.items():
+            if key == "episode_index":
+                ep_buffer[key] = current_ep_idx
+            elif key in ["timestamp", "frame_index"]:
+                # Appended as python scalars by add_frame
+                dtype = np.float64 if key == "timestamp" else np.int64
+                ep_buffer[key] = _FeatureColumn((), dtype, self._column_capacity)
+            elif key not in ["index", "task_index"] and is_valid_numpy_dtype_string(ft["dtype"]):
+                ep_buffer[key] = _FeatureColumn(
+                    tuple(ft["shape"]), np.dtype(ft["dtype"]), self._column_capacity
+                )
+            else:
+                ep_buffer[key] = []
         return ep_buffer
 
     def _get_image_file_path(self, episode_index: int, image_key: str, frame_index: int) -> Path:
@@ -170,7 +283,7 @@ class DatasetWriter:
             if isinstance(frame[name], torch.Tensor):
                 frame[name] = frame[name].numpy()
 
-        validate_frame(frame, self._meta.features)
+        self._validate_frame(frame)
 
         if self.episode_buffer is None:
             self.episode_buffer = self._create_episode_buffer()
@@ -190,45 +303,117 @@ class DatasetWriter:
             )
 
         # Add frame features to episode_buffer
+        features = self._meta.features
+        episode_buffer = self.episode_buffer
         for key in frame:
-            if key not in self._meta.features:
+            if key not in features:
                 raise ValueError(
-                    f"An element of the frame is not in the features. '{key}' not in '{self._meta.features.keys()}'."
+                    f"An element of the frame is not in the features. '{key}' not in '{features.keys()}'."
                 )
 
-            if self._meta.features[key]["dtype"] == "video" and self._streaming_encoder is not None:
+            dtype = features[key]["dtype"]
+            if dtype == "video" and self._streaming_encoder is not None:
                 self._streaming_encoder.feed_frame(key, frame[key])
-                self.episode_buffer[key].append(None)
-            elif self._meta.features[key]["dtype"] in ["image", "video"]:
+                episode_buffer[key].append(None)
+            elif dtype in ["image", "video"]:
                 img_path = self._get_image_file_path(
-                    episode_index=self.episode_buffer["episode_index"], image_key=key, frame_index=frame_index
+                    episode_index=episode_buffer["episode_index"], image_key=key, frame_index=frame_index
                 )
                 if frame_index == 0:
                     img_path.parent.mkdir(parents=True, exist_ok=True)
-                compress_level = 1 if self._meta.features[key]["dtype"] == "video" else 6
+                compress_level = 1 if dtype == "video" else 6
                 self._save_image(frame[key], img_path, compress_level)
-                self.episode_buffer[key].append(str(img_path))
+                episode_buffer[key].append(str(img_path))
             else:
-                self.episode_buffer[key].append(frame[key])
+                episode_buffer[key].append(frame[key])
 
         self.episode_buffer["size"] += 1
 
+    def _next_episode_index(self) -> int:
+        if self._save_queue is None:
+            return self._meta.total_episodes
+        # The episodes handed off to the save thread aren't in the metadata yet
+        return self._next_background_episode_index
+
+    @property
+    def next_episode_index(self) -> int:
+        """Index of the episode being recorded, counting the episodes still saved in the background."""
+        return self._next_episode_index()
+
     def save_episode(
         self,
         episode_data: dict | None = None,
         parallel_encoding: bool = True,
     ) -> None:
-        """Save the current episode in self.episode_buffer to disk."""
+        """Save the current episode in self.episode_buffer to disk.
+
+        With background saving, the episode is only prepared here (the numeric features are stacked, and
+        the image writer and streaming encoder are flushed) and handed off to the save thread, which
+        computes the stats, writes the parquet data and videos and updates the metadata in recording
+        order. The next episode can be recorded as soon as this method returns.
+        """
+        self._raise_background_save_error()
         episode_buffer = episode_data if episode_data is not None else self.episode_buffer
 
-        validate_episode_buffer(episode_buffer, self._meta.total_episodes, self._meta.features)
+        validate_episode_buffer(episode_buffer, self._next_episode_index(), self._meta.features)
+
+        delete_images = episode_data is None and len(self._meta.image_keys) > 0
+        pending = self._prepare_episode(episode_buffer, delete_images)
+
+        if self._save_queue is None:
+            self._commit_episode(pending, parallel_encoding)
+            if episode_data is None:
+                self.clear_episode_buffer(delete_images=delete_images)
+            return
+
+        pending.journal_dir = self._write_journal(pending)
+        self._next_background_episode_index = pending.episode_index + 1
+        self._save_queue.put((pending, parallel_encoding))
+        if episode_data is None:
+            self.episode_buffer = self._create_episode_buffer()
 
+    def _prepare_episode(self, episode_buffer: dict, delete_images: bool) -> _PendingEpisode:
+        """Take the data of an episode out of its buffer, once all its frames are written."""
         # size and task are special cases that won't be added to hf_dataset
         episode_length = episode_buffer.pop("size")
         tasks = episode_buffer.pop("task")
-        episode_tasks = list(set(tasks))
         episode_index = episode_buffer["episode_index"]
 
+        for key, ft in self._meta.features.items():
+            if key in ["index", "episode_index", "task_index"] or ft["dtype"] in ["image", "video"]:
+                continue
+            if isinstance(episode_buffer[key], _FeatureColumn):
+                episode_buffer[key] = episode_buffer[key].to_numpy()
+            else:
+                episode_buffer[key] = np.stack(episode_buffer[key])
+        # Preallocate the next episodes for as many frames as this one
+        self._column_capacity = max(MIN_COLUMN_CAPACITY, episode_length)
+
+        # Wait for image writer to end, so that episode stats over images can be computed
+        self._wait_image_writer()
+
+        streaming_results = None
+        if self._streaming_encoder is not None and len(self._meta.video_keys) > 0:
+            streaming_results = self._streaming_encoder.finish_episode()
+
+        return _PendingEpisode(
+            episode_index=episode_index,
+            source_episode_index=episode_index,
+            length=episode_length,
+            tasks=tasks,
+            buffer=episode_buffer,
+            streaming_results=streaming_results,
+            delete_images=delete_images,
+        )
+
+    def _commit_episode(self, pending: _PendingEpisode, parallel_encoding: bool) -> None:
+        """Write the data, videos and metadata of a prepared episode."""
+        episode_buffer = pending.buffer
+        episode_index = pending.episode_index
+        episode_length = pending.length
+        tasks = pending.tasks
+        episode_tasks = list(set(tasks))
+
         episode_buffer["index"] = np.arange(self._meta.total_frames, self._meta.total_frames + episode_length)
         episode_buffer["episode_index"] = np.full((episode_length,), episode_index)
 
@@ -238,17 +423,12 @@ class DatasetWriter:
         # Given tasks in natural language, find their corresponding task indices
         episode_buffer["task_index"] = np.array([self._meta.get_task_index(task) for task in tasks])
 
-        for key, ft in self._meta.features.items():
-            if key in ["index", "episode_index", "task_index"] or ft["dtype"] in ["image", "video"]:
-                continue
-            episode_buffer[key] = np.stack(episode_buffer[key])
-
-        # Wait for image writer to end, so that episode stats over images can be computed
-        self._wait_image_writer()
-
         has_video_keys = len(self._meta.video_keys) > 0
-        use_streaming = self._streaming_encoder is not None and has_video_keys
-        use_batched_encoding = self._batch_encoding_size > 1
+        use_streaming = pending.streaming_results is not None
+        # Recovered episodes that were renumbered can't be found by their index in the images directory
+        use_batched_encoding = (
+            self._batch_encoding_size > 1 and pending.source_episode_index == pending.episode_index
+        )
 
         if use_streaming:
             non_video_buffer = {
@@ -261,53 +441,60 @@ class DatasetWriter:
         else:
             ep_stats = compute_episode_stats(episode_buffer, self._meta.features)
 
-        ep_metadata = self._save_episode_data(episode_buffer)
-
+        # Videos are saved before the parquet data, so that a failing video doesn't leave the rows of an
+        # episode missing from the metadata in the data file
+        video_metadata = {}
         if use_streaming:
-            streaming_results = self._streaming_encoder.finish_episode()
             for video_key in self._meta.video_keys:
-                temp_path, video_stats = streaming_results[video_key]
+                temp_path, video_stats = pending.streaming_results[video_key]
                 if video_stats is not None:
                     ep_stats[video_key] = {
                         k: v if k == "count" else np.squeeze(v.reshape(1, -1, 1, 1) / 255.0, axis=0)
                         for k, v in video_stats.items()
                     }
-                ep_metadata.update(self._save_episode_video(video_key, episode_index, temp_path=temp_path))
+                video_metadata.update(self._save_episode_video(video_key, episode_index, temp_path=temp_path))
         elif has_video_keys and not use_batched_encoding:
+            source_index = pending.source_episode_index
             num_cameras = len(self._meta.video_keys)
             if parallel_encoding and num_cameras > 1:
-                with concurrent.futures.ProcessPoolExecutor(max_workers=num_cameras) as executor:
-                    future_to_key = {
-                        executor.submit(
-                            _encode_video_worker,
-                            video_key,
-                            episode_index,
-                            self._root,
-                            self._meta.fps,
-                            self._vcodec,
-                            self._encoder_threads,
-                        ): video_key
-                        for video_key in self._meta.video_keys
-                    }
-
-                    results = {}
-                    for future in concurrent.futures.as_completed(future_to_key):
-                        video_key = future_to_key[future]
-                        try:
-                            temp_path = future.result()
-                            results[video_key] = temp_path
-                        except Exception as exc:
-                            logger.error(f"Video encoding failed for {video_key}: {exc}")
-                            raise exc
+                encoding_pool = self._get_encoding_pool()
+                future_to_key = {
+                    encoding_pool.submit(
+                        _encode_video_worker,
+                        video_key,
+                        source_index,
+                        self._root,
+                        self._meta.fps,
+                        self._vcodec,
+                        self._encoder_threads,
+                    ): video_key
+                    for video_key in self._meta.video_keys
+                }
+
+                results = {}
+                for future in concurrent.futures.as_completed(future_to_key):
+                    video_key = future_to_key[future]
+                    try:
+                        temp_path = future.result()
+                        results[video_key] = temp_path
+                    except Exception as exc:
+                        logger.error(f"Video encoding failed for {video_key}: {exc}")
+                        raise exc
 
                 for video_key in self._meta.video_keys:
                     temp_path = results[video_key]
-                    ep_metadata.update(
+                    video_metadata.update(
                         self._save_episode_video(video_key, episode_index, temp_path=temp_path)
                     )
             else:
                 for video_key in self._meta.video_keys:
-                    ep_metadata.update(self._save_episode_video(video_key, episode_index))
+                    temp_path = self._encode_temporary_episode_video(video_key, source_index)
+                    video_metadata.update(
+                        self._save_episode_video(video_key, episode_index, temp_path=temp_path)
+                    )
+
+        ep_metadata = self._save_episode_data(episode_buffer)
+        ep_metadata.update(video_metadata)
 
         # `meta.save_episode` need to be executed after encoding the videos
         self._meta.save_episode(episode_index, episode_length, episode_tasks, ep_stats, ep_metadata)
@@ -320,8 +507,178 @@ class DatasetWriter:
                 self._batch_save_episode_video(start_ep, end_ep)
                 self._episodes_since_last_encoding = 0
 
-        if episode_data is None:
-            self.clear_episode_buffer(delete_images=len(self._meta.image_keys) > 0)
+    def _get_encoding_pool(self) -> concurrent.futures.ProcessPoolExecutor:
+        """Return the process pool encoding the cameras of an episode in parallel, kept across episodes."""
+        if self._encoding_pool is None:
+            self._encoding_pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=len(self._meta.video_keys)
+            )
+        return self._encoding_pool
+
+    # ── Background saving ─────────────────────────────────────────────
+
+    def _background_save_loop(self) -> None:
+        """Commit the episodes handed off by `save_episode`, in recording order."""
+        while (item := self._save_queue.get()) is not None:
+            pending, parallel_encoding = item
+            # Once an episode failed, the next ones are kept in their journal to preserve the episode order
+            if self._background_save_error is None:
+                try:
+                    self._commit_episode(pending, parallel_encoding)
+                    if pending.delete_images:
+                        self._delete_episode_images(pending.source_episode_index)
+                    shutil.rmtree(pending.journal_dir, ignore_errors=True)
+                except Exception as e:
+                    logger.error(f"Saving episode {pending.episode_index} in the background failed: {e}")
+                    self._background_save_error = e
+            self._save_queue.task_done()
+        self._save_queue.task_done()
+
+    def _raise_background_save_error(self) -> None:
+        if self._background_save_error is not None:
+            raise RuntimeError(
+                "Saving an episode in the background failed. The episodes that weren't saved are kept in "
+                f"{self._root / PENDING_EPISODES_DIR} and are recovered by `LeRobotDataset.resume()`."
+            ) from self._background_save_error
+
+    def wait_for_saved_episodes(self) -> None:
+        """Block until the episodes handed off to background saving are committed.
+
+        Raises:
+            RuntimeError: If saving an episode in the background failed.
+        """
+        if self._save_queue is not None:
+            self._save_queue.join()
+        self._raise_background_save_error()
+
+    def _stop_background_saving(self) -> None:
+        if self._save_thread is not None:
+            self._save_queue.put(None)
+            self._save_thread.join()
+            self._save_thread = None
+            if self._background_save_error is None:
+                shutil.rmtree(self._root / PENDING_EPISODES_DIR, ignore_errors=True)
+
+    def _write_journal(self, pending: _PendingEpisode) -> Path:
+        """Persist an episode handed off to background saving, until it's committed.
+
+        The numeric features and the streaming video stats go to `data.npz`. The tasks and the paths of
+        the temporary images and streamed videos go to `episode.json`, which is written last.
+        """
+        journal_dir = self._root / PENDING_EPISODES_DIR / f"episode-{pending.episode_index:06d}"
+        if journal_dir.exists():
+            shutil.rmtree(journal_dir)
+        journal_dir.mkdir(parents=True)
+
+        arrays, images = {}, {}
+        for key, value in pending.buffer.items():
+            if self._meta.features.get(key, {}).get("dtype") in ["image", "video"]:
+                images[key] = value
+            else:
+                arrays[f"data/{key}"] = value
+        streaming_videos = None
+        if pending.streaming_results is not None:
+            streaming_videos = {}
+            for video_key, (temp_path, video_stats) in pending.streaming_results.items():
+                streaming_videos[video_key] = str(temp_path)
+                for stat, value in (video_stats or {}).items():
+                    arrays[f"video_stats/{video_key}/{stat}"] = value
+        np.savez(journal_dir / "data.npz", **arrays)
+
+        episode = {
+            "episode_index": pending.episode_index,
+            "source_episode_index": pending.source_episode_index,
+            "length": pending.length,
+            "tasks": pending.tasks,
+            "images": images,
+            "streaming_videos": streaming_videos,
+            "delete_images": pending.delete_images,
+        }
+        tmp_path = journal_dir / "episode.json.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(episode, f)
+        tmp_path.replace(journal_dir / "episode.json")
+        return journal_dir
+
+    def _load_journal(self, journal_dir: Path) -> _PendingEpisode | None:
+        """Load a journaled episode, or return `None` if its temporary files are gone."""
+        episode_path = journal_dir / "episode.json"
+        if not episode_path.exists():
+            return None
+        with open(episode_path) as f:
+            episode = json.load(f)
+
+        buffer, video_stats = {}, {}
+        with np.load(journal_dir / "data.npz", allow_pickle=False) as arrays:
+            for name in arrays.files:
+                if name.startswith("data/"):
+                    buffer[name.removeprefix("data/")] = arrays[name]
+                else:
+                    _, video_key, stat = name.split("/")
+                    video_stats.setdefault(video_key, {})[stat] = arrays[name]
+        buffer.update(episode["images"])
+
+        streaming_results = None
+        missing = [path for paths in episode["images"].values() for path in paths if path is not None]
+        if episode["streaming_videos"] is not None:
+            streaming_results = {
+                video_key: (Path(path), video_stats.get(video_key))
+                for video_key, path in episode["streaming_videos"].items()
+            }
+            missing += [str(path) for path, _ in streaming_results.values()]
+        missing = [path for path in missing if not Path(path).exists()]
+        if missing:
+            logger.warning(
+                f"Episode {episode['episode_index']} in {journal_dir} can't be recovered, "
+                f"{len(missing)} of its temporary files are missing (e.g. {missing[0]})."
+            )
+            return None
+
+        return _PendingEpisode(
+            episode_index=episode["episode_index"],
+            source_episode_index=episode["source_episode_index"],
+            length=episode["length"],
+            tasks=episode["tasks"],
+            buffer=buffer,
+            streaming_results=streaming_results,
+            delete_images=episode["delete_images"],
+            journal_dir=journal_dir,
+        )
+
+    def recover_pending_episodes(self) -> int:
+        """Commit the episodes that an interrupted session handed off to background saving.
+
+        Episodes whose save didn't complete (the process was killed, or saving failed) are committed in
+        recording order after the episodes in the metadata, and renumbered if episodes recorded before
+        them were lost. Called by `LeRobotDataset.resume()`.
+
+        Returns:
+            The number of recovered episodes.
+        """
+        journal_root = self._root / PENDING_EPISODES_DIR
+        if not journal_root.is_dir():
+            return 0
+
+        total_episodes = self._meta.total_episodes
+        recovered = 0
+        for journal_dir in sorted(journal_root.glob("episode-*")):
+            pending = self._load_journal(journal_dir)
+            # Episodes already in the metadata were committed right before their journal was removed
+            if pending is not None and pending.episode_index >= total_episodes:
+                logger.info(
+                    f"Recovering episode {pending.episode_index} as episode {self._meta.total_episodes}"
+                )
+                pending.episode_index = self._meta.total_episodes
+                self._commit_episode(pending, parallel_encoding=True)
+                if pending.delete_images:
+                    self._delete_episode_images(pending.source_episode_index)
+                recovered += 1
+            shutil.rmtree(journal_dir)
+        shutil.rmtree(journal_root, ignore_errors=True)
+
+        self._next_background_episode_index = self._meta.total_episodes
+        self.episode_buffer = self._create_episode_buffer()
+        return recovered
 
     def _batch_save_episode_video(self, start_episode: int, end_episode: int | None = None) -> None:
         """Batch save videos for multiple episodes."""
@@ -373,9 +730,12 @@ class DatasetWriter:
         # Use metadata features as the authoritative schema
         hf_features = get_hf_features_from_features(self._meta.features)
         ep_dict = {key: episode_buffer[key] for key in hf_features}
-        ep_dataset = datasets.Dataset.from_dict(ep_dict, features=hf_features, split="train")
-        ep_dataset = embed_images(ep_dataset)
-        ep_num_frames = len(ep_dataset)
+        table = _episode_to_arrow_table(ep_dict, hf_features)
+        if table is None:
+            ep_dataset = datasets.Dataset.from_dict(ep_dict, features=hf_features, split="train")
+            ep_dataset = embed_images(ep_dataset)
+            table = ep_dataset.with_format("arrow")[:]
+        ep_num_frames = table.num_rows
 
         if self._latest_episode is None:
             chunk_idx, file_idx = 0, 0
@@ -414,7 +774,6 @@ class DatasetWriter:
         path = self._root / self._meta.data_path.format(chunk_index=chunk_idx, file_index=file_idx)
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        table = ep_dataset.with_format("arrow")[:]
         if not self._pq_writer:
             self._pq_writer = pq.ParquetWriter(
                 path, schema=table.schema, compression="snappy", use_dictionary=True
@@ -526,13 +885,16 @@ class DatasetWriter:
             # save_episode() mutates the buffer. Handle both types here.
             if isinstance(episode_index, np.ndarray):
                 episode_index = episode_index.item() if episode_index.size == 1 else episode_index[0]
-            for cam_key in self._meta.image_keys:
-                img_dir = self._get_image_file_dir(episode_index, cam_key)
-                if img_dir.is_dir():
-                    shutil.rmtree(img_dir)
+            self._delete_episode_images(episode_index)
 
         self.episode_buffer = self._create_episode_buffer()
 
+    def _delete_episode_images(self, episode_index: int) -> None:
+        for cam_key in self._meta.image_keys:
+            img_dir = self._get_image_file_dir(episode_index, cam_key)
+            if img_dir.is_dir():
+                shutil.rmtree(img_dir)
+
     def start_image_writer(self, num_processes: int = 0, num_threads: int = 4) -> None:
         """Start an :class:`AsyncImageWriter` for background image persistence.
 
@@ -614,6 +976,8 @@ class DatasetWriter:
         """
         if getattr(self, "_finalized", False):
             return
+        # 0. Wait for the episodes handed off to background saving to be committed
+        self._stop_background_saving()
         # 1. Wait for async image writes to complete, then stop
         if self.image_writer is not None:
             self.image_writer.wait_until_done()
@@ -625,7 +989,11 @@ class DatasetWriter:
         self.close_writer()
         # 4. Finalize metadata (idempotent)
         self._meta.finalize()
+        if self._encoding_pool is not None:
+            self._encoding_pool.shutdown()
+            self._encoding_pool = None
         self._finalized = True
+        self._raise_background_save_error()
 
     def __del__(self):
         """Safety net: release resources on garbage collection."""
@@ -97,6 +97,9 @@ def make_dataset(cfg: TrainPipelineConfig) -> LeRobotDataset | MultiLeRobotDatas
                 revision=cfg.dataset.revision,
                 video_backend=cfg.dataset.video_backend,
                 tolerance_s=cfg.tolerance_s,
+                materialize=cfg.dataset.materialize,
+                video_decoder_cache_size=cfg.dataset.video_decoder_cache_size,
+                video_decoder_cache_max_mb=cfg.dataset.video_decoder_cache_max_mb,
             )
         else:
             dataset = StreamingLeRobotDataset(
@@ -13,6 +13,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from collections.abc import Callable
 from pprint import pformat
 from typing import Any
 
@@ -389,6 +390,63 @@ def validate_frame(frame: dict, features: dict) -> None:
         raise ValueError(error_message)
 
 
+def make_frame_validator(features: dict) -> Callable[[dict], None]:
+    """Compile `validate_frame` for a features dictionary, to validate frames recorded at a high rate.
+
+    The expected keys, numpy dtypes and shapes are resolved once here, so that validating a valid frame
+    is a few `isinstance` and attribute comparisons per feature. When a check fails, the frame goes
+    through `validate_frame`, which builds the error message.
+
+    Args:
+        features (dict): The LeRobot features dictionary for the dataset.
+
+    Returns:
+        Callable[[dict], None]: A function with the same contract as `validate_frame(frame, features)`.
+    """
+    checks = []
+    for name in set(features) - set(DEFAULT_FEATURES):
+        expected_dtype = features[name]["dtype"]
+        expected_shape = features[name]["shape"]
+        if is_valid_numpy_dtype_string(expected_dtype):
+            np_dtype = np.dtype(expected_dtype)
+
+            def check(value, np_dtype=np_dtype, shape=expected_shape):
+                return isinstance(value, np.ndarray) and value.dtype == np_dtype and value.shape == shape
+
+        elif expected_dtype in ["image", "video"] and len(expected_shape) == 3:
+            c, h, w = expected_shape
+            image_shapes = {(c, h, w), (h, w, c)}
+
+            def check(value, image_shapes=image_shapes):
+                if isinstance(value, np.ndarray):
+                    return value.shape in image_shapes
+                return isinstance(value, PILImage.Image)
+
+        elif expected_dtype == "string":
+
+            def check(value):
+                return isinstance(value, str)
+
+        else:
+
+            def check(value):
+                return False
+
+        checks.append((name, check))
+    num_keys = len(checks) + 1  # the features and "task"
+
+    def validate(frame: dict) -> None:
+        if len(frame) == num_keys and "task" in frame:
+            for name, check in checks:
+                if name not in frame or not check(frame[name]):
+                    break
+            else:
+                return
+        validate_frame(frame, features)
+
+    return validate
+
+
 def validate_features_presence(actual_features: set[str], expected_features: set[str]) -> str:
     """Check for missing or extra features in a frame.
 
@@ -13,10 +13,14 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import contextlib
 import logging
 import multiprocessing
 import queue
+import shutil
 import threading
+from dataclasses import dataclass
+from multiprocessing import queues as mp_queues, resource_tracker, shared_memory
 from pathlib import Path
 
 import numpy as np
@@ -25,6 +29,9 @@ import torch
 
 logger = logging.getLogger(__name__)
 
+# tmpfs backing the POSIX shared memory segments on Linux
+SHARED_MEMORY_DIR = Path("/dev/shm")
+
 
 def safe_stop_image_writer(func):
     def wrapper(*args, **kwargs):
@@ -106,26 +113,120 @@ def write_image(image: np.ndarray | PIL.Image.Image, fpath: Path, compress_level
         logger.error("Error writing image %s: %s", fpath, e)
 
 
-def worker_thread_loop(queue: queue.Queue):
+@dataclass(frozen=True)
+class SharedFrame:
+    """Reference to an image written in a slot of a :class:`SharedMemoryFramePool`."""
+
+    shm_name: str
+    slot: int
+    shape: tuple[int, ...]
+    dtype: str
+
+
+class SharedMemoryFramePool:
+    """A fixed number of shared-memory slots holding images of the same size in bytes.
+
+    The recording process copies each image once into a free slot and only sends a :class:`SharedFrame`
+    to the image writer processes, instead of pickling the full image through the queue. The writer
+    processes send the slot index back through `released_slots` once the image is on disk.
+    """
+
+    def __init__(self, frame_nbytes: int, num_slots: int):
+        self.frame_nbytes = frame_nbytes
+        self.num_slots = num_slots
+        self.shm = shared_memory.SharedMemory(create=True, size=frame_nbytes * num_slots)
+        self._free_slots = list(range(num_slots))
+
+    @property
+    def slots_in_use(self) -> int:
+        return self.num_slots - len(self._free_slots)
+
+    def put(self, image: np.ndarray) -> SharedFrame | None:
+        """Copy `image` into a free slot, or return `None` if all the slots are in use."""
+        if not self._free_slots:
+            return None
+        slot = self._free_slots.pop()
+        shared = np.ndarray(image.shape, image.dtype, buffer=self.shm.buf, offset=slot * self.frame_nbytes)
+        shared[...] = image
+        return SharedFrame(self.shm.name, slot, image.shape, image.dtype.str)
+
+    def release(self, slot: int) -> None:
+        self._free_slots.append(slot)
+
+    def close(self) -> None:
+        self.shm.close()
+        self.shm.unlink()
+
+
+def _free_shared_memory_bytes() -> int | None:
+    """Free space for shared memory segments, or `None` where they aren't backed by a filesystem (e.g. macOS)."""
+    if not SHARED_MEMORY_DIR.is_dir():
+        return None
+    return shutil.disk_usage(SHARED_MEMORY_DIR).free
+
+
+class SharedFrameReader:
+    """Resolves :class:`SharedFrame` references in an image writer process and gives their slots back."""
+
+    def __init__(self, released_slots: mp_queues.Queue):
+        self.released_slots = released_slots
+        self._segments: dict[str, shared_memory.SharedMemory] = {}
+        self._lock = threading.Lock()
+
+    def view(self, frame: SharedFrame) -> np.ndarray:
+        with self._lock:
+            if frame.shm_name not in self._segments:
+                self._segments[frame.shm_name] = shared_memory.SharedMemory(name=frame.shm_name)
+            shm = self._segments[frame.shm_name]
+        dtype = np.dtype(frame.dtype)
+        offset = frame.slot * int(np.prod(frame.shape)) * dtype.itemsize
+        return np.ndarray(frame.shape, dtype, buffer=shm.buf, offset=offset)
+
+    def release(self, frame: SharedFrame) -> None:
+        self.released_slots.put((frame.shm_name, frame.slot))
+
+    def close(self) -> None:
+        for shm in self._segments.values():
+            with contextlib.suppress(BufferError):
+                shm.close()
+        self._segments.clear()
+
+
+def worker_thread_loop(queue: queue.Queue, frame_reader: SharedFrameReader | None = None):
     while True:
         item = queue.get()
         if item is None:
             queue.task_done()
             break
         image_array, fpath, compress_level = item
-        write_image(image_array, fpath, compress_level)
+        if isinstance(image_array, SharedFrame):
+            shared_frame = image_array
+            # The image is on disk once write_image returns, so its slot can be reused right away
+            image_array = frame_reader.view(shared_frame)
+            write_image(image_array, fpath, compress_level)
+            del image_array
+            frame_reader.release(shared_frame)
+        else:
+            write_image(image_array, fpath, compress_level)
         queue.task_done()
 
 
-def worker_process(queue: queue.Queue, num_threads: int):
+def worker_process(queue: queue.Queue, num_threads: int, released_slots: mp_queues.Queue | None = None):
+    frame_reader = None
+    if released_slots is not None:
+        # Don't block the exit of the process on slots that the recording process won't reuse anymore
+        released_slots.cancel_join_thread()
+        frame_reader = SharedFrameReader(released_slots)
     threads = []
     for _ in range(num_threads):
-        t = threading.Thread(target=worker_thread_loop, args=(queue,))
+        t = threading.Thread(target=worker_thread_loop, args=(queue, frame_reader))
         t.daemon = True
         t.start()
         threads.append(t)
     for t in threads:
         t.join()
+    if frame_reader is not None:
+        frame_reader.close()
 
 
 class AsyncImageWriter:
@@ -141,15 +242,28 @@ class AsyncImageWriter:
     The optimal number of processes and threads depends on your computer capabilities.
     We advise to use 4 threads per camera with 0 processes. If the fps is not stable, try to increase or lower
     the number of threads. If it is still not stable, try to use 1 subprocess, or more.
+
+    With processes, numpy images are copied into a :class:`SharedMemoryFramePool` of `shared_memory_slots`
+    slots per image size, and only a reference to their slot goes through the queue. When all the slots are
+    in use (the processes can't keep up), images are pickled through the queue as without shared memory,
+    which `get_stats()["pool_full_images"]` counts. `shared_memory_slots=0` always pickles the images.
+    Pools get fewer slots when `/dev/shm` is too small for them (e.g. the 64MB default of Docker), and
+    images are pickled when not even one slot fits.
     """
 
-    def __init__(self, num_processes: int = 0, num_threads: int = 1):
+    def __init__(self, num_processes: int = 0, num_threads: int = 1, shared_memory_slots: int = 30):
         self.num_processes = num_processes
         self.num_threads = num_threads
+        self.shared_memory_slots = shared_memory_slots
         self.queue = None
         self.threads = []
         self.processes = []
         self._stopped = False
+        self._frame_pools: dict[int, SharedMemoryFramePool | None] = {}
+        self._frame_pools_by_name: dict[str, SharedMemoryFramePool] = {}
+        self._released_slots = None
+        self._stats = {"shared_memory_images": 0, "pickled_images": 0, "pool_full_images": 0}
+        self._max_slots_in_use = 0
 
         if num_threads <= 0 and num_processes <= 0:
             raise ValueError("Number of threads and processes must be greater than zero.")
@@ -165,8 +279,15 @@ class AsyncImageWriter:
         else:
             # Use multiprocessing
             self.queue = multiprocessing.JoinableQueue()
+            if self.shared_memory_slots > 0:
+                self._released_slots = multiprocessing.Queue()
+                # Share this process' resource tracker with the workers, so that the segments they attach
+                # to are only cleaned up once, when this process unlinks them
+                resource_tracker.ensure_running()
             for _ in range(self.num_processes):
-                p = multiprocessing.Process(target=worker_process, args=(self.queue, self.num_threads))
+                p = multiprocessing.Process(
+                    target=worker_process, args=(self.queue, self.num_threads, self._released_slots)
+                )
                 p.daemon = True
                 p.start()
                 self.processes.append(p)
@@ -177,8 +298,74 @@ class AsyncImageWriter:
         if isinstance(image, torch.Tensor):
             # Convert tensor to numpy array to minimize main process time
             image = image.cpu().numpy()
+        if self._released_slots is not None and isinstance(image, np.ndarray) and not self._stopped:
+            image = self._to_shared_memory(image)
+        elif self.num_processes > 0:
+            self._stats["pickled_images"] += 1
         self.queue.put((image, fpath, compress_level))
 
+    def _to_shared_memory(self, image: np.ndarray) -> SharedFrame | np.ndarray:
+        self._reclaim_slots()
+        if image.nbytes not in self._frame_pools:
+            self._frame_pools[image.nbytes] = self._create_frame_pool(image.nbytes)
+        frame_pool = self._frame_pools[image.nbytes]
+        if frame_pool is None:
+            self._stats["pickled_images"] += 1
+            return image
+
+        shared_frame = frame_pool.put(image)
+        if shared_frame is None:
+            self._stats["pool_full_images"] += 1
+            self._stats["pickled_images"] += 1
+            return image
+        self._stats["shared_memory_images"] += 1
+        self._max_slots_in_use = max(self._max_slots_in_use, frame_pool.slots_in_use)
+        return shared_frame
+
+    def _create_frame_pool(self, frame_nbytes: int) -> SharedMemoryFramePool | None:
+        num_slots = self.shared_memory_slots
+        free_bytes = _free_shared_memory_bytes()
+        if free_bytes is not None:
+            # The pages of a segment are only allocated when written, and the writing process is killed with
+            # SIGBUS when /dev/shm is full, so leave half of the free space to the other pools and processes
+            num_slots = min(num_slots, free_bytes // 2 // frame_nbytes)
+        if num_slots < self.shared_memory_slots:
+            logger.warning(
+                f"Not enough free space in {SHARED_MEMORY_DIR} ({free_bytes} bytes) for {self.shared_memory_slots} "
+                f"images of {frame_nbytes} bytes, using {num_slots} shared memory slots instead. "
+                "Increase its size (e.g. `docker run --shm-size=1g`) to avoid pickling the images."
+            )
+        if num_slots == 0:
+            return None
+        frame_pool = SharedMemoryFramePool(frame_nbytes, num_slots)
+        self._frame_pools_by_name[frame_pool.shm.name] = frame_pool
+        return frame_pool
+
+    def _reclaim_slots(self):
+        while True:
+            try:
+                shm_name, slot = self._released_slots.get_nowait()
+            except queue.Empty:
+                break
+            self._frame_pools_by_name[shm_name].release(slot)
+
+    def get_stats(self) -> dict[str, int]:
+        """Return the shared-memory transport counters of the image writer processes.
+
+        `slots_in_use` and `max_slots_in_use` count the images that are waiting to be written (per image
+        size). `pool_full_images` counts the images that had to be pickled because no slot was free, a sign
+        that the processes can't keep up with the recording.
+        """
+        if self._released_slots is not None and not self._stopped:
+            self._reclaim_slots()
+        return {
+            **self._stats,
+            "slots_in_use": max(
+                (pool.slots_in_use for pool in self._frame_pools_by_name.values()), default=0
+            ),
+            "max_slots_in_use": self._max_slots_in_use,
+        }
+
     def wait_until_done(self):
         self.queue.join()
 
@@ -201,5 +388,9 @@ class AsyncImageWriter:
                     p.terminate()
             self.queue.close()
             self.queue.join_thread()
+            for frame_pool in self._frame_pools_by_name.values():
+                frame_pool.close()
+            if self._released_slots is not None:
+                self._released_slots.close()
 
         self._stopped = True
@@ -15,12 +15,13 @@
 # limitations under the License.
 import json
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 import datasets
 import numpy as np
 import pandas
 import pandas as pd
+import pyarrow as pa
 import pyarrow.dataset as pa_ds
 import pyarrow.parquet as pq
 import torch
@@ -257,12 +258,12 @@ def load_episodes(local_dir: Path) -> datasets.Dataset:
 
 
 def load_image_as_numpy(
-    fpath: str | Path, dtype: np.dtype = np.float32, channel_first: bool = True
+    fpath: str | Path | BinaryIO, dtype: np.dtype = np.float32, channel_first: bool = True
 ) -> np.ndarray:
     """Load an image from a file into a numpy array.
 
     Args:
-        fpath (str | Path): Path to the image file.
+        fpath (str | Path | BinaryIO): Path to the image file, or file object of the encoded image.
         dtype (np.dtype): The desired data type of the output array. If floating,
             pixels are scaled to [0, 1].
         channel_first (bool): If True, converts the image to (C, H, W) format.
@@ -307,6 +308,48 @@ def hf_transform_to_torch(items_dict: dict[str, list[Any]]) -> dict[str, list[to
     return items_dict
 
 
+def arrow_column_to_numpy(column: pa.Array | pa.ChunkedArray, shape: tuple[int, ...]) -> np.ndarray | None:
+    """Convert a numeric Arrow column to a contiguous numpy array without going through Python objects.
+
+    Fixed-size lists (``datasets.Sequence``) and ``datasets.ArrayXD`` extension columns are flattened
+    down to their primitive values and reshaped to ``(num_rows, *shape)``. Scalar columns are returned
+    with shape ``(num_rows,)``.
+
+    Args:
+        column: The Arrow column to convert.
+        shape: The per-row feature shape, as stored in the LeRobot features dictionary.
+
+    Returns:
+        np.ndarray | None: The converted array, or ``None`` if the column is not a numeric column that can
+        be converted losslessly (e.g. images, strings, or columns containing nulls).
+    """
+    if isinstance(column, pa.ChunkedArray):
+        column = column.combine_chunks()
+    num_rows = len(column)
+    if isinstance(column, pa.ExtensionArray):
+        column = column.storage
+    if column.null_count > 0:
+        return None
+
+    is_nested = False
+    while pa.types.is_list(column.type) or pa.types.is_fixed_size_list(column.type):
+        column = column.flatten()
+        is_nested = True
+
+    if not (
+        pa.types.is_integer(column.type)
+        or pa.types.is_floating(column.type)
+        or pa.types.is_boolean(column.type)
+    ):
+        return None
+
+    values = column.to_numpy(zero_copy_only=False)
+    row_shape = tuple(shape) if is_nested else ()
+    if values.size != num_rows * int(np.prod(row_shape, dtype=np.int64)):
+        return None
+    return values.reshape((num_rows, *row_shape))
+
+
 def to_parquet_with_hf_images(
     df: pandas.DataFrame, path: Path, features: datasets.Features | None = None
 ) -> None:
@@ -33,6 +33,7 @@ from lerobot.datasets.utils import (
     is_valid_version,
 )
 from lerobot.datasets.video_utils import (
+    DEFAULT_VIDEO_DECODER_CACHE_SIZE,
     StreamingVideoEncoder,
     get_safe_default_codec,
     resolve_vcodec,
@@ -60,6 +61,9 @@ class LeRobotDataset(torch.utils.data.Dataset):
         streaming_encoding: bool = False,
         encoder_queue_maxsize: int = 30,
         encoder_threads: int | None = None,
+        materialize: bool = False,
+        video_decoder_cache_size: int | None = DEFAULT_VIDEO_DECODER_CACHE_SIZE,
+        video_decoder_cache_max_mb: float | None = None,
     ):
         """
         2 modes are available for instantiating this class, depending on 2 different use cases:
@@ -185,6 +189,15 @@ class LeRobotDataset(torch.utils.data.Dataset):
             encoder_threads (int | None, optional): Number of threads per encoder instance. None lets the
                 codec auto-detect (default). Lower values reduce CPU usage per encoder. Maps to 'lp' (via svtav1-params) for
                 libsvtav1 and 'threads' for h264/hevc.
+            materialize (bool, optional): If True, load every numeric (non-video, non-image) column into
+                contiguous shared-memory tensors once, and serve frames by slicing them instead of going
+                through the Hugging Face dataset formatter. Tensors are shared with DataLoader workers. Useful
+                when these features fit in RAM. Defaults to False.
+            video_decoder_cache_size (int | None, optional): Maximum number of video decoders, and thus open
+                video files, kept by each process (e.g. each DataLoader worker). Least recently used decoders
+                are closed first. Set to None for no limit. Defaults to 64, as `DatasetConfig`.
+            video_decoder_cache_max_mb (float | None, optional): Maximum estimated memory, in MB, of the video
+                decoders kept by each process. Defaults to None (unbounded).
 
         Note:
             Write-mode parameters (``streaming_encoding``, ``batch_encoding_size``) passed to
@@ -204,6 +217,9 @@ class LeRobotDataset(torch.utils.data.Dataset):
         self._batch_encoding_size = batch_encoding_size
         self._vcodec = resolve_vcodec(vcodec)
         self._encoder_threads = encoder_threads
+        self._materialize = materialize
+        self._video_decoder_cache_size = video_decoder_cache_size
+        self._video_decoder_cache_max_mb = video_decoder_cache_max_mb
 
         if self._requested_root is not None:
             self._requested_root.mkdir(exist_ok=True, parents=True)
@@ -224,6 +240,9 @@ class LeRobotDataset(torch.utils.data.Dataset):
             video_backend=self._video_backend,
             delta_timestamps=delta_timestamps,
             image_transforms=image_transforms,
+            materialize=materialize,
+            video_decoder_cache_size=video_decoder_cache_size,
+            video_decoder_cache_max_mb=video_decoder_cache_max_mb,
         )
 
         # Load actual data
@@ -287,6 +306,9 @@ class LeRobotDataset(torch.utils.data.Dataset):
                 video_backend=self._video_backend,
                 delta_timestamps=self.delta_timestamps,
                 image_transforms=self.image_transforms,
+                materialize=self._materialize,
+                video_decoder_cache_size=self._video_decoder_cache_size,
+                video_decoder_cache_max_mb=self._video_decoder_cache_max_mb,
             )
         return self.reader
 
@@ -296,6 +318,7 @@ class LeRobotDataset(torch.utils.data.Dataset):
         vcodec: str,
         encoder_queue_maxsize: int,
         encoder_threads: int | None,
+        encoder_stats_frame_stride: int = 1,
     ) -> StreamingVideoEncoder:
         return StreamingVideoEncoder(
             fps=fps,
@@ -306,6 +329,7 @@ class LeRobotDataset(torch.utils.data.Dataset):
             preset=None,
             queue_maxsize=encoder_queue_maxsize,
             encoder_threads=encoder_threads,
+            stats_frame_stride=encoder_stats_frame_stride,
         )
 
     # ── Metadata properties ───────────────────────────────────────────
@@ -369,6 +393,8 @@ class LeRobotDataset(torch.utils.data.Dataset):
 
         Delegates to :meth:`DatasetWriter.save_episode`. Encodes videos, writes
         parquet data, and updates metadata. The episode buffer is reset afterward.
+        With ``background_saving``, this work happens in a background thread and
+        the episode only shows in the metadata once it's committed.
 
         Args:
             episode_data: Optional pre-built episode dict. If ``None``, uses the
@@ -442,6 +468,29 @@ class LeRobotDataset(torch.utils.data.Dataset):
             RuntimeError: If the dataset is currently being recorded and
                 :meth:`finalize` has not been called yet.
         """
+        return self._get_active_reader().get_item(idx)
+
+    def __getitems__(self, indices: list[int]) -> list[dict]:
+        """Return several frames at once, as a list of items identical to ``[self[i] for i in indices]``.
+
+        Called by the PyTorch ``DataLoader`` with the indices of a whole batch. Delegates to
+        :meth:`DatasetReader.get_items`, which reads tabular columns with one Arrow take and decodes the
+        frames of each video file with a single decoder call for the whole batch.
+
+        Args:
+            indices: Indices into the (possibly episode-filtered) dataset.
+
+        Returns:
+            List of dicts mapping feature names to their tensor values, one per index.
+
+        Raises:
+            RuntimeError: If the dataset is currently being recorded and
+                :meth:`finalize` has not been called yet.
+        """
+        return self._get_active_reader().get_items(indices)
+
+    def _get_active_reader(self) -> DatasetReader:
+        """Return the reader with its HF dataset loaded, refusing reads while recording."""
         if self.writer is not None and not self._is_finalized:
             raise RuntimeError(
                 "Cannot read from a dataset that is being recorded. Call finalize() first, then access items."
@@ -450,7 +499,7 @@ class LeRobotDataset(torch.utils.data.Dataset):
         if reader.hf_dataset is None:
             # One-shot load after finalize()
             reader.load_and_activate()
-        return reader.get_item(idx)
+        return reader
 
     def select_columns(self, column_names: str | list[str]):
         """Select specific columns from the underlying dataset.
@@ -625,6 +674,8 @@ class LeRobotDataset(torch.utils.data.Dataset):
         streaming_encoding: bool = False,
         encoder_queue_maxsize: int = 30,
         encoder_threads: int | None = None,
+        encoder_stats_frame_stride: int = 1,
+        background_saving: bool = False,
     ) -> "LeRobotDataset":
         """Create a new LeRobotDataset from scratch for recording data.
 
@@ -658,6 +709,11 @@ class LeRobotDataset(torch.utils.data.Dataset):
             encoder_queue_maxsize: Max buffered frames per camera when using
                 streaming encoding.
             encoder_threads: Threads per encoder instance. ``None`` for auto.
+            encoder_stats_frame_stride: Compute the streamed video stats on
+                every N-th frame only.
+            background_saving: If ``True``, :meth:`save_episode` returns once
+                the episode is handed off to a background thread, which writes
+                it while the next episode is recorded.
 
         Returns:
             A new :class:`LeRobotDataset` in write mode.
@@ -685,6 +741,9 @@ class LeRobotDataset(torch.utils.data.Dataset):
         obj._batch_encoding_size = batch_encoding_size
         obj._vcodec = vcodec
         obj._encoder_threads = encoder_threads
+        obj._materialize = False
+        obj._video_decoder_cache_size = DEFAULT_VIDEO_DECODER_CACHE_SIZE
+        obj._video_decoder_cache_max_mb = None
 
         # Reader is lazily created on first access (write-only mode)
         obj.reader = None
@@ -692,7 +751,9 @@ class LeRobotDataset(torch.utils.data.Dataset):
         # Create writer
         streaming_enc = None
         if streaming_encoding and len(obj.meta.video_keys) > 0:
-            streaming_enc = cls._build_streaming_encoder(fps, vcodec, encoder_queue_maxsize, encoder_threads)
+            streaming_enc = cls._build_streaming_encoder(
+                fps, vcodec, encoder_queue_maxsize, encoder_threads, encoder_stats_frame_stride
+            )
         obj.writer = DatasetWriter(
             meta=obj.meta,
             root=obj.root,
@@ -700,6 +761,7 @@ class LeRobotDataset(torch.utils.data.Dataset):
             encoder_threads=encoder_threads,
             batch_encoding_size=batch_encoding_size,
             streaming_encoder=streaming_enc,
+            background_saving=background_saving,
         )
 
         if image_writer_processes or image_writer_threads:
@@ -725,6 +787,8 @@ class LeRobotDataset(torch.utils.data.Dataset):
         streaming_encoding: bool = False,
         encoder_queue_maxsize: int = 30,
         encoder_threads: int | None = None,
+        encoder_stats_frame_stride: int = 1,
+        background_saving: bool = False,
     ) -> "LeRobotDataset":
         """Resume recording on an existing dataset.
 
@@ -754,6 +818,11 @@ class LeRobotDataset(torch.utils.data.Dataset):
                 capture.
             encoder_queue_maxsize: Max buffered frames per camera for streaming.
             encoder_threads: Threads per encoder instance. ``None`` for auto.
+            encoder_stats_frame_stride: Compute the streamed video stats on
+                every N-th frame only.
+            background_saving: If ``True``, :meth:`save_episode` returns once
+                the episode is handed off to a background thread, which writes
+                it while the next episode is recorded.
 
         Returns:
             A :class:`LeRobotDataset` in write mode, ready to append episodes.
@@ -777,6 +846,9 @@ class LeRobotDataset(torch.utils.data.Dataset):
         obj._batch_encoding_size = batch_encoding_size
         obj._vcodec = vcodec
         obj._encoder_threads = encoder_threads
+        obj._materialize = False
+        obj._video_decoder_cache_size = DEFAULT_VIDEO_DECODER_CACHE_SIZE
+        obj._video_decoder_cache_max_mb = None
 
         if obj._requested_root is not None:
             obj._requested_root.mkdir(exist_ok=True, parents=True)
@@ -794,7 +866,7 @@ class LeRobotDataset(torch.utils.data.Dataset):
         streaming_enc = None
         if streaming_encoding and len(obj.meta.video_keys) > 0:
             streaming_enc = cls._build_streaming_encoder(
-                obj.meta.fps, vcodec, encoder_queue_maxsize, encoder_threads
+                obj.meta.fps, vcodec, encoder_queue_maxsize, encoder_threads, encoder_stats_frame_stride
             )
         obj.writer = DatasetWriter(
             meta=obj.meta,
@@ -804,7 +876,12 @@ class LeRobotDataset(torch.utils.data.Dataset):
             batch_encoding_size=batch_encoding_size,
             streaming_encoder=streaming_enc,
             initial_frames=obj.meta.total_frames,
+            background_saving=background_saving,
         )
+        # Commit the episodes that an interrupted session was saving in the background
+        num_recovered = obj.writer.recover_pending_episodes()
+        if num_recovered:
+            logger.info(f"Recovered {num_recovered} episode(s) that weren't saved by the previous session")
 
         if image_writer_processes or image_writer_threads:
             obj.writer.start_image_writer(image_writer_processes, image_writer_threads)
@@ -13,11 +13,14 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import bisect
 import logging
 from collections.abc import Callable
+from itertools import accumulate
 from pathlib import Path
 
 import datasets
+import numpy as np
 import torch
 import torch.utils
 
@@ -49,6 +52,8 @@ class MultiLeRobotDataset(torch.utils.data.Dataset):
         video_backend: str | None = None,
     ):
         super().__init__()
+        if not repo_ids:
+            raise ValueError("MultiLeRobotDataset needs at least one repo_id.")
         self.repo_ids = repo_ids
         self.root = Path(root) if root else HF_LEROBOT_HOME
         self.tolerances_s = tolerances_s if tolerances_s else dict.fromkeys(repo_ids, 0.0001)
@@ -89,6 +94,9 @@ class MultiLeRobotDataset(torch.utils.data.Dataset):
                 )
                 self.disabled_features.update(extra_keys)
 
+        # Cumulative number of frames of the sub-datasets, used to route a global index to its sub-dataset
+        self._cumulative_frames = list(accumulate(ds.num_frames for ds in self._datasets))
+
         self.delta_timestamps = delta_timestamps
         # TODO(rcadene, aliberts): We should not perform this aggregation for datasets
         # with multiple robots of different ranges. Instead we should have one normalization
@@ -173,7 +181,12 @@ class MultiLeRobotDataset(torch.utils.data.Dataset):
     @property
     def num_frames(self) -> int:
         """Number of samples/frames."""
-        return sum(d.num_frames for d in self._datasets)
+        return self._cumulative_frames[-1]
+
+    @property
+    def dataset_num_frames(self) -> list[int]:
+        """Number of samples/frames of each sub-dataset, in the order of `repo_ids`."""
+        return np.diff(self._cumulative_frames, prepend=0).tolist()
 
     @property
     def num_episodes(self) -> int:
@@ -192,28 +205,50 @@ class MultiLeRobotDataset(torch.utils.data.Dataset):
     def __len__(self):
         return self.num_frames
 
-    def __getitem__(self, idx: int) -> dict[str, torch.Tensor]:
+    def _locate(self, idx: int) -> tuple[int, int]:
+        """Return the index of the sub-dataset owning ``idx`` and the index of the frame within it."""
         if idx >= len(self):
             raise IndexError(f"Index {idx} out of bounds.")
-        # Determine which dataset to get an item from based on the index.
-        start_idx = 0
-        dataset_idx = 0
-        for dataset in self._datasets:
-            if idx >= start_idx + dataset.num_frames:
-                start_idx += dataset.num_frames
-                dataset_idx += 1
-                continue
-            break
-        else:
-            raise AssertionError("We expect the loop to break out as long as the index is within bounds.")
-        item = self._datasets[dataset_idx][idx - start_idx]
+        dataset_idx = bisect.bisect_right(self._cumulative_frames, idx)
+        start_idx = self._cumulative_frames[dataset_idx - 1] if dataset_idx > 0 else 0
+        return dataset_idx, idx - start_idx
+
+    def _postprocess_item(self, item: dict, dataset_idx: int) -> dict:
         item["dataset_index"] = torch.tensor(dataset_idx)
         for data_key in self.disabled_features:
             if data_key in item:
                 del item[data_key]
-
         return item
 
+    def __getitem__(self, idx: int) -> dict[str, torch.Tensor]:
+        dataset_idx, local_idx = self._locate(idx)
+        item = self._datasets[dataset_idx][local_idx]
+        return self._postprocess_item(item, dataset_idx)
+
+    def __getitems__(self, indices: list[int]) -> list[dict[str, torch.Tensor]]:
+        """Batched version of `__getitem__`: indices are grouped per sub-dataset and fetched with a single
+        `LeRobotDataset.__getitems__` call each, then returned in the requested order."""
+        indices_arr = np.asarray(indices, dtype=np.int64)
+        if len(indices_arr) > 0 and indices_arr.max() >= len(self):
+            raise IndexError(f"Index {int(indices_arr.max())} out of bounds.")
+        dataset_indices = np.searchsorted(self._cumulative_frames, indices_arr, side="right")
+        starts = np.concatenate([[0], self._cumulative_frames])[dataset_indices]
+        local_indices = indices_arr - starts
+
+        local_indices_per_dataset: dict[int, list[int]] = {}
+        positions_per_dataset: dict[int, list[int]] = {}
+        for dataset_idx in np.unique(dataset_indices).tolist():
+            positions = np.flatnonzero(dataset_indices == dataset_idx)
+            local_indices_per_dataset[dataset_idx] = local_indices[positions].tolist()
+            positions_per_dataset[dataset_idx] = positions.tolist()
+
+        items: list[dict] = [{} for _ in indices]
+        for dataset_idx, local_indices in local_indices_per_dataset.items():
+            dataset_items = self._datasets[dataset_idx].__getitems__(local_indices)
+            for position, item in zip(positions_per_dataset[dataset_idx], dataset_items, strict=True):
+                items[position] = self._postprocess_item(item, dataset_idx)
+        return items
+
     def __repr__(self):
         return (
             f"{self.__class__.__name__}(\n"
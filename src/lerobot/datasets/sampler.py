@@ -16,10 +16,13 @@
 import logging
 from collections.abc import Iterator
 
+import numpy as np
 import torch
 
 logger = logging.getLogger(__name__)
 
+_ITER_CHUNK_SIZE = 65536
+
 
 class EpisodeAwareSampler:
     def __init__(
@@ -30,6 +33,9 @@ class EpisodeAwareSampler:
         drop_n_first_frames: int = 0,
         drop_n_last_frames: int = 0,
         shuffle: bool = False,
+        episode_groups: list | None = None,
+        locality_window: int = 1,
+        seed: int | None = None,
     ):
         """Sampler that optionally incorporates episode boundary information.
 
@@ -41,46 +47,226 @@ class EpisodeAwareSampler:
             drop_n_first_frames: Number of frames to drop from the start of each episode.
             drop_n_last_frames: Number of frames to drop from the end of each episode.
             shuffle: Whether to shuffle the indices.
+            episode_groups: Group of each episode (e.g. the video file it is stored in), aligned with
+                            `dataset_from_indices`. Frames of a locality window are all drawn from one group.
+                            If None, each episode is its own group.
+            locality_window: Number of frames drawn from the same group before moving to another one when
+                             shuffling. 1 gives a uniform shuffle, larger values trade randomness for decoder
+                             locality. See `_locality_permutation`.
+            seed: Seed of the shuffling. Each iteration uses `seed + base_epoch + epoch` and increments the
+                  epoch, so that a run resumed with `set_base_epoch` and `set_start_offset` sees the same order.
+                  If None, the global torch RNG is used.
         """
         if drop_n_first_frames < 0:
             raise ValueError(f"drop_n_first_frames must be >= 0, got {drop_n_first_frames}")
         if drop_n_last_frames < 0:
             raise ValueError(f"drop_n_last_frames must be >= 0, got {drop_n_last_frames}")
+        if locality_window < 1:
+            raise ValueError(f"locality_window must be >= 1, got {locality_window}")
+        if episode_groups is not None and len(episode_groups) != len(dataset_from_indices):
+            raise ValueError(
+                f"episode_groups has {len(episode_groups)} entries but the dataset has "
+                f"{len(dataset_from_indices)} episodes."
+            )
 
-        indices = []
-        for episode_idx, (start_index, end_index) in enumerate(
-            zip(dataset_from_indices, dataset_to_indices, strict=True)
-        ):
-            if episode_indices_to_use is None or episode_idx in episode_indices_to_use:
-                ep_length = end_index - start_index
-                if drop_n_first_frames + drop_n_last_frames >= ep_length:
-                    logger.warning(
-                        "Episode %d has %d frames but drop_n_first_frames=%d and "
-                        "drop_n_last_frames=%d removes all frames. Skipping.",
-                        episode_idx,
-                        ep_length,
-                        drop_n_first_frames,
-                        drop_n_last_frames,
-                    )
-                    continue
-                indices.extend(range(start_index + drop_n_first_frames, end_index - drop_n_last_frames))
-
-        if not indices:
+        from_indices = np.asarray(dataset_from_indices, dtype=np.int64)
+        to_indices = np.asarray(dataset_to_indices, dtype=np.int64)
+        if len(from_indices) != len(to_indices):
+            raise ValueError(
+                f"dataset_from_indices and dataset_to_indices have different lengths "
+                f"({len(from_indices)} != {len(to_indices)})."
+            )
+        num_episodes = len(from_indices)
+
+        use_episode = np.ones(num_episodes, dtype=bool)
+        if episode_indices_to_use is not None:
+            use_episode[:] = False
+            selected = np.asarray(list(episode_indices_to_use), dtype=np.int64)
+            use_episode[selected[(selected >= 0) & (selected < num_episodes)]] = True
+
+        ep_lengths = to_indices - from_indices
+        too_short = use_episode & (ep_lengths <= drop_n_first_frames + drop_n_last_frames)
+        for episode_idx in np.flatnonzero(too_short):
+            logger.warning(
+                "Episode %d has %d frames but drop_n_first_frames=%d and "
+                "drop_n_last_frames=%d removes all frames. Skipping.",
+                episode_idx,
+                ep_lengths[episode_idx],
+                drop_n_first_frames,
+                drop_n_last_frames,
+            )
+        use_episode &= ~too_short
+
+        starts = from_indices[use_episode] + drop_n_first_frames
+        counts = ep_lengths[use_episode] - drop_n_first_frames - drop_n_last_frames
+        if counts.sum() == 0:
             raise ValueError(
                 "No valid frames remain after applying drop_n_first_frames and drop_n_last_frames. "
                 "All episodes were either filtered out or had too few frames."
             )
 
-        self.indices = indices
+        # Concatenation of arange(start, start + count) for every kept episode
+        offsets = np.cumsum(counts) - counts
+        self.indices = np.arange(counts.sum(), dtype=np.int64) + np.repeat(starts - offsets, counts)
+
+        if episode_groups is None:
+            ep_groups = np.arange(num_episodes, dtype=np.int64)
+        else:
+            group_ids = {}
+            ep_groups = np.fromiter(
+                (group_ids.setdefault(group, len(group_ids)) for group in episode_groups),
+                dtype=np.int64,
+                count=num_episodes,
+            )
+        self._kept_episode_groups = ep_groups[use_episode]
+        self._kept_episode_counts = counts
+
         self.shuffle = shuffle
+        self.locality_window = locality_window
+        self.seed = seed
+        self.base_epoch = 0
+        self.epoch = 0
+        self.start_offset = 0
+
+    def set_epoch(self, epoch: int) -> None:
+        """Set the epoch used to seed the permutation of the next iteration (only used when `seed` is set).
+
+        The epoch counts from `base_epoch`: accelerate's prepared dataloaders call `set_epoch` with their own
+        iteration counter, which starts at 0 on every run.
+        """
+        self.epoch = epoch
+
+    def set_base_epoch(self, epoch: int) -> None:
+        """Set the epoch of the first iteration, e.g. the interrupted epoch when resuming from a checkpoint."""
+        self.base_epoch = epoch
+
+    def set_start_offset(self, offset: int) -> None:
+        """Skip the first `offset` samples of the next iteration, e.g. when resuming from a checkpoint.
+
+        Combined with `seed` and `set_base_epoch`, the resumed iteration yields exactly the samples that the
+        interrupted one had not reached yet. The offset only applies to one iteration.
+        """
+        if not 0 <= offset <= len(self.indices):
+            raise ValueError(f"offset must be in [0, {len(self.indices)}], got {offset}")
+        self.start_offset = offset
+
+    def _locality_permutation(self, generator: torch.Generator | None) -> np.ndarray:
+        """Shuffle the indices in windows of `locality_window` frames that share the same group.
+
+        The frames of each group are shuffled and cut into windows, each window is sorted so that the video
+        decoder reads forward, and the order of the windows is shuffled across all groups. Every frame is still
+        visited exactly once per epoch.
+        """
+        index_groups = np.repeat(self._kept_episode_groups, self._kept_episode_counts)
+        order = torch.randperm(len(self.indices), generator=generator).numpy()
+        # A stable sort by group keeps the frames of each group in random order
+        order = order[np.argsort(index_groups[order], kind="stable")]
+        indices = self.indices[order]
+        groups = index_groups[order]
+
+        positions = np.arange(len(indices))
+        is_group_start = np.ones(len(indices), dtype=bool)
+        is_group_start[1:] = groups[1:] != groups[:-1]
+        group_starts = np.maximum.accumulate(np.where(is_group_start, positions, 0))
+        is_window_start = is_group_start | ((positions - group_starts) % self.locality_window == 0)
+        window_ids = np.cumsum(is_window_start) - 1
+
+        window_order = torch.randperm(int(window_ids[-1]) + 1, generator=generator).numpy()
+        return indices[np.lexsort((indices, window_order[window_ids]))]
+
+    def _epoch_indices(self) -> np.ndarray:
+        if not self.shuffle:
+            return self.indices
+        generator = None
+        if self.seed is not None:
+            generator = torch.Generator().manual_seed(self.seed + self.base_epoch + self.epoch)
+        if self.locality_window > 1:
+            return self._locality_permutation(generator)
+        return self.indices[torch.randperm(len(self.indices), generator=generator).numpy()]
 
     def __iter__(self) -> Iterator[int]:
-        if self.shuffle:
-            for i in torch.randperm(len(self.indices)):
-                yield self.indices[i]
-        else:
-            for i in self.indices:
-                yield i
+        indices = self._epoch_indices()
+        offset, self.start_offset = self.start_offset, 0
+        if self.seed is not None:
+            self.epoch += 1
+        # Convert to Python ints in chunks rather than materializing the whole epoch as a list
+        for start in range(offset, len(indices), _ITER_CHUNK_SIZE):
+            yield from indices[start : start + _ITER_CHUNK_SIZE].tolist()
 
     def __len__(self) -> int:
         return len(self.indices)
+
+
+class WeightedDatasetSampler:
+    def __init__(
+        self,
+        dataset_num_frames: list[int],
+        temperature: float = 1.0,
+        dataset_weights: list[float] | None = None,
+        num_samples: int | None = None,
+        seed: int | None = None,
+    ):
+        """Sampler drawing frames from a concatenation of datasets (e.g. `MultiLeRobotDataset`) with a
+        temperature-based mixture over the datasets.
+
+        Each sample first draws a dataset with probability proportional to `weight ** (1 / temperature)`, then a
+        frame uniformly within it. Frames are drawn with replacement, so small datasets can be up-sampled without
+        duplicating them on disk.
+
+        Args:
+            dataset_num_frames: Number of frames of each dataset, in the order they are concatenated
+                                (`MultiLeRobotDataset.dataset_num_frames`).
+            temperature: 1 samples datasets proportionally to their weights, larger values flatten the mixture
+                         towards uniform over datasets, values below 1 sharpen it.
+            dataset_weights: Base weight of each dataset. Defaults to the number of frames, in which case a
+                             temperature of 1 is equivalent to uniform sampling over all frames.
+            num_samples: Number of samples per iteration. Defaults to the total number of frames.
+            seed: Seed of the sampling. Each iteration uses `seed + epoch` and increments the epoch. If None,
+                  the global torch RNG is used.
+        """
+        if temperature <= 0:
+            raise ValueError(f"temperature must be > 0, got {temperature}")
+        num_frames = np.asarray(dataset_num_frames, dtype=np.int64)
+        weights = num_frames.astype(np.float64) if dataset_weights is None else np.asarray(dataset_weights)
+        if len(weights) != len(num_frames):
+            raise ValueError(
+                f"dataset_weights has {len(weights)} entries but there are {len(num_frames)} datasets."
+            )
+        if np.any(weights < 0):
+            raise ValueError("dataset_weights must be >= 0.")
+        # Datasets without frames can't be sampled from
+        weights = np.where(num_frames > 0, weights, 0.0)
+        if not np.any(weights > 0):
+            raise ValueError("At least one non-empty dataset must have a positive weight.")
+
+        # Zero weights stay zero at an infinite temperature, where 0 ** 0 would be 1
+        probabilities = np.where(weights > 0, weights ** (1.0 / temperature), 0.0)
+        self.probabilities = probabilities / probabilities.sum()
+        self.dataset_num_frames = num_frames
+        self._offsets = np.cumsum(num_frames) - num_frames
+        self.num_samples = int(num_frames.sum()) if num_samples is None else num_samples
+        self.seed = seed
+        self.epoch = 0
+
+    def set_epoch(self, epoch: int) -> None:
+        """Set the epoch used to seed the next iteration (only used when `seed` is set)."""
+        self.epoch = epoch
+
+    def __iter__(self) -> Iterator[int]:
+        generator = None
+        if self.seed is not None:
+            generator = torch.Generator().manual_seed(self.seed + self.epoch)
+            self.epoch += 1
+        probabilities = torch.from_numpy(self.probabilities)
+        for start in range(0, self.num_samples, _ITER_CHUNK_SIZE):
+            chunk_size = min(_ITER_CHUNK_SIZE, self.num_samples - start)
+            dataset_indices = torch.multinomial(
+                probabilities, chunk_size, replacement=True, generator=generator
+            ).numpy()
+            # Uniform frame within the drawn dataset
+            uniform = torch.rand(chunk_size, generator=generator, dtype=torch.float64).numpy()
+            local_indices = (uniform * self.dataset_num_frames[dataset_indices]).astype(np.int64)
+            yield from (self._offsets[dataset_indices] + local_indices).tolist()
+
+    def __len__(self) -> int:
+        return self.num_samples
@@ -17,11 +17,15 @@ import contextlib
 import glob
 import importlib
 import logging
+import os
 import queue
 import shutil
+import sys
 import tempfile
 import threading
+import time
 import warnings
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from fractions import Fraction
 from pathlib import Path
@@ -39,6 +43,12 @@ from PIL import Image
 
 logger = logging.getLogger(__name__)
 
+# Number of decoded frames assumed to be buffered by a video decoder when estimating its memory footprint.
+_DECODER_BUFFERED_FRAMES = 4
+
+# Default number of video decoders, and thus open video files, kept by the cache of each dataset reader process.
+DEFAULT_VIDEO_DECODER_CACHE_SIZE = 64
+
 # List of hardware encoders to probe for auto-selection. Availability depends on the platform and FFmpeg build.
 # Determines the order of preference for auto-selection when vcodec="auto" is used.
 HW_ENCODERS = [
@@ -131,6 +141,7 @@ def decode_video_frames(
     timestamps: list[float],
     tolerance_s: float,
     backend: str | None = None,
+    decoder_cache: "VideoDecoderCache | None" = None,
 ) -> torch.Tensor:
     """
     Decodes video frames using the specified backend.
@@ -140,6 +151,8 @@ def decode_video_frames(
         timestamps (list[float]): List of timestamps to extract frames.
         tolerance_s (float): Allowed deviation in seconds for frame retrieval.
         backend (str, optional): Backend to use for decoding. Defaults to "torchcodec" when available in the platform; otherwise, defaults to "pyav"..
+        decoder_cache (VideoDecoderCache, optional): Decoder cache used by the "torchcodec" backend. Defaults to
+            the module-level cache.
 
     Returns:
         torch.Tensor: Decoded frames.
@@ -149,7 +162,9 @@ def decode_video_frames(
     if backend is None:
         backend = get_safe_default_codec()
     if backend == "torchcodec":
-        return decode_video_frames_torchcodec(video_path, timestamps, tolerance_s)
+        return decode_video_frames_torchcodec(
+            video_path, timestamps, tolerance_s, decoder_cache=decoder_cache
+        )
     elif backend in ["pyav", "video_reader"]:
         return decode_video_frames_torchvision(video_path, timestamps, tolerance_s, backend)
     else:
@@ -260,11 +275,43 @@ def decode_video_frames_torchvision(
 
 
 class VideoDecoderCache:
-    """Thread-safe cache for video decoders to avoid expensive re-initialization."""
+    """Thread-safe cache for video decoders to avoid expensive re-initialization.
+
+    Each cached entry keeps a torchcodec ``VideoDecoder`` and its open file handle alive. The cache can be bounded
+    by number of entries (``max_size``) and/or by an estimate of the decoders memory (``max_bytes``), in which
+    case the least recently used decoders are closed first. Both default to ``None`` (unbounded).
+
+    The cache is per process: after a fork (e.g. in DataLoader workers), the entries inherited from the parent
+    are closed on first use so that every worker only accounts for the files it opened itself. When pickled
+    (e.g. DataLoader workers with the ``spawn`` start method), only the configuration is transferred.
+    """
 
-    def __init__(self):
-        self._cache: dict[str, tuple[Any, Any]] = {}
+    def __init__(self, max_size: int | None = None, max_bytes: int | None = None):
+        if max_size is not None and max_size < 1:
+            raise ValueError(f"max_size must be a positive integer or None, got {max_size}.")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError(f"max_bytes must be a positive integer or None, got {max_bytes}.")
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self._init_state()
+
+    def _init_state(self) -> None:
+        # video_path -> (decoder, file_handle, estimated_bytes), ordered from least to most recently used
+        self._cache: OrderedDict[str, tuple[Any, Any, int]] = OrderedDict()
         self._lock = Lock()
+        self._pid = os.getpid()
+        self._estimated_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __getstate__(self) -> dict:
+        return {"max_size": self.max_size, "max_bytes": self.max_bytes}
+
+    def __setstate__(self, state: dict) -> None:
+        self.max_size = state["max_size"]
+        self.max_bytes = state["max_bytes"]
+        self._init_state()
 
     def get_decoder(self, video_path: str):
         """Get a cached decoder or create a new one."""
@@ -276,25 +323,78 @@ class VideoDecoderCache:
         video_path = str(video_path)
 
         with self._lock:
-            if video_path not in self._cache:
-                file_handle = fsspec.open(video_path).__enter__()
-                decoder = VideoDecoder(file_handle, seek_mode="approximate")
-                self._cache[video_path] = (decoder, file_handle)
-
-            return self._cache[video_path][0]
+            if self._pid != os.getpid():
+                self._reset_after_fork()
+
+            if video_path in self._cache:
+                self.hits += 1
+                self._cache.move_to_end(video_path)
+                return self._cache[video_path][0]
+
+            self.misses += 1
+            file_handle = fsspec.open(video_path).__enter__()
+            decoder = VideoDecoder(file_handle, seek_mode="approximate")
+            estimated_bytes = _estimate_decoder_bytes(decoder)
+            self._cache[video_path] = (decoder, file_handle, estimated_bytes)
+            self._estimated_bytes += estimated_bytes
+            self._evict()
+
+            return decoder
+
+    def _evict(self) -> None:
+        """Close least recently used decoders until the cache fits its bounds. Always keeps the newest entry."""
+        while len(self._cache) > 1 and (
+            (self.max_size is not None and len(self._cache) > self.max_size)
+            or (self.max_bytes is not None and self._estimated_bytes > self.max_bytes)
+        ):
+            _, (_, file_handle, estimated_bytes) = self._cache.popitem(last=False)
+            file_handle.close()
+            self._estimated_bytes -= estimated_bytes
+            self.evictions += 1
+
+    def _reset_after_fork(self) -> None:
+        """Drop the entries inherited from the parent process, whose decoders can't be shared."""
+        for _, file_handle, _ in self._cache.values():
+            with contextlib.suppress(Exception):
+                file_handle.close()
+        self._cache.clear()
+        self._estimated_bytes = 0
+        self.hits = self.misses = self.evictions = 0
+        self._pid = os.getpid()
 
     def clear(self):
         """Clear the cache and close file handles."""
         with self._lock:
-            for _, file_handle in self._cache.values():
+            for _, file_handle, _ in self._cache.values():
                 file_handle.close()
             self._cache.clear()
+            self._estimated_bytes = 0
 
     def size(self) -> int:
         """Return the number of cached decoders."""
         with self._lock:
             return len(self._cache)
 
+    def stats(self) -> dict[str, int]:
+        """Return the cache counters, e.g. for logging: open decoders (i.e. file descriptors), estimated
+        memory in bytes, hits, misses and evictions since creation."""
+        with self._lock:
+            return {
+                "open_decoders": len(self._cache),
+                "estimated_bytes": self._estimated_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+def _estimate_decoder_bytes(decoder) -> int:
+    """Rough estimate of the memory held by a decoder: a few decoded RGB frames worth of buffers."""
+    metadata = decoder.metadata
+    width = getattr(metadata, "width", None) or 0
+    height = getattr(metadata, "height", None) or 0
+    return _DECODER_BUFFERED_FRAMES * width * height * 3
+
 
 class FrameTimestampError(ValueError):
     """Helper error to indicate the retrieved timestamps exceed the queried ones"""
@@ -569,13 +669,84 @@ def concatenate_video_files(
     Path(tmp_concatenate_path).unlink()
 
 
+def _hwc_view(image: np.ndarray) -> np.ndarray:
+    """Return a (H,W,3) RGB view of a (H,W,C) or (C,H,W) image.
+
+    Like the conversion to RGB of PIL images, the alpha channel of RGBA images is dropped and grayscale
+    (H,W) or (H,W,1) images are repeated on the 3 channels.
+    """
+    if image.ndim == 3 and image.shape[0] == 3:
+        # CHW -> HWC
+        image = image.transpose(1, 2, 0)
+    if image.ndim == 2:
+        image = image[:, :, None]
+    if image.shape[2] == 4:
+        return image[:, :, :3]
+    if image.shape[2] == 1:
+        return np.broadcast_to(image, (*image.shape[:2], 3))
+    return image
+
+
+def _to_hwc_uint8(image: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+    """Convert a (H,W,C) or (C,H,W), uint8 or [0, 1] float image to a contiguous (H,W,3) uint8 array.
+
+    The conversion is written into `out` when given. Otherwise an image that is already a contiguous
+    (H,W,C) uint8 array is returned as is.
+    """
+    image = _hwc_view(image)
+    if out is None:
+        if image.dtype == np.uint8 and image.flags.c_contiguous:
+            return image
+        out = np.empty(image.shape, dtype=np.uint8)
+    if image.dtype == np.uint8:
+        np.copyto(out, image)
+    else:
+        np.multiply(image, 255, out=out, casting="unsafe")
+    return out
+
+
+class _FrameBufferPool:
+    """A thread-safe pool of (H,W,C) uint8 frame buffers.
+
+    `StreamingVideoEncoder.feed_frame` copies each frame into a buffer of the pool, and the encoder thread
+    gives the buffer back once it's encoded, so recording doesn't allocate a new frame every step.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._free: list[np.ndarray] = []
+        self._lock = Lock()
+
+    def acquire(self, shape: tuple[int, ...]) -> np.ndarray:
+        with self._lock:
+            while self._free:
+                buffer = self._free.pop()
+                if buffer.shape == shape:
+                    return buffer
+        return np.empty(shape, dtype=np.uint8)
+
+    def release(self, buffer: np.ndarray) -> None:
+        with self._lock:
+            if len(self._free) < self.capacity:
+                self._free.append(buffer)
+
+
+def _lower_thread_priority() -> None:
+    """Lower the scheduling priority of the calling thread, on Linux where niceness is per thread."""
+    if sys.platform == "linux":
+        with contextlib.suppress(OSError):
+            os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 10)
+
+
 class _CameraEncoderThread(threading.Thread):
     """A thread that encodes video frames streamed via a queue into an MP4 file.
 
     One instance is created per camera per episode. Frames are received as numpy arrays
-    from the main thread, encoded in real-time using PyAV (which releases the GIL during
-    encoding), and written to disk. Stats are computed incrementally using
-    RunningQuantileStats and returned via result_queue.
+    from the main thread, wrapped without a copy into `av.VideoFrame`s, encoded in real-time
+    using PyAV (which releases the GIL during encoding), and written to disk. Stats are
+    computed incrementally using RunningQuantileStats on a downsampled copy of every
+    `stats_frame_stride`-th frame, in a low-priority side thread so they never delay the
+    encoding, and returned via result_queue.
     """
 
     def __init__(
@@ -591,6 +762,8 @@ class _CameraEncoderThread(threading.Thread):
         result_queue: queue.Queue,
         stop_event: threading.Event,
         encoder_threads: int | None = None,
+        stats_frame_stride: int = 1,
+        frame_pool: _FrameBufferPool | None = None,
     ):
         super().__init__(daemon=True)
         self.video_path = video_path
@@ -604,6 +777,11 @@ class _CameraEncoderThread(threading.Thread):
         self.result_queue = result_queue
         self.stop_event = stop_event
         self.encoder_threads = encoder_threads
+        self.stats_frame_stride = stats_frame_stride
+        self.frame_pool = frame_pool
+        # Counters read by StreamingVideoEncoder.get_queue_stats()
+        self.encoded_frames = 0
+        self.encode_s = 0.0
 
     def run(self) -> None:
         from lerobot.datasets.compute_stats import RunningQuantileStats, auto_downsample_height_width
@@ -611,8 +789,17 @@ class _CameraEncoderThread(threading.Thread):
         container = None
         output_stream = None
         stats_tracker = RunningQuantileStats()
+        stats_queue: queue.SimpleQueue = queue.SimpleQueue()
         frame_count = 0
 
+        def update_stats() -> None:
+            _lower_thread_priority()
+            while (img_for_stats := stats_queue.get()) is not None:
+                stats_tracker.update(img_for_stats)
+
+        stats_thread = threading.Thread(target=update_stats, daemon=True)
+        stats_thread.start()
+
         try:
             logging.getLogger("libav").setLevel(av.logging.WARNING)
 
@@ -628,13 +815,8 @@ class _CameraEncoderThread(threading.Thread):
                     # Sentinel: flush and close
                     break
 
-                # Ensure HWC uint8 numpy array
-                if isinstance(frame_data, np.ndarray):
-                    if frame_data.ndim == 3 and frame_data.shape[0] == 3:
-                        # CHW -> HWC
-                        frame_data = frame_data.transpose(1, 2, 0)
-                    if frame_data.dtype != np.uint8:
-                        frame_data = (frame_data * 255).astype(np.uint8)
+                # Ensure contiguous HWC uint8 numpy array (frames fed by StreamingVideoEncoder already are)
+                frame_data = _to_hwc_uint8(frame_data)
 
                 # Open container on first frame (to get width/height)
                 if container is None:
@@ -657,24 +839,33 @@ class _CameraEncoderThread(threading.Thread):
                     output_stream.height = height
                     output_stream.time_base = Fraction(1, self.fps)
 
-                # Encode frame with explicit timestamps
-                pil_img = Image.fromarray(frame_data)
-                video_frame = av.VideoFrame.from_image(pil_img)
+                # Take a downsampled copy of the frame for the stats before its buffer is recycled
+                if frame_count % self.stats_frame_stride == 0:
+                    img_chw = frame_data.transpose(2, 0, 1)  # HWC -> CHW
+                    img_downsampled = auto_downsample_height_width(img_chw)
+                    # Reshape CHW to (H*W, C) for per-channel stats (like compute_episode_stats)
+                    channels = img_downsampled.shape[0]
+                    stats_queue.put(
+                        np.ascontiguousarray(img_downsampled.transpose(1, 2, 0)).reshape(-1, channels)
+                    )
+
+                # Encode frame with explicit timestamps, wrapping the numpy buffer without a copy
+                encode_start = time.perf_counter()
+                video_frame = av.VideoFrame.from_numpy_buffer(frame_data, format="rgb24")
                 video_frame.pts = frame_count
                 video_frame.time_base = Fraction(1, self.fps)
                 packet = output_stream.encode(video_frame)
                 if packet:
                     container.mux(packet)
+                self.encode_s += time.perf_counter() - encode_start
 
-                # Update stats with downsampled frame (per-channel stats like compute_episode_stats)
-                img_chw = frame_data.transpose(2, 0, 1)  # HWC -> CHW
-                img_downsampled = auto_downsample_height_width(img_chw)
-                # Reshape CHW to (H*W, C) for per-channel stats
-                channels = img_downsampled.shape[0]
-                img_for_stats = img_downsampled.transpose(1, 2, 0).reshape(-1, channels)
-                stats_tracker.update(img_for_stats)
+                # The frame was converted to the stream's pixel format by the encoder, so its buffer can
+                # be reused. An rgb24 stream may still reference it.
+                if self.frame_pool is not None and self.pix_fmt != "rgb24":
+                    self.frame_pool.release(frame_data)
 
                 frame_count += 1
+                self.encoded_frames = frame_count
 
             # Flush encoder
             if output_stream is not None:
@@ -687,6 +878,9 @@ class _CameraEncoderThread(threading.Thread):
 
             av.logging.restore_default_callback()
 
+            stats_queue.put(None)
+            stats_thread.join()
+
             # Get stats and put on result queue
             if frame_count >= 2:
                 stats = stats_tracker.get_statistics()
@@ -696,6 +890,7 @@ class _CameraEncoderThread(threading.Thread):
 
         except Exception as e:
             logger.error(f"Encoder thread error: {e}")
+            stats_queue.put(None)
             if container is not None:
                 with contextlib.suppress(Exception):
                     container.close()
@@ -712,6 +907,11 @@ class StreamingVideoEncoder:
     Uses threading instead of multiprocessing to avoid the overhead of pickling large
     numpy arrays through multiprocessing.Queue. PyAV's encode() releases the GIL,
     so encoding runs in parallel with the main recording loop.
+
+    Frames are copied into a per-camera pool of reusable buffers and handed to PyAV without
+    a further copy. `stats_frame_stride` computes the episode stats on every N-th frame only,
+    and `get_queue_stats()` reports the queue depth, dropped frames and encode time of each
+    camera to tell whether the encoders keep up with the recording.
     """
 
     def __init__(
@@ -724,7 +924,10 @@ class StreamingVideoEncoder:
         preset: int | None = None,
         queue_maxsize: int = 30,
         encoder_threads: int | None = None,
+        stats_frame_stride: int = 1,
     ):
+        if stats_frame_stride < 1:
+            raise ValueError(f"stats_frame_stride must be >= 1, got {stats_frame_stride}")
         self.fps = fps
         self.vcodec = resolve_vcodec(vcodec)
         self.pix_fmt = pix_fmt
@@ -733,6 +936,7 @@ class StreamingVideoEncoder:
         self.preset = preset
         self.queue_maxsize = queue_maxsize
         self.encoder_threads = encoder_threads
+        self.stats_frame_stride = stats_frame_stride
 
         self._frame_queues: dict[str, queue.Queue] = {}
         self._result_queues: dict[str, queue.Queue] = {}
@@ -740,6 +944,10 @@ class StreamingVideoEncoder:
         self._stop_events: dict[str, threading.Event] = {}
         self._video_paths: dict[str, Path] = {}
         self._dropped_frames: dict[str, int] = {}
+        self._frame_pools: dict[str, _FrameBufferPool] = {}
+        self._fed_frames: dict[str, int] = {}
+        self._max_queue_depths: dict[str, int] = {}
+        self._last_queue_stats: dict[str, dict[str, float]] = {}
         self._episode_active = False
         self._closed = False
 
@@ -754,6 +962,7 @@ class StreamingVideoEncoder:
             self.cancel_episode()
 
         self._dropped_frames.clear()
+        self._last_queue_stats.clear()
 
         for video_key in video_keys:
             frame_queue: queue.Queue = queue.Queue(maxsize=self.queue_maxsize)
@@ -762,6 +971,8 @@ class StreamingVideoEncoder:
 
             temp_video_dir = Path(tempfile.mkdtemp(dir=temp_dir))
             video_path = temp_video_dir / f"{video_key.replace('/', '_')}_streaming.mp4"
+            # Enough buffers for a full queue, the frame being encoded and the one being fed
+            frame_pool = _FrameBufferPool(capacity=self.queue_maxsize + 2)
 
             encoder_thread = _CameraEncoderThread(
                 video_path=video_path,
@@ -775,6 +986,8 @@ class StreamingVideoEncoder:
                 result_queue=result_queue,
                 stop_event=stop_event,
                 encoder_threads=self.encoder_threads,
+                stats_frame_stride=self.stats_frame_stride,
+                frame_pool=frame_pool,
             )
             encoder_thread.start()
 
@@ -783,14 +996,18 @@ class StreamingVideoEncoder:
             self._threads[video_key] = encoder_thread
             self._stop_events[video_key] = stop_event
             self._video_paths[video_key] = video_path
+            self._frame_pools[video_key] = frame_pool
+            self._fed_frames[video_key] = 0
+            self._max_queue_depths[video_key] = 0
 
         self._episode_active = True
 
     def feed_frame(self, video_key: str, image: np.ndarray) -> None:
         """Feed a frame to the encoder for a specific camera.
 
-        A copy of the image is made before enqueueing to prevent race conditions
-        with camera drivers that may reuse buffers. If the encoder queue is full
+        The image is copied (and converted to (H,W,C) uint8) into a pooled buffer before
+        enqueueing to prevent race conditions with camera drivers that may reuse buffers.
+        If the encoder queue is full
         (encoder can't keep up), the frame is dropped with a warning instead of
         crashing the recording session.
 
@@ -815,9 +1032,16 @@ class StreamingVideoEncoder:
                 pass
             raise RuntimeError(f"Encoder thread for {video_key} is not alive")
 
+        frame_queue = self._frame_queues[video_key]
+        frame_pool = self._frame_pools[video_key]
+        image = _hwc_view(image)
+        buffer = _to_hwc_uint8(image, out=frame_pool.acquire(image.shape))
+        self._fed_frames[video_key] += 1
+        self._max_queue_depths[video_key] = max(self._max_queue_depths[video_key], frame_queue.qsize() + 1)
         try:
-            self._frame_queues[video_key].put(image.copy(), timeout=0.1)
+            frame_queue.put(buffer, timeout=0.1)
         except queue.Full:
+            frame_pool.release(buffer)
             self._dropped_frames[video_key] = self._dropped_frames.get(video_key, 0) + 1
             count = self._dropped_frames[video_key]
             # Log periodically to avoid spam (1st, then every 10th)
@@ -827,6 +1051,32 @@ class StreamingVideoEncoder:
                     f"Consider using vcodec='auto' for hardware encoding or increasing encoder_queue_maxsize."
                 )
 
+    def get_queue_stats(self) -> dict[str, dict[str, float]]:
+        """Return the encoding counters of the current (or last finished) episode for each camera.
+
+        A `max_queue_depth` close to `queue_maxsize`, or dropped frames, means that the
+        encoder of the camera can't keep up with the recording fps.
+
+        Returns:
+            Dict mapping video_key to a dict with `queue_depth`, `max_queue_depth`,
+            `fed_frames`, `dropped_frames`, `encoded_frames` and `encode_s` (the time spent
+            converting and encoding frames)
+        """
+        if not self._episode_active:
+            return {video_key: dict(stats) for video_key, stats in self._last_queue_stats.items()}
+
+        return {
+            video_key: {
+                "queue_depth": self._frame_queues[video_key].qsize(),
+                "max_queue_depth": self._max_queue_depths[video_key],
+                "fed_frames": self._fed_frames[video_key],
+                "dropped_frames": self._dropped_frames.get(video_key, 0),
+                "encoded_frames": thread.encoded_frames,
+                "encode_s": thread.encode_s,
+            }
+            for video_key, thread in self._threads.items()
+        }
+
     def finish_episode(self) -> dict[str, tuple[Path, dict | None]]:
         """Finish encoding the current episode.
 
@@ -869,6 +1119,7 @@ class StreamingVideoEncoder:
                 logger.error(f"No result from encoder thread for {video_key}")
                 results[video_key] = (self._video_paths[video_key], None)
 
+        self._last_queue_stats = self.get_queue_stats()
         self._cleanup()
         self._episode_active = False
         return results
@@ -913,6 +1164,9 @@ class StreamingVideoEncoder:
         self._threads.clear()
         self._stop_events.clear()
         self._video_paths.clear()
+        self._frame_pools.clear()
+        self._fed_frames.clear()
+        self._max_queue_depths.clear()
 
 
 @dataclass
@@ -57,6 +57,8 @@ class EnvConfig(draccus.ChoiceRegistry, abc.ABC):
     fps: int = 30
     features: dict[str, PolicyFeature] = field(default_factory=dict)
     features_map: dict[str, str] = field(default_factory=dict)
+    # Number of tasks of a suite evaluated at once: their vector envs step concurrently and the policy runs on
+    # one batch spanning all of them.
     max_parallel_tasks: int = 1
     disable_env_checker: bool = True
 
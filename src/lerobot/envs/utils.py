@@ -175,14 +175,35 @@ class _LazyAsyncVectorEnv:
         self._ensure()
         return self._env.reset(**kwargs)
 
+    def reset_async(self, **kwargs):
+        self._ensure()
+        self._env.reset_async(**kwargs)
+
+    def reset_wait(self):
+        return self._env.reset_wait()
+
     def step(self, actions):
         self._ensure()
         return self._env.step(actions)
 
+    def step_async(self, actions):
+        self._ensure()
+        self._env.step_async(actions)
+
+    def step_wait(self):
+        return self._env.step_wait()
+
     def call(self, name, *args, **kwargs):
         self._ensure()
         return self._env.call(name, *args, **kwargs)
 
+    def call_async(self, name, *args, **kwargs):
+        self._ensure()
+        self._env.call_async(name, *args, **kwargs)
+
+    def call_wait(self):
+        return self._env.call_wait()
+
     def get_attr(self, name):
         self._ensure()
         return self._env.get_attr(name)
@@ -193,6 +214,125 @@ class _LazyAsyncVectorEnv:
             self._env = None
 
 
+def _concatenate_batches(batches: list[Any]) -> Any:
+    """Concatenate (possibly nested dicts of) batched arrays along the batch dimension."""
+    if isinstance(batches[0], Mapping):
+        return {key: _concatenate_batches([batch[key] for batch in batches]) for key in batches[0]}
+    return np.concatenate([np.asarray(batch) for batch in batches])
+
+
+def _concatenate_infos(infos: list[dict], num_envs: list[int]) -> dict:
+    """Concatenate vector env infos, zero-filling the keys some of the vector envs did not report."""
+    concatenated = {}
+    for key in dict.fromkeys(key for info in infos for key in info):
+        values = [info.get(key) for info in infos]
+        template = next(value for value in values if value is not None)
+        if isinstance(template, Mapping):
+            concatenated[key] = _concatenate_infos([value or {} for value in values], num_envs)
+            continue
+        template = np.asarray(template)
+        concatenated[key] = np.concatenate(
+            [
+                np.asarray(value)
+                if value is not None
+                else np.zeros((n, *template.shape[1:]), dtype=template.dtype)
+                for value, n in zip(values, num_envs, strict=True)
+            ]
+        )
+    return concatenated
+
+
+class MultiTaskVectorEnv:
+    """Steps the vector envs of several tasks as a single batch of sub-environments.
+
+    The sub-environments of all tasks are concatenated along the batch dimension, so that a single policy
+    call serves every task of the batch. Vector envs supporting `step_async`/`step_wait` (AsyncVectorEnv,
+    _LazyAsyncVectorEnv) are all dispatched before waiting for any of them, so that the worker processes of
+    the different tasks step concurrently. Their observations come back through shared memory when the
+    vector env was created with `shared_memory=True`.
+    """
+
+    def __init__(self, envs: Sequence[gym.vector.VectorEnv]):
+        if not envs:
+            raise ValueError("MultiTaskVectorEnv needs at least one vector env.")
+        self.envs = list(envs)
+        self.env_num_envs = [env.num_envs for env in self.envs]
+        self.num_envs = sum(self.env_num_envs)
+        bounds = np.cumsum([0, *self.env_num_envs]).tolist()
+        self.env_slices = [slice(start, stop) for start, stop in zip(bounds[:-1], bounds[1:], strict=True)]
+
+    @property
+    def metadata(self) -> dict:
+        if hasattr(self.envs[0], "metadata"):
+            return self.envs[0].metadata
+        # _LazyAsyncVectorEnv does not expose the metadata of its sub-environments
+        return self.envs[0].get_attr("metadata")[0]
+
+    @property
+    def unwrapped(self) -> "MultiTaskVectorEnv":
+        return self
+
+    def _dispatch(self, method: str, args_per_env: list[tuple], kwargs_per_env: list[dict]) -> list:
+        results: list = [None] * len(self.envs)
+        pending = []
+        for i, (env, args, kwargs) in enumerate(zip(self.envs, args_per_env, kwargs_per_env, strict=True)):
+            if hasattr(env, f"{method}_async"):
+                getattr(env, f"{method}_async")(*args, **kwargs)
+                pending.append(i)
+            else:
+                results[i] = getattr(env, method)(*args, **kwargs)
+        # Wait for every pending vector env before raising, so that none is left in a waiting state.
+        error = None
+        for i in pending:
+            try:
+                results[i] = getattr(self.envs[i], f"{method}_wait")()
+            except Exception as e:
+                error = error or e
+        if error is not None:
+            raise error
+        return results
+
+    def reset(self, *, seed: int | Sequence[int] | None = None, options: dict | None = None):
+        seeds: list[int | list[int] | None]
+        if seed is None:
+            seeds = [None] * len(self.envs)
+        elif isinstance(seed, int):
+            # Same seeds as a single vector env seeded with `seed`: seed + sub-environment index
+            seeds = [seed + env_slice.start for env_slice in self.env_slices]
+        else:
+            seeds = [list(seed[env_slice]) for env_slice in self.env_slices]
+        results = self._dispatch(
+            "reset", [()] * len(self.envs), [{"seed": env_seed, "options": options} for env_seed in seeds]
+        )
+        observations, infos = zip(*results, strict=True)
+        return _concatenate_batches(list(observations)), _concatenate_infos(list(infos), self.env_num_envs)
+
+    def step(self, actions):
+        actions = np.asarray(actions)
+        results = self._dispatch(
+            "step", [(actions[env_slice],) for env_slice in self.env_slices], [{}] * len(self.envs)
+        )
+        observations, rewards, terminations, truncations, infos = zip(*results, strict=True)
+        return (
+            _concatenate_batches(list(observations)),
+            np.concatenate(rewards),
+            np.concatenate(terminations),
+            np.concatenate(truncations),
+            _concatenate_infos(list(infos), self.env_num_envs),
+        )
+
+    def call(self, name: str, *args, **kwargs) -> tuple:
+        results = self._dispatch("call", [(name, *args)] * len(self.envs), [kwargs] * len(self.envs))
+        return tuple(value for result in results for value in result)
+
+    def get_attr(self, name: str) -> tuple:
+        return tuple(value for env in self.envs for value in env.get_attr(name))
+
+    def close(self) -> None:
+        for env in self.envs:
+            env.close()
+
+
 def check_env_attributes_and_types(env: gym.vector.VectorEnv) -> None:
     with warnings.catch_warnings():
         warnings.simplefilter("once", UserWarning)
@@ -95,6 +95,9 @@ class DiffusionConfig(PreTrainedConfig):
         clip_sample_range: The magnitude of the clipping range as described above.
         num_inference_steps: Number of reverse diffusion steps to use at inference time (steps are evenly
             spaced). If not provided, this defaults to be the same as `num_train_timesteps`.
+        num_action_candidates: Number of candidate action trajectories sampled at inference time, in a single
+            batched denoising pass. The candidate most consistent with the previously executed actions (or the
+            one closest to the mean of the candidates, for the first chunk) is kept. 1 disables the selection.
         do_mask_loss_for_padding: Whether to mask the loss when there are copy-padded actions. See
             `LeRobotDataset` and `load_previous_and_future_frames` for more information. Note, this defaults
             to False as the original Diffusion Policy implementation does the same.
@@ -146,6 +149,7 @@ class DiffusionConfig(PreTrainedConfig):
 
     # Inference
     num_inference_steps: int | None = None
+    num_action_candidates: int = 1
 
     # Optimization
     compile_model: bool = False
@@ -183,6 +187,9 @@ class DiffusionConfig(PreTrainedConfig):
                 f"Got {self.noise_scheduler_type}."
             )
 
+        if self.num_action_candidates < 1:
+            raise ValueError(f"`num_action_candidates` must be at least 1. Got {self.num_action_candidates}.")
+
         if self.resize_shape is not None and (
             len(self.resize_shape) != 2 or any(d <= 0 for d in self.resize_shape)
         ):
@@ -43,6 +43,9 @@ from lerobot.policies.utils import (
 )
 from lerobot.utils.constants import ACTION, OBS_ENV_STATE, OBS_IMAGES, OBS_STATE
 
+# Batch key of camera frames already encoded with `DiffusionModel.encode_images`
+OBS_IMAGE_FEATURES = "observation.image_features"
+
 
 class DiffusionPolicy(PreTrainedPolicy):
     """
@@ -71,6 +74,10 @@ class DiffusionPolicy(PreTrainedPolicy):
 
         # queues are populated during rollout of the policy, they contain the n latest observations and actions
         self._queues = None
+        # features of the queued camera frames, keyed by frame id, so that each frame is only encoded once
+        self._image_features_cache = {}
+        # last action chunk returned by `select_action`, used to pick among several sampled candidates
+        self._previous_actions = None
 
         self.diffusion = DiffusionModel(config)
 
@@ -89,13 +96,45 @@ class DiffusionPolicy(PreTrainedPolicy):
             self._queues[OBS_IMAGES] = deque(maxlen=self.config.n_obs_steps)
         if self.config.env_state_feature:
             self._queues[OBS_ENV_STATE] = deque(maxlen=self.config.n_obs_steps)
+        self._image_features_cache = {}
+        self._previous_actions = None
+
+    def _encode_queued_images(self) -> Tensor:
+        """Image features of the queued frames, of shape (B, n_obs_steps, feature_dim).
+
+        Frames still in the queue since the previous chunk reuse their cached features, and the copies of the
+        first observation filling the queue are encoded once.
+        """
+        frames = list(self._queues[OBS_IMAGES])
+        cache = {
+            id(frame): self._image_features_cache[id(frame)]
+            for frame in frames
+            if id(frame) in self._image_features_cache
+        }
+        new_frames = list({id(frame): frame for frame in frames if id(frame) not in cache}.values())
+        if new_frames:
+            new_features = self.diffusion.encode_images(torch.stack(new_frames, dim=1))
+            for frame, features in zip(new_frames, new_features.unbind(1), strict=True):
+                # Keep a reference to the frame, so that its id is not reused while it is cached
+                cache[id(frame)] = (frame, features)
+        self._image_features_cache = cache
+        return torch.stack([cache[id(frame)][1] for frame in frames], dim=1)
 
     @torch.no_grad()
     def predict_action_chunk(self, batch: dict[str, Tensor], noise: Tensor | None = None) -> Tensor:
         """Predict a chunk of actions given environment observations."""
         # stack n latest observations from the queue
-        batch = {k: torch.stack(list(self._queues[k]), dim=1) for k in batch if k in self._queues}
-        actions = self.diffusion.generate_actions(batch, noise=noise)
+        stacked = {
+            k: torch.stack(list(self._queues[k]), dim=1)
+            for k in batch
+            if k in self._queues and k != OBS_IMAGES
+        }
+        # the images are passed as features, encoding only the frames that were not encoded yet
+        if OBS_IMAGES in batch and OBS_IMAGES in self._queues:
+            stacked[OBS_IMAGE_FEATURES] = self._encode_queued_images()
+        actions = self.diffusion.generate_actions(
+            stacked, noise=noise, previous_actions=self._previous_actions
+        )
 
         return actions
 
@@ -133,6 +172,7 @@ class DiffusionPolicy(PreTrainedPolicy):
 
         if len(self._queues[ACTION]) == 0:
             actions = self.predict_action_chunk(batch, noise=noise)
+            self._previous_actions = actions
             self._queues[ACTION].extend(actions.transpose(0, 1))
 
         action = self._queues[ACTION].popleft()
@@ -243,37 +283,40 @@ class DiffusionModel(nn.Module):
 
         return sample
 
+    def encode_images(self, images: Tensor) -> Tensor:
+        """Encode camera frames of shape (B, n_obs_steps, num_cameras, C, H, W) into (B, n_obs_steps, feature_dim)
+        features, with the features of all the cameras concatenated."""
+        batch_size, n_obs_steps = images.shape[:2]
+        if self.config.use_separate_rgb_encoder_per_camera:
+            # Combine batch and sequence dims while rearranging to make the camera index dimension first.
+            images_per_camera = einops.rearrange(images, "b s n ... -> n (b s) ...")
+            img_features_list = torch.cat(
+                [encoder(images) for encoder, images in zip(self.rgb_encoder, images_per_camera, strict=True)]
+            )
+            # Separate batch and sequence dims back out. The camera index dim gets absorbed into the
+            # feature dim (effectively concatenating the camera features).
+            return einops.rearrange(
+                img_features_list, "(n b s) ... -> b s (n ...)", b=batch_size, s=n_obs_steps
+            )
+        # Combine batch, sequence, and "which camera" dims before passing to shared encoder.
+        img_features = self.rgb_encoder(einops.rearrange(images, "b s n ... -> (b s n) ..."))
+        # Separate batch dim and sequence dim back out. The camera index dim gets absorbed into the
+        # feature dim (effectively concatenating the camera features).
+        return einops.rearrange(img_features, "(b s n) ... -> b s (n ...)", b=batch_size, s=n_obs_steps)
+
     def _prepare_global_conditioning(self, batch: dict[str, Tensor]) -> Tensor:
-        """Encode image features and concatenate them all together along with the state vector."""
-        batch_size, n_obs_steps = batch[OBS_STATE].shape[:2]
+        """Encode image features and concatenate them all together along with the state vector.
+
+        Image features already encoded with `encode_images` can be passed as `OBS_IMAGE_FEATURES` instead of the
+        images.
+        """
         global_cond_feats = [batch[OBS_STATE]]
         # Extract image features.
         if self.config.image_features:
-            if self.config.use_separate_rgb_encoder_per_camera:
-                # Combine batch and sequence dims while rearranging to make the camera index dimension first.
-                images_per_camera = einops.rearrange(batch[OBS_IMAGES], "b s n ... -> n (b s) ...")
-                img_features_list = torch.cat(
-                    [
-                        encoder(images)
-                        for encoder, images in zip(self.rgb_encoder, images_per_camera, strict=True)
-                    ]
-                )
-                # Separate batch and sequence dims back out. The camera index dim gets absorbed into the
-                # feature dim (effectively concatenating the camera features).
-                img_features = einops.rearrange(
-                    img_features_list, "(n b s) ... -> b s (n ...)", b=batch_size, s=n_obs_steps
-                )
+            if OBS_IMAGE_FEATURES in batch:
+                global_cond_feats.append(batch[OBS_IMAGE_FEATURES])
             else:
-                # Combine batch, sequence, and "which camera" dims before passing to shared encoder.
-                img_features = self.rgb_encoder(
-                    einops.rearrange(batch[OBS_IMAGES], "b s n ... -> (b s n) ...")
-                )
-                # Separate batch dim and sequence dim back out. The camera index dim gets absorbed into the
-                # feature dim (effectively concatenating the camera features).
-                img_features = einops.rearrange(
-                    img_features, "(b s n) ... -> b s (n ...)", b=batch_size, s=n_obs_steps
-                )
-            global_cond_feats.append(img_features)
+                global_cond_feats.append(self.encode_images(batch[OBS_IMAGES]))
 
         if self.config.env_state_feature:
             global_cond_feats.append(batch[OBS_ENV_STATE])
@@ -281,16 +324,48 @@ class DiffusionModel(nn.Module):
         # Concatenate features then flatten to (B, global_cond_dim).
         return torch.cat(global_cond_feats, dim=-1).flatten(start_dim=1)
 
-    def generate_actions(self, batch: dict[str, Tensor], noise: Tensor | None = None) -> Tensor:
+    def _select_candidates(self, candidates: Tensor, previous_actions: Tensor | None = None) -> Tensor:
+        """Pick one of the (B, K, horizon, action_dim) candidate trajectories for each batch element.
+
+        The first `n_obs_steps - 1` actions of a trajectory overlap with the last actions of the previous chunk
+        (see `DiffusionPolicy.select_action`). When they are known, the candidate that best agrees with them is
+        kept, for temporally consistent chunks. Otherwise, the candidate closest to the mean of all the
+        candidates is kept, which avoids outlier samples.
+        """
+        start = self.config.n_obs_steps - 1
+        num_overlap = min(start, previous_actions.shape[1]) if previous_actions is not None else 0
+        if num_overlap > 0:
+            reference = previous_actions[:, None, -num_overlap:]
+            overlap = candidates[:, :, start - num_overlap : start]
+        else:
+            reference = candidates.mean(dim=1, keepdim=True)
+            overlap = candidates
+        distances = (overlap - reference).square().sum(dim=(-2, -1))  # (B, K)
+        best = distances.argmin(dim=1)
+        return candidates[torch.arange(len(candidates), device=candidates.device), best]
+
+    def generate_actions(
+        self,
+        batch: dict[str, Tensor],
+        noise: Tensor | None = None,
+        previous_actions: Tensor | None = None,
+    ) -> Tensor:
         """
         This function expects `batch` to have:
         {
             "observation.state": (B, n_obs_steps, state_dim)
 
             "observation.images": (B, n_obs_steps, num_cameras, C, H, W)
+                OR
+            "observation.image_features": (B, n_obs_steps, feature_dim)
                 AND/OR
             "observation.environment_state": (B, n_obs_steps, environment_dim)
         }
+
+        With `config.num_action_candidates = K > 1`, K trajectories are sampled for each batch element in a
+        single batched denoising pass (`noise` is then of shape (B * K, horizon, action_dim)) and one of them
+        is kept, see `_select_candidates`. `previous_actions` are the (B, n_action_steps, action_dim) actions
+        of the previous chunk, if any.
         """
         batch_size, n_obs_steps = batch[OBS_STATE].shape[:2]
         assert n_obs_steps == self.config.n_obs_steps
@@ -299,7 +374,18 @@ class DiffusionModel(nn.Module):
         global_cond = self._prepare_global_conditioning(batch)  # (B, global_cond_dim)
 
         # run sampling
-        actions = self.conditional_sample(batch_size, global_cond=global_cond, noise=noise)
+        num_candidates = self.config.num_action_candidates
+        if num_candidates > 1:
+            # All the candidates share the conditioning, and are denoised together as one batch
+            global_cond = global_cond.repeat_interleave(num_candidates, dim=0)
+            candidates = self.conditional_sample(
+                batch_size * num_candidates, global_cond=global_cond, noise=noise
+            )
+            actions = self._select_candidates(
+                candidates.unflatten(0, (batch_size, num_candidates)), previous_actions
+            )
+        else:
+            actions = self.conditional_sample(batch_size, global_cond=global_cond, noise=noise)
 
         # Extract `n_action_steps` steps worth of actions (from the current observation).
         start = n_obs_steps - 1
@@ -15,7 +15,6 @@
 # limitations under the License.
 
 import builtins
-import copy
 import logging
 import math
 from collections import deque
@@ -36,6 +35,7 @@ if TYPE_CHECKING or _transformers_available:
     from lerobot.policies.pi_gemma import (
         PaliGemmaForConditionalGenerationWithPiGemma,
         PiGemmaForCausalLM,
+        ReadOnlyPrefixCache,
         _gated_residual,
         layernorm_forward,
     )
@@ -43,6 +43,7 @@ else:
     CONFIG_MAPPING = None
     modeling_gemma = None
     PiGemmaForCausalLM = None
+    ReadOnlyPrefixCache = None
     _gated_residual = None
     layernorm_forward = None
     PaliGemmaForConditionalGenerationWithPiGemma = None
@@ -886,7 +887,8 @@ class PI05Pytorch(nn.Module):  # see openpi `PI0Pytorch`
         full_att_2d_masks_4d = self._prepare_attention_masks_4d(full_att_2d_masks)
         self.paligemma_with_expert.gemma_expert.model.config._attn_implementation = "eager"  # noqa: SLF001
 
-        past_key_values = copy.deepcopy(past_key_values)
+        # The prefix cache is shared by all the denoising steps, the suffix only reads from it
+        past_key_values = ReadOnlyPrefixCache(past_key_values)
         outputs_embeds, _ = self.paligemma_with_expert.forward(
             attention_mask=full_att_2d_masks_4d,
             position_ids=position_ids,
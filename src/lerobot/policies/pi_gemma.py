@@ -133,6 +133,38 @@ class PiGemmaRMSNorm(nn.Module):
         return f"dim={self.dim}, eps={self.eps}"
 
 
+class ReadOnlyPrefixCache:
+    """
+    Read-only view of the prefix KV cache, shared by all the denoising steps of a flow-matching sampler.
+    Attention layers get the cached prefix keys/values concatenated with the suffix ones, exactly as
+    DynamicCache.update would return them, but the prefix cache is never extended. This replaces a deepcopy
+    of the whole cache before every denoising step.
+    """
+
+    def __init__(self, cache: DynamicCache):
+        # Avoid nesting views when a view is passed back in (e.g. by a denoise step wrapper)
+        self.cache = cache.cache if isinstance(cache, ReadOnlyPrefixCache) else cache
+
+    def update(
+        self,
+        key_states: torch.Tensor,
+        value_states: torch.Tensor,
+        layer_idx: int,
+        cache_kwargs: dict | None = None,
+    ) -> tuple[torch.Tensor, torch.Tensor]:
+        layer = self.cache.layers[layer_idx]
+        keys = torch.cat([layer.keys, key_states], dim=-2)
+        values = torch.cat([layer.values, value_states], dim=-2)
+        return keys, values
+
+    def get_seq_length(self, layer_idx: int = 0) -> int:
+        return self.cache.get_seq_length(layer_idx)
+
+    def __getattr__(self, name: str):
+        # Everything else (mask sizes, sliding flags, ...) is answered by the prefix cache
+        return getattr(self.cache, name)
+
+
 def _get_pi_gemma_decoder_layer_base():
     """base for PiGemmaDecoderLayer"""
 
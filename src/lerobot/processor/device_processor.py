@@ -49,6 +49,8 @@ class DeviceProcessorStep(ProcessorStep):
     device: str = "cpu"
     float_dtype: str | None = None
 
+    supports_action_chunks = True
+
     DTYPE_MAPPING = {
         "float16": torch.float16,
         "float32": torch.float32,
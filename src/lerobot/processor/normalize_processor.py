@@ -408,6 +408,8 @@ class NormalizerProcessorStep(_NormalizationMixin, ProcessorStep):
     It is typically used in the pre-processing pipeline before feeding data to a policy.
     """
 
+    supports_action_chunks = True
+
     @classmethod
     def from_lerobot_dataset(
         cls,
@@ -483,6 +485,8 @@ class UnnormalizerProcessorStep(_NormalizationMixin, ProcessorStep):
     environment.
     """
 
+    supports_action_chunks = True
+
     @classmethod
     def from_lerobot_dataset(
         cls,
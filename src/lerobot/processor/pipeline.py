@@ -39,7 +39,7 @@ from collections.abc import Callable, Iterable, Sequence
 from copy import deepcopy
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, TypedDict, TypeVar, cast
+from typing import Any, ClassVar, TypedDict, TypeVar, cast
 
 import torch
 from huggingface_hub import hf_hub_download
@@ -148,9 +148,13 @@ class ProcessorStep(ABC):
     alters the shape or type of data features.
 
     Subclasses can optionally be stateful by implementing `state_dict` and `load_state_dict`.
+
+    Steps that set `supports_action_chunks` process policy actions with a time axis, `(B, T, action_dim)`,
+    the same way as single actions, `(B, action_dim)`, so a whole action chunk can go through them at once.
     """
 
     _current_transition: EnvTransition | None = None
+    supports_action_chunks: ClassVar[bool] = False
 
     @property
     def transition(self) -> EnvTransition:
@@ -294,6 +298,11 @@ class DataProcessorPipeline[TInput, TOutput](HubMixin):
         transformed_transition = self._forward(transition)
         return self.to_output(transformed_transition)
 
+    @property
+    def supports_action_chunks(self) -> bool:
+        """Whether every step accepts action chunks of shape `(B, T, action_dim)`, see `ProcessorStep`."""
+        return all(step.supports_action_chunks for step in self.steps)
+
     def _forward(self, transition: EnvTransition) -> EnvTransition:
         """Executes all processing steps and hooks in sequence.
 
@@ -1705,6 +1714,8 @@ class IdentityProcessorStep(ProcessorStep):
     This can be useful as a placeholder or for debugging purposes.
     """
 
+    supports_action_chunks = True
+
     def __call__(self, transition: EnvTransition) -> EnvTransition:
         """Returns the transition without modification."""
         return transition
@@ -172,6 +172,8 @@ class AbsoluteActionsProcessorStep(ProcessorStep):
     enabled: bool = False
     relative_step: RelativeActionsProcessorStep | None = field(default=None, repr=False)
 
+    supports_action_chunks = True
+
     def __call__(self, transition: EnvTransition) -> EnvTransition:
         if not self.enabled:
             return transition
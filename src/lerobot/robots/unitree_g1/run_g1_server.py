@@ -160,6 +160,18 @@ def main() -> None:
     parser.add_argument("--camera-width", type=int, default=640, help="Camera width (default: 640)")
     parser.add_argument("--camera-height", type=int, default=480, help="Camera height (default: 480)")
     parser.add_argument("--camera-port", type=int, default=5555, help="Camera ZMQ port (default: 5555)")
+    parser.add_argument(
+        "--camera-protocol",
+        choices=["binary", "json"],
+        default="binary",
+        help="Camera wire format, 'json' for clients of the previous protocol (default: binary)",
+    )
+    parser.add_argument(
+        "--camera-encoding",
+        choices=["jpeg", "raw"],
+        default="jpeg",
+        help="Camera frame encoding of the binary protocol (default: jpeg)",
+    )
     args = parser.parse_args()
 
     # Optionally start camera server in background thread
@@ -167,6 +179,8 @@ def main() -> None:
     if args.camera:
         camera_config = {
             "fps": args.camera_fps,
+            "protocol": args.camera_protocol,
+            "encoding": args.camera_encoding,
             "cameras": {
                 "head_camera": {
                     "device_id": args.camera_device,
@@ -148,10 +148,11 @@ Show dataset information without feature details:
         --operation.type info \
         --operation.show_features false
 
-Recompute dataset statistics:
+Recompute dataset statistics with 8 worker processes:
     lerobot-edit-dataset \
         --repo_id lerobot/pusht \
-        --operation.type recompute_stats
+        --operation.type recompute_stats \
+        --operation.num_workers 8
 
 Recompute stats for relative actions and push to hub:
     lerobot-edit-dataset \
@@ -254,6 +255,8 @@ class RecomputeStatsConfig(OperationConfig):
     relative_exclude_joints: list[str] | None = None
     chunk_size: int = 50
     num_workers: int = 0
+    # Maximum number of frames read at once from a data file
+    chunk_rows: int = 10_000
 
 
 @OperationConfig.register_subclass("info")
@@ -571,6 +574,7 @@ def handle_recompute_stats(cfg: EditDatasetConfig) -> None:
         relative_exclude_joints=cfg.operation.relative_exclude_joints,
         chunk_size=cfg.operation.chunk_size,
         num_workers=cfg.operation.num_workers,
+        chunk_rows=cfg.operation.chunk_rows,
     )
 
     logging.info(f"Stats written to {dataset.root}")
@@ -46,12 +46,11 @@ Note that in both examples, the repo/folder should contain at least `config.json
 You can learn about the CLI options for this script in the `EvalPipelineConfig` in lerobot/configs/eval.py
 """
 
-import concurrent.futures as cf
 import json
 import logging
 import threading
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from collections.abc import Callable
 from contextlib import nullcontext
 from copy import deepcopy
@@ -73,6 +72,7 @@ from lerobot.configs import parser
 from lerobot.configs.eval import EvalPipelineConfig
 from lerobot.envs.factory import make_env, make_env_pre_post_processors
 from lerobot.envs.utils import (
+    MultiTaskVectorEnv,
     check_env_attributes_and_types,
     close_envs,
     preprocess_observation,
@@ -92,6 +92,36 @@ from lerobot.utils.utils import (
 )
 
 
+def _env_tasks(env: gym.vector.VectorEnv) -> list[str]:
+    """Infer "task" from sub-environments (prefer natural language description)."""
+    # env.call() works with both SyncVectorEnv and AsyncVectorEnv.
+    try:
+        return list(env.call("task_description"))
+    except (AttributeError, NotImplementedError):
+        try:
+            return list(env.call("task"))
+        except (AttributeError, NotImplementedError):
+            return [""] * env.num_envs
+
+
+def _step_successes(info: dict, num_envs: int) -> list[bool]:
+    """Success condition of each sub-environment after a vector env step."""
+    # VectorEnv stores is_success in `info["final_info"][env_index]["is_success"]`. "final_info" isn't
+    # available if none of the envs finished.
+    if "final_info" in info:
+        final_info = info["final_info"]
+        if not isinstance(final_info, dict):
+            raise RuntimeError(
+                "Unsupported `final_info` format: expected dict (Gymnasium >= 1.0). "
+                "You're likely using an older version of gymnasium (< 1.0). Please upgrade."
+            )
+        return final_info["is_success"].tolist()
+    if "is_success" in info:
+        is_success = info["is_success"]
+        return is_success.tolist() if hasattr(is_success, "tolist") else [bool(is_success)] * num_envs
+    return [False] * num_envs
+
+
 def rollout(
     env: gym.vector.VectorEnv,
     policy: PreTrainedPolicy,
@@ -165,15 +195,7 @@ def rollout(
         if return_observations:
             all_observations.append(deepcopy(observation))
 
-        # Infer "task" from sub-environments (prefer natural language description).
-        # env.call() works with both SyncVectorEnv and AsyncVectorEnv.
-        try:
-            observation["task"] = list(env.call("task_description"))
-        except (AttributeError, NotImplementedError):
-            try:
-                observation["task"] = list(env.call("task"))
-            except (AttributeError, NotImplementedError):
-                observation["task"] = [""] * env.num_envs
+        observation["task"] = _env_tasks(env)
 
         # Apply environment-specific preprocessing (e.g., LiberoProcessorStep for LIBERO)
         observation = env_preprocessor(observation)
@@ -196,23 +218,7 @@ def rollout(
         if render_callback is not None:
             render_callback(env)
 
-        # VectorEnv stores is_success in `info["final_info"][env_index]["is_success"]`. "final_info" isn't
-        # available if none of the envs finished.
-        if "final_info" in info:
-            final_info = info["final_info"]
-            if not isinstance(final_info, dict):
-                raise RuntimeError(
-                    "Unsupported `final_info` format: expected dict (Gymnasium >= 1.0). "
-                    "You're likely using an older version of gymnasium (< 1.0). Please upgrade."
-                )
-            successes = final_info["is_success"].tolist()
-        elif "is_success" in info:
-            is_success = info["is_success"]
-            successes = (
-                is_success.tolist() if hasattr(is_success, "tolist") else [bool(is_success)] * env.num_envs
-            )
-        else:
-            successes = [False] * env.num_envs
+        successes = _step_successes(info, env.num_envs)
 
         # Keep track of which environments are done so far.
         # Mark the episode as done if we reach the maximum step limit.
@@ -258,6 +264,193 @@ def rollout(
     return ret
 
 
+# Policies whose `select_action` only queues the first `n_action_steps` actions of `predict_action_chunk`, so
+# that `rollout_continuous` can keep one action queue per sub-environment on their behalf.
+CHUNKED_POLICY_TYPES = ("act", "groot", "pi0", "pi05", "pi0_fast", "smolvla", "wall_x", "xvla")
+
+
+def _chunked_n_action_steps(policy: PreTrainedPolicy) -> int | None:
+    """`n_action_steps` of the policy if it supports `rollout_continuous`, None otherwise."""
+    if getattr(policy, "name", None) not in CHUNKED_POLICY_TYPES:
+        return None
+    if getattr(policy.config, "temporal_ensemble_coeff", None) is not None:
+        return None
+    return policy.config.n_action_steps
+
+
+def _select_slots(batch: dict[str, Any], slots: list[int]) -> dict[str, Any]:
+    """Rows of a batched observation for the given sub-environments."""
+    index = torch.tensor(slots)
+    selected = {}
+    for key, value in batch.items():
+        if isinstance(value, Tensor):
+            selected[key] = value[index]
+        elif isinstance(value, list | tuple):
+            selected[key] = [value[slot] for slot in slots]
+        else:
+            selected[key] = value
+    return selected
+
+
+def rollout_continuous(
+    env: gym.vector.VectorEnv,
+    policy: PreTrainedPolicy,
+    env_preprocessor: PolicyProcessorPipeline[dict[str, Any], dict[str, Any]],
+    env_postprocessor: PolicyProcessorPipeline[dict[str, Any], dict[str, Any]],
+    preprocessor: PolicyProcessorPipeline[dict[str, Any], dict[str, Any]],
+    postprocessor: PolicyProcessorPipeline[PolicyAction, PolicyAction],
+    n_episodes: int,
+    n_action_steps: int,
+    start_seed: int | None = None,
+    n_episodes_rendered: int = 0,
+) -> list[dict]:
+    """Run `n_episodes` episodes through a batch of environments, keeping every sub-environment busy.
+
+    Unlike `rollout`, a sub-environment whose episode is done is reset right away with the seed of the next
+    episode, instead of being stepped until the whole batch is done. Episode `i` uses the seed
+    `start_seed + i`, as it would in consecutive `rollout` batches.
+
+    The policy state is kept per sub-environment: the policy must be one of `CHUNKED_POLICY_TYPES`, whose
+    action queue is handled here with one queue per sub-environment. A new action chunk is only predicted for
+    the sub-environments whose queue is empty, and resetting a sub-environment only clears its own queue.
+
+    Args:
+        env: The batch of environments.
+        policy: The policy.
+        n_episodes: The number of episodes to run.
+        n_action_steps: Number of actions of each predicted chunk to run before predicting the next one.
+        start_seed: The seed of the first episode. If not provided, the environments are not manually seeded.
+        n_episodes_rendered: Number of episodes, starting from the first one, whose frames are rendered.
+    Returns:
+        A list with, for each episode, a dictionary of its "sum_reward", "max_reward", "success" and "seed",
+        and of its rendered "frames" (a list of (h, w, c) arrays) for the first `n_episodes_rendered` episodes.
+    """
+    assert isinstance(policy, nn.Module), "Policy must be a PyTorch nn module."
+
+    def seed_of(episode_ix: int) -> int | None:
+        return None if start_seed is None else start_seed + int(episode_ix)
+
+    policy.reset()
+    num_envs = env.num_envs
+    observation, info = env.reset(seed=None if start_seed is None else [seed_of(i) for i in range(num_envs)])
+    max_steps = env.call("_max_episode_steps")[0]
+    check_env_attributes_and_types(env)
+
+    episodes = [
+        {
+            "rewards": [],
+            "successes": [],
+            "seed": seed_of(i),
+            "frames": [] if i < n_episodes_rendered else None,
+        }
+        for i in range(n_episodes)
+    ]
+    # Episode running in each sub-environment, -1 once there is no episode left to start.
+    slot_episodes = np.array([i if i < n_episodes else -1 for i in range(num_envs)])
+    slot_steps = np.zeros(num_envs, dtype=int)
+    action_queues = [deque() for _ in range(num_envs)]
+    next_episode = min(num_envs, n_episodes)
+
+    def render(slots: list[int]):
+        slots = [slot for slot in slots if episodes[slot_episodes[slot]]["frames"] is not None]
+        if slots:
+            frames = env.call("render")
+            for slot in slots:
+                episodes[slot_episodes[slot]]["frames"].append(frames[slot])
+
+    render(np.flatnonzero(slot_episodes >= 0).tolist())
+    progbar = trange(
+        n_episodes,
+        desc=f"Running {n_episodes} episodes with at most {max_steps} steps",
+        disable=inside_slurm(),  # we dont want progress bar when we use slurm, since it clutters the logs
+        leave=False,
+    )
+    while (slot_episodes >= 0).any():
+        active = np.flatnonzero(slot_episodes >= 0).tolist()
+        replan = [slot for slot in active if not action_queues[slot]]
+        if replan:
+            # Numpy array to tensor and changing dictionary keys to LeRobot policy format.
+            batch = preprocess_observation(observation)
+            batch["task"] = _env_tasks(env)
+            batch = env_preprocessor(_select_slots(batch, replan))
+            batch = preprocessor(batch)
+            with torch.inference_mode():
+                chunk = policy.predict_action_chunk(batch)[:, :n_action_steps]
+            for step_ix in range(chunk.shape[1]):
+                action_transition = env_postprocessor({ACTION: postprocessor(chunk[:, step_ix])})
+                for slot, action in zip(replan, action_transition[ACTION].to("cpu").numpy(), strict=True):
+                    action_queues[slot].append(action)
+
+        slot_actions = {slot: action_queues[slot].popleft() for slot in active}
+        idle_action = np.zeros_like(slot_actions[active[0]])
+        action_numpy = np.stack([slot_actions.get(slot, idle_action) for slot in range(num_envs)])
+        observation, reward, terminated, truncated, info = env.step(action_numpy)
+        successes = _step_successes(info, num_envs)
+        slot_steps[active] += 1
+        # The episode is done when the env says so, or when it reaches the maximum step limit.
+        done = terminated | truncated | (slot_steps >= max_steps)
+
+        for slot in active:
+            episode = episodes[slot_episodes[slot]]
+            episode["rewards"].append(float(reward[slot]))
+            episode["successes"].append(bool(successes[slot]))
+        render([slot for slot in active if not done[slot]])
+
+        finished = [slot for slot in active if done[slot]]
+        if not finished:
+            continue
+        progbar.update(len(finished))
+        started = []
+        for slot in finished:
+            action_queues[slot].clear()
+            slot_steps[slot] = 0
+            slot_episodes[slot] = next_episode if next_episode < n_episodes else -1
+            if next_episode < n_episodes:
+                started.append(slot)
+                next_episode += 1
+        if started:
+            reset_mask = np.zeros(num_envs, dtype=bool)
+            reset_mask[started] = True
+            seeds = None
+            if start_seed is not None:
+                seeds = [
+                    seed_of(slot_episodes[slot]) if reset_mask[slot] else None for slot in range(num_envs)
+                ]
+            observation, info = env.reset(seed=seeds, options={"reset_mask": reset_mask})
+            render(started)
+
+    if hasattr(policy, "use_original_modules"):
+        policy.use_original_modules()
+
+    return [
+        {
+            "sum_reward": float(np.sum(episode["rewards"])),
+            "max_reward": float(np.max(episode["rewards"])),
+            "success": any(episode["successes"]),
+            "seed": episode["seed"],
+            "frames": episode["frames"],
+        }
+        for episode in episodes
+    ]
+
+
+def _rollout_episode_metrics(rollout_data: dict) -> tuple[Tensor, Tensor, Tensor, Tensor]:
+    """Per-episode (done_index, sum_reward, max_reward, success) of a batched rollout."""
+    # Figure out where in each rollout sequence the first done condition was encountered (results after
+    # this won't be included).
+    n_steps = rollout_data["done"].shape[1]
+    # Note: this relies on a property of argmax: that it returns the first occurrence as a tiebreaker.
+    done_indices = torch.argmax(rollout_data["done"].to(int), dim=1)
+
+    # Make a mask with shape (batch, n_steps) to mask out rollout data after the first done
+    # (batch-element-wise). Note the `done_indices + 1` to make sure to keep the data from the done step.
+    mask = (torch.arange(n_steps) <= einops.repeat(done_indices + 1, "b -> b s", s=n_steps)).int()
+    sum_rewards = einops.reduce((rollout_data["reward"] * mask), "b n -> b", "sum")
+    max_rewards = einops.reduce((rollout_data["reward"] * mask), "b n -> b", "max")
+    successes = einops.reduce((rollout_data["success"] * mask), "b n -> b", "any")
+    return done_indices, sum_rewards, max_rewards, successes
+
+
 def eval_policy(
     env: gym.vector.VectorEnv,
     policy: PreTrainedPolicy,
@@ -270,6 +463,7 @@ def eval_policy(
     videos_dir: Path | None = None,
     return_episode_data: bool = False,
     start_seed: int | None = None,
+    continuous_batching: bool = False,
 ) -> dict:
     """
     Args:
@@ -282,6 +476,9 @@ def eval_policy(
             the "episodes" key of the returned dictionary.
         start_seed: The first seed to use for the first individual rollout. For all subsequent rollouts the
             seed is incremented by 1. If not provided, the environments are not manually seeded.
+        continuous_batching: Run the episodes with `rollout_continuous`, which resets each sub-environment as
+            soon as its episode is done, instead of with batches of `rollout`. Only supported for the policies
+            of `CHUNKED_POLICY_TYPES` and without `return_episode_data`, falls back to `rollout` otherwise.
     Returns:
         Dictionary with metrics and data regarding the rollouts.
     """
@@ -303,6 +500,27 @@ def eval_policy(
     start = time.time()
     policy.eval()
 
+    if continuous_batching:
+        n_action_steps = _chunked_n_action_steps(policy)
+        if n_action_steps is not None and not return_episode_data:
+            return _eval_policy_continuous(
+                env=env,
+                policy=policy,
+                env_preprocessor=env_preprocessor,
+                env_postprocessor=env_postprocessor,
+                preprocessor=preprocessor,
+                postprocessor=postprocessor,
+                n_episodes=n_episodes,
+                n_action_steps=n_action_steps,
+                max_episodes_rendered=max_episodes_rendered,
+                videos_dir=videos_dir,
+                start_seed=start_seed,
+            )
+        logging.warning(
+            "Continuous batching is only supported for the policies of CHUNKED_POLICY_TYPES and without "
+            "returning the episode data, falling back to batched rollouts."
+        )
+
     # Determine how many batched rollouts we need to get n_episodes. Note that if n_episodes is not evenly
     # divisible by env.num_envs we end up discarding some data in the last batch.
     n_batches = n_episodes // env.num_envs + int((n_episodes % env.num_envs) != 0)
@@ -360,21 +578,12 @@ def eval_policy(
             render_callback=render_frame if max_episodes_rendered > 0 else None,
         )
 
-        # Figure out where in each rollout sequence the first done condition was encountered (results after
-        # this won't be included).
-        n_steps = rollout_data["done"].shape[1]
-        # Note: this relies on a property of argmax: that it returns the first occurrence as a tiebreaker.
-        done_indices = torch.argmax(rollout_data["done"].to(int), dim=1)
-
-        # Make a mask with shape (batch, n_steps) to mask out rollout data after the first done
-        # (batch-element-wise). Note the `done_indices + 1` to make sure to keep the data from the done step.
-        mask = (torch.arange(n_steps) <= einops.repeat(done_indices + 1, "b -> b s", s=n_steps)).int()
+        done_indices, batch_sum_rewards, batch_max_rewards, batch_successes = _rollout_episode_metrics(
+            rollout_data
+        )
         # Extend metrics.
-        batch_sum_rewards = einops.reduce((rollout_data["reward"] * mask), "b n -> b", "sum")
         sum_rewards.extend(batch_sum_rewards.tolist())
-        batch_max_rewards = einops.reduce((rollout_data["reward"] * mask), "b n -> b", "max")
         max_rewards.extend(batch_max_rewards.tolist())
-        batch_successes = einops.reduce((rollout_data["success"] * mask), "b n -> b", "any")
         all_successes.extend(batch_successes.tolist())
         if seeds:
             all_seeds.extend(seeds)
@@ -469,6 +678,73 @@ def eval_policy(
     return info
 
 
+def _eval_policy_continuous(
+    env: gym.vector.VectorEnv,
+    policy: PreTrainedPolicy,
+    env_preprocessor: PolicyProcessorPipeline[dict[str, Any], dict[str, Any]],
+    env_postprocessor: PolicyProcessorPipeline[dict[str, Any], dict[str, Any]],
+    preprocessor: PolicyProcessorPipeline[dict[str, Any], dict[str, Any]],
+    postprocessor: PolicyProcessorPipeline[PolicyAction, PolicyAction],
+    n_episodes: int,
+    n_action_steps: int,
+    max_episodes_rendered: int,
+    videos_dir: Path | None,
+    start_seed: int | None,
+) -> dict:
+    """`eval_policy(continuous_batching=True)`, returning the same metrics with `rollout_continuous`."""
+    start = time.time()
+    episodes = rollout_continuous(
+        env=env,
+        policy=policy,
+        env_preprocessor=env_preprocessor,
+        env_postprocessor=env_postprocessor,
+        preprocessor=preprocessor,
+        postprocessor=postprocessor,
+        n_episodes=n_episodes,
+        n_action_steps=n_action_steps,
+        start_seed=start_seed,
+        n_episodes_rendered=max_episodes_rendered,
+    )
+
+    video_paths = []
+    threads = []  # for video saving threads
+    for episode_ix, episode in enumerate(episodes[:max_episodes_rendered]):
+        videos_dir.mkdir(parents=True, exist_ok=True)
+        video_path = videos_dir / f"eval_episode_{episode_ix}.mp4"
+        video_paths.append(str(video_path))
+        thread = threading.Thread(
+            target=write_video,
+            args=(str(video_path), np.stack(episode["frames"]), env.unwrapped.metadata["render_fps"]),
+        )
+        thread.start()
+        threads.append(thread)
+    for thread in threads:
+        thread.join()
+
+    info = {
+        "per_episode": [
+            {
+                "episode_ix": i,
+                "sum_reward": episode["sum_reward"],
+                "max_reward": episode["max_reward"],
+                "success": episode["success"],
+                "seed": episode["seed"],
+            }
+            for i, episode in enumerate(episodes)
+        ],
+        "aggregated": {
+            "avg_sum_reward": float(np.nanmean([episode["sum_reward"] for episode in episodes])),
+            "avg_max_reward": float(np.nanmean([episode["max_reward"] for episode in episodes])),
+            "pc_success": float(np.nanmean([episode["success"] for episode in episodes]) * 100),
+            "eval_s": time.time() - start,
+            "eval_ep_s": (time.time() - start) / n_episodes,
+        },
+    }
+    if max_episodes_rendered > 0:
+        info["video_paths"] = video_paths
+    return info
+
+
 def _compile_episode_data(
     rollout_data: dict, done_indices: Tensor, start_episode_index: int, start_data_index: int, fps: float
 ) -> dict:
@@ -573,6 +849,7 @@ def eval_main(cfg: EvalPipelineConfig):
             videos_dir=Path(cfg.output_dir) / "videos",
             start_seed=cfg.seed,
             max_parallel_tasks=cfg.env.max_parallel_tasks,
+            continuous_batching=cfg.eval.continuous_batching,
         )
         print("Overall Aggregated Metrics:")
         print(info["overall"])
@@ -615,6 +892,7 @@ def eval_one(
     videos_dir: Path | None,
     return_episode_data: bool,
     start_seed: int | None,
+    continuous_batching: bool = False,
 ) -> TaskMetrics:
     """Evaluates one task_id of one suite using the provided vec env."""
 
@@ -632,6 +910,7 @@ def eval_one(
         videos_dir=task_videos_dir,
         return_episode_data=return_episode_data,
         start_seed=start_seed,
+        continuous_batching=continuous_batching,
     )
 
     per_episode = task_result["per_episode"]
@@ -658,6 +937,7 @@ def run_one(
     videos_dir: Path | None,
     return_episode_data: bool,
     start_seed: int | None,
+    continuous_batching: bool = False,
 ):
     """
     Run eval_one for a single (task_group, task_id, env).
@@ -682,6 +962,7 @@ def run_one(
         videos_dir=task_videos_dir,
         return_episode_data=return_episode_data,
         start_seed=start_seed,
+        continuous_batching=continuous_batching,
     )
     # ensure we always provide video_paths key to simplify accumulation
     if max_episodes_rendered > 0:
@@ -689,6 +970,107 @@ def run_one(
     return task_group, task_id, metrics
 
 
+def eval_tasks_batched(
+    tasks: list[tuple[str, int, gym.vector.VectorEnv]],
+    *,
+    policy: PreTrainedPolicy,
+    env_preprocessor: PolicyProcessorPipeline[dict[str, Any], dict[str, Any]],
+    env_postprocessor: PolicyProcessorPipeline[dict[str, Any], dict[str, Any]],
+    preprocessor: PolicyProcessorPipeline[dict[str, Any], dict[str, Any]],
+    postprocessor: PolicyProcessorPipeline[PolicyAction, PolicyAction],
+    n_episodes: int,
+    max_episodes_rendered: int,
+    videos_dir: Path | None,
+    start_seed: int | None,
+) -> list[tuple[str, int, TaskMetrics]]:
+    """
+    Evaluate several (task_group, task_id, env) tasks at once, with a single policy batch spanning the
+    sub-environments of all of them (see `MultiTaskVectorEnv`).
+    Each task runs the same `n_episodes` episodes, with the same seeds and videos, as `run_one` would.
+    Returns a (task_group, task_id, task_metrics) tuple per task, in the order of `tasks`.
+    """
+    if max_episodes_rendered > 0 and not videos_dir:
+        raise ValueError("If max_episodes_rendered > 0, videos_dir must be provided.")
+
+    env = MultiTaskVectorEnv([vec for _, _, vec in tasks])
+    policy.eval()
+    task_metrics = [TaskMetrics(sum_rewards=[], max_rewards=[], successes=[], video_paths=[]) for _ in tasks]
+    task_videos_dirs = [
+        videos_dir / f"{task_group}_{task_id}" if videos_dir is not None else None
+        for task_group, task_id, _ in tasks
+    ]
+    threads = []  # for video saving threads
+
+    n_batches = max(-(-n_episodes // num_envs) for num_envs in env.env_num_envs)
+    progbar = trange(
+        n_batches, desc=f"Stepping through eval batches of {len(tasks)} tasks", disable=inside_slurm()
+    )
+    for batch_ix in progbar:
+        # Number of episodes of each task kept from this batch, the others are past `n_episodes`.
+        n_kept = [min(max(n_episodes - batch_ix * n, 0), n) for n in env.env_num_envs]
+        # (task index, sub-environment index) of the episodes to render in this batch.
+        render_slots = [
+            (t, env_slice.start + i)
+            for t, env_slice in enumerate(env.env_slices)
+            for i in range(min(max_episodes_rendered - len(task_metrics[t]["video_paths"]), n_kept[t]))
+        ]
+        ep_frames: list[np.ndarray] = []
+
+        def render_frame(env: gym.vector.VectorEnv):
+            frames = env.call("render")
+            ep_frames.append(np.stack([frames[slot] for _, slot in render_slots]))  # noqa: B023
+
+        seeds = None
+        if start_seed is not None:
+            seeds = [start_seed + batch_ix * n + i for n in env.env_num_envs for i in range(n)]
+        rollout_data = rollout(
+            env=env,
+            policy=policy,
+            env_preprocessor=env_preprocessor,
+            env_postprocessor=env_postprocessor,
+            preprocessor=preprocessor,
+            postprocessor=postprocessor,
+            seeds=seeds,
+            render_callback=render_frame if render_slots else None,
+        )
+        done_indices, sum_rewards, max_rewards, successes = _rollout_episode_metrics(rollout_data)
+        for metrics, env_slice, kept in zip(task_metrics, env.env_slices, n_kept, strict=True):
+            kept_slice = slice(env_slice.start, env_slice.start + kept)
+            metrics["sum_rewards"].extend(sum_rewards[kept_slice].tolist())
+            metrics["max_rewards"].extend(max_rewards[kept_slice].tolist())
+            metrics["successes"].extend(successes[kept_slice].tolist())
+
+        # Maybe render video for visualization.
+        if render_slots and len(ep_frames) > 0:
+            batch_stacked_frames = np.stack(ep_frames, axis=1)  # (n_rendered, t, *)
+            for stacked_frames, (t, slot) in zip(batch_stacked_frames, render_slots, strict=True):
+                task_videos_dirs[t].mkdir(parents=True, exist_ok=True)
+                video_path = task_videos_dirs[t] / f"eval_episode_{len(task_metrics[t]['video_paths'])}.mp4"
+                task_metrics[t]["video_paths"].append(str(video_path))
+                thread = threading.Thread(
+                    target=write_video,
+                    args=(
+                        str(video_path),
+                        stacked_frames[: done_indices[slot] + 1],  # + 1 to capture the last observation
+                        env.metadata["render_fps"],
+                    ),
+                )
+                thread.start()
+                threads.append(thread)
+
+        all_successes = [success for metrics in task_metrics for success in metrics["successes"]]
+        progbar.set_postfix({"running_success_rate": f"{np.mean(all_successes).item() * 100:.1f}%"})
+
+    # Wait till all video rendering threads are done.
+    for thread in threads:
+        thread.join()
+
+    return [
+        (task_group, task_id, metrics)
+        for (task_group, task_id, _), metrics in zip(tasks, task_metrics, strict=True)
+    ]
+
+
 def eval_policy_all(
     envs: dict[str, dict[int, gym.vector.VectorEnv]],
     policy,
@@ -703,13 +1085,15 @@ def eval_policy_all(
     return_episode_data: bool = False,
     start_seed: int | None = None,
     max_parallel_tasks: int = 1,
+    continuous_batching: bool = False,
 ) -> dict:
     """
     Evaluate a nested `envs` dict: {task_group: {task_id: vec_env}}.
-    This implementation flattens tasks, runs them sequentially or via ThreadPoolExecutor,
-    accumulates per-group and overall statistics, and returns the same aggregate metrics
-    schema as the single-env evaluator (avg_sum_reward / avg_max_reward / pc_success / timings)
-    plus per-task infos.
+    This implementation flattens tasks and runs them sequentially, or with `max_parallel_tasks > 1`
+    rolls out up to `max_parallel_tasks` tasks of a group at once as one policy batch (see
+    `eval_tasks_batched`). It accumulates per-group and overall statistics, and returns the same
+    aggregate metrics schema as the single-env evaluator (avg_sum_reward / avg_max_reward / pc_success /
+    timings) plus per-task infos.
     """
     start_t = time.time()
 
@@ -745,7 +1129,7 @@ def eval_policy_all(
             group_acc[group]["video_paths"].extend(paths)
             overall["video_paths"].extend(paths)
 
-    # Choose runner (sequential vs threaded)
+    # Choose runner (sequential vs batched across tasks)
     task_runner = partial(
         run_one,
         policy=policy,
@@ -758,6 +1142,7 @@ def eval_policy_all(
         videos_dir=videos_dir,
         return_episode_data=return_episode_data,
         start_seed=start_seed,
+        continuous_batching=continuous_batching,
     )
 
     if max_parallel_tasks <= 1:
@@ -781,18 +1166,38 @@ def eval_policy_all(
                         prefetch_thread = threading.Thread(target=next_env._ensure, daemon=True)
                         prefetch_thread.start()
     else:
-        with cf.ThreadPoolExecutor(max_workers=max_parallel_tasks) as executor:
-            fut2meta = {}
-            for task_group, task_id, env in tasks:
-                fut = executor.submit(task_runner, task_group, task_id, env)
-                fut2meta[fut] = (task_group, task_id, env)
-            for fut in cf.as_completed(fut2meta):
-                tg, tid, env = fut2meta[fut]
-                try:
-                    tg, tid, metrics = fut.result()
+        if continuous_batching:
+            logging.warning(
+                "Continuous batching isn't supported when several tasks are evaluated at once "
+                f"(max_parallel_tasks={max_parallel_tasks}), falling back to batched rollouts."
+            )
+        shard_runner = partial(
+            eval_tasks_batched,
+            policy=policy,
+            env_preprocessor=env_preprocessor,
+            env_postprocessor=env_postprocessor,
+            preprocessor=preprocessor,
+            postprocessor=postprocessor,
+            n_episodes=n_episodes,
+            max_episodes_rendered=max_episodes_rendered,
+            videos_dir=videos_dir,
+            start_seed=start_seed,
+        )
+        # Shards never span task groups, whose tasks share the env type and episode length.
+        shards = []
+        for task_group, group in envs.items():
+            group_tasks = [(task_group, task_id, env) for task_id, env in group.items()]
+            shards += [
+                group_tasks[i : i + max_parallel_tasks]
+                for i in range(0, len(group_tasks), max_parallel_tasks)
+            ]
+        for shard in shards:
+            try:
+                for tg, tid, metrics in shard_runner(shard):
                     _accumulate_to(tg, metrics)
                     per_task_infos.append({"task_group": tg, "task_id": tid, "metrics": metrics})
-                finally:
+            finally:
+                for _, _, env in shard:
                     env.close()
 
     # compute aggregated metrics helper (robust to lists/scalars)
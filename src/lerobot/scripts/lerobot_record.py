@@ -201,6 +201,12 @@ class DatasetRecordConfig:
     # Number of threads per encoder instance. None = auto (codec default).
     # Lower values reduce CPU usage, maps to 'lp' (via svtav1-params) for libsvtav1 and 'threads' for h264/hevc..
     encoder_threads: int | None = None
+    # Compute the video stats on every N-th frame only when using streaming encoding. Higher values
+    # reduce the CPU load of the encoder threads.
+    encoder_stats_frame_stride: int = 1
+    # Save the episodes in a background thread, so that the next episode can be recorded while the previous
+    # one is written. Episodes that weren't saved when the process stopped are recovered with --resume=true.
+    background_saving: bool = False
     # Rename map for the observation to override the image and state keys
     rename_map: dict[str, str] = field(default_factory=dict)
 
@@ -528,6 +534,8 @@ def record(cfg: RecordConfig) -> LeRobotDataset:
                 streaming_encoding=cfg.dataset.streaming_encoding,
                 encoder_queue_maxsize=cfg.dataset.encoder_queue_maxsize,
                 encoder_threads=cfg.dataset.encoder_threads,
+                encoder_stats_frame_stride=cfg.dataset.encoder_stats_frame_stride,
+                background_saving=cfg.dataset.background_saving,
                 image_writer_processes=cfg.dataset.num_image_writer_processes if num_cameras > 0 else 0,
                 image_writer_threads=cfg.dataset.num_image_writer_threads_per_camera * num_cameras
                 if num_cameras > 0
@@ -551,6 +559,8 @@ def record(cfg: RecordConfig) -> LeRobotDataset:
                 streaming_encoding=cfg.dataset.streaming_encoding,
                 encoder_queue_maxsize=cfg.dataset.encoder_queue_maxsize,
                 encoder_threads=cfg.dataset.encoder_threads,
+                encoder_stats_frame_stride=cfg.dataset.encoder_stats_frame_stride,
+                background_saving=cfg.dataset.background_saving,
             )
 
         # Load pretrained policy
@@ -587,7 +597,7 @@ def record(cfg: RecordConfig) -> LeRobotDataset:
         with VideoEncodingManager(dataset):
             recorded_episodes = 0
             while recorded_episodes < cfg.dataset.num_episodes and not events["stop_recording"]:
-                log_say(f"Recording episode {dataset.num_episodes}", cfg.play_sounds)
+                log_say(f"Recording episode {dataset.writer.next_episode_index}", cfg.play_sounds)
                 record_loop(
                     robot=robot,
                     events=events,
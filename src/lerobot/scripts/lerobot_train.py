@@ -15,6 +15,7 @@
 # limitations under the License.
 import dataclasses
 import logging
+import math
 import time
 from contextlib import nullcontext
 from pprint import pformat
@@ -42,10 +43,13 @@ from lerobot.utils.import_utils import register_third_party_plugins
 from lerobot.utils.logging_utils import AverageMeter, MetricsTracker
 from lerobot.utils.random_utils import set_seed
 from lerobot.utils.train_utils import (
+    BatchPrefetcher,
+    PreprocessingCollate,
     get_step_checkpoint_dir,
     get_step_identifier,
     load_training_state,
     save_checkpoint,
+    split_preprocessor,
     update_last_checkpoint,
 )
 from lerobot.utils.utils import (
@@ -355,19 +359,46 @@ def train(cfg: TrainPipelineConfig, accelerator: Accelerator | None = None):
         logging.info(f"{num_total_params=} ({format_big_number(num_total_params)})")
 
     # create dataloader for offline training
-    if hasattr(cfg.policy, "drop_n_last_frames"):
+    use_locality = cfg.dataset.locality_window > 1 and not cfg.dataset.streaming
+    if hasattr(cfg.policy, "drop_n_last_frames") or use_locality:
         shuffle = False
+        episode_groups = None
+        if use_locality and dataset.meta.video_keys:
+            vid_key = dataset.meta.video_keys[0]
+            episode_groups = list(
+                zip(
+                    dataset.meta.episodes[f"videos/{vid_key}/chunk_index"],
+                    dataset.meta.episodes[f"videos/{vid_key}/file_index"],
+                    strict=True,
+                )
+            )
         sampler = EpisodeAwareSampler(
             dataset.meta.episodes["dataset_from_index"],
             dataset.meta.episodes["dataset_to_index"],
             episode_indices_to_use=dataset.episodes,
-            drop_n_last_frames=cfg.policy.drop_n_last_frames,
+            drop_n_last_frames=getattr(cfg.policy, "drop_n_last_frames", 0),
             shuffle=True,
+            episode_groups=episode_groups,
+            locality_window=cfg.dataset.locality_window,
+            seed=cfg.seed,
         )
+        if cfg.resume and cfg.seed is not None:
+            # Skip the part of the interrupted epoch that was already trained on
+            effective_bs = cfg.batch_size * accelerator.num_processes
+            batches_per_epoch = math.ceil(len(sampler) / effective_bs)
+            # A base epoch, since the prepared dataloader calls `set_epoch` with its own counter from 0
+            sampler.set_base_epoch(step // batches_per_epoch)
+            sampler.set_start_offset((step % batches_per_epoch) * effective_bs)
     else:
         shuffle = True
         sampler = None
 
+    collate_fn = None
+    batch_preprocessor = preprocessor
+    if cfg.preprocess_in_workers:
+        worker_preprocessor, batch_preprocessor = split_preprocessor(preprocessor)
+        collate_fn = PreprocessingCollate(worker_preprocessor)
+
     dataloader = torch.utils.data.DataLoader(
         dataset,
         num_workers=cfg.num_workers,
@@ -377,6 +408,7 @@ def train(cfg: TrainPipelineConfig, accelerator: Accelerator | None = None):
         pin_memory=device.type == "cuda",
         drop_last=False,
         prefetch_factor=2 if cfg.num_workers > 0 else None,
+        collate_fn=collate_fn,
     )
 
     # Prepare everything with accelerator
@@ -384,7 +416,9 @@ def train(cfg: TrainPipelineConfig, accelerator: Accelerator | None = None):
     policy, optimizer, dataloader, lr_scheduler = accelerator.prepare(
         policy, optimizer, dataloader, lr_scheduler
     )
-    dl_iter = cycle(dataloader)
+    batch_iter = BatchPrefetcher(
+        cycle(dataloader), batch_preprocessor, device, num_prefetch=cfg.prefetch_batches
+    )
 
     policy.train()
 
@@ -394,6 +428,8 @@ def train(cfg: TrainPipelineConfig, accelerator: Accelerator | None = None):
         "lr": AverageMeter("lr", ":0.1e"),
         "update_s": AverageMeter("updt_s", ":.3f"),
         "dataloading_s": AverageMeter("data_s", ":.3f"),
+        "preprocess_s": AverageMeter("prep_s", ":.3f"),
+        "data_wait_s": AverageMeter("wait_s", ":.3f"),
     }
 
     # Keep global batch size for logging; MetricsTracker handles world size internally.
@@ -421,10 +457,11 @@ def train(cfg: TrainPipelineConfig, accelerator: Accelerator | None = None):
         )
 
     for _ in range(step, cfg.steps):
-        start_time = time.perf_counter()
-        batch = next(dl_iter)
-        batch = preprocessor(batch)
-        train_tracker.dataloading_s = time.perf_counter() - start_time
+        batch = next(batch_iter)
+        # When prefetching, preprocessing overlaps with the updates: `data_wait_s` is what stalls training
+        train_tracker.dataloading_s = batch_iter.dataloading_s
+        train_tracker.preprocess_s = batch_iter.preprocess_s
+        train_tracker.data_wait_s = batch_iter.wait_s
 
         train_tracker, output_dict = update_policy(
             train_tracker,
@@ -503,6 +540,7 @@ def train(cfg: TrainPipelineConfig, accelerator: Accelerator | None = None):
                         max_episodes_rendered=4,
                         start_seed=cfg.seed,
                         max_parallel_tasks=cfg.env.max_parallel_tasks,
+                        continuous_batching=cfg.eval.continuous_batching,
                     )
                 # overall metrics (suite-agnostic)
                 aggregated = eval_info["overall"]
@@ -535,6 +573,7 @@ def train(cfg: TrainPipelineConfig, accelerator: Accelerator | None = None):
 
             accelerator.wait_for_everyone()
 
+    batch_iter.close()
     if is_main_process:
         progbar.close()
 
@@ -204,16 +204,14 @@ def process_episode(args):
         states = []
         actions = []
 
-        for abs_idx in range(from_idx, to_idx):
-            # map absolute index to relative index if needed
-            if dataset.reader._absolute_to_relative_idx is not None:
-                if abs_idx not in dataset.reader._absolute_to_relative_idx:
-                    # this episode's frames aren't in the filtered dataset
-                    return None
-                rel_idx = dataset.reader._absolute_to_relative_idx[abs_idx]
-            else:
-                rel_idx = abs_idx
+        # map absolute indices to relative indices if needed
+        try:
+            rel_indices = dataset.reader.abs_to_rel_indices(np.arange(from_idx, to_idx)).tolist()
+        except KeyError:
+            # this episode's frames aren't in the filtered dataset
+            return None
 
+        for rel_idx in rel_indices:
             frame = dataset.get_raw_item(rel_idx)
 
             # get state (could be from observation.state or other state key)
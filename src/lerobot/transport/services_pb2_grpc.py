@@ -254,6 +254,11 @@ class AsyncInferenceStub:
                 request_serializer=lerobot_dot_transport_dot_services__pb2.Empty.SerializeToString,
                 response_deserializer=lerobot_dot_transport_dot_services__pb2.Actions.FromString,
                 _registered_method=True)
+        self.StreamActions = channel.stream_stream(
+                '/transport.AsyncInference/StreamActions',
+                request_serializer=lerobot_dot_transport_dot_services__pb2.Observation.SerializeToString,
+                response_deserializer=lerobot_dot_transport_dot_services__pb2.Actions.FromString,
+                _registered_method=True)
         self.SendPolicyInstructions = channel.unary_unary(
                 '/transport.AsyncInference/SendPolicyInstructions',
                 request_serializer=lerobot_dot_transport_dot_services__pb2.PolicySetup.SerializeToString,
@@ -285,6 +290,14 @@ class AsyncInferenceServicer:
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def StreamActions(self, request_iterator, context):
+        """Robot <-> Policy over one long-lived stream: observations go up, and each action chunk
+        is pushed down as soon as it is computed
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def SendPolicyInstructions(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -310,6 +323,11 @@ def add_AsyncInferenceServicer_to_server(servicer, server):
                     request_deserializer=lerobot_dot_transport_dot_services__pb2.Empty.FromString,
                     response_serializer=lerobot_dot_transport_dot_services__pb2.Actions.SerializeToString,
             ),
+            'StreamActions': grpc.stream_stream_rpc_method_handler(
+                    servicer.StreamActions,
+                    request_deserializer=lerobot_dot_transport_dot_services__pb2.Observation.FromString,
+                    response_serializer=lerobot_dot_transport_dot_services__pb2.Actions.SerializeToString,
+            ),
             'SendPolicyInstructions': grpc.unary_unary_rpc_method_handler(
                     servicer.SendPolicyInstructions,
                     request_deserializer=lerobot_dot_transport_dot_services__pb2.PolicySetup.FromString,
@@ -387,6 +405,33 @@ class AsyncInference:
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def StreamActions(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            '/transport.AsyncInference/StreamActions',
+            lerobot_dot_transport_dot_services__pb2.Observation.SerializeToString,
+            lerobot_dot_transport_dot_services__pb2.Actions.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def SendPolicyInstructions(request,
             target,
@@ -18,7 +18,10 @@
 import io
 import json
 import logging
+import math
 import pickle  # nosec B403: Safe usage for internal serialization only
+import struct
+import warnings
 from multiprocessing.synchronize import Event as MpEvent
 from queue import Queue
 from typing import Any
@@ -34,6 +37,13 @@ TransferState = services_pb2.TransferState  # type: ignore[attr-defined]
 CHUNK_SIZE = 2 * 1024 * 1024  # 2 MB
 MAX_MESSAGE_SIZE = 4 * 1024 * 1024  # 4 MB
 
+# Flat tensor wire format: magic, little-endian header length, JSON header, then the raw tensor buffers.
+# Payloads without the magic prefix are legacy `torch.save` archives.
+TENSOR_WIRE_MAGIC = b"LRTW\x01"
+_HEADER_LENGTH = struct.Struct("<Q")
+# Tensor buffers start on this byte boundary (relative to the start of the payload)
+_TENSOR_ALIGNMENT = 64
+
 
 def bytes_buffer_size(buffer: io.BytesIO) -> int:
     buffer.seek(0, io.SEEK_END)
@@ -42,9 +52,12 @@ def bytes_buffer_size(buffer: io.BytesIO) -> int:
     return result
 
 
-def send_bytes_in_chunks(buffer: bytes, message_class: Any, log_prefix: str = "", silent: bool = True):
-    bytes_buffer: io.BytesIO = io.BytesIO(buffer)
-    size_in_bytes = bytes_buffer_size(bytes_buffer)
+def send_bytes_in_chunks(
+    buffer: bytes | bytearray | memoryview, message_class: Any, log_prefix: str = "", silent: bool = True
+):
+    # Chunks are sliced from a view of the buffer, so the payload itself is never copied as a whole
+    view = memoryview(buffer).cast("B")
+    size_in_bytes = view.nbytes
 
     sent_bytes = 0
 
@@ -61,7 +74,7 @@ def send_bytes_in_chunks(buffer: bytes, message_class: Any, log_prefix: str = ""
             transfer_state = TransferState.TRANSFER_BEGIN
 
         size_to_read = min(CHUNK_SIZE, size_in_bytes - sent_bytes)
-        chunk = bytes_buffer.read(size_to_read)
+        chunk = view[sent_bytes : sent_bytes + size_to_read].tobytes()
 
         yield message_class(transfer_state=transfer_state, data=chunk)
         sent_bytes += size_to_read
@@ -70,11 +83,12 @@ def send_bytes_in_chunks(buffer: bytes, message_class: Any, log_prefix: str = ""
     logging_method(f"{log_prefix} Published {sent_bytes / 1024 / 1024} MB")
 
 
-def receive_bytes_in_chunks(iterator, queue: Queue | None, shutdown_event: MpEvent, log_prefix: str = ""):
-    bytes_buffer = io.BytesIO()
+def iter_bytes_in_chunks(iterator, shutdown_event: MpEvent, log_prefix: str = ""):
+    """Yield every message reassembled from a stream of chunks, until the stream ends or shutdown is set."""
+    # Chunks are joined once at the end of the transfer instead of being appended to a growing buffer
+    chunks: list[bytes] = []
     step = 0
 
-    logging.info(f"{log_prefix} Starting receiver")
     for item in iterator:
         logging.debug(f"{log_prefix} Received item")
         if shutdown_event.is_set():
@@ -82,44 +96,158 @@ def receive_bytes_in_chunks(iterator, queue: Queue | None, shutdown_event: MpEve
             return
 
         if item.transfer_state == TransferState.TRANSFER_BEGIN:
-            bytes_buffer.seek(0)
-            bytes_buffer.truncate(0)
-            bytes_buffer.write(item.data)
+            chunks = [item.data]
             logging.debug(f"{log_prefix} Received data at step 0")
             step = 0
         elif item.transfer_state == TransferState.TRANSFER_MIDDLE:
-            bytes_buffer.write(item.data)
+            chunks.append(item.data)
             step += 1
             logging.debug(f"{log_prefix} Received data at step {step}")
         elif item.transfer_state == TransferState.TRANSFER_END:
-            bytes_buffer.write(item.data)
-            logging.debug(f"{log_prefix} Received data at step end size {bytes_buffer_size(bytes_buffer)}")
-
-            if queue is not None:
-                queue.put(bytes_buffer.getvalue())
-            else:
-                return bytes_buffer.getvalue()
-
-            bytes_buffer.seek(0)
-            bytes_buffer.truncate(0)
+            chunks.append(item.data)
+            data = b"".join(chunks)
+            logging.debug(f"{log_prefix} Received data at step end size {len(data)}")
+            chunks = []
             step = 0
-
-            logging.debug(f"{log_prefix} Queue updated")
+            yield data
         else:
             logging.warning(f"{log_prefix} Received unknown transfer state {item.transfer_state}")
             raise ValueError(f"Received unknown transfer state {item.transfer_state}")
 
 
-def state_to_bytes(state_dict: dict[str, torch.Tensor]) -> bytes:
-    """Convert model state dict to flat array for transmission"""
-    bytes_buffer = io.BytesIO()
+def receive_bytes_in_chunks(iterator, queue: Queue | None, shutdown_event: MpEvent, log_prefix: str = ""):
+    logging.info(f"{log_prefix} Starting receiver")
+    for data in iter_bytes_in_chunks(iterator, shutdown_event, log_prefix):
+        if queue is None:
+            return data
+
+        queue.put(data)
+        logging.debug(f"{log_prefix} Queue updated")
+
+
+def _align(offset: int) -> int:
+    return -(-offset // _TENSOR_ALIGNMENT) * _TENSOR_ALIGNMENT
+
+
+def _encode_node(obj: Any, tensors: list[torch.Tensor]) -> Any:
+    """Describe `obj` as a JSON node, appending its tensors to `tensors` in wire order."""
+    if isinstance(obj, torch.Tensor):
+        tensors.append(obj)
+        return {"tensor": len(tensors) - 1}
+    if isinstance(obj, dict):
+        for key in obj:
+            if not isinstance(key, str):
+                raise TypeError(f"Only string keys can be serialized, got {type(key).__name__}")
+        return {"dict": {key: _encode_node(value, tensors) for key, value in obj.items()}}
+    if isinstance(obj, list | tuple):
+        kind = "list" if isinstance(obj, list) else "tuple"
+        return {kind: [_encode_node(value, tensors) for value in obj]}
+    if obj is None or isinstance(obj, bool | int | float | str):
+        return {"value": obj}
+    raise TypeError(f"Cannot serialize object of type {type(obj).__name__}")
+
+
+def _decode_node(node: dict, tensors: list[torch.Tensor]) -> Any:
+    if "tensor" in node:
+        return tensors[node["tensor"]]
+    if "dict" in node:
+        return {key: _decode_node(value, tensors) for key, value in node["dict"].items()}
+    if "list" in node:
+        return [_decode_node(value, tensors) for value in node["list"]]
+    if "tuple" in node:
+        return tuple(_decode_node(value, tensors) for value in node["tuple"])
+    return node["value"]
+
+
+def tensors_to_bytes(obj: Any) -> bytes:
+    """Serialize nested dicts/lists of tensors and scalars into the flat tensor wire format.
+
+    The payload is a JSON header describing the structure and the name, dtype, shape and offset of every
+    tensor, followed by the raw contiguous tensor buffers. Each tensor is copied exactly once, straight into
+    the output, and no pickling is involved.
+    """
+    tensors: list[torch.Tensor] = []
+    tree = _encode_node(obj, tensors)
+
+    buffers = []
+    specs = []
+    offset = 0
+    for tensor in tensors:
+        tensor = tensor.detach().cpu().contiguous()
+        # A flat byte view supports every dtype, including the ones NumPy doesn't know (e.g. bfloat16)
+        buffer = tensor.reshape(-1).view(torch.uint8).numpy()
+        offset = _align(offset)
+        specs.append(
+            {
+                "dtype": str(tensor.dtype).removeprefix("torch."),
+                "shape": list(tensor.shape),
+                "offset": offset,
+            }
+        )
+        buffers.append((offset, buffer))
+        offset += buffer.nbytes
+
+    header = json.dumps({"tree": tree, "tensors": specs}).encode("utf-8")
+    header_end = len(TENSOR_WIRE_MAGIC) + _HEADER_LENGTH.size + len(header)
+    parts: list[bytes | memoryview] = [TENSOR_WIRE_MAGIC, _HEADER_LENGTH.pack(len(header)), header]
+    position = header_end
+    data_start = _align(header_end)
+    for buffer_offset, buffer in buffers:
+        parts.append(bytes(data_start + buffer_offset - position))
+        parts.append(memoryview(buffer))
+        position = data_start + buffer_offset + buffer.nbytes
+    return b"".join(parts)
+
+
+def bytes_to_tensors(buffer: bytes | bytearray | memoryview) -> Any:
+    """Inverse of `tensors_to_bytes`.
+
+    Tensors are created with `torch.frombuffer` and share memory with `buffer`. When `buffer` is immutable
+    (e.g. `bytes`) the tensors must be treated as read-only: copy them (e.g. `load_state_dict`, `.to(device)`)
+    before modifying them in place.
+    """
+    view = memoryview(buffer).cast("B")
+    header_start = len(TENSOR_WIRE_MAGIC) + _HEADER_LENGTH.size
+    if view[: len(TENSOR_WIRE_MAGIC)] != TENSOR_WIRE_MAGIC or len(view) < header_start:
+        raise ValueError("Buffer is not in the tensor wire format")
+    (header_length,) = _HEADER_LENGTH.unpack_from(view, len(TENSOR_WIRE_MAGIC))
+    header = json.loads(bytes(view[header_start : header_start + header_length]))
+    data_start = _align(header_start + header_length)
+
+    tensors = []
+    with warnings.catch_warnings():
+        # `torch.frombuffer` warns on read-only buffers, see the docstring
+        warnings.filterwarnings("ignore", message="The given buffer is not writable")
+        for spec in header["tensors"]:
+            dtype = getattr(torch, spec["dtype"], None)
+            if not isinstance(dtype, torch.dtype):
+                raise ValueError(f"Unknown tensor dtype '{spec['dtype']}'")
+            shape = spec["shape"]
+            numel = math.prod(shape)
+            if numel == 0:
+                tensors.append(torch.empty(shape, dtype=dtype))
+                continue
+            offset = data_start + spec["offset"]
+            if offset + numel * dtype.itemsize > len(view):
+                raise ValueError("Buffer is truncated")
+            tensor = torch.frombuffer(view, dtype=dtype, count=numel, offset=offset)
+            tensors.append(tensor.reshape(shape))
+    return _decode_node(header["tree"], tensors)
+
+
+def _is_tensor_wire_format(buffer: bytes | bytearray | memoryview) -> bool:
+    return bytes(memoryview(buffer)[: len(TENSOR_WIRE_MAGIC)]) == TENSOR_WIRE_MAGIC
 
-    torch.save(state_dict, bytes_buffer)
 
-    return bytes_buffer.getvalue()
+def state_to_bytes(state_dict: dict[str, torch.Tensor]) -> bytes:
+    """Convert model state dict to flat array for transmission"""
+    return tensors_to_bytes(state_dict)
 
 
 def bytes_to_state_dict(buffer: bytes) -> dict[str, torch.Tensor]:
+    if _is_tensor_wire_format(buffer):
+        return bytes_to_tensors(buffer)
+    # Legacy `torch.save` payload from an older peer
     bytes_buffer = io.BytesIO(buffer)
     bytes_buffer.seek(0)
     return torch.load(bytes_buffer, weights_only=True)
@@ -138,6 +266,9 @@ def bytes_to_python_object(buffer: bytes) -> Any:
 
 
 def bytes_to_transitions(buffer: bytes) -> list[Transition]:
+    if _is_tensor_wire_format(buffer):
+        return bytes_to_tensors(buffer)
+    # Legacy `torch.save` payload from an older peer
     bytes_buffer = io.BytesIO(buffer)
     bytes_buffer.seek(0)
     transitions = torch.load(bytes_buffer, weights_only=True)
@@ -145,9 +276,7 @@ def bytes_to_transitions(buffer: bytes) -> list[Transition]:
 
 
 def transitions_to_bytes(transitions: list[Transition]) -> bytes:
-    bytes_buffer = io.BytesIO()
-    torch.save(transitions, bytes_buffer)
-    return bytes_buffer.getvalue()
+    return tensors_to_bytes(transitions)
 
 
 def grpc_channel_options(
@@ -13,8 +13,14 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
 
+import torch
 from torch.optim import Optimizer
 from torch.optim.lr_scheduler import LRScheduler
 
@@ -23,7 +29,7 @@ from lerobot.datasets.io_utils import load_json, write_json
 from lerobot.optim.optimizers import load_optimizer_state, save_optimizer_state
 from lerobot.optim.schedulers import load_scheduler_state, save_scheduler_state
 from lerobot.policies.pretrained import PreTrainedPolicy
-from lerobot.processor import PolicyProcessorPipeline
+from lerobot.processor import DataProcessorPipeline, DeviceProcessorStep, PolicyProcessorPipeline
 from lerobot.utils.constants import (
     CHECKPOINTS_DIR,
     LAST_CHECKPOINT_LINK,
@@ -167,3 +173,128 @@ def load_training_state(
         scheduler = load_scheduler_state(scheduler, training_state_dir)
 
     return step, optimizer, scheduler
+
+
+def split_preprocessor(
+    preprocessor: DataProcessorPipeline,
+) -> tuple[DataProcessorPipeline, DataProcessorPipeline]:
+    """Splits a policy preprocessor before its first `DeviceProcessorStep`.
+
+    The first pipeline only holds CPU steps (renaming, batching, tokenization, ...) and can run in the dataloader
+    workers with `PreprocessingCollate`. The second one moves the batch to the device and runs the remaining
+    steps. Chaining both is equivalent to running `preprocessor`.
+    """
+    for idx, step in enumerate(preprocessor.steps):
+        if isinstance(step, DeviceProcessorStep):
+            return preprocessor[:idx], preprocessor[idx:]
+    # Without a device step, there is no telling which steps are safe to run in the workers
+    return preprocessor[:0], preprocessor
+
+
+class PreprocessingCollate:
+    """Dataloader `collate_fn` collating the samples, then running a (CPU-only) preprocessor on the batch."""
+
+    def __init__(self, preprocessor: DataProcessorPipeline):
+        self.preprocessor = preprocessor
+
+    def __call__(self, samples: list[dict[str, Any]]) -> dict[str, Any]:
+        return self.preprocessor(torch.utils.data.default_collate(samples))
+
+
+def _record_stream(obj: Any, stream: torch.cuda.Stream) -> None:
+    """Marks the CUDA tensors of a (nested) batch as used by `stream`, see `torch.Tensor.record_stream`."""
+    if isinstance(obj, torch.Tensor):
+        if obj.is_cuda:
+            obj.record_stream(stream)
+    elif isinstance(obj, dict):
+        for value in obj.values():
+            _record_stream(value, stream)
+    elif isinstance(obj, (list, tuple)):
+        for value in obj:
+            _record_stream(value, stream)
+
+
+class BatchPrefetcher:
+    """Iterates over preprocessed batches, running the preprocessor ahead of the training loop.
+
+    With `num_prefetch > 0`, the preprocessor runs on a background thread for the next `num_prefetch` batches
+    while the training loop works on the current one. Batches are still fetched on the calling thread, since
+    distributed dataloaders may synchronize processes while iterating. On CUDA, the preprocessing runs on a side
+    stream so that host-to-device copies and normalization kernels overlap with the training step. With
+    `num_prefetch=0`, batches are preprocessed synchronously on `next`.
+
+    After each `next`, `dataloading_s` holds the time spent fetching a batch from `batches`, `preprocess_s` the
+    time spent preprocessing the returned batch, and `wait_s` the total time the caller was blocked in `next`.
+    """
+
+    def __init__(
+        self,
+        batches: Iterator[dict[str, Any]],
+        preprocessor: Callable[[dict[str, Any]], dict[str, Any]],
+        device: torch.device,
+        num_prefetch: int = 1,
+    ):
+        self.batches = batches
+        self.preprocessor = preprocessor
+        self.num_prefetch = num_prefetch
+        self.stream = torch.cuda.Stream(device) if num_prefetch > 0 and device.type == "cuda" else None
+        self.dataloading_s = 0.0
+        self.preprocess_s = 0.0
+        self.wait_s = 0.0
+
+        self._executor = ThreadPoolExecutor(max_workers=1) if num_prefetch > 0 else None
+        self._pending: deque[Future] = deque()
+        self._exhausted = False
+
+    def _preprocess(self, batch: dict[str, Any]) -> tuple[dict[str, Any], torch.cuda.Event | None, float]:
+        start_time = time.perf_counter()
+        event = None
+        if self.stream is not None:
+            with torch.cuda.stream(self.stream):
+                batch = self.preprocessor(batch)
+                event = torch.cuda.Event()
+                event.record(self.stream)
+        else:
+            batch = self.preprocessor(batch)
+        return batch, event, time.perf_counter() - start_time
+
+    def __iter__(self) -> "BatchPrefetcher":
+        return self
+
+    def __next__(self) -> dict[str, Any]:
+        start_time = time.perf_counter()
+        if self._executor is None:
+            batch = next(self.batches)
+            self.dataloading_s = time.perf_counter() - start_time
+            batch, _, self.preprocess_s = self._preprocess(batch)
+            self.wait_s = self.dataloading_s + self.preprocess_s
+            return batch
+
+        # Keep the next `num_prefetch` batches in flight behind the returned one
+        while not self._exhausted and len(self._pending) <= self.num_prefetch:
+            try:
+                batch = next(self.batches)
+            except StopIteration:
+                self._exhausted = True
+                break
+            self._pending.append(self._executor.submit(self._preprocess, batch))
+        loaded_time = time.perf_counter()
+        self.dataloading_s = loaded_time - start_time
+        if not self._pending:
+            raise StopIteration
+
+        batch, event, self.preprocess_s = self._pending.popleft().result()
+        if event is not None:
+            current_stream = torch.cuda.current_stream(self.stream.device)
+            current_stream.wait_event(event)
+            # The tensors were allocated on the side stream: keep their memory from being reused while the
+            # training step still uses them
+            _record_stream(batch, current_stream)
+        self.wait_s = self.dataloading_s + time.perf_counter() - loaded_time
+        return batch
+
+    def close(self) -> None:
+        """Stops the background preprocessing, if any."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._pending.clear()
@@ -43,8 +43,12 @@ pytest.importorskip("grpc")
 # -----------------------------------------------------------------------------
 
 
-def test_async_inference_e2e(monkeypatch):
-    """Tests the full asynchronous inference pipeline."""
+@pytest.mark.parametrize("stream_actions, server_streams", [(True, True), (False, True), (True, False)])
+def test_async_inference_e2e(monkeypatch, stream_actions, server_streams):
+    """Tests the full asynchronous inference pipeline, with streamed or polled actions.
+
+    A streaming client falls back to polled actions with a server that doesn't implement `StreamActions`.
+    """
     # Import grpc-dependent modules inside the test function
     import grpc
 
@@ -120,6 +124,13 @@ def test_async_inference_e2e(monkeypatch):
 
     monkeypatch.setattr(PolicyServer, "SendPolicyInstructions", _fake_send_policy_instructions, raising=True)
 
+    if not server_streams:
+        # Same answer as the servers of previous versions, without the `StreamActions` method
+        def _unimplemented_stream_actions(self, request_iterator, context):  # noqa: N802
+            context.abort(grpc.StatusCode.UNIMPLEMENTED, "Method not implemented!")
+
+        monkeypatch.setattr(PolicyServer, "StreamActions", _unimplemented_stream_actions, raising=True)
+
     # Build gRPC server running a PolicyServer
     server = grpc.server(futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="policy_server"))
     services_pb2_grpc.add_AsyncInferenceServicer_to_server(policy_server, server)
@@ -139,6 +150,7 @@ def test_async_inference_e2e(monkeypatch):
         policy_type="test",
         pretrained_name_or_path="test",
         actions_per_chunk=20,
+        stream_actions=stream_actions,
     )
 
     client = RobotClient(client_config)
@@ -151,11 +163,8 @@ def test_async_inference_e2e(monkeypatch):
     def counting_aggregate(*args, **kwargs):
         action_chunks_received["count"] += 1
         # Check that all received actions are on CPU
-        if args:
-            for timed_action in args[0]:  # args[0] is the list of TimedAction
-                action_tensor = timed_action.get_action()
-                if action_tensor.device.type != "cpu":
-                    action_chunks_received["actions_on_cpu"] = False
+        if args and args[0].actions.device.type != "cpu":  # args[0] is the TimedActionChunk
+            action_chunks_received["actions_on_cpu"] = False
         return original_aggregate(*args, **kwargs)
 
     monkeypatch.setattr(client, "_aggregate_action_queues", counting_aggregate)
@@ -174,6 +183,7 @@ def test_async_inference_e2e(monkeypatch):
 
     assert action_chunks_received["count"] > 0, "Client did not receive any action chunks"
     assert len(policy_server._predicted_timesteps) > 0, "Server did not record any predicted timesteps"
+    assert client.stream_actions == (stream_actions and server_streams)
 
     # ------------------------------------------------------------------
     # 4. Stop the system
@@ -20,8 +20,10 @@ import numpy as np
 import torch
 
 from lerobot.async_inference.helpers import (
+    ActionChunkBuffer,
     FPSTracker,
     TimedAction,
+    TimedActionChunk,
     TimedObservation,
     observations_similar,
     prepare_image,
@@ -113,6 +115,94 @@ def test_timed_action_getters():
     assert ta.get_timestep() == 0
 
 
+def test_timed_action_chunk():
+    """TimedActionChunk expands into consecutive TimedActions and pickles as a single tensor."""
+    actions = torch.randn(50, 6)
+    chunk = TimedActionChunk(timestamp=100.0, timestep=7, environment_dt=0.1, actions=actions)
+
+    timed_actions = chunk.to_timed_actions()
+    assert len(chunk) == len(timed_actions) == 50
+    assert [ta.get_timestep() for ta in timed_actions] == list(range(7, 57))
+    assert math.isclose(timed_actions[3].get_timestamp(), 100.3)
+    assert torch.equal(timed_actions[3].get_action(), actions[3])
+
+    restored = pickle.loads(pickle.dumps(chunk))  # nosec B301
+    assert torch.equal(restored.actions, actions)
+    assert len(pickle.dumps(chunk)) < len(pickle.dumps(timed_actions))
+
+
+def test_timed_action_chunk_from_timed_actions():
+    chunk = TimedActionChunk(timestamp=100.0, timestep=7, environment_dt=0.1, actions=torch.randn(5, 6))
+    restored = TimedActionChunk.from_timed_actions(chunk.to_timed_actions(), environment_dt=0.1)
+
+    assert restored.timestep == 7
+    assert restored.timestamp == 100.0
+    assert torch.equal(restored.actions, chunk.actions)
+
+
+# ---------------------------------------------------------------------
+# ActionChunkBuffer
+# ---------------------------------------------------------------------
+
+
+def _chunk(timestep: int, count: int, value: float) -> TimedActionChunk:
+    return TimedActionChunk(
+        timestamp=float(timestep),
+        timestep=timestep,
+        environment_dt=1.0,
+        actions=torch.full((count, 2), value),
+    )
+
+
+def test_action_chunk_buffer_pops_in_order():
+    buffer = ActionChunkBuffer()
+    assert buffer.empty()
+    assert buffer.pop() is None
+
+    buffer.merge(_chunk(3, 4, 1.0), latest_timestep=-1)
+    assert len(buffer) == 4
+    assert buffer.timesteps() == [3, 4, 5, 6]
+
+    popped = [buffer.pop() for _ in range(4)]
+    assert [action.get_timestep() for action in popped] == [3, 4, 5, 6]
+    assert [action.get_timestamp() for action in popped] == [3.0, 4.0, 5.0, 6.0]
+    assert buffer.empty()
+    assert buffer.pop() is None
+
+
+def test_action_chunk_buffer_merge_blends_pending_timesteps():
+    buffer = ActionChunkBuffer()
+    buffer.merge(_chunk(0, 4, 10.0), latest_timestep=-1)
+    assert buffer.pop().get_timestep() == 0
+
+    # Timesteps 1..3 are pending, 0 was already popped and 4..5 are new
+    buffer.merge(_chunk(0, 6, 20.0), latest_timestep=0, aggregate_fn=lambda old, new: 0.5 * old + 0.5 * new)
+
+    assert buffer.timesteps() == [1, 2, 3, 4, 5]
+    values = [buffer.pop().get_action()[0].item() for _ in range(5)]
+    assert values == [15.0, 15.0, 15.0, 20.0, 20.0]
+
+
+def test_action_chunk_buffer_merge_drops_stale_actions():
+    buffer = ActionChunkBuffer()
+    buffer.merge(_chunk(0, 5, 1.0), latest_timestep=2)
+
+    assert buffer.timesteps() == [3, 4]
+    assert buffer.pop().get_timestamp() == 3.0
+
+
+def test_action_chunk_buffer_merge_keeps_published_chunk():
+    """Actions popped before a merge are not modified by it."""
+    buffer = ActionChunkBuffer()
+    buffer.merge(_chunk(0, 4, 1.0), latest_timestep=-1)
+    popped = buffer.pop()
+
+    buffer.merge(_chunk(0, 4, 3.0), latest_timestep=-1, aggregate_fn=lambda old, new: old + new)
+
+    assert torch.equal(popped.get_action(), torch.full((2,), 1.0))
+    assert buffer.pop().get_action()[0].item() == 4.0
+
+
 def test_timed_observation_getters():
     """TimedObservation stores & returns timestamp, dict and timestep."""
     ts = time.time()
@@ -0,0 +1,123 @@
+# Copyright 2026 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the typed observation encoding of the async inference stack."""
+
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+import torch
+
+# The observations are framed with the transport utilities, which need grpc
+pytest.importorskip("grpc")
+
+from lerobot.async_inference.constants import SUPPORTED_OBSERVATION_CODECS
+from lerobot.async_inference.helpers import TimedObservation
+from lerobot.async_inference.observation_codec import IMAGE_CODECS, decode_observation, encode_observation
+
+
+def _smooth_image(height: int = 48, width: int = 64) -> np.ndarray:
+    """Gradient image, compressible by the lossy codecs without large errors."""
+    y, x = np.mgrid[0:height, 0:width]
+    return np.stack([x * 255 // width, y * 255 // height, (x + y) * 255 // (width + height)], axis=-1).astype(
+        np.uint8
+    )
+
+
+def _make_observation() -> TimedObservation:
+    return TimedObservation(
+        timestamp=123.5,
+        timestep=7,
+        observation={
+            "shoulder_pan.pos": 0.25,
+            "gripper.pos": np.float32(-1.5),
+            "front": _smooth_image(),
+            "depth": np.arange(12, dtype=np.uint16).reshape(3, 4),
+            "task": "pick the cube",
+        },
+        must_go=True,
+    )
+
+
+def test_supported_codecs_match_registry():
+    assert list(IMAGE_CODECS) == SUPPORTED_OBSERVATION_CODECS
+
+
+def test_raw_codec_roundtrip_is_lossless():
+    obs = _make_observation()
+    decoded = decode_observation(encode_observation(obs, "raw"))
+
+    assert decoded.get_timestamp() == obs.get_timestamp()
+    assert decoded.get_timestep() == obs.get_timestep()
+    assert decoded.must_go is True
+    assert list(decoded.get_observation()) == list(obs.get_observation())
+
+    observation = decoded.get_observation()
+    assert observation["shoulder_pan.pos"] == 0.25
+    assert observation["gripper.pos"] == -1.5
+    assert observation["task"] == "pick the cube"
+    np.testing.assert_array_equal(observation["front"], obs.get_observation()["front"])
+    np.testing.assert_array_equal(observation["depth"], obs.get_observation()["depth"])
+    assert observation["depth"].dtype == np.uint16
+    # Decoded arrays can be modified in place
+    observation["front"][0, 0, 0] = 1
+
+
+@pytest.mark.parametrize("codec", ["jpeg", "webp"])
+def test_lossy_codecs_compress_camera_frames(codec):
+    obs = _make_observation()
+    raw_size = len(encode_observation(obs, "raw"))
+    data = encode_observation(obs, codec, quality=90)
+    decoded = decode_observation(data).get_observation()
+
+    assert len(data) < raw_size
+    image = obs.get_observation()["front"]
+    assert decoded["front"].shape == image.shape
+    assert decoded["front"].dtype == np.uint8
+    # Close to the original, with the RGB channel order preserved
+    assert np.abs(decoded["front"].astype(int) - image.astype(int)).mean() < 4
+    assert decoded["shoulder_pan.pos"] == 0.25
+
+
+def test_decode_with_executor():
+    obs = _make_observation()
+    obs.observation["wrist"] = _smooth_image()[::-1].copy()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        decoded = decode_observation(encode_observation(obs, "jpeg"), executor).get_observation()
+
+    expected = decode_observation(encode_observation(obs, "jpeg")).get_observation()
+    for key in ["front", "wrist"]:
+        np.testing.assert_array_equal(decoded[key], expected[key])
+
+
+def test_decode_pickled_observation():
+    obs = _make_observation()
+    decoded = decode_observation(pickle.dumps(obs))
+
+    assert decoded.get_timestep() == obs.get_timestep()
+    np.testing.assert_array_equal(decoded.get_observation()["front"], obs.get_observation()["front"])
+
+
+def test_tensor_values_are_kept():
+    obs = TimedObservation(timestamp=0.0, timestep=0, observation={"state": torch.arange(3.0)})
+    decoded = decode_observation(encode_observation(obs)).get_observation()
+
+    assert isinstance(decoded["state"], torch.Tensor)
+    assert torch.equal(decoded["state"], torch.arange(3.0))
+
+
+def test_unknown_codec():
+    with pytest.raises(ValueError, match="Unknown observation codec"):
+        encode_observation(_make_observation(), "png")
@@ -217,3 +217,233 @@ def test_predict_action_chunk(monkeypatch, policy_server):
     for i, ta in enumerate(timed_actions):
         expected_ts = obs.get_timestamp() + i * policy_server.config.environment_dt
         assert abs(ta.get_timestamp() - expected_ts) < 1e-6
+
+
+def test_time_action_chunk_compact(policy_server):
+    """The compact chunk expands to the same timed actions as the list form."""
+    actions = torch.randn(5, 6)
+
+    compact = policy_server._time_action_chunk(3.0, actions, 7, compact=True)
+    expected = policy_server._time_action_chunk(3.0, list(actions), 7)
+
+    assert len(compact) == 5
+    for ta, expected_ta in zip(compact.to_timed_actions(), expected, strict=True):
+        assert ta.get_timestep() == expected_ta.get_timestep()
+        assert abs(ta.get_timestamp() - expected_ta.get_timestamp()) < 1e-9
+        assert torch.equal(ta.get_action(), expected_ta.get_action())
+
+
+def test_postprocess_action_chunk(policy_server):
+    """Chunk-aware postprocessors are called once on (B, T, D), others once per action."""
+    calls = []
+
+    class _Postprocessor:
+        def __init__(self, supports_action_chunks):
+            self.supports_action_chunks = supports_action_chunks
+
+        def __call__(self, action):
+            calls.append(action.shape)
+            return action * 2
+
+    action_tensor = torch.randn(2, 20, 6)
+    for supports_action_chunks, expected_calls in [(True, [(2, 20, 6)]), (False, [(2, 6)] * 20)]:
+        calls.clear()
+        policy_server.postprocessor = _Postprocessor(supports_action_chunks)
+        processed = policy_server._postprocess_action_chunk(action_tensor)
+        assert torch.equal(processed, action_tensor * 2)
+        assert calls == expected_calls
+
+
+def test_predict_action_chunks_batches_observations(policy_server):
+    """A batch of observations runs through the policy once and each chunk matches its observation."""
+    policy_server.preprocessor = lambda obs: obs
+    policy_server.postprocessor = lambda tensor: tensor
+    calls = []
+
+    def _predict_action_chunk(observation):
+        calls.append(observation[OBS_STATE].shape[0])
+        # Each action repeats the state it was predicted from
+        return observation[OBS_STATE].unsqueeze(1).expand(-1, 20, -1)
+
+    policy_server.policy.predict_action_chunk = _predict_action_chunk
+
+    observations = [_make_obs(torch.full((6,), float(i)), timestep=10 * i) for i in range(3)]
+    action_chunks = policy_server._predict_action_chunks(observations)
+
+    assert calls == [3]
+    for i, action_chunk in enumerate(action_chunks):
+        timed_actions = action_chunk.to_timed_actions()
+        assert [ta.get_timestep() for ta in timed_actions] == list(range(10 * i, 10 * i + 20))
+        assert all(torch.equal(ta.get_action(), torch.full((6,), float(i))) for ta in timed_actions)
+
+
+class _MockContext:
+    def __init__(self, peer: str):
+        self._peer = peer
+        self.active = True
+
+    def peer(self) -> str:
+        return self._peer
+
+    def is_active(self) -> bool:
+        return self.active
+
+
+@require_package("grpcio", "grpc")
+def test_stream_actions_pushes_chunks(monkeypatch, policy_server):
+    """`StreamActions` pushes one action chunk per observation received on the same stream."""
+    import pickle
+    from queue import Queue
+
+    from lerobot.async_inference.policy_server import PolicyServer
+    from lerobot.transport import services_pb2  # type: ignore
+    from lerobot.transport.utils import send_bytes_in_chunks
+
+    policy_server.policy_type = "act"
+    policy_server.preprocessor = lambda obs: obs
+    policy_server.postprocessor = lambda tensor: tensor
+
+    def _fake_get_action_chunk(_self, _obs, _type="act"):
+        return torch.zeros(1, policy_server.actions_per_chunk, 6)
+
+    monkeypatch.setattr(PolicyServer, "_get_action_chunk", _fake_get_action_chunk, raising=True)
+
+    context = _MockContext("client")
+    policy_server.Ready(None, context)
+
+    observations = Queue()
+
+    def _request_iterator():
+        while (obs := observations.get()) is not None:
+            yield from send_bytes_in_chunks(pickle.dumps(obs), services_pb2.Observation, silent=True)
+
+    stream = policy_server.StreamActions(_request_iterator(), context)
+
+    for timestep in range(2):
+        observations.put(_make_obs(torch.full((6,), float(timestep)), timestep=timestep, must_go=True))
+        timed_actions = pickle.loads(next(stream).data)  # nosec
+        assert [ta.get_timestep() for ta in timed_actions] == list(
+            range(timestep, timestep + policy_server.actions_per_chunk)
+        )
+
+    # The stream ends once the client closes its side
+    observations.put(None)
+    assert list(stream) == []
+
+
+@require_package("grpcio", "grpc")
+def test_batching_policy_server_routes_chunks_to_clients():
+    """Concurrent `GetActions` calls of several clients are served by a single batched forward pass."""
+    import pickle
+    import threading
+
+    from lerobot.async_inference.configs import PolicyServerConfig
+    from lerobot.async_inference.policy_server import BatchingPolicyServer
+
+    server = BatchingPolicyServer(
+        PolicyServerConfig(max_batch_size=4, batch_timeout=1.0, inference_latency=0.0)
+    )
+    try:
+        server.policy = MockPolicy()
+        server.actions_per_chunk = 20
+        server.lerobot_features = {
+            OBS_STATE: {"dtype": "float32", "shape": [6], "names": [f"joint{i}" for i in range(1, 7)]}
+        }
+        server.preprocessor = lambda obs: obs
+        server.postprocessor = lambda tensor: tensor
+        batch_sizes = []
+
+        def _predict_action_chunk(observation):
+            batch_sizes.append(observation[OBS_STATE].shape[0])
+            return observation[OBS_STATE].unsqueeze(1).expand(-1, 20, -1)
+
+        server.policy.predict_action_chunk = _predict_action_chunk
+
+        clients = [_MockContext(f"client-{i}") for i in range(3)]
+        for i, context in enumerate(clients):
+            server.Ready(None, context)
+            assert server._handle_observation(context.peer(), _make_obs(torch.full((6,), float(i)), i, True))
+
+        responses = [None] * len(clients)
+
+        def _get_actions(i):
+            responses[i] = server.GetActions(None, clients[i])
+
+        threads = [threading.Thread(target=_get_actions, args=(i,)) for i in range(len(clients))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+
+        assert sum(batch_sizes) == len(clients)
+        for i, response in enumerate(responses):
+            action_chunk = pickle.loads(response.data)  # nosec
+            assert action_chunk[0].get_timestep() == i
+            assert torch.equal(action_chunk[0].get_action(), torch.full((6,), float(i)))
+    finally:
+        server.stop()
+
+
+@require_package("grpcio", "grpc")
+def test_batching_policy_server_collect_batch():
+    """Batches close when every waiting client is included, when full, or when the budget is spent."""
+    from lerobot.async_inference.configs import PolicyServerConfig
+    from lerobot.async_inference.policy_server import BatchingPolicyServer, _BatchRequest
+
+    server = BatchingPolicyServer(PolicyServerConfig(max_batch_size=3, batch_timeout=0.2))
+    server.stop()
+    server._batching_thread.join()
+
+    def _submit(n):
+        for i in range(n):
+            server._requests.put(_BatchRequest(f"client-{i}", _make_obs(torch.zeros(6), i), {}))
+
+    # All waiting clients are part of the batch: no need to wait for the budget
+    server._waiting_clients = 2
+    _submit(2)
+    start = time.perf_counter()
+    assert len(server._collect_batch()) == 2
+    assert time.perf_counter() - start < 0.2
+
+    # Batch is full
+    server._waiting_clients = 5
+    _submit(5)
+    assert len(server._collect_batch()) == 3
+    # Budget is spent while a client is still waiting for its observation
+    start = time.perf_counter()
+    assert len(server._collect_batch()) == 2
+    assert time.perf_counter() - start >= 0.2
+
+    assert server._collect_batch() == []
+
+
+@require_package("grpcio", "grpc")
+def test_batching_policy_server_ignores_unknown_clients():
+    from lerobot.async_inference.configs import PolicyServerConfig
+    from lerobot.async_inference.policy_server import BatchingPolicyServer
+
+    server = BatchingPolicyServer(PolicyServerConfig(max_batch_size=2))
+    try:
+        assert server._handle_observation("unknown", _make_obs(torch.zeros(6), must_go=True)) is False
+        assert server.GetActions(None, _MockContext("unknown")).ByteSize() == 0
+    finally:
+        server.stop()
+
+
+@require_package("grpcio", "grpc")
+def test_batching_policy_server_evicts_idle_clients():
+    """The sessions of clients that stopped calling the server are dropped when another client connects."""
+    from lerobot.async_inference.configs import PolicyServerConfig
+    from lerobot.async_inference.policy_server import BatchingPolicyServer
+
+    server = BatchingPolicyServer(PolicyServerConfig(max_batch_size=2, client_idle_timeout=10))
+    try:
+        server.Ready(None, _MockContext("idle"))
+        server.Ready(None, _MockContext("active"))
+        server._clients["idle"].last_seen -= 11
+        assert server._handle_observation("active", _make_obs(torch.zeros(6), must_go=True))
+
+        server.Ready(None, _MockContext("new"))
+        assert set(server._clients) == {"active", "new"}
+    finally:
+        server.stop()
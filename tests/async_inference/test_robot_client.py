@@ -20,7 +20,6 @@ no real hardware is accessed. Only the queue-update mechanism is verified.
 from __future__ import annotations
 
 import time
-from queue import Queue
 
 import pytest
 import torch
@@ -101,11 +100,19 @@ def test_update_action_queue_discards_stale(robot_client):
     robot_client._aggregate_action_queues(incoming)
 
     # Extract timesteps from queue
-    resulting_timesteps = [a.get_timestep() for a in robot_client.action_queue.queue]
+    resulting_timesteps = robot_client.action_queue.timesteps()
 
     assert resulting_timesteps == [5, 6, 7]
 
 
+def test_control_loop_action_on_empty_queue(robot_client):
+    """`control_loop_action` returns `None` without performing anything when the queue is empty."""
+    robot_client.latest_action = 4
+
+    assert robot_client.control_loop_action() is None
+    assert robot_client.latest_action == 4
+
+
 @pytest.mark.parametrize(
     "weight_old, weight_new",
     [
@@ -137,8 +144,7 @@ def test_aggregate_action_queues_combines_actions_in_overlap(
         for a in current_actions
     ]
 
-    for a in current_actions:
-        robot_client.action_queue.put(a)
+    robot_client._aggregate_action_queues(current_actions)
 
     # Incoming chunk contains timesteps 3..7 -> expect 5,6,7 kept.
     incoming = _make_actions(start_ts=time.time(), start_t=3, count=5)  # 3,4,5,6,7
@@ -152,7 +158,11 @@ def test_aggregate_action_queues_combines_actions_in_overlap(
 
     queue_overlap_actions = []
     queue_non_overlap_actions = []
-    for a in robot_client.action_queue.queue:
+    queued_actions = []
+    while (a := robot_client.action_queue.pop()) is not None:
+        queued_actions.append(a)
+
+    for a in queued_actions:
         if a.get_timestep() in overlap_timesteps:
             queue_overlap_actions.append(a)
         elif a.get_timestep() in nonoverlap_timesteps:
@@ -183,15 +193,15 @@ def test_aggregate_action_queues_combines_actions_in_overlap(
 )
 def test_ready_to_send_observation(robot_client, chunk_size: int, queue_len: int, expected: bool):
     """Validate `_ready_to_send_observation` ratio logic for various sizes."""
+    from lerobot.async_inference.helpers import ActionChunkBuffer
 
     robot_client.action_chunk_size = chunk_size
 
     # Clear any existing actions then fill with `queue_len` dummy entries ----
-    robot_client.action_queue = Queue()
+    robot_client.action_queue = ActionChunkBuffer()
 
     dummy_actions = _make_actions(start_ts=time.time(), start_t=0, count=queue_len)
-    for act in dummy_actions:
-        robot_client.action_queue.put(act)
+    robot_client._aggregate_action_queues(dummy_actions)
 
     assert robot_client._ready_to_send_observation() is expected
 
@@ -216,6 +226,8 @@ def test_ready_to_send_observation(robot_client, chunk_size: int, queue_len: int
 )
 def test_ready_to_send_observation_with_varying_threshold(robot_client, g_threshold: float, expected: bool):
     """Validate `_ready_to_send_observation` with fixed sizes and varying `g`."""
+    from lerobot.async_inference.helpers import ActionChunkBuffer
+
     # Fixed sizes for this test: ratio = 6 / 10 = 0.6
     chunk_size = 10
     queue_len = 6
@@ -225,10 +237,9 @@ def test_ready_to_send_observation_with_varying_threshold(robot_client, g_thresh
     robot_client._chunk_size_threshold = g_threshold
 
     # Fill queue with dummy actions
-    robot_client.action_queue = Queue()
+    robot_client.action_queue = ActionChunkBuffer()
     dummy_actions = _make_actions(start_ts=time.time(), start_t=0, count=queue_len)
-    for act in dummy_actions:
-        robot_client.action_queue.put(act)
+    robot_client._aggregate_action_queues(dummy_actions)
 
     assert robot_client._ready_to_send_observation() is expected
 
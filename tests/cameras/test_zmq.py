@@ -0,0 +1,223 @@
+#!/usr/bin/env python
+
+# Copyright 2026 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Example of running a specific test:
+# ```bash
+# pytest tests/cameras/test_zmq.py::test_binary_loopback
+# ```
+
+import socket
+import threading
+import time
+from contextlib import contextmanager
+
+import numpy as np
+import pytest
+
+zmq = pytest.importorskip("zmq")
+
+from lerobot.cameras.zmq import ZMQCamera, ZMQCameraConfig  # noqa: E402
+from lerobot.cameras.zmq.configuration_zmq import ZMQProtocol  # noqa: E402
+from lerobot.cameras.zmq.image_server import FramePublisher, encode_frame  # noqa: E402
+from lerobot.cameras.zmq.protocol import (  # noqa: E402
+    FrameEncoding,
+    decode_payload,
+    pack_frame,
+    subscribe,
+    unpack_header,
+)
+
+HEIGHT, WIDTH = 48, 64
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _make_image(value: int) -> np.ndarray:
+    image = np.full((HEIGHT, WIDTH, 3), value, dtype=np.uint8)
+    image[:, : WIDTH // 2, 0] = 255 - value
+    return image
+
+
+@contextmanager
+def _publishing(
+    port: int, images: dict[str, np.ndarray], protocol=ZMQProtocol.BINARY, encoding=FrameEncoding.JPEG
+):
+    """Publish the images in a loop, until the context exits."""
+    context = zmq.Context()
+    pub = context.socket(zmq.PUB)
+    pub.setsockopt(zmq.LINGER, 0)
+    pub.bind(f"tcp://127.0.0.1:{port}")
+    publisher = FramePublisher(pub, protocol, encoding)
+    stop = threading.Event()
+
+    def loop():
+        while not stop.is_set():
+            frames = {
+                name: (image, encode_frame(image, protocol, encoding), time.time())
+                for name, image in images.items()
+            }
+            publisher.publish(frames)
+            time.sleep(0.01)
+
+    thread = threading.Thread(target=loop, daemon=True)
+    thread.start()
+    try:
+        yield publisher
+    finally:
+        stop.set()
+        thread.join()
+        pub.close()
+        context.term()
+
+
+def _make_camera(port: int, camera_name: str, protocol=ZMQProtocol.BINARY) -> ZMQCamera:
+    config = ZMQCameraConfig(
+        server_address="127.0.0.1",
+        port=port,
+        camera_name=camera_name,
+        width=WIDTH,
+        height=HEIGHT,
+        fps=30,
+        protocol=protocol,
+    )
+    return ZMQCamera(config)
+
+
+@pytest.mark.parametrize("encoding", [FrameEncoding.RAW, FrameEncoding.JPEG])
+def test_pack_frame_roundtrip(encoding):
+    image = _make_image(40)
+    parts = pack_frame("head", image, sequence=7, timestamp=12.5, encoding=encoding)
+
+    header = unpack_header(parts[0], bytes(parts[1]))
+    assert header.camera_name == "head"
+    assert header.encoding == encoding
+    assert (header.height, header.width, header.channels) == (HEIGHT, WIDTH, 3)
+    assert header.sequence == 7
+    assert header.timestamp == 12.5
+
+    frame = decode_payload(header, bytes(parts[2]))
+    if encoding == FrameEncoding.RAW:
+        np.testing.assert_array_equal(frame, image)
+    else:
+        assert frame.shape == image.shape
+        assert np.abs(frame.astype(int) - image).mean() < 5
+
+
+def test_unpack_header_rejects_invalid_messages():
+    parts = pack_frame("head", _make_image(0), sequence=0, timestamp=0.0, encoding=FrameEncoding.RAW)
+    with pytest.raises(RuntimeError, match="header"):
+        unpack_header(parts[0], bytes(parts[1])[:-1])
+    with pytest.raises(RuntimeError, match="magic"):
+        unpack_header(parts[0], b"XXXX" + bytes(parts[1])[4:])
+
+
+@pytest.mark.parametrize("encoding", [FrameEncoding.RAW, FrameEncoding.JPEG])
+def test_binary_loopback(encoding):
+    """The camera only receives the frames of its own topic, even when another camera name starts with it."""
+    port = _free_port()
+    images = {"head": _make_image(40), "head_wrist": _make_image(200)}
+    with _publishing(port, images, encoding=encoding):
+        camera = _make_camera(port, "head")
+        camera.connect(warmup=False)
+        try:
+            for _ in range(3):
+                frame = camera.read()
+                assert frame.shape == (HEIGHT, WIDTH, 3)
+                assert np.abs(frame.astype(int) - images["head"]).mean() < 5
+        finally:
+            camera.disconnect()
+    assert camera.received_frames >= 3
+
+
+def test_json_compatibility_loopback():
+    port = _free_port()
+    images = {"head": _make_image(40)}
+    with _publishing(port, images, protocol=ZMQProtocol.JSON):
+        camera = _make_camera(port, "head", protocol=ZMQProtocol.JSON)
+        camera.connect(warmup=False)
+        try:
+            frame = camera.read()
+        finally:
+            camera.disconnect()
+    assert frame.shape == (HEIGHT, WIDTH, 3)
+    assert np.abs(frame.astype(int) - images["head"]).mean() < 5
+
+
+@pytest.mark.parametrize(
+    "server_protocol, client_protocol, expected",
+    [
+        (ZMQProtocol.JSON, ZMQProtocol.BINARY, "protocol: json"),
+        (ZMQProtocol.BINARY, ZMQProtocol.JSON, "protocol: binary"),
+    ],
+)
+def test_protocol_mismatch_is_reported(server_protocol, client_protocol, expected):
+    port = _free_port()
+    with _publishing(port, {"head": _make_image(40)}, protocol=server_protocol):
+        camera = _make_camera(port, "head", protocol=client_protocol)
+        # Auto-detecting the resolution reads a frame during connect, before the read thread starts
+        camera.width = camera.height = None
+        with pytest.raises(RuntimeError, match=expected):
+            camera.connect(warmup=False)
+        assert not camera.is_connected
+
+
+def test_subscribe_to_several_cameras():
+    port = _free_port()
+    images = {"left": _make_image(10), "right": _make_image(20), "depth": _make_image(30)}
+    context = zmq.Context()
+    sub = context.socket(zmq.SUB)
+    sub.setsockopt(zmq.RCVTIMEO, 5000)
+    subscribe(sub, ["left", "right"])
+    sub.connect(f"tcp://127.0.0.1:{port}")
+    try:
+        with _publishing(port, images, encoding=FrameEncoding.RAW):
+            received = set()
+            for _ in range(20):
+                topic, header, payload = sub.recv_multipart()
+                frame_header = unpack_header(topic, header)
+                received.add(frame_header.camera_name)
+                np.testing.assert_array_equal(
+                    decode_payload(frame_header, payload), images[frame_header.camera_name]
+                )
+    finally:
+        sub.close(linger=0)
+        context.term()
+    assert received == {"left", "right"}
+
+
+class _Part:
+    def __init__(self, data):
+        self.bytes = bytes(data)
+        self.buffer = memoryview(self.bytes)
+
+
+def test_dropped_frames_are_counted():
+    camera = _make_camera(_free_port(), "head")
+    image = _make_image(0)
+    for sequence in [0, 1, 4, 5, 9]:
+        parts = pack_frame("head", image, sequence, time.time(), FrameEncoding.RAW)
+        camera._unpack_frame_header([_Part(part) for part in parts])
+    assert camera.received_frames == 5
+    assert camera.dropped_frames == 2 + 3
+
+    # A server restart starts the sequence over without counting drops
+    parts = pack_frame("head", image, 0, time.time(), FrameEncoding.RAW)
+    camera._unpack_frame_header([_Part(part) for part in parts])
+    assert camera.dropped_frames == 5
@@ -19,6 +19,7 @@ import numpy as np
 import pytest
 
 from lerobot.datasets.compute_stats import (
+    DEFAULT_QUANTILES,
     RunningQuantileStats,
     _assert_type_and_shape,
     aggregate_feature_stats,
@@ -832,3 +833,106 @@ def test_fixed_quantiles_always_computed():
         for q_key in expected_quantiles:
             assert q_key in episode_stats[key]
             assert episode_stats[key][q_key].shape == (features[key]["shape"][0],)
+
+
+def test_running_quantile_stats_histograms_match_np_histogram():
+    """Test that the vectorized binning matches `np.histogram` on each dimension."""
+    np.random.seed(42)
+    data1 = np.random.normal(0, 1, (500, 4))
+    data2 = np.random.normal(0, 1, (500, 4)) * 0.5
+
+    running_stats = RunningQuantileStats(num_quantile_bins=100)
+    running_stats.update(data1)
+    running_stats.update(data2)  # Within range, so the bins are unchanged
+
+    for i in range(4):
+        expected, _ = np.histogram(
+            np.concatenate([data1[:, i], data2[:, i]]), bins=running_stats._bin_edges[i]
+        )
+        np.testing.assert_array_equal(running_stats._histograms[i], expected)
+
+
+def test_running_quantile_stats_rebinning_preserves_counts():
+    """Test that rebinning after a range expansion keeps every sample."""
+    np.random.seed(42)
+    running_stats = RunningQuantileStats(num_quantile_bins=200)
+    running_stats.update(np.random.uniform(0, 1, (300, 3)))
+    running_stats.update(np.random.uniform(-5, 5, (300, 3)))
+
+    np.testing.assert_array_equal(running_stats._histograms.sum(axis=1), [600, 600, 600])
+
+
+def test_running_quantile_stats_merge():
+    """Test that merged partial statistics match statistics computed over all the data."""
+    np.random.seed(42)
+    chunks = [np.random.normal(i, 1 + i, (400, 3)) for i in range(4)]
+
+    full = RunningQuantileStats()
+    for chunk in chunks:
+        full.update(chunk)
+
+    merged = RunningQuantileStats()
+    for chunk in chunks:
+        partial = RunningQuantileStats()
+        partial.update(chunk)
+        merged.merge(partial)
+
+    full_stats, merged_stats = full.get_statistics(), merged.get_statistics()
+    data = np.concatenate(chunks)
+    np.testing.assert_equal(merged_stats["count"], np.array([1600]))
+    np.testing.assert_allclose(merged_stats["min"], data.min(axis=0))
+    np.testing.assert_allclose(merged_stats["max"], data.max(axis=0))
+    np.testing.assert_allclose(merged_stats["mean"], data.mean(axis=0), atol=1e-10)
+    np.testing.assert_allclose(merged_stats["std"], data.std(axis=0), atol=1e-6)
+    for q in DEFAULT_QUANTILES:
+        q_key = f"q{int(q * 100):02d}"
+        np.testing.assert_allclose(merged_stats[q_key], full_stats[q_key], atol=0.05)
+        np.testing.assert_allclose(merged_stats[q_key], np.quantile(data, q, axis=0), atol=0.1)
+
+
+def test_running_quantile_stats_merge_same_bins_is_exact():
+    """Test that histograms sharing the same bin edges are merged without rebinning."""
+    np.random.seed(42)
+    data = np.random.normal(0, 1, (1000, 2))
+    reference = RunningQuantileStats()
+    reference.update(data)
+
+    first, second = RunningQuantileStats(), RunningQuantileStats()
+    first.merge(reference)
+    second.merge(reference)
+    first.merge(second)
+
+    np.testing.assert_array_equal(first._histograms, 2 * reference._histograms)
+
+
+def test_running_quantile_stats_merge_mismatch_raises():
+    first, second = RunningQuantileStats(), RunningQuantileStats(num_quantile_bins=10)
+    first.update(np.random.normal(0, 1, (10, 2)))
+    second.update(np.random.normal(0, 1, (10, 2)))
+    with pytest.raises(ValueError, match="quantile bins"):
+        first.merge(second)
+
+    third = RunningQuantileStats()
+    third.update(np.random.normal(0, 1, (10, 3)))
+    with pytest.raises(ValueError, match="does not match"):
+        first.merge(third)
+
+
+def test_running_quantile_stats_merge_with_value_range_is_exact():
+    """Test that partial statistics sharing a value range merge into the same histograms as one pass."""
+    np.random.seed(42)
+    chunks = [np.random.uniform(-i, i, (300, 2)) for i in range(1, 5)]
+    value_range = (np.array([-4.0, -4.0]), np.array([4.0, 4.0]))
+
+    full = RunningQuantileStats(value_range=value_range)
+    merged = RunningQuantileStats()
+    for chunk in chunks:
+        full.update(chunk)
+        partial = RunningQuantileStats(value_range=value_range)
+        partial.update(chunk)
+        merged.merge(partial)
+
+    np.testing.assert_array_equal(merged._bin_edges, full._bin_edges)
+    np.testing.assert_array_equal(merged._histograms, full._histograms)
+    for key, value in full.get_statistics().items():
+        np.testing.assert_allclose(merged.get_statistics()[key], value, err_msg=key)
@@ -15,7 +15,12 @@
 # limitations under the License.
 """Contract tests for DatasetReader."""
 
+import numpy as np
+import pytest
+import torch
+
 from lerobot.datasets.dataset_reader import DatasetReader
+from lerobot.datasets.lerobot_dataset import LeRobotDataset
 from lerobot.datasets.video_utils import get_safe_default_codec
 
 # ── Loading ──────────────────────────────────────────────────────────
@@ -166,3 +171,145 @@ def test_get_episodes_file_paths_includes_video_paths(tmp_path, lerobot_dataset_
     if len(dataset.meta.video_keys) > 0:
         paths = dataset.reader.get_episodes_file_paths()
         assert any("video" in str(p).lower() for p in paths)
+
+
+# ── Delta-timestamp windows ──────────────────────────────────────────
+
+
+def test_delta_window_matches_hf_dataset_rows(tmp_path, lerobot_dataset_factory):
+    """Vectorized window gather returns the same values and padding as row-by-row access."""
+    delta_timestamps = {"action": [i / 30 for i in range(-3, 10)], "state": [-1 / 30, 0.0]}
+    dataset = lerobot_dataset_factory(
+        root=tmp_path / "ds",
+        total_episodes=3,
+        total_frames=60,
+        episodes=[0, 2],
+        use_videos=False,
+        delta_timestamps=delta_timestamps,
+    )
+    reader = dataset.reader
+
+    for rel_idx in [0, 1, len(dataset) // 2, len(dataset) - 1]:
+        item = dataset[rel_idx]
+        row = reader.hf_dataset[rel_idx]
+        ep_idx = row["episode_index"].item()
+        abs_idx = row["index"].item()
+        ep_start = dataset.meta.episodes[ep_idx]["dataset_from_index"]
+        ep_end = dataset.meta.episodes[ep_idx]["dataset_to_index"]
+
+        for key, delta_idx in reader.delta_indices.items():
+            query = [abs_idx + delta for delta in delta_idx]
+            expected_pad = torch.tensor([q < ep_start or q >= ep_end for q in query])
+            clamped = [max(ep_start, min(ep_end - 1, q)) for q in query]
+            expected = torch.stack(reader.hf_dataset[reader.abs_to_rel_indices(clamped).tolist()][key])
+
+            assert torch.equal(item[f"{key}_is_pad"], expected_pad)
+            assert item[key].dtype == expected.dtype
+            assert torch.equal(item[key], expected)
+
+
+def test_abs_to_rel_indices_with_episode_filter(tmp_path, lerobot_dataset_factory):
+    """abs_to_rel_indices() maps the `index` column back to row positions and rejects unselected frames."""
+    dataset = lerobot_dataset_factory(
+        root=tmp_path / "ds", total_episodes=3, total_frames=60, episodes=[1], use_videos=False
+    )
+    reader = dataset.reader
+    abs_indices = reader.hf_dataset.with_format("numpy")["index"][:]
+
+    np.testing.assert_array_equal(reader.abs_to_rel_indices(abs_indices), np.arange(len(abs_indices)))
+    with pytest.raises(KeyError):
+        reader.abs_to_rel_indices(np.array([dataset.meta.episodes[0]["dataset_from_index"]]))
+
+
+# ── Materialized mode ────────────────────────────────────────────────
+
+
+def test_materialized_items_match_hf_dataset(tmp_path, lerobot_dataset_factory):
+    """Materialized mode serves the same items as the HF formatter path, images included."""
+    delta_timestamps = {"action": [i / 30 for i in range(-2, 5)]}
+    dataset = lerobot_dataset_factory(
+        root=tmp_path / "ds",
+        total_episodes=3,
+        total_frames=45,
+        use_videos=False,
+        delta_timestamps=delta_timestamps,
+    )
+    materialized = LeRobotDataset(
+        dataset.repo_id, root=dataset.root, delta_timestamps=delta_timestamps, materialize=True
+    )
+
+    assert materialized.reader._columns is not None
+    assert all(column.is_shared() for column in materialized.reader._columns.values())
+    for idx in [0, 14, 15, len(dataset) - 1]:
+        expected, actual = dataset[idx], materialized[idx]
+        assert expected.keys() == actual.keys()
+        for key, value in expected.items():
+            if isinstance(value, torch.Tensor):
+                assert value.dtype == actual[key].dtype, key
+                assert torch.equal(value, actual[key]), key
+            else:
+                assert value == actual[key], key
+
+
+def test_materialized_dataset_in_dataloader_workers(tmp_path, lerobot_dataset_factory):
+    """Materialized columns can be used from DataLoader worker processes."""
+    dataset = lerobot_dataset_factory(
+        root=tmp_path / "ds", total_episodes=2, total_frames=20, use_videos=False, materialize=True
+    )
+    dataloader = torch.utils.data.DataLoader(dataset, batch_size=4, num_workers=2)
+    indices = torch.cat([batch["index"] for batch in dataloader])
+    assert torch.equal(indices, torch.arange(len(dataset)))
+
+
+# ── Batched reads ────────────────────────────────────────────────────
+
+
+def _assert_items_equal(expected: dict, actual: dict) -> None:
+    assert list(expected.keys()) == list(actual.keys())
+    for key, value in expected.items():
+        if isinstance(value, torch.Tensor):
+            assert value.dtype == actual[key].dtype, key
+            assert torch.equal(value, actual[key]), key
+        else:
+            assert value == actual[key], key
+
+
+@pytest.mark.parametrize("use_videos", [False, True])
+def test_get_items_matches_get_item(tmp_path, lerobot_dataset_factory, use_videos):
+    """get_items() returns the same items as calling get_item() on each index."""
+    delta_timestamps = {"action": [i / 30 for i in range(-2, 5)], "state": [-1 / 30, 0.0]}
+    dataset = lerobot_dataset_factory(
+        root=tmp_path / "ds",
+        total_episodes=3,
+        total_frames=45,
+        episodes=[0, 2],
+        use_videos=use_videos,
+        delta_timestamps=delta_timestamps,
+    )
+    if use_videos:
+        camera_key = dataset.meta.video_keys[0]
+        dataset.reader.delta_indices[camera_key] = [-1, 0]
+
+    indices = [0, len(dataset) - 1, 3, len(dataset) // 2, 3, len(dataset) - 2]
+    items = dataset.__getitems__(indices)
+
+    assert len(items) == len(indices)
+    for idx, item in zip(indices, items, strict=True):
+        _assert_items_equal(dataset[idx], item)
+
+
+def test_dataloader_uses_batched_reads(tmp_path, lerobot_dataset_factory):
+    """A DataLoader over the dataset yields the same batches as when reading items one at a time."""
+    dataset = lerobot_dataset_factory(
+        root=tmp_path / "ds",
+        total_episodes=2,
+        total_frames=20,
+        use_videos=False,
+        delta_timestamps={"action": [0.0, 1 / 30]},
+    )
+    batched = next(iter(torch.utils.data.DataLoader(dataset, batch_size=8)))
+    expected = torch.utils.data.default_collate([dataset[i] for i in range(8)])
+
+    assert torch.equal(batched["action"], expected["action"])
+    assert torch.equal(batched["action_is_pad"], expected["action_is_pad"])
+    assert batched["task"] == expected["task"]
@@ -15,18 +15,24 @@
 # limitations under the License.
 """Tests for dataset tools utilities."""
 
+import io
 from unittest.mock import patch
 
 import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 import torch
+from PIL import Image
 
 from lerobot.datasets.dataset_tools import (
+    _compute_file_stats,
     add_features,
     delete_episodes,
     merge_datasets,
     modify_features,
     modify_tasks,
+    recompute_stats,
     remove_feature,
     split_dataset,
 )
@@ -1321,3 +1327,66 @@ def test_convert_image_to_video_dataset_subset_episodes(tmp_path):
 
         if output_dir.exists():
             shutil.rmtree(output_dir)
+
+
+@pytest.mark.parametrize("num_workers", [0, 2])
+def test_recompute_stats_numeric(sample_dataset, num_workers):
+    """Test that recomputed stats match the stats of all the frames, read in small chunks."""
+    recompute_stats(sample_dataset, num_workers=num_workers, chunk_rows=7)
+
+    for key in ["action", "observation.state"]:
+        data = np.stack(sample_dataset.hf_dataset[key]).astype(np.float64)
+        stats = sample_dataset.meta.stats[key]
+        np.testing.assert_array_equal(stats["count"], [len(data)])
+        np.testing.assert_allclose(stats["min"], data.min(axis=0), rtol=1e-6)
+        np.testing.assert_allclose(stats["max"], data.max(axis=0), rtol=1e-6)
+        np.testing.assert_allclose(stats["mean"], data.mean(axis=0), atol=1e-6)
+        np.testing.assert_allclose(stats["std"], data.std(axis=0), atol=1e-6)
+        np.testing.assert_allclose(stats["q50"], np.quantile(data, 0.5, axis=0), atol=0.1)
+
+
+def test_recompute_stats_parallel_matches_sequential(sample_dataset):
+    recompute_stats(sample_dataset, num_workers=0, chunk_rows=7)
+    sequential = {key: dict(value) for key, value in sample_dataset.meta.stats.items()}
+    recompute_stats(sample_dataset, num_workers=2, chunk_rows=13)
+
+    for key in ["action", "observation.state"]:
+        for stat, value in sequential[key].items():
+            np.testing.assert_allclose(sample_dataset.meta.stats[key][stat], value, err_msg=f"{key}/{stat}")
+
+
+def test_recompute_stats_images(sample_dataset):
+    """Test per-channel image stats; episodes are short enough for every frame to be sampled."""
+    recompute_stats(sample_dataset, skip_image_video=False, chunk_rows=16)
+
+    key = "observation.images.top"
+    images = np.stack([np.asarray(img) for img in sample_dataset.hf_dataset.with_format(None)[key]])
+    pixels = images.reshape(-1, 3) / 255.0
+    stats = sample_dataset.meta.stats[key]
+    assert stats["mean"].shape == (3, 1, 1)
+    assert stats["q01"].shape == (3, 1, 1)
+    np.testing.assert_array_equal(stats["count"], [len(images)])
+    np.testing.assert_allclose(stats["mean"].reshape(3), pixels.mean(axis=0), atol=1e-6)
+    np.testing.assert_allclose(stats["std"].reshape(3), pixels.std(axis=0), atol=1e-6)
+    np.testing.assert_allclose(stats["max"].reshape(3), pixels.max(axis=0), atol=1e-6)
+
+
+@pytest.mark.parametrize("mode", ["L", "RGBA"])
+def test_compute_file_stats_converts_images_to_rgb(tmp_path, mode):
+    """Grayscale and RGBA images are converted to RGB, like when the dataset is loaded."""
+    images = [Image.new(mode, (8, 6), color=128 if mode == "L" else (255, 0, 0, 10)) for _ in range(2)]
+    encoded = []
+    for image in images:
+        buffer = io.BytesIO()
+        image.save(buffer, format="PNG")
+        encoded.append({"bytes": buffer.getvalue(), "path": None})
+    path = tmp_path / "file-000.parquet"
+    pq.write_table(pa.table({"index": [0, 1], "observation.image": encoded}), path)
+
+    stats, image_counts = _compute_file_stats(
+        path, {}, {}, ["observation.image"], np.array([0, 1]), [], None, 1e-4, chunk_rows=16
+    )
+
+    assert image_counts == {"observation.image": 2}
+    expected = [128 / 255] * 3 if mode == "L" else [1.0, 0.0, 0.0]
+    np.testing.assert_allclose(stats["observation.image"].get_statistics()["mean"], expected, atol=1e-6)
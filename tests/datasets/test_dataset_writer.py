@@ -15,17 +15,25 @@
 # limitations under the License.
 """Contract tests for DatasetWriter."""
 
+import threading
 from pathlib import Path
 from unittest.mock import patch
 
+import datasets
 import numpy as np
 import pytest
 import torch
 from PIL import Image
 
-from lerobot.datasets.dataset_writer import _encode_video_worker
+from lerobot.datasets.dataset_writer import (
+    MIN_COLUMN_CAPACITY,
+    DatasetWriter,
+    _encode_video_worker,
+    _episode_to_arrow_table,
+)
+from lerobot.datasets.feature_utils import get_hf_features_from_features
 from lerobot.datasets.lerobot_dataset import LeRobotDataset
-from lerobot.datasets.utils import DEFAULT_IMAGE_PATH
+from lerobot.datasets.utils import DEFAULT_IMAGE_PATH, PENDING_EPISODES_DIR
 from tests.fixtures.constants import DEFAULT_FPS, DUMMY_REPO_ID
 
 SIMPLE_FEATURES = {
@@ -177,6 +185,60 @@ def test_save_multiple_episodes(tmp_path):
     assert dataset.meta.total_frames == total_frames
 
 
+def test_add_frame_grows_columns_beyond_initial_capacity(tmp_path):
+    """Episodes longer than the preallocated columns are recorded in full and in order."""
+    dataset = LeRobotDataset.create(
+        repo_id=DUMMY_REPO_ID, fps=DEFAULT_FPS, features=SIMPLE_FEATURES, root=tmp_path / "ds"
+    )
+    n_frames = 2 * MIN_COLUMN_CAPACITY + 3
+    states = np.arange(n_frames * 6, dtype=np.float32).reshape(n_frames, 6)
+    for state in states:
+        dataset.add_frame({"task": "Dummy task", "state": state, "action": -state})
+    assert len(dataset.writer.episode_buffer["state"]) == n_frames
+    dataset.save_episode()
+    # The next episode is preallocated for as many frames as the previous one
+    assert dataset.writer._column_capacity == n_frames
+    dataset.finalize()
+
+    for i in (0, MIN_COLUMN_CAPACITY, n_frames - 1):
+        item = dataset[i]
+        assert torch.equal(item["state"], torch.from_numpy(states[i]))
+        assert item["frame_index"].item() == i
+        assert item["timestamp"].item() == pytest.approx(i / DEFAULT_FPS)
+
+
+def test_episode_arrow_table_matches_datasets():
+    """Numpy columns are converted to the same arrow table as through `datasets.Dataset.from_dict`."""
+    features = {
+        "state": {"dtype": "float32", "shape": (6,), "names": None},
+        "reward": {"dtype": "float64", "shape": (1,), "names": None},
+        "done": {"dtype": "bool", "shape": (1,), "names": None},
+        "language": {"dtype": "string", "shape": (1,), "names": None},
+        "index": {"dtype": "int64", "shape": (1,), "names": None},
+        "timestamp": {"dtype": "float32", "shape": (1,), "names": None},
+    }
+    n_frames = 5
+    ep_dict = {
+        "state": np.random.randn(n_frames, 6).astype(np.float32),
+        "reward": np.random.randn(n_frames, 1),
+        "done": np.zeros((n_frames, 1), dtype=bool),
+        "language": ["pick"] * n_frames,
+        "index": np.arange(n_frames),
+        "timestamp": np.arange(n_frames) / DEFAULT_FPS,
+    }
+    hf_features = get_hf_features_from_features(features)
+
+    table = _episode_to_arrow_table(ep_dict, hf_features)
+    expected = datasets.Dataset.from_dict(ep_dict, features=hf_features).with_format("arrow")[:]
+    assert table.schema.equals(expected.schema, check_metadata=True)
+    assert table.equals(expected)
+
+    image_features = get_hf_features_from_features(
+        {"image": {"dtype": "image", "shape": (8, 8, 3), "names": ["height", "width", "channels"]}}
+    )
+    assert _episode_to_arrow_table({"image": ["frame.png"]}, image_features) is None
+
+
 # ── clear / lifecycle ────────────────────────────────────────────────
 
 
@@ -224,3 +286,135 @@ def test_finalize_then_read_roundtrip(tmp_path):
     for i in range(5):
         item = dataset[i]
         assert torch.allclose(item["state"], known_states[i], atol=1e-5)
+
+
+# ── background saving ────────────────────────────────────────────────
+
+IMAGE_FEATURES = {
+    **SIMPLE_FEATURES,
+    "observation.image": {"dtype": "image", "shape": (8, 8, 3), "names": ["height", "width", "channels"]},
+}
+
+
+def _make_episodes(lengths: list[int]) -> list[list[dict]]:
+    """Build deterministic episodes, so that the same data can be recorded in several datasets."""
+    rng = np.random.default_rng(0)
+    return [
+        [
+            {
+                "task": f"task {ep % 2}",
+                "state": rng.standard_normal(6, dtype=np.float32),
+                "action": rng.standard_normal(6, dtype=np.float32),
+                "observation.image": rng.integers(0, 256, size=(8, 8, 3), dtype=np.uint8),
+            }
+            for _ in range(n_frames)
+        ]
+        for ep, n_frames in enumerate(lengths)
+    ]
+
+
+def _record(dataset: LeRobotDataset, episodes: list[list[dict]]) -> None:
+    for frames in episodes:
+        for frame in frames:
+            dataset.add_frame(dict(frame))
+        dataset.save_episode()
+
+
+def test_background_saving_matches_sync(tmp_path):
+    """Episodes saved in the background are identical to episodes saved synchronously."""
+    episodes = _make_episodes([3, 2, 4])
+    datasets = {}
+    for background_saving in (False, True):
+        root = tmp_path / f"ds_{background_saving}"
+        dataset = LeRobotDataset.create(
+            repo_id=DUMMY_REPO_ID,
+            fps=DEFAULT_FPS,
+            features=IMAGE_FEATURES,
+            root=root,
+            use_videos=False,
+            background_saving=background_saving,
+        )
+        _record(dataset, episodes)
+        dataset.finalize()
+        assert not (root / PENDING_EPISODES_DIR).exists()
+        assert not (root / "images").exists() or not any((root / "images").rglob("*.png"))
+        datasets[background_saving] = dataset
+
+    sync, background = datasets[False], datasets[True]
+    assert background.meta.total_episodes == sync.meta.total_episodes == 3
+    assert background.meta.total_frames == sync.meta.total_frames == 9
+    for i in range(9):
+        sync_item, background_item = sync[i], background[i]
+        assert sync_item["task"] == background_item["task"]
+        for key in ("index", "episode_index", "task_index", "state", "action", "observation.image"):
+            assert torch.equal(sync_item[key], background_item[key])
+    for key in ("state", "action"):
+        np.testing.assert_allclose(sync.meta.stats[key]["mean"], background.meta.stats[key]["mean"])
+
+
+def test_background_save_episode_returns_before_commit(tmp_path):
+    """The next episode can be recorded while the previous one is committed."""
+    dataset = LeRobotDataset.create(
+        repo_id=DUMMY_REPO_ID,
+        fps=DEFAULT_FPS,
+        features=IMAGE_FEATURES,
+        root=tmp_path / "ds",
+        use_videos=False,
+        background_saving=True,
+    )
+    commit_episode = DatasetWriter._commit_episode
+    release = threading.Event()
+
+    def blocked_commit_episode(self, pending, parallel_encoding):
+        release.wait(timeout=10)
+        commit_episode(self, pending, parallel_encoding)
+
+    with patch.object(DatasetWriter, "_commit_episode", blocked_commit_episode):
+        episodes = _make_episodes([2, 3])
+        _record(dataset, episodes[:1])
+        # The episode is journaled but not committed yet, and the next one gets the following index
+        assert dataset.meta.total_episodes == 0
+        assert (tmp_path / "ds" / PENDING_EPISODES_DIR / "episode-000000" / "episode.json").exists()
+        assert dataset.writer.episode_buffer["episode_index"] == 1
+        _record(dataset, episodes[1:])
+        assert dataset.meta.total_episodes == 0
+
+        release.set()
+        dataset.finalize()
+
+    assert dataset.meta.total_episodes == 2
+    assert dataset.meta.total_frames == 5
+    assert not (tmp_path / "ds" / PENDING_EPISODES_DIR).exists()
+
+
+def test_background_save_failure_is_recovered_on_resume(tmp_path):
+    """A failed background save is raised, and the journaled episode is committed on resume."""
+    root = tmp_path / "ds"
+    dataset = LeRobotDataset.create(
+        repo_id=DUMMY_REPO_ID,
+        fps=DEFAULT_FPS,
+        features=IMAGE_FEATURES,
+        root=root,
+        use_videos=False,
+        background_saving=True,
+    )
+    episodes = _make_episodes([2, 3])
+    _record(dataset, episodes[:1])
+    dataset.writer.wait_for_saved_episodes()
+    with patch.object(DatasetWriter, "_save_episode_data", side_effect=OSError("disk full")):
+        _record(dataset, episodes[1:])
+        with pytest.raises(RuntimeError, match="Saving an episode in the background failed"):
+            dataset.finalize()
+    assert dataset.meta.total_episodes == 1
+    assert (root / PENDING_EPISODES_DIR / "episode-000001").is_dir()
+
+    dataset = LeRobotDataset.resume(DUMMY_REPO_ID, root=root)
+    assert dataset.meta.total_episodes == 2
+    assert dataset.meta.total_frames == 5
+    assert not (root / PENDING_EPISODES_DIR).exists()
+    dataset.finalize()
+
+    for i, frame in enumerate(episodes[0] + episodes[1]):
+        item = dataset[i]
+        assert item["task"] == frame["task"]
+        assert torch.allclose(item["state"], torch.from_numpy(frame["state"]))
@@ -413,6 +413,26 @@ def test_multilerobot_dataset_set_image_transforms_propagates(tmp_path, lerobot_
     assert all(child.image_transforms is None for child in dataset._datasets)
 
 
+def test_multilerobot_dataset_getitems(tmp_path, lerobot_dataset_factory):
+    """__getitems__ routes indices to their sub-dataset and preserves the requested order."""
+    root = tmp_path / "multi"
+    repo_ids = ["lerobot/test_multi_a", "lerobot/test_multi_b"]
+
+    for repo_id in repo_ids:
+        lerobot_dataset_factory(root=root / repo_id, repo_id=repo_id, use_videos=False)
+
+    dataset = MultiLeRobotDataset(repo_ids, root=root, download_videos=False)
+    indices = [len(dataset) - 1, 0, len(dataset._datasets[0]), 1, 0]
+    items = dataset.__getitems__(indices)
+
+    assert len(items) == len(indices)
+    for idx, item in zip(indices, items, strict=True):
+        expected = dataset[idx]
+        assert expected.keys() == item.keys()
+        assert item["dataset_index"] == expected["dataset_index"]
+        assert torch.equal(item["index"], expected["index"])
+
+
 def test_image_array_to_pil_image_wrong_range_float_0_255():
     image = np.random.rand(*DUMMY_HWC) * 255
     with pytest.raises(ValueError):
@@ -1644,3 +1664,38 @@ def test_delta_timestamps_query_returns_correct_values(tmp_path, empty_lerobot_d
     # Previous frame is outside episode, so it's clamped to first frame and marked as padded
     assert state_values == [10.0, 10.0], f"Expected [10.0, 10.0], got {state_values}"
     assert is_pad == [True, False], f"Expected [True, False], got {is_pad}"
+
+
+def test_multilerobot_dataset_index_routing(tmp_path, lerobot_dataset_factory):
+    """Global indices are routed to the sub-dataset owning them, up to the first and last frame of each."""
+    root = tmp_path / "multi"
+    repo_ids = ["lerobot/test_multi_a", "lerobot/test_multi_b", "lerobot/test_multi_c"]
+    for i, repo_id in enumerate(repo_ids):
+        lerobot_dataset_factory(
+            root=root / repo_id,
+            repo_id=repo_id,
+            total_episodes=1 + i,
+            total_frames=40 + 10 * i,
+            use_videos=False,
+        )
+    dataset = MultiLeRobotDataset(repo_ids, root=root, download_videos=False)
+
+    num_frames = dataset.dataset_num_frames
+    assert num_frames == [ds.num_frames for ds in dataset._datasets]
+    assert len(dataset) == sum(num_frames)
+
+    offsets = np.cumsum([0, *num_frames])
+    for dataset_idx in range(len(repo_ids)):
+        first, last = offsets[dataset_idx], offsets[dataset_idx + 1] - 1
+        assert dataset._locate(first) == (dataset_idx, 0)
+        assert dataset._locate(last) == (dataset_idx, num_frames[dataset_idx] - 1)
+
+    with pytest.raises(IndexError):
+        dataset._locate(len(dataset))
+    with pytest.raises(IndexError):
+        dataset.__getitems__([0, len(dataset)])
+
+
+def test_multilerobot_dataset_requires_repo_ids(tmp_path):
+    with pytest.raises(ValueError, match="at least one repo_id"):
+        MultiLeRobotDataset([], root=tmp_path)
@@ -20,8 +20,11 @@ import numpy as np
 import pytest
 from PIL import Image
 
+from lerobot.datasets import image_writer
 from lerobot.datasets.image_writer import (
     AsyncImageWriter,
+    SharedFrame,
+    SharedMemoryFramePool,
     image_array_to_pil_image,
     safe_stop_image_writer,
     write_image,
@@ -177,6 +180,83 @@ def test_save_image_numpy_multiprocessing(tmp_path, img_array_factory):
         writer.stop()
 
 
+def test_save_image_numpy_shared_memory(tmp_path, img_array_factory):
+    writer = AsyncImageWriter(num_processes=1, num_threads=2, shared_memory_slots=4)
+    try:
+        image_arrays = [img_array_factory() for _ in range(20)]
+        fpaths = [tmp_path / f"frame_{i:06d}.png" for i in range(len(image_arrays))]
+        for image_array, fpath in zip(image_arrays, fpaths, strict=True):
+            writer.save_image(image_array, fpath)
+        writer.wait_until_done()
+        for image_array, fpath in zip(image_arrays, fpaths, strict=True):
+            assert np.array_equal(np.array(Image.open(fpath)), image_array)
+
+        stats = writer.get_stats()
+        # Images that didn't find a free slot are pickled through the queue instead
+        assert stats["shared_memory_images"] + stats["pool_full_images"] == len(image_arrays)
+        assert stats["pickled_images"] == stats["pool_full_images"]
+        assert 1 <= stats["max_slots_in_use"] <= 4
+    finally:
+        writer.stop()
+
+
+def test_save_image_without_shared_memory(tmp_path, img_array_factory):
+    writer = AsyncImageWriter(num_processes=1, num_threads=1, shared_memory_slots=0)
+    try:
+        image_array = img_array_factory()
+        fpath = tmp_path / DUMMY_IMAGE
+        writer.save_image(image_array, fpath)
+        writer.wait_until_done()
+        assert np.array_equal(np.array(Image.open(fpath)), image_array)
+        assert writer.get_stats()["pickled_images"] == 1
+        assert writer.get_stats()["shared_memory_images"] == 0
+    finally:
+        writer.stop()
+
+
+@pytest.mark.parametrize("free_slots, expected_slots", [(0, 0), (3, 1), (100, 4)])
+def test_shared_memory_slots_fit_in_free_space(
+    tmp_path, img_array_factory, monkeypatch, caplog, free_slots, expected_slots
+):
+    image_array = img_array_factory()
+    monkeypatch.setattr(image_writer, "_free_shared_memory_bytes", lambda: free_slots * image_array.nbytes)
+    writer = AsyncImageWriter(num_processes=1, num_threads=1, shared_memory_slots=4)
+    try:
+        fpath = tmp_path / DUMMY_IMAGE
+        writer.save_image(image_array, fpath)
+        writer.wait_until_done()
+        assert np.array_equal(np.array(Image.open(fpath)), image_array)
+
+        frame_pool = writer._frame_pools[image_array.nbytes]
+        assert (frame_pool.num_slots if frame_pool is not None else 0) == expected_slots
+        # Without a single slot the images are pickled through the queue instead
+        assert writer.get_stats()["shared_memory_images"] == min(expected_slots, 1)
+        assert writer.get_stats()["pickled_images"] == 1 - min(expected_slots, 1)
+        assert ("shared memory slots instead" in caplog.text) == (expected_slots < 4)
+    finally:
+        writer.stop()
+
+
+def test_shared_memory_frame_pool(img_array_factory):
+    image_array = img_array_factory()
+    pool = SharedMemoryFramePool(image_array.nbytes, num_slots=2)
+    try:
+        first, second = pool.put(image_array), pool.put(image_array[::-1])
+        assert isinstance(first, SharedFrame)
+        assert first.slot != second.slot
+        assert pool.slots_in_use == 2
+        assert pool.put(image_array) is None
+
+        pool.release(first.slot)
+        assert pool.slots_in_use == 1
+        third = pool.put(image_array)
+        assert third.slot == first.slot
+        assert third.shape == image_array.shape
+        assert np.dtype(third.dtype) == image_array.dtype
+    finally:
+        pool.close()
+
+
 def test_save_image_torch(tmp_path, img_tensor_factory):
     writer = AsyncImageWriter()
     try:
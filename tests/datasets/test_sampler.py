@@ -15,6 +15,7 @@
 # limitations under the License.
 import logging
 
+import numpy as np
 import pytest
 import torch
 from datasets import Dataset
@@ -22,7 +23,7 @@ from datasets import Dataset
 from lerobot.datasets.io_utils import (
     hf_transform_to_torch,
 )
-from lerobot.datasets.sampler import EpisodeAwareSampler
+from lerobot.datasets.sampler import EpisodeAwareSampler, WeightedDatasetSampler
 
 
 def calculate_episode_data_index(hf_dataset: Dataset) -> dict[str, torch.Tensor]:
@@ -52,7 +53,7 @@ def test_drop_n_first_frames():
     dataset.set_transform(hf_transform_to_torch)
     episode_data_index = calculate_episode_data_index(dataset)
     sampler = EpisodeAwareSampler(episode_data_index["from"], episode_data_index["to"], drop_n_first_frames=1)
-    assert sampler.indices == [1, 4, 5]
+    assert sampler.indices.tolist() == [1, 4, 5]
     assert len(sampler) == 3
     assert list(sampler) == [1, 4, 5]
 
@@ -68,7 +69,7 @@ def test_drop_n_last_frames():
     dataset.set_transform(hf_transform_to_torch)
     episode_data_index = calculate_episode_data_index(dataset)
     sampler = EpisodeAwareSampler(episode_data_index["from"], episode_data_index["to"], drop_n_last_frames=1)
-    assert sampler.indices == [0, 3, 4]
+    assert sampler.indices.tolist() == [0, 3, 4]
     assert len(sampler) == 3
     assert list(sampler) == [0, 3, 4]
 
@@ -86,7 +87,7 @@ def test_episode_indices_to_use():
     sampler = EpisodeAwareSampler(
         episode_data_index["from"], episode_data_index["to"], episode_indices_to_use=[0, 2]
     )
-    assert sampler.indices == [0, 1, 3, 4, 5]
+    assert sampler.indices.tolist() == [0, 1, 3, 4, 5]
     assert len(sampler) == 5
     assert list(sampler) == [0, 1, 3, 4, 5]
 
@@ -102,11 +103,11 @@ def test_shuffle():
     dataset.set_transform(hf_transform_to_torch)
     episode_data_index = calculate_episode_data_index(dataset)
     sampler = EpisodeAwareSampler(episode_data_index["from"], episode_data_index["to"], shuffle=False)
-    assert sampler.indices == [0, 1, 2, 3, 4, 5]
+    assert sampler.indices.tolist() == [0, 1, 2, 3, 4, 5]
     assert len(sampler) == 6
     assert list(sampler) == [0, 1, 2, 3, 4, 5]
     sampler = EpisodeAwareSampler(episode_data_index["from"], episode_data_index["to"], shuffle=True)
-    assert sampler.indices == [0, 1, 2, 3, 4, 5]
+    assert sampler.indices.tolist() == [0, 1, 2, 3, 4, 5]
     assert len(sampler) == 6
     assert set(sampler) == {0, 1, 2, 3, 4, 5}
 
@@ -132,5 +133,175 @@ def test_partial_episode_drop_warns(caplog):
     with caplog.at_level(logging.WARNING, logger="lerobot.datasets.sampler"):
         sampler = EpisodeAwareSampler([0, 1], [1, 6], drop_n_first_frames=1)
     # Episode 0 is skipped (1 frame, drop 1), Episode 1 keeps frames 2-5
-    assert sampler.indices == [2, 3, 4, 5]
+    assert sampler.indices.tolist() == [2, 3, 4, 5]
     assert "Episode 0" in caplog.text
+
+
+def test_invalid_locality_window_raises():
+    with pytest.raises(ValueError, match="locality_window must be >= 1"):
+        EpisodeAwareSampler([0], [10], locality_window=0)
+
+
+def test_episode_groups_length_mismatch_raises():
+    with pytest.raises(ValueError, match="episode_groups"):
+        EpisodeAwareSampler([0, 5], [5, 10], episode_groups=[0])
+
+
+def test_locality_window_is_a_permutation():
+    torch.manual_seed(0)
+    sampler = EpisodeAwareSampler(
+        [0, 7, 20, 31], [7, 20, 31, 50], drop_n_first_frames=1, shuffle=True, locality_window=4
+    )
+    indices = list(sampler)
+    assert sorted(indices) == sampler.indices.tolist()
+    assert len(indices) == len(sampler)
+
+
+def test_locality_window_groups_frames():
+    torch.manual_seed(0)
+    # Episodes 0-1 are stored in one video file and episodes 2-3 in another
+    from_indices, to_indices = [0, 10, 20, 30], [10, 20, 30, 40]
+    episode_groups = [(0, 0), (0, 0), (0, 1), (0, 1)]
+    sampler = EpisodeAwareSampler(
+        from_indices, to_indices, shuffle=True, episode_groups=episode_groups, locality_window=5
+    )
+    indices = list(sampler)
+    assert sorted(indices) == list(range(40))
+
+    # Each window of 5 frames comes from a single file and is sorted for forward decoding
+    for start in range(0, len(indices), 5):
+        window = indices[start : start + 5]
+        assert len({idx // 20 for idx in window}) == 1
+        assert window == sorted(window)
+
+
+def test_locality_window_respects_episode_filter():
+    torch.manual_seed(0)
+    sampler = EpisodeAwareSampler(
+        [0, 10, 20], [10, 20, 30], episode_indices_to_use=[0, 2], shuffle=True, locality_window=3
+    )
+    assert sorted(sampler) == list(range(10)) + list(range(20, 30))
+
+
+def test_indices_are_int64_array():
+    sampler = EpisodeAwareSampler([0, 3, 3], [3, 3, 8], drop_n_first_frames=1)
+    assert isinstance(sampler.indices, np.ndarray)
+    assert sampler.indices.dtype == np.int64
+    assert sampler.indices.tolist() == [1, 2, 4, 5, 6, 7]
+    assert all(isinstance(idx, int) for idx in sampler)
+
+
+def test_mismatched_episode_bounds_raise():
+    with pytest.raises(ValueError, match="different lengths"):
+        EpisodeAwareSampler([0, 5], [5])
+
+
+@pytest.mark.parametrize("locality_window", [1, 4])
+def test_seeded_shuffle_is_reproducible_across_epochs(locality_window):
+    kwargs = {"shuffle": True, "seed": 42, "locality_window": locality_window}
+    sampler = EpisodeAwareSampler([0, 10, 25], [10, 25, 40], **kwargs)
+    first_epoch, second_epoch = list(sampler), list(sampler)
+    assert first_epoch != second_epoch
+    assert sampler.epoch == 2
+
+    other = EpisodeAwareSampler([0, 10, 25], [10, 25, 40], **kwargs)
+    other.set_epoch(1)
+    assert list(other) == second_epoch
+
+
+@pytest.mark.parametrize("shuffle", [False, True])
+def test_resume_at_offset(shuffle):
+    sampler = EpisodeAwareSampler([0, 10, 25], [10, 25, 40], shuffle=shuffle, seed=0)
+    full_epoch = list(sampler)
+
+    resumed = EpisodeAwareSampler([0, 10, 25], [10, 25, 40], shuffle=shuffle, seed=0)
+    resumed.set_start_offset(17)
+    assert list(resumed) == full_epoch[17:]
+    # The offset only applies to the resumed epoch
+    assert len(list(resumed)) == len(full_epoch)
+
+
+def _accelerate_batches(sampler, n_batches: int) -> list[list[int]]:
+    """Batches of indices yielded by a dataloader prepared by accelerate, cycled over epochs."""
+    from accelerate import Accelerator
+
+    dataloader = torch.utils.data.DataLoader(range(40), batch_size=6, sampler=sampler)
+    dataloader = Accelerator(cpu=True).prepare(dataloader)
+    batches = []
+    while len(batches) < n_batches:
+        batches += [batch.tolist() for batch in dataloader]
+    return batches[:n_batches]
+
+
+@pytest.mark.parametrize("resume_step", [3, 7, 10])
+def test_resume_through_accelerate(resume_step):
+    """A run resumed as in lerobot_train yields the batches of the uninterrupted run, in later epochs too."""
+    kwargs = {"shuffle": True, "seed": 0}
+    uninterrupted = _accelerate_batches(EpisodeAwareSampler([0, 10, 25], [10, 25, 40], **kwargs), 20)
+
+    resumed = EpisodeAwareSampler([0, 10, 25], [10, 25, 40], **kwargs)
+    batches_per_epoch = 7
+    resumed.set_base_epoch(resume_step // batches_per_epoch)
+    resumed.set_start_offset((resume_step % batches_per_epoch) * 6)
+    assert _accelerate_batches(resumed, 20 - resume_step) == uninterrupted[resume_step:]
+
+
+def test_invalid_start_offset_raises():
+    sampler = EpisodeAwareSampler([0], [10])
+    with pytest.raises(ValueError, match="offset must be in"):
+        sampler.set_start_offset(11)
+
+
+def test_weighted_dataset_sampler_indices_in_range():
+    sampler = WeightedDatasetSampler([5, 0, 20], seed=0)
+    indices = list(sampler)
+    assert len(indices) == len(sampler) == 25
+    assert all(0 <= idx < 25 for idx in indices)
+
+
+@pytest.mark.parametrize(
+    "temperature, expected",
+    [
+        (1.0, [0.1, 0.9]),
+        (float("inf"), [0.5, 0.5]),
+    ],
+)
+def test_weighted_dataset_sampler_temperature(temperature, expected):
+    sampler = WeightedDatasetSampler([100, 900], temperature=temperature, num_samples=20_000, seed=0)
+    np.testing.assert_allclose(sampler.probabilities, expected)
+
+    indices = np.array(list(sampler))
+    observed = [np.mean(indices < 100), np.mean(indices >= 100)]
+    np.testing.assert_allclose(observed, expected, atol=0.02)
+
+
+@pytest.mark.parametrize("temperature", [1.0, 2.0, float("inf")])
+def test_weighted_dataset_sampler_never_draws_empty_datasets(temperature):
+    sampler = WeightedDatasetSampler(
+        [10, 0, 10], dataset_weights=[1, 5, 0], temperature=temperature, num_samples=500, seed=0
+    )
+    np.testing.assert_allclose(sampler.probabilities, [1.0, 0.0, 0.0])
+    assert all(0 <= idx < 10 for idx in sampler)
+
+
+def test_weighted_dataset_sampler_custom_weights():
+    sampler = WeightedDatasetSampler([10, 10, 10], dataset_weights=[1, 0, 3], num_samples=1000, seed=0)
+    np.testing.assert_allclose(sampler.probabilities, [0.25, 0.0, 0.75])
+    assert not any(10 <= idx < 20 for idx in sampler)
+
+
+def test_weighted_dataset_sampler_is_reproducible():
+    first = WeightedDatasetSampler([10, 30], temperature=2.0, seed=3)
+    second = WeightedDatasetSampler([10, 30], temperature=2.0, seed=3)
+    first_epoch = list(first)
+    assert first_epoch == list(second)
+    assert list(first) != first_epoch
+
+
+def test_weighted_dataset_sampler_invalid_arguments():
+    with pytest.raises(ValueError, match="temperature"):
+        WeightedDatasetSampler([10], temperature=0)
+    with pytest.raises(ValueError, match="dataset_weights has"):
+        WeightedDatasetSampler([10, 10], dataset_weights=[1.0])
+    with pytest.raises(ValueError, match="positive weight"):
+        WeightedDatasetSampler([0, 10], dataset_weights=[1.0, 0.0])
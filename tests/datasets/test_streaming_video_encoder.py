@@ -28,6 +28,7 @@ from lerobot.datasets.video_utils import (
     VALID_VIDEO_CODECS,
     StreamingVideoEncoder,
     _CameraEncoderThread,
+    _FrameBufferPool,
     _get_codec_options,
     detect_available_hw_encoders,
     resolve_vcodec,
@@ -258,6 +259,58 @@ class TestCameraEncoderThread:
         encoder_thread.join(timeout=10)
         assert not encoder_thread.is_alive()
 
+    def test_stats_frame_stride(self, tmp_path):
+        """Test that the stats are only computed on every stats_frame_stride-th frame."""
+        frame_queue: queue.Queue = queue.Queue(maxsize=60)
+        result_queue: queue.Queue = queue.Queue(maxsize=1)
+
+        encoder_thread = _CameraEncoderThread(
+            video_path=tmp_path / "test_stride" / "test.mp4",
+            fps=30,
+            vcodec="libsvtav1",
+            pix_fmt="yuv420p",
+            g=2,
+            crf=30,
+            preset=13,
+            frame_queue=frame_queue,
+            result_queue=result_queue,
+            stop_event=threading.Event(),
+            stats_frame_stride=5,
+        )
+        encoder_thread.start()
+
+        # Only frames 0 and 5 are dark
+        for i in range(10):
+            frame_queue.put(np.full((64, 96, 3), 10 if i % 5 == 0 else 200, dtype=np.uint8))
+        frame_queue.put(None)
+        encoder_thread.join(timeout=60)
+
+        status, stats = result_queue.get(timeout=5)
+        assert status == "ok"
+        np.testing.assert_array_equal(stats["max"], [10, 10, 10])
+        assert encoder_thread.encoded_frames == 10
+
+
+class TestFrameBufferPool:
+    def test_reuses_released_buffers(self):
+        pool = _FrameBufferPool(capacity=1)
+        buffer = pool.acquire((4, 6, 3))
+        assert buffer.shape == (4, 6, 3) and buffer.dtype == np.uint8
+        pool.release(buffer)
+        assert pool.acquire((4, 6, 3)) is buffer
+        # The pool is empty again
+        assert pool.acquire((4, 6, 3)) is not buffer
+
+    def test_capacity_and_shape(self):
+        pool = _FrameBufferPool(capacity=1)
+        first, second = pool.acquire((4, 6, 3)), pool.acquire((4, 6, 3))
+        pool.release(first)
+        pool.release(second)
+        assert pool.acquire((4, 6, 3)) is first
+        # A buffer of another shape is never handed out
+        pool.release(first)
+        assert pool.acquire((8, 6, 3)).shape == (8, 6, 3)
+
 
 # ─── StreamingVideoEncoder tests ───
 
@@ -473,6 +526,74 @@ class TestStreamingVideoEncoder:
 
         encoder.close()
 
+    def test_float_chw_frames(self, tmp_path):
+        """Test that float CHW frames in [0, 1] are converted to HWC uint8 before encoding."""
+        encoder = StreamingVideoEncoder(fps=30, vcodec="libsvtav1", pix_fmt="yuv420p", g=2, crf=30, preset=13)
+        encoder.start_episode([f"{OBS_IMAGES}.cam"], tmp_path)
+
+        for _ in range(5):
+            encoder.feed_frame(f"{OBS_IMAGES}.cam", np.full((3, 64, 96), 0.5, dtype=np.float32))
+
+        mp4_path, stats = encoder.finish_episode()[f"{OBS_IMAGES}.cam"]
+        np.testing.assert_array_equal(stats["mean"], [127, 127, 127])
+        with av.open(str(mp4_path)) as container:
+            frames = [frame.to_ndarray(format="rgb24") for frame in container.decode(video=0)]
+        assert len(frames) == 5
+        assert frames[0].shape == (64, 96, 3)
+        assert np.abs(frames[0].astype(int) - 127).max() <= 2
+
+        encoder.close()
+
+    @pytest.mark.parametrize("channels", [None, 1, 4])
+    def test_grayscale_and_rgba_frames(self, tmp_path, channels):
+        """Test that grayscale frames are repeated on 3 channels and that the alpha channel is dropped."""
+        encoder = StreamingVideoEncoder(fps=30, vcodec="libsvtav1", pix_fmt="yuv420p", g=2, crf=30, preset=13)
+        encoder.start_episode([f"{OBS_IMAGES}.cam"], tmp_path)
+
+        shape = (64, 96) if channels is None else (64, 96, channels)
+        frame = np.full(shape, 127, dtype=np.uint8)
+        if channels == 4:
+            frame[:, :, 3] = 0
+        for _ in range(5):
+            encoder.feed_frame(f"{OBS_IMAGES}.cam", frame)
+
+        mp4_path, stats = encoder.finish_episode()[f"{OBS_IMAGES}.cam"]
+        np.testing.assert_array_equal(stats["mean"], [127, 127, 127])
+        with av.open(str(mp4_path)) as container:
+            frames = [frame.to_ndarray(format="rgb24") for frame in container.decode(video=0)]
+        assert len(frames) == 5
+        assert frames[0].shape == (64, 96, 3)
+        assert np.abs(frames[0].astype(int) - 127).max() <= 2
+
+        encoder.close()
+
+    def test_queue_stats(self, tmp_path):
+        """Test that the queue depth, fed, dropped and encoded frame counters are reported."""
+        encoder = StreamingVideoEncoder(fps=30, vcodec="libsvtav1", pix_fmt="yuv420p", g=2, crf=30, preset=13)
+        assert encoder.get_queue_stats() == {}
+
+        video_key = f"{OBS_IMAGES}.cam"
+        encoder.start_episode([video_key], tmp_path)
+        num_frames = 12
+        for _ in range(num_frames):
+            encoder.feed_frame(video_key, np.random.randint(0, 255, (64, 96, 3), dtype=np.uint8))
+
+        live_stats = encoder.get_queue_stats()[video_key]
+        assert live_stats["fed_frames"] == num_frames
+        assert 0 <= live_stats["queue_depth"] <= encoder.queue_maxsize
+        encoder.finish_episode()
+
+        # The counters of the last episode stay available after it finished
+        stats = encoder.get_queue_stats()[video_key]
+        assert stats["queue_depth"] == 0
+        assert 1 <= stats["max_queue_depth"] <= encoder.queue_maxsize
+        assert stats["fed_frames"] == num_frames
+        assert stats["dropped_frames"] == 0
+        assert stats["encoded_frames"] == num_frames
+        assert stats["encode_s"] > 0
+
+        encoder.close()
+
     def test_encoder_threads_none_by_default(self, tmp_path):
         """Test that encoder_threads defaults to None (codec auto-detect)."""
         encoder = StreamingVideoEncoder(fps=30, vcodec="libsvtav1", pix_fmt="yuv420p")
@@ -504,6 +625,8 @@ class TestStreamingVideoEncoder:
         dropped = encoder._dropped_frames.get(f"{OBS_IMAGES}.cam", 0)
         # We can't guarantee drops but can verify no crash occurred
         assert dropped >= 0
+        stats = encoder.get_queue_stats()[f"{OBS_IMAGES}.cam"]
+        assert stats["encoded_frames"] + stats["dropped_frames"] == num_frames
 
         encoder.close()
 
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+
+# Copyright 2026 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the bounded video decoder cache."""
+
+import pickle
+import sys
+import types
+from unittest.mock import patch
+
+import pytest
+
+from lerobot.datasets.video_utils import _DECODER_BUFFERED_FRAMES, VideoDecoderCache
+
+
+class _FakeVideoDecoder:
+    def __init__(self, source, seek_mode="exact"):
+        self.source = source
+        self.metadata = types.SimpleNamespace(width=4, height=2, average_fps=30)
+
+
+@pytest.fixture
+def fake_torchcodec(monkeypatch):
+    """Install a fake `torchcodec.decoders` module so the cache can be tested without torchcodec."""
+    torchcodec = types.ModuleType("torchcodec")
+    decoders = types.ModuleType("torchcodec.decoders")
+    decoders.VideoDecoder = _FakeVideoDecoder
+    torchcodec.decoders = decoders
+    monkeypatch.setitem(sys.modules, "torchcodec", torchcodec)
+    monkeypatch.setitem(sys.modules, "torchcodec.decoders", decoders)
+    with patch("lerobot.datasets.video_utils.importlib.util.find_spec", return_value=True):
+        yield
+
+
+@pytest.fixture
+def video_files(tmp_path):
+    paths = []
+    for i in range(4):
+        path = tmp_path / f"file-{i:03d}.mp4"
+        path.write_bytes(b"")
+        paths.append(str(path))
+    return paths
+
+
+def test_unbounded_by_default(fake_torchcodec, video_files):
+    cache = VideoDecoderCache()
+    decoders = [cache.get_decoder(path) for path in video_files]
+
+    assert cache.size() == len(video_files)
+    assert cache.get_decoder(video_files[0]) is decoders[0]
+    assert cache.stats()["evictions"] == 0
+
+
+def test_lru_eviction_by_count(fake_torchcodec, video_files):
+    cache = VideoDecoderCache(max_size=2)
+    first = cache.get_decoder(video_files[0])
+    cache.get_decoder(video_files[1])
+    # Touch the first file so the second one becomes the least recently used
+    assert cache.get_decoder(video_files[0]) is first
+    cache.get_decoder(video_files[2])
+
+    assert cache.size() == 2
+    assert cache.get_decoder(video_files[0]) is first
+    stats = cache.stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 3
+    assert stats["evictions"] == 1
+    assert stats["open_decoders"] == 2
+
+
+def test_eviction_by_estimated_bytes(fake_torchcodec, video_files):
+    decoder_bytes = _DECODER_BUFFERED_FRAMES * 4 * 2 * 3
+    cache = VideoDecoderCache(max_bytes=3 * decoder_bytes)
+    for path in video_files:
+        cache.get_decoder(path)
+
+    assert cache.size() == 3
+    assert cache.stats()["estimated_bytes"] == 3 * decoder_bytes
+
+
+def test_evicted_file_handles_are_closed(fake_torchcodec, video_files):
+    cache = VideoDecoderCache(max_size=1)
+    first = cache.get_decoder(video_files[0])
+    cache.get_decoder(video_files[1])
+
+    assert first.source.closed
+
+
+def test_invalid_bounds():
+    with pytest.raises(ValueError):
+        VideoDecoderCache(max_size=0)
+    with pytest.raises(ValueError):
+        VideoDecoderCache(max_bytes=0)
+
+
+def test_pickle_keeps_configuration_only(fake_torchcodec, video_files):
+    cache = VideoDecoderCache(max_size=3, max_bytes=1000)
+    cache.get_decoder(video_files[0])
+
+    restored = pickle.loads(pickle.dumps(cache))
+    assert restored.max_size == 3
+    assert restored.max_bytes == 1000
+    assert restored.size() == 0
+
+
+def test_entries_are_dropped_in_forked_process(fake_torchcodec, video_files):
+    cache = VideoDecoderCache()
+    decoder = cache.get_decoder(video_files[0])
+
+    # Simulate running in a DataLoader worker forked from this process
+    cache._pid = -1
+    assert cache.get_decoder(video_files[0]) is not decoder
+    assert decoder.source.closed
+    assert cache.stats()["misses"] == 1
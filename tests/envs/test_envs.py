@@ -28,8 +28,10 @@ from lerobot.configs.types import PolicyFeature
 from lerobot.envs.configs import EnvConfig
 from lerobot.envs.factory import make_env, make_env_config
 from lerobot.envs.utils import (
+    MultiTaskVectorEnv,
     _normalize_hub_result,
     _parse_hub_url,
+    close_envs,
     preprocess_observation,
 )
 from tests.utils import require_env
@@ -266,3 +268,28 @@ def test_make_env_from_hub_async():
 
     # clean up
     env.close()
+
+
+def test_multi_task_vector_env_matches_individual_vector_envs():
+    def make_vec_env(num_envs):
+        return gym.vector.SyncVectorEnv([lambda: gym.make("CartPole-v1") for _ in range(num_envs)])
+
+    references = [make_vec_env(2), make_vec_env(3)]
+    env = MultiTaskVectorEnv([make_vec_env(2), make_vec_env(3)])
+    assert env.num_envs == 5
+
+    observation, _ = env.reset(seed=[10, 11, 20, 21, 22])
+    expected = [references[0].reset(seed=[10, 11])[0], references[1].reset(seed=[20, 21, 22])[0]]
+    np.testing.assert_array_equal(observation, np.concatenate(expected))
+
+    actions = np.array([0, 1, 1, 0, 1])
+    observation, reward, terminated, truncated, _ = env.step(actions)
+    expected = [references[0].step(actions[:2]), references[1].step(actions[2:])]
+    np.testing.assert_array_equal(observation, np.concatenate([step[0] for step in expected]))
+    np.testing.assert_array_equal(reward, np.concatenate([step[1] for step in expected]))
+    np.testing.assert_array_equal(terminated, np.concatenate([step[2] for step in expected]))
+    np.testing.assert_array_equal(truncated, np.concatenate([step[3] for step in expected]))
+    assert env.call("spec")[0].id == "CartPole-v1" and len(env.call("spec")) == 5
+
+    env.close()
+    close_envs(references)
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+
+# Copyright 2026 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test the read-only prefix KV cache shared by the pi0/pi05 denoising steps"""
+
+import copy
+
+import pytest
+import torch
+
+pytest.importorskip("transformers")
+
+from transformers.cache_utils import DynamicCache  # noqa: E402
+from transformers.models.gemma.modeling_gemma import GemmaConfig  # noqa: E402
+
+from lerobot.policies.pi_gemma import PiGemmaModel, ReadOnlyPrefixCache  # noqa: E402
+
+
+def _tiny_gemma_model() -> PiGemmaModel:
+    config = GemmaConfig(
+        vocab_size=32,
+        hidden_size=32,
+        intermediate_size=64,
+        num_hidden_layers=2,
+        num_attention_heads=2,
+        num_key_value_heads=1,
+        head_dim=16,
+    )
+    config._attn_implementation = "eager"
+    return PiGemmaModel(config).eval()
+
+
+def test_update_does_not_extend_prefix_cache():
+    cache = DynamicCache()
+    prefix_keys, prefix_values = torch.randn(1, 1, 5, 4), torch.randn(1, 1, 5, 4)
+    cache.update(prefix_keys, prefix_values, 0)
+
+    view = ReadOnlyPrefixCache(cache)
+    suffix_keys, suffix_values = torch.randn(1, 1, 3, 4), torch.randn(1, 1, 3, 4)
+    keys, values = view.update(suffix_keys, suffix_values, 0)
+
+    torch.testing.assert_close(keys, torch.cat([prefix_keys, suffix_keys], dim=-2))
+    torch.testing.assert_close(values, torch.cat([prefix_values, suffix_values], dim=-2))
+    assert view.get_seq_length() == 5
+    assert cache.get_seq_length() == 5
+    assert ReadOnlyPrefixCache(view).cache is cache
+
+
+@torch.no_grad()
+def test_suffix_forward_matches_deepcopied_cache():
+    torch.manual_seed(0)
+    model = _tiny_gemma_model()
+    prefix = model(inputs_embeds=torch.randn(2, 6, 32), use_cache=True)
+    suffix_embs = torch.randn(2, 4, 32)
+    position_ids = torch.arange(6, 10)[None].expand(2, -1)
+
+    expected = model(
+        inputs_embeds=suffix_embs,
+        position_ids=position_ids,
+        past_key_values=copy.deepcopy(prefix.past_key_values),
+        use_cache=False,
+    ).last_hidden_state
+    # Several denoising steps reuse the same prefix cache
+    for _ in range(2):
+        actual = model(
+            inputs_embeds=suffix_embs,
+            position_ids=position_ids,
+            past_key_values=ReadOnlyPrefixCache(prefix.past_key_values),
+            use_cache=False,
+        ).last_hidden_state
+        torch.testing.assert_close(actual, expected)
+    assert prefix.past_key_values.get_seq_length() == 6
@@ -35,6 +35,8 @@ from lerobot.envs.utils import close_envs, preprocess_observation
 from lerobot.optim.factory import make_optimizer_and_scheduler
 from lerobot.policies.act.configuration_act import ACTConfig
 from lerobot.policies.act.modeling_act import ACTTemporalEnsembler
+from lerobot.policies.diffusion.configuration_diffusion import DiffusionConfig
+from lerobot.policies.diffusion.modeling_diffusion import OBS_IMAGE_FEATURES, DiffusionPolicy
 from lerobot.policies.factory import (
     get_policy_class,
     make_policy,
@@ -506,3 +508,95 @@ def test_vqbet_discretize_keeps_buffers_on_device():
         "vq_layer.freeze_codebook was moved off the model device after discretize(). "
         "Use .fill_(True) instead of = torch.tensor(True) to keep the buffer on device."
     )
+
+
+def _make_tiny_diffusion_policy(**kwargs) -> DiffusionPolicy:
+    config = DiffusionConfig(
+        down_dims=(16, 32),
+        horizon=8,
+        num_inference_steps=3,
+        crop_shape=None,
+        spatial_softmax_num_keypoints=4,
+        **{"n_action_steps": 4, **kwargs},
+    )
+    config.input_features = {
+        f"{OBS_IMAGES}.top": PolicyFeature(type=FeatureType.VISUAL, shape=(3, 32, 32)),
+        f"{OBS_IMAGES}.wrist": PolicyFeature(type=FeatureType.VISUAL, shape=(3, 32, 32)),
+        OBS_STATE: PolicyFeature(type=FeatureType.STATE, shape=(2,)),
+    }
+    config.output_features = {ACTION: PolicyFeature(type=FeatureType.ACTION, shape=(2,))}
+    return DiffusionPolicy(config).eval()
+
+
+def _make_diffusion_observation() -> dict[str, torch.Tensor]:
+    return {
+        f"{OBS_IMAGES}.top": torch.rand(2, 3, 32, 32),
+        f"{OBS_IMAGES}.wrist": torch.rand(2, 3, 32, 32),
+        OBS_STATE: torch.randn(2, 2),
+    }
+
+
+@pytest.mark.parametrize("use_separate_rgb_encoder_per_camera", [False, True])
+def test_diffusion_select_action_encodes_each_frame_once(use_separate_rgb_encoder_per_camera):
+    torch.manual_seed(0)
+    # Replanning at every step, so that consecutive observation windows overlap
+    policy = _make_tiny_diffusion_policy(
+        n_obs_steps=3,
+        n_action_steps=1,
+        use_separate_rgb_encoder_per_camera=use_separate_rgb_encoder_per_camera,
+    )
+    observations = [_make_diffusion_observation() for _ in range(4)]
+
+    encoded_frames = []
+    encode_images = policy.diffusion.encode_images
+
+    def counting_encode_images(images):
+        encoded_frames.append(images.shape[1])
+        return encode_images(images)
+
+    policy.diffusion.encode_images = counting_encode_images
+    for observation in observations:
+        policy.select_action(dict(observation))
+    # Only the new frame is encoded at each step, including the first one which fills the queue
+    assert encoded_frames == [1, 1, 1, 1]
+    assert len(policy._image_features_cache) == policy.config.n_obs_steps
+
+    # Same conditioning as encoding the whole window of images at once
+    policy.diffusion.encode_images = encode_images
+    window = {
+        OBS_STATE: torch.stack([obs[OBS_STATE] for obs in observations[1:]], dim=1),
+        OBS_IMAGES: torch.stack(
+            [
+                torch.stack([obs[key] for key in policy.config.image_features], dim=-4)
+                for obs in observations[1:]
+            ],
+            dim=1,
+        ),
+    }
+    cached_window = {OBS_STATE: window[OBS_STATE], OBS_IMAGE_FEATURES: policy._encode_queued_images()}
+    torch.testing.assert_close(
+        policy.diffusion._prepare_global_conditioning(cached_window),
+        policy.diffusion._prepare_global_conditioning(window),
+    )
+
+
+def test_diffusion_action_candidates():
+    torch.manual_seed(0)
+    policy = _make_tiny_diffusion_policy(num_action_candidates=3)
+    observation = _make_diffusion_observation()
+    # The candidates of a batch element are denoised in the same pass
+    actions = policy.select_action(observation, noise=torch.randn(2 * 3, policy.config.horizon, 2))
+    assert actions.shape == (2, 2)
+    assert policy._previous_actions.shape == (2, policy.config.n_action_steps, 2)
+
+    # With n_obs_steps=2, the first action of a candidate overlaps with the last executed one
+    candidates = torch.zeros(2, 3, policy.config.horizon, 2)
+    candidates[:, 0, 0] = 5.0
+    candidates[:, 1, 0] = 1.0
+    candidates[:, 2, 0] = -3.0
+    previous_actions = torch.full((2, policy.config.n_action_steps, 2), 1.5)
+    selected = policy.diffusion._select_candidates(candidates, previous_actions)
+    torch.testing.assert_close(selected, candidates[:, 1])
+    # Without previous actions, the candidate closest to the mean (1.0) is kept
+    selected = policy.diffusion._select_candidates(candidates)
+    torch.testing.assert_close(selected, candidates[:, 1])
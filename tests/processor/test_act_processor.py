@@ -355,6 +355,24 @@ def test_act_processor_batch_consistency():
     assert processed_batched[TransitionKey.ACTION.value].shape[0] == 8
 
 
+def test_act_postprocessor_action_chunk():
+    """Test that a whole (B, T, action_dim) chunk postprocesses like each of its actions."""
+    config = create_default_config()
+    stats = {
+        OBS_STATE: {"mean": torch.zeros(7), "std": torch.ones(7)},
+        ACTION: {"mean": torch.tensor([1.0, -2.0, 0.5, 3.0]), "std": torch.tensor([2.0, 0.5, 1.0, 4.0])},
+    }
+    _, postprocessor = make_act_pre_post_processors(config, stats)
+    assert postprocessor.supports_action_chunks
+
+    action_chunk = torch.randn(3, 10, 4)
+    processed_chunk = postprocessor(action_chunk)
+    processed_actions = torch.stack([postprocessor(action_chunk[:, i]) for i in range(10)], dim=1)
+
+    assert processed_chunk.shape == (3, 10, 4)
+    torch.testing.assert_close(processed_chunk, processed_actions)
+
+
 @pytest.mark.skipif(not torch.cuda.is_available(), reason="CUDA not available")
 def test_act_processor_bfloat16_device_float32_normalizer():
     """Test: DeviceProcessor(bfloat16) + NormalizerProcessor(float32) → output bfloat16 via automatic adaptation"""
@@ -0,0 +1,215 @@
+#!/usr/bin/env python
+
+# Copyright 2026 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+
+import gymnasium as gym
+import numpy as np
+import pytest
+import torch
+from torch import nn
+
+from lerobot.configs.types import FeatureType, PolicyFeature
+from lerobot.policies.act.configuration_act import ACTConfig
+from lerobot.policies.act.modeling_act import ACTPolicy
+from lerobot.scripts.lerobot_eval import eval_policy, eval_policy_all, eval_tasks_batched, rollout_continuous
+from lerobot.utils.constants import ACTION, OBS_ENV_STATE, OBS_STATE
+
+
+class CountdownEnv(gym.Env):
+    """Episodes of a seed-dependent length, rewarding the action and succeeding on even lengths."""
+
+    metadata = {"render_fps": 10}
+    _max_episode_steps = 12
+
+    def __init__(self, task_id: int):
+        self.task_id = task_id
+        self.task = f"task {task_id}"
+        self.task_description = self.task
+        self.observation_space = gym.spaces.Dict(
+            {
+                "agent_pos": gym.spaces.Box(-np.inf, np.inf, shape=(2,), dtype=np.float32),
+                "environment_state": gym.spaces.Box(-np.inf, np.inf, shape=(2,), dtype=np.float32),
+            }
+        )
+        self.action_space = gym.spaces.Box(-np.inf, np.inf, shape=(1,), dtype=np.float32)
+
+    def _observation(self):
+        state = np.array([self.task_id, self.steps_left], dtype=np.float32)
+        return {"agent_pos": state, "environment_state": state}
+
+    def reset(self, seed=None, options=None):
+        super().reset(seed=seed)
+        self.length = int(self.np_random.integers(2, 10)) + self.task_id
+        self.steps_left = self.length
+        return self._observation(), {"is_success": False}
+
+    def step(self, action):
+        self.steps_left -= 1
+        terminated = self.steps_left <= 0
+        info = {"is_success": terminated and self.length % 2 == 0}
+        return self._observation(), abs(float(action[0])), terminated, False, info
+
+    def render(self):
+        return np.full((4, 4, 3), self.steps_left, dtype=np.uint8)
+
+
+class StatePolicy(nn.Module):
+    def reset(self):
+        pass
+
+    def select_action(self, batch):
+        return batch[OBS_STATE].sum(dim=-1, keepdim=True)
+
+
+def _identity(x):
+    return x
+
+
+def _make_envs(task_ids, num_envs):
+    return {
+        "suite": {
+            task_id: gym.vector.SyncVectorEnv([lambda task_id=task_id: CountdownEnv(task_id)] * num_envs)
+            for task_id in task_ids
+        }
+    }
+
+
+def _postprocess_actions(transition):
+    if ACTION in transition:
+        transition[ACTION] = torch.as_tensor(transition[ACTION])
+    return transition
+
+
+PROCESSORS = {
+    "env_preprocessor": _identity,
+    "env_postprocessor": _postprocess_actions,
+    "preprocessor": _identity,
+    "postprocessor": _identity,
+}
+
+
+def test_eval_tasks_batched_matches_tasks_evaluated_one_by_one():
+    n_episodes = 5
+    envs = _make_envs(range(3), num_envs=2)
+    tasks = [("suite", task_id, env) for task_id, env in envs["suite"].items()]
+    kwargs = {
+        "policy": StatePolicy(),
+        "n_episodes": n_episodes,
+        "max_episodes_rendered": 0,
+        "videos_dir": None,
+        "start_seed": 7,
+        **PROCESSORS,
+    }
+
+    batched = eval_tasks_batched(tasks, **kwargs)
+    one_by_one = [eval_tasks_batched([task], **kwargs)[0] for task in tasks]
+
+    assert batched == one_by_one
+    for _, _, metrics in batched:
+        assert len(metrics["successes"]) == n_episodes
+        assert any(metrics["successes"]) and not all(metrics["successes"])
+
+
+def test_eval_policy_all_batches_tasks_of_a_group():
+    results = [
+        eval_policy_all(
+            envs=_make_envs(range(3), num_envs=2),
+            policy=StatePolicy(),
+            n_episodes=3,
+            start_seed=0,
+            max_parallel_tasks=max_parallel_tasks,
+            **PROCESSORS,
+        )
+        for max_parallel_tasks in (2, 3)
+    ]
+
+    for info in results:
+        assert [task["task_id"] for task in info["per_task"]] == [0, 1, 2]
+        assert info["overall"]["n_episodes"] == 9
+    assert results[0]["per_task"] == results[1]["per_task"]
+    assert results[0]["per_group"] == results[1]["per_group"]
+
+
+def test_eval_policy_all_warns_that_parallel_tasks_ignore_continuous_batching(caplog):
+    with caplog.at_level(logging.WARNING):
+        info = eval_policy_all(
+            envs=_make_envs(range(2), num_envs=2),
+            policy=StatePolicy(),
+            n_episodes=2,
+            start_seed=0,
+            max_parallel_tasks=2,
+            continuous_batching=True,
+            **PROCESSORS,
+        )
+
+    assert info["overall"]["n_episodes"] == 4
+    assert "Continuous batching isn't supported when several tasks are evaluated at once" in caplog.text
+
+
+def _make_tiny_act_policy() -> ACTPolicy:
+    config = ACTConfig(
+        chunk_size=4,
+        n_action_steps=3,
+        dim_model=16,
+        n_heads=2,
+        dim_feedforward=32,
+        n_encoder_layers=1,
+        n_decoder_layers=1,
+        use_vae=False,
+        device="cpu",
+    )
+    config.input_features = {
+        OBS_STATE: PolicyFeature(type=FeatureType.STATE, shape=(2,)),
+        OBS_ENV_STATE: PolicyFeature(type=FeatureType.ENV, shape=(2,)),
+    }
+    config.output_features = {ACTION: PolicyFeature(type=FeatureType.ACTION, shape=(1,))}
+    torch.manual_seed(0)
+    return ACTPolicy(config).eval()
+
+
+def test_continuous_batching_reports_the_same_metrics():
+    env = gym.vector.SyncVectorEnv([lambda: CountdownEnv(1)] * 3)
+    kwargs = {"policy": _make_tiny_act_policy(), "n_episodes": 7, "start_seed": 3, **PROCESSORS}
+
+    expected = eval_policy(env, **kwargs)["per_episode"]
+    actual = eval_policy(env, continuous_batching=True, **kwargs)["per_episode"]
+
+    assert [ep["seed"] for ep in actual] == [ep["seed"] for ep in expected] == list(range(3, 10))
+    assert [ep["success"] for ep in actual] == [ep["success"] for ep in expected]
+    for key in ("sum_reward", "max_reward"):
+        assert [ep[key] for ep in actual] == pytest.approx([ep[key] for ep in expected], rel=1e-5)
+    env.close()
+
+
+def test_rollout_continuous_renders_each_episode_from_its_reset():
+    env = gym.vector.SyncVectorEnv([lambda: CountdownEnv(0)] * 2)
+    episodes = rollout_continuous(
+        env,
+        _make_tiny_act_policy(),
+        n_episodes=5,
+        n_action_steps=3,
+        start_seed=0,
+        n_episodes_rendered=4,
+        **PROCESSORS,
+    )
+
+    for episode in episodes[:4]:
+        frames = episode["frames"]
+        # From the reset observation to the one before the last step, counting the steps left down.
+        assert [frame[0, 0, 0] for frame in frames] == list(range(len(frames), 0, -1))
+    assert episodes[4]["frames"] is None
+    env.close()
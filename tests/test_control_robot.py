@@ -14,8 +14,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import threading
 from unittest.mock import patch
 
+import pandas as pd
+
+from lerobot.datasets.dataset_writer import DatasetWriter
+from lerobot.datasets.io_utils import load_episodes
 from lerobot.scripts.lerobot_calibrate import CalibrateConfig, calibrate
 from lerobot.scripts.lerobot_record import DatasetRecordConfig, RecordConfig, record
 from lerobot.scripts.lerobot_replay import DatasetReplayConfig, ReplayConfig, replay
@@ -83,6 +88,54 @@ def test_record_and_resume(tmp_path):
     assert dataset.meta.total_tasks == 1
 
 
+def test_record_announces_episode_index_with_background_saving(tmp_path):
+    """The announced episode index counts the episodes that are still saved in the background."""
+    dataset_cfg = DatasetRecordConfig(
+        repo_id=DUMMY_REPO_ID,
+        single_task="Dummy task",
+        root=tmp_path / "record",
+        num_episodes=2,
+        episode_time_s=0.1,
+        reset_time_s=0,
+        push_to_hub=False,
+        background_saving=True,
+    )
+    cfg = RecordConfig(
+        robot=MockRobotConfig(),
+        dataset=dataset_cfg,
+        teleop=MockTeleopConfig(),
+        play_sounds=False,
+    )
+
+    announced = []
+    second_episode_announced = threading.Event()
+
+    def log_say(text, *args, **kwargs):
+        if text.startswith("Recording episode"):
+            announced.append(text)
+            if len(announced) == 2:
+                second_episode_announced.set()
+
+    # Keep the first episode in the save thread until the second one is announced
+    commit_episode = DatasetWriter._commit_episode
+
+    def blocked_commit_episode(self, pending, parallel_encoding):
+        second_episode_announced.wait(timeout=10)
+        commit_episode(self, pending, parallel_encoding)
+
+    with (
+        patch("lerobot.scripts.lerobot_record.log_say", side_effect=log_say),
+        patch.object(DatasetWriter, "_commit_episode", blocked_commit_episode),
+    ):
+        dataset = record(cfg)
+
+    assert announced == ["Recording episode 0", "Recording episode 1"]
+    assert dataset.meta.total_episodes == 2
+    assert load_episodes(dataset.root)["episode_index"] == [0, 1]
+    data = pd.concat(pd.read_parquet(path) for path in sorted((dataset.root / "data").rglob("*.parquet")))
+    assert data["episode_index"].tolist() == [0] * 3 + [1] * 3
+
+
 def test_record_and_replay(tmp_path):
     robot_cfg = MockRobotConfig()
     teleop_cfg = MockTeleopConfig()
@@ -235,6 +235,31 @@ def test_receive_bytes_in_chunks_multiple_messages():
     assert queue.empty()
 
 
+@require_package("grpcio", "grpc")
+def test_iter_bytes_in_chunks_yields_each_message():
+    from lerobot.transport.utils import iter_bytes_in_chunks, services_pb2
+
+    """Test that every message is yielded as soon as its last chunk is received."""
+    shutdown_event = Event()
+    received = []
+
+    def chunks():
+        yield services_pb2.Observation(
+            data=b"Start1 ", transfer_state=services_pb2.TransferState.TRANSFER_BEGIN
+        )
+        yield services_pb2.Observation(data=b"End1", transfer_state=services_pb2.TransferState.TRANSFER_END)
+        # The first message must be available before the stream sends anything else
+        assert received == [b"Start1 End1"]
+        yield services_pb2.Observation(
+            data=b"Message2", transfer_state=services_pb2.TransferState.TRANSFER_END
+        )
+
+    for data in iter_bytes_in_chunks(chunks(), shutdown_event):
+        received.append(data)
+
+    assert received == [b"Start1 End1", b"Message2"]
+
+
 @require_package("grpcio", "grpc")
 def test_receive_bytes_in_chunks_shutdown_during_receive():
     from lerobot.transport.utils import receive_bytes_in_chunks, services_pb2
@@ -570,3 +595,90 @@ def test_receive_bytes_in_chunks_unknown_state():
 
     with pytest.raises(ValueError, match="Received unknown transfer state"):
         receive_bytes_in_chunks(bad_iterator, output_queue, shutdown_event)
+
+
+@require_package("grpcio", "grpc")
+def test_tensor_wire_format_roundtrip():
+    from lerobot.transport.utils import TENSOR_WIRE_MAGIC, bytes_to_tensors, tensors_to_bytes
+
+    """Test nested structures, non-NumPy dtypes, empty tensors and scalars in the flat wire format."""
+    obj = {
+        "policy": {"weight": torch.randn(3, 4), "bias": torch.randn(4).to(torch.bfloat16)},
+        "empty": torch.empty(0, 5),
+        "scalar": torch.tensor(True),
+        "items": [1, 2.5, None, "name", (torch.arange(3), False)],
+    }
+
+    data = tensors_to_bytes(obj)
+    assert data.startswith(TENSOR_WIRE_MAGIC)
+    restored = bytes_to_tensors(data)
+
+    assert torch.equal(restored["policy"]["weight"], obj["policy"]["weight"])
+    assert restored["policy"]["bias"].dtype == torch.bfloat16
+    assert torch.equal(restored["policy"]["bias"], obj["policy"]["bias"])
+    assert restored["empty"].shape == (0, 5)
+    assert restored["scalar"].shape == () and restored["scalar"].item() is True
+    assert restored["items"][:4] == [1, 2.5, None, "name"]
+    assert isinstance(restored["items"][4], tuple)
+    assert torch.equal(restored["items"][4][0], torch.arange(3))
+
+
+@require_package("grpcio", "grpc")
+def test_tensor_wire_format_is_zero_copy():
+    from lerobot.transport.utils import bytes_to_tensors, tensors_to_bytes
+
+    """Test that decoded tensors are views of the received buffer."""
+    data = bytearray(tensors_to_bytes({"a": torch.zeros(4), "b": torch.ones(3, dtype=torch.int64)}))
+    restored = bytes_to_tensors(data)
+
+    # Tensor buffers are aligned relative to each other
+    assert (restored["b"].data_ptr() - restored["a"].data_ptr()) % 64 == 0
+    restored["a"][0] = 7.0
+    assert bytes_to_tensors(data)["a"][0].item() == 7.0
+
+
+@require_package("grpcio", "grpc")
+def test_tensor_wire_format_errors():
+    from lerobot.transport.utils import bytes_to_tensors, tensors_to_bytes
+
+    """Test the errors raised for unsupported objects and malformed buffers."""
+    with pytest.raises(TypeError):
+        tensors_to_bytes({"array": object()})
+    with pytest.raises(TypeError):
+        tensors_to_bytes({1: torch.zeros(1)})
+    with pytest.raises(ValueError, match="not in the tensor wire format"):
+        bytes_to_tensors(b"invalid")
+
+    data = tensors_to_bytes({"a": torch.zeros(100)})
+    with pytest.raises(ValueError, match="truncated"):
+        bytes_to_tensors(data[:-8])
+
+
+@require_package("grpcio", "grpc")
+def test_bytes_to_state_dict_legacy_payload():
+    from lerobot.transport.utils import bytes_to_state_dict, bytes_to_transitions
+
+    """Test that `torch.save` payloads from older peers are still accepted."""
+    state_dict = {"policy": {"weight": torch.randn(2, 2)}}
+    buffer = io.BytesIO()
+    torch.save(state_dict, buffer)
+    assert torch.equal(
+        bytes_to_state_dict(buffer.getvalue())["policy"]["weight"], state_dict["policy"]["weight"]
+    )
+
+    transitions = [{"state": {"data": torch.randn(3)}, ACTION: torch.randn(2), "reward": 1.0}]
+    buffer = io.BytesIO()
+    torch.save(transitions, buffer)
+    assert torch.equal(bytes_to_transitions(buffer.getvalue())[0][ACTION], transitions[0][ACTION])
+
+
+@require_package("grpcio", "grpc")
+def test_send_bytes_in_chunks_from_memoryview():
+    from lerobot.transport.utils import CHUNK_SIZE, send_bytes_in_chunks, services_pb2
+
+    """Test that chunks can be streamed from a memoryview without changing their content."""
+    data = bytes(range(256)) * (CHUNK_SIZE // 256 + 1)
+    chunks = list(send_bytes_in_chunks(memoryview(data), services_pb2.InteractionMessage))
+
+    assert len(chunks) == 2
+    assert b"".join(chunk.data for chunk in chunks) == data
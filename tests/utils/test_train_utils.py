@@ -17,9 +17,22 @@
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+import pytest
+import torch
+
+from lerobot.configs.types import FeatureType, NormalizationMode, PolicyFeature
+from lerobot.processor import (
+    AddBatchDimensionProcessorStep,
+    DeviceProcessorStep,
+    NormalizerProcessorStep,
+    PolicyProcessorPipeline,
+    RenameObservationsProcessorStep,
+)
 from lerobot.utils.constants import (
+    ACTION,
     CHECKPOINTS_DIR,
     LAST_CHECKPOINT_LINK,
+    OBS_STATE,
     OPTIMIZER_PARAM_GROUPS,
     OPTIMIZER_STATE,
     RNG_STATE,
@@ -28,6 +41,9 @@ from lerobot.utils.constants import (
     TRAINING_STEP,
 )
 from lerobot.utils.train_utils import (
+    BatchPrefetcher,
+    PreprocessingCollate,
+    _record_stream,
     get_step_checkpoint_dir,
     get_step_identifier,
     load_training_state,
@@ -35,8 +51,10 @@ from lerobot.utils.train_utils import (
     save_checkpoint,
     save_training_state,
     save_training_step,
+    split_preprocessor,
     update_last_checkpoint,
 )
+from tests.utils import require_cuda
 
 
 def test_get_step_identifier():
@@ -112,3 +130,117 @@ def test_save_load_training_state(tmp_path, optimizer, scheduler):
     assert loaded_step == 10
     assert loaded_optimizer is optimizer
     assert loaded_scheduler is scheduler
+
+
+def _make_preprocessor() -> PolicyProcessorPipeline:
+    features = {
+        OBS_STATE: PolicyFeature(type=FeatureType.STATE, shape=(2,)),
+        ACTION: PolicyFeature(type=FeatureType.ACTION, shape=(2,)),
+    }
+    stats = {key: {"mean": torch.ones(2), "std": 2 * torch.ones(2)} for key in features}
+    return PolicyProcessorPipeline(
+        steps=[
+            RenameObservationsProcessorStep(rename_map={"observation.joints": OBS_STATE}),
+            AddBatchDimensionProcessorStep(),
+            DeviceProcessorStep(device="cpu"),
+            NormalizerProcessorStep(
+                features=features,
+                norm_map={
+                    FeatureType.STATE: NormalizationMode.MEAN_STD,
+                    FeatureType.ACTION: NormalizationMode.MEAN_STD,
+                },
+                stats=stats,
+            ),
+        ]
+    )
+
+
+def _make_samples(num_samples: int) -> list[dict]:
+    return [
+        {"observation.joints": torch.tensor([i, -i], dtype=torch.float32), ACTION: torch.full((2,), float(i))}
+        for i in range(num_samples)
+    ]
+
+
+def test_split_preprocessor():
+    preprocessor = _make_preprocessor()
+    worker_preprocessor, device_preprocessor = split_preprocessor(preprocessor)
+
+    assert [type(step) for step in worker_preprocessor.steps] == [
+        RenameObservationsProcessorStep,
+        AddBatchDimensionProcessorStep,
+    ]
+    assert isinstance(device_preprocessor.steps[0], DeviceProcessorStep)
+
+    samples = _make_samples(4)
+    expected = preprocessor(torch.utils.data.default_collate(samples))
+    actual = device_preprocessor(PreprocessingCollate(worker_preprocessor)(samples))
+    torch.testing.assert_close(actual[OBS_STATE], expected[OBS_STATE])
+    torch.testing.assert_close(actual[ACTION], expected[ACTION])
+
+
+def test_split_preprocessor_without_device_step():
+    preprocessor = PolicyProcessorPipeline(steps=[AddBatchDimensionProcessorStep()])
+    worker_preprocessor, device_preprocessor = split_preprocessor(preprocessor)
+    assert len(worker_preprocessor) == 0
+    assert device_preprocessor is preprocessor
+
+
+@pytest.mark.parametrize("num_prefetch", [0, 1, 3])
+def test_batch_prefetcher(num_prefetch):
+    preprocessor = _make_preprocessor()
+    batches = [torch.utils.data.default_collate(_make_samples(2)) for _ in range(5)]
+    for i, batch in enumerate(batches):
+        batch[ACTION] = batch[ACTION] + i
+
+    prefetcher = BatchPrefetcher(iter(batches), preprocessor, torch.device("cpu"), num_prefetch=num_prefetch)
+    preprocessed = list(prefetcher)
+    prefetcher.close()
+
+    assert len(preprocessed) == len(batches)
+    for batch, actual in zip(batches, preprocessed, strict=True):
+        torch.testing.assert_close(actual[ACTION], (batch[ACTION] - 1) / 2)
+    assert prefetcher.preprocess_s > 0
+    assert prefetcher.wait_s >= prefetcher.dataloading_s
+
+
+def test_record_stream_walks_nested_batches():
+    stream = Mock()
+    tensors = [Mock(spec=torch.Tensor, is_cuda=True) for _ in range(4)]
+    batch = {
+        ACTION: tensors[0],
+        "observation.images": {"top": tensors[1], "wrist": [tensors[2], (tensors[3], "not a tensor")]},
+        "task": ["pick"],
+        "cpu": torch.zeros(1),
+    }
+
+    _record_stream(batch, stream)
+
+    for tensor in tensors:
+        tensor.record_stream.assert_called_once_with(stream)
+
+
+@require_cuda
+def test_batch_prefetcher_records_nested_tensors_on_the_current_stream():
+    def preprocessor(batch):
+        return {ACTION: batch[ACTION].cuda(), "observation.images": {"top": [batch[ACTION].cuda() * 2]}}
+
+    batches = [{ACTION: torch.full((2, 3), float(i))} for i in range(3)]
+    prefetcher = BatchPrefetcher(iter(batches), preprocessor, torch.device("cuda"), num_prefetch=1)
+    with patch.object(torch.Tensor, "record_stream", autospec=True) as record_stream:
+        preprocessed = list(prefetcher)
+    prefetcher.close()
+
+    assert record_stream.call_count == 2 * len(batches)
+    for i, batch in enumerate(preprocessed):
+        torch.testing.assert_close(batch["observation.images"]["top"][0].cpu(), torch.full((2, 3), 2.0 * i))
+
+
+def test_batch_prefetcher_propagates_errors():
+    def failing_preprocessor(batch):
+        raise RuntimeError("preprocessing failed")
+
+    prefetcher = BatchPrefetcher(iter([{}]), failing_preprocessor, torch.device("cpu"), num_prefetch=1)
+    with pytest.raises(RuntimeError, match="preprocessing failed"):
+        next(prefetcher)
+    prefetcher.close()